@@ -0,0 +1,240 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+
+class _Doctor:
+    __slots__ = ('id', 'specialty', 'available', 'active_calls', 'assigned', 'version')
+
+    def __init__(self, doctor_id, specialty):
+        self.id = doctor_id
+        self.specialty = specialty
+        self.available = False
+        self.active_calls = 0
+        self.assigned = 0
+        self.version = 0
+
+
+class _Waiting:
+    __slots__ = ('patient_id', 'specialty', 'enqueued_at', 'seq', 'cancelled')
+
+    def __init__(self, patient_id, specialty, seq):
+        self.patient_id = patient_id
+        self.specialty = specialty
+        self.enqueued_at = time.time()
+        self.seq = seq
+        self.cancelled = False
+
+
+class DoctorAssignment:
+    """
+    Picks the doctor for auto-matched video calls and queues patients when none is free.
+
+    Free doctors sit in min-heaps keyed by (active calls, calls assigned so far), one heap
+    per specialty plus one over all doctors, so the least loaded doctor with the right
+    specialty is found in O(log n). A doctor whose load or availability changes gets a
+    new heap entry and the old one is skipped when it surfaces (lazy deletion).
+
+    Patients who find nobody free wait in FIFO queues per requested specialty. When a
+    doctor frees up, next_patient() hands them the longest-waiting patient that fits.
+
+    The engine only keeps state; the caller creates rooms and sends notifications.
+    """
+
+    def __init__(self, max_calls_per_doctor=1):
+        self.max_calls_per_doctor = max_calls_per_doctor
+        self.lock = threading.Lock()
+        self.doctors = {}
+        # specialty -> heap of (active_calls, assigned, seq, version, doctor_id); None is all doctors
+        self.heaps = {None: []}
+        # specialty -> deque of _Waiting; None holds patients with no preference
+        self.waiting = {None: deque()}
+        self.waiting_by_patient = {}
+        self.counter = itertools.count()
+        self.assignments = 0
+        self.queued = 0
+
+    def _has_capacity(self, doctor):
+        return doctor.available and doctor.active_calls < self.max_calls_per_doctor
+
+    def _push(self, doctor):
+        """Re-enter a doctor in the heaps after their state changed"""
+        doctor.version += 1
+        if not self._has_capacity(doctor):
+            return
+        entry = (doctor.active_calls, doctor.assigned, next(self.counter), doctor.version, doctor.id)
+        heapq.heappush(self.heaps[None], entry)
+        if doctor.specialty is not None:
+            heapq.heappush(self.heaps.setdefault(doctor.specialty, []), entry)
+        if len(self.heaps[None]) > 4 * len(self.doctors) + 64:
+            self._compact()
+
+    def _compact(self):
+        """Drop stale entries once they outnumber the live ones"""
+        for specialty, heap in self.heaps.items():
+            live = [e for e in heap if self._is_live(e)]
+            heapq.heapify(live)
+            self.heaps[specialty] = live
+
+    def _is_live(self, entry):
+        doctor = self.doctors.get(entry[4])
+        return doctor is not None and doctor.version == entry[3] and self._has_capacity(doctor)
+
+    def _pop_free(self, specialty):
+        heap = self.heaps.get(specialty)
+        while heap:
+            if not self._is_live(heap[0]):
+                heapq.heappop(heap)
+                continue
+            return self.doctors[heap[0][4]]
+        return None
+
+    def _reserve(self, doctor):
+        doctor.active_calls += 1
+        doctor.assigned += 1
+        self.assignments += 1
+        self._push(doctor)
+        return doctor.id
+
+    def load(self, doctors, active_calls):
+        """
+        Replace the doctor state, keeping the waiting room.
+
+        :param doctors: iterable of (doctor_id, specialty, available)
+        :param active_calls: doctor_id -> number of calls open right now
+        """
+        with self.lock:
+            self.doctors = {}
+            self.heaps = {None: []}
+            for doctor_id, specialty, available in doctors:
+                doctor = self.doctors[doctor_id] = _Doctor(doctor_id, specialty)
+                doctor.available = bool(available)
+                doctor.active_calls = active_calls.get(doctor_id, 0)
+                self._push(doctor)
+
+    def set_doctor(self, doctor_id, specialty=None, available=False):
+        """Add or update a doctor; available means online and accepting calls"""
+        with self.lock:
+            doctor = self.doctors.get(doctor_id)
+            if doctor is None:
+                doctor = self.doctors[doctor_id] = _Doctor(doctor_id, specialty)
+            elif doctor.specialty != specialty:
+                doctor.specialty = specialty
+            doctor.available = bool(available)
+            self._push(doctor)
+
+    def remove_doctor(self, doctor_id):
+        """Forget a doctor, e.g. one whose account no longer exists; their heap entries go stale"""
+        with self.lock:
+            return self.doctors.pop(doctor_id, None) is not None
+
+    def call_started(self, doctor_id):
+        """Count a call that was set up outside assign(), e.g. with a requested doctor"""
+        with self.lock:
+            doctor = self.doctors.get(doctor_id)
+            if doctor is not None:
+                doctor.active_calls += 1
+                self._push(doctor)
+
+    def call_ended(self, doctor_id):
+        with self.lock:
+            doctor = self.doctors.get(doctor_id)
+            if doctor is not None and doctor.active_calls > 0:
+                doctor.active_calls -= 1
+                self._push(doctor)
+
+    def assign(self, patient_id, specialty=None):
+        """
+        Reserve the least loaded free doctor for a patient, preferring the specialty.
+
+        :return: (doctor_id, None) on success, or (None, position in the waiting room)
+        """
+        with self.lock:
+            doctor = None
+            if specialty is not None:
+                doctor = self._pop_free(specialty)
+            if doctor is None:
+                doctor = self._pop_free(None)
+            if doctor is not None:
+                self._cancel_waiting(patient_id)
+                return self._reserve(doctor), None
+
+            # Nobody is free: join (or keep the place in) the waiting room
+            entry = self.waiting_by_patient.get(patient_id)
+            if entry is None:
+                entry = _Waiting(patient_id, specialty, next(self.counter))
+                self.waiting.setdefault(specialty, deque()).append(entry)
+                self.waiting_by_patient[patient_id] = entry
+                self.queued += 1
+            return None, self._position(entry)
+
+    def next_patient(self, doctor_id):
+        """
+        Take the longest-waiting patient this doctor can see, reserving the doctor.
+
+        :return: patient_id, or None if nobody is waiting or the doctor isn't free
+        """
+        with self.lock:
+            doctor = self.doctors.get(doctor_id)
+            if doctor is None or not self._has_capacity(doctor):
+                return None
+
+            # Oldest patient who asked for this doctor's specialty or for anyone; failing
+            # that, the oldest patient overall, as assign() also falls back to any doctor
+            best = self._oldest_head([self.waiting.get(doctor.specialty), self.waiting[None]])
+            if best is None:
+                best = self._oldest_head(self.waiting.values())
+            if best is None:
+                return None
+
+            entry = best.popleft()
+            del self.waiting_by_patient[entry.patient_id]
+            self._reserve(doctor)
+            return entry.patient_id
+
+    @staticmethod
+    def _oldest_head(queues):
+        best = None
+        for queue in queues:
+            if not queue:
+                continue
+            while queue and queue[0].cancelled:
+                queue.popleft()
+            if queue and (best is None or queue[0].seq < best[0].seq):
+                best = queue
+        return best
+
+    def _cancel_waiting(self, patient_id):
+        entry = self.waiting_by_patient.pop(patient_id, None)
+        if entry is not None:
+            entry.cancelled = True
+        return entry is not None
+
+    def leave_waiting_room(self, patient_id):
+        with self.lock:
+            return self._cancel_waiting(patient_id)
+
+    def _position(self, entry):
+        queue = self.waiting.get(entry.specialty, ())
+        return 1 + sum(1 for other in queue if not other.cancelled and other.seq < entry.seq)
+
+    def waiting_position(self, patient_id):
+        with self.lock:
+            entry = self.waiting_by_patient.get(patient_id)
+            return self._position(entry) if entry is not None else None
+
+    def stats(self):
+        with self.lock:
+            free = sum(1 for d in self.doctors.values() if self._has_capacity(d))
+            return {
+                'doctors': len(self.doctors),
+                'available_doctors': sum(1 for d in self.doctors.values() if d.available),
+                'free_doctors': free,
+                'active_calls': sum(d.active_calls for d in self.doctors.values()),
+                'waiting_patients': len(self.waiting_by_patient),
+                'assignments': self.assignments,
+                'queued': self.queued,
+                'max_calls_per_doctor': self.max_calls_per_doctor
+            }
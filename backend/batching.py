@@ -0,0 +1,199 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import torch
+
+
+class _PendingRequest:
+    """A single image tensor waiting to be batched"""
+    __slots__ = ('tensor', 'future', 'enqueued_at')
+
+    def __init__(self, tensor):
+        self.tensor = tensor
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class BatchStats:
+    """Running batch-size numbers for one model queue"""
+
+    def __init__(self, max_batch_size):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.total_wait = 0.0
+        self.total_forward = 0.0
+        # size_histogram[n] is the number of forward passes that ran with n images
+        self.size_histogram = [0] * (max_batch_size + 1)
+
+    def record(self, batch_size, wait_seconds, forward_seconds):
+        with self.lock:
+            self.requests += batch_size
+            self.batches += 1
+            self.largest_batch = max(self.largest_batch, batch_size)
+            self.total_wait += wait_seconds
+            self.total_forward += forward_seconds
+            if batch_size < len(self.size_histogram):
+                self.size_histogram[batch_size] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'batches': self.batches,
+                'avg_batch_size': (self.requests / self.batches) if self.batches else 0.0,
+                'largest_batch': self.largest_batch,
+                'avg_queue_wait_ms': (self.total_wait / self.requests * 1000) if self.requests else 0.0,
+                'avg_forward_ms': (self.total_forward / self.batches * 1000) if self.batches else 0.0,
+                'batch_size_histogram': {
+                    str(size): count for size, count in enumerate(self.size_histogram) if count
+                }
+            }
+
+
+class ModelBatcher:
+    """
+    Gathers concurrent inference requests for one model and runs them as a single forward pass.
+
+    A batch is dispatched as soon as it holds max_batch_size images, or when the oldest
+    request in it has waited max_wait seconds, whichever comes first.
+
+    With inline=True each request runs on its own in the caller's thread. That is for
+    servers whose requests never overlap, e.g. eventlet without monkey patching, where
+    waiting on the worker thread would block every other request without ever batching.
+    """
+
+    def __init__(self, model_key, model_loader, device, max_batch_size, max_wait, inline=False):
+        self.model_key = model_key
+        self.model_loader = model_loader
+        self.device = device
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait)
+        self.stats = BatchStats(self.max_batch_size)
+        self.queue = deque()
+        self.condition = threading.Condition()
+        self.inline = inline
+        self.worker = None
+        if not inline:
+            self.worker = threading.Thread(target=self._run, name=f"batcher-{model_key}", daemon=True)
+            self.worker.start()
+
+    def submit(self, img_tensor):
+        """
+        Queue a preprocessed image for inference.
+
+        :param img_tensor: Tensor of shape (C, H, W) or (1, C, H, W)
+        :return: Future resolving to the softmax probabilities for this image
+        """
+        if img_tensor.dim() == 4:
+            img_tensor = img_tensor[0]
+        request = _PendingRequest(img_tensor)
+        if self.inline:
+            request.future.set_running_or_notify_cancel()
+            self._process([request])
+            return request.future
+        with self.condition:
+            self.queue.append(request)
+            self.condition.notify()
+        return request.future
+
+    def queue_depth(self):
+        with self.condition:
+            return len(self.queue)
+
+    def _next_batch(self):
+        """Block until a batch is ready and pop it off the queue"""
+        with self.condition:
+            while not self.queue:
+                self.condition.wait()
+
+            # The wait window starts when the oldest request arrived, so a lone
+            # request never waits longer than max_wait
+            deadline = self.queue[0].enqueued_at + self.max_wait
+            while len(self.queue) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+
+            size = min(len(self.queue), self.max_batch_size)
+            return [self.queue.popleft() for _ in range(size)]
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            # Skip requests whose callers have already given up
+            batch = [r for r in batch if r.future.set_running_or_notify_cancel()]
+            if batch:
+                self._process(batch)
+
+    def _process(self, batch):
+        started = time.monotonic()
+        try:
+            model = self.model_loader(self.model_key)
+            if model is None:
+                raise RuntimeError(f"Failed to load model: {self.model_key}")
+
+            inputs = torch.stack([r.tensor for r in batch]).to(self.device)
+            with torch.no_grad():
+                output = model(inputs)
+                probabilities = torch.nn.functional.softmax(output, dim=1).cpu()
+        except Exception as e:
+            for r in batch:
+                r.future.set_exception(e)
+            return
+
+        finished = time.monotonic()
+        wait = sum(started - r.enqueued_at for r in batch)
+        self.stats.record(len(batch), wait, finished - started)
+
+        # Hand each row back to the request that sent it
+        for i, r in enumerate(batch):
+            r.future.set_result(probabilities[i])
+
+
+class BatchingInferenceServer:
+    """Per-model batching queues keyed by MODELS key"""
+
+    def __init__(self, model_loader, device, max_batch_size=16, max_wait_ms=10, inline=False):
+        self.model_loader = model_loader
+        self.device = device
+        self.inline = inline
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.batchers = {}
+        self.lock = threading.Lock()
+
+    def _batcher(self, model_key):
+        batcher = self.batchers.get(model_key)
+        if batcher is None:
+            with self.lock:
+                batcher = self.batchers.get(model_key)
+                if batcher is None:
+                    batcher = ModelBatcher(model_key, self.model_loader, self.device,
+                                           self.max_batch_size, self.max_wait, self.inline)
+                    self.batchers[model_key] = batcher
+        return batcher
+
+    def submit(self, model_key, img_tensor):
+        """Queue an image for model_key and return a Future of its probabilities"""
+        return self._batcher(model_key).submit(img_tensor)
+
+    def predict(self, model_key, img_tensor, timeout=None):
+        """Run an image through the batching queue and wait for its probabilities"""
+        return self.submit(model_key, img_tensor).result(timeout=timeout)
+
+    def stats(self):
+        """Batch-size numbers and queue depth for every model that has served requests"""
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'inline': self.inline,
+            'models': {
+                key: dict(batcher.stats.snapshot(), queue_depth=batcher.queue_depth())
+                for key, batcher in list(self.batchers.items())
+            }
+        }
@@ -0,0 +1,104 @@
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+
+def _has_efficientnet_layout(model):
+    return all(hasattr(model, name) for name in ('features', 'avgpool', 'classifier'))
+
+
+def _same_backbone(models):
+    """True if every model has identical feature-extractor weights"""
+    first = models[0].features.state_dict()
+    for other in models[1:]:
+        other_state = other.features.state_dict()
+        if first.keys() != other_state.keys():
+            return False
+        for name, tensor in first.items():
+            if not torch.equal(tensor, other_state[name]):
+                return False
+    return True
+
+
+class ModelPanel:
+    """
+    Runs several classifiers on one preprocessed image batch.
+
+    When all models share the same EfficientNet feature extractor the backbone runs
+    once and only the classifier heads run per model. Otherwise the models run
+    concurrently on the same input tensor.
+    """
+
+    def __init__(self, model_keys, model_loader, device, max_workers=None):
+        self.model_keys = list(model_keys)
+        self.model_loader = model_loader
+        self.device = device
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.model_keys),
+                                           thread_name_prefix='panel')
+        self.lock = threading.Lock()
+        # (weak references to the models last checked, whether they share a backbone).
+        # Weak, so a model evicted from the registry is neither kept alive nor mistaken
+        # for the one reloaded in its place, as an id() could be
+        self._backbone_check = ((), False)
+
+    def _load(self, model_keys):
+        models = {}
+        for key in model_keys:
+            model = self.model_loader(key)
+            if model is None:
+                raise RuntimeError(f"Failed to load model: {key}")
+            models[key] = model
+        return models
+
+    def shares_backbone(self, models):
+        """Compare backbones once per set of loaded models and remember the answer"""
+        with self.lock:
+            refs, shared = self._backbone_check
+            if len(refs) == len(models) and all(ref() is m for ref, m in zip(refs, models)):
+                return shared
+
+        shared = len(models) > 1 and all(_has_efficientnet_layout(m) for m in models) and _same_backbone(models)
+        with self.lock:
+            self._backbone_check = (tuple(weakref.ref(m) for m in models), shared)
+        return shared
+
+    def run(self, img_tensor, model_keys=None):
+        """
+        Classify a preprocessed image with every model in the panel.
+
+        :param img_tensor: Tensor of shape (C, H, W) or (N, C, H, W)
+        :param model_keys: optional subset of the panel's models to run
+        :return: (dict of model_key -> softmax probabilities, whether the backbone was shared)
+        """
+        keys = list(model_keys) if model_keys is not None else self.model_keys
+        if not keys:
+            return {}, False
+        if img_tensor.dim() == 3:
+            img_tensor = img_tensor.unsqueeze(0)
+        inputs = img_tensor.to(self.device)
+        models = self._load(keys)
+        shared = self.shares_backbone([models[k] for k in keys])
+
+        with torch.no_grad():
+            if shared:
+                first = models[keys[0]]
+                features = torch.flatten(first.avgpool(first.features(inputs)), 1)
+                outputs = {k: models[k].classifier(features) for k in keys}
+            else:
+                futures = {k: self.executor.submit(self._forward, models[k], inputs) for k in keys}
+                outputs = {k: f.result() for k, f in futures.items()}
+
+        probabilities = {
+            k: torch.nn.functional.softmax(out, dim=1).cpu()
+            for k, out in outputs.items()
+        }
+        if img_tensor.shape[0] == 1:
+            probabilities = {k: p[0] for k, p in probabilities.items()}
+        return probabilities, shared
+
+    @staticmethod
+    def _forward(model, inputs):
+        with torch.no_grad():
+            return model(inputs)
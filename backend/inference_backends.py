@@ -0,0 +1,264 @@
+import argparse
+import os
+import time
+
+import torch
+
+try:
+    import onnxruntime
+except ImportError:  # ONNX Runtime is only needed for the 'onnx' backend
+    onnxruntime = None
+
+
+# Inference backends a model can be served with
+BACKENDS = ('eager', 'torchscript', 'int8_dynamic', 'int8_static', 'onnx')
+
+# Backends that only run on CPU
+CPU_ONLY_BACKENDS = ('int8_dynamic', 'int8_static', 'onnx')
+
+ARTIFACT_SUFFIXES = {
+    'torchscript': '.torchscript.pt',
+    'int8_dynamic': '.int8_dynamic.pt',
+    'int8_static': '.int8_static.pt',
+    'onnx': '.onnx'
+}
+
+INPUT_SHAPE = (1, 3, 224, 224)
+
+# How closely each backend matches eager mode, as (min top-1 agreement, max absolute
+# softmax difference). TorchScript and ONNX run the same fp32 graph; dynamic INT8 only
+# quantizes the classifier. Static INT8 quantizes every layer, and on EfficientNet's SiLU
+# and squeeze-excitation blocks the loss depends on the weights, so it has no fixed bound
+# and must be checked with compare_backends() on real samples before it is served.
+TOLERANCES = {
+    'torchscript': (1.0, 1e-4),
+    'onnx': (1.0, 1e-4),
+    'int8_dynamic': (0.95, 0.05)
+}
+
+
+def artifact_path(weights_path, backend):
+    """Where the compiled artifact for a backend is cached, next to the .pth file"""
+    return os.path.splitext(weights_path)[0] + ARTIFACT_SUFFIXES[backend]
+
+
+def _is_fresh(artifact, weights_path):
+    """An artifact is reused only if it is newer than the weights it was built from"""
+    try:
+        return os.path.getmtime(artifact) >= os.path.getmtime(weights_path)
+    except OSError:
+        return False
+
+
+class OnnxRuntimeModel:
+    """Callable wrapper giving an ONNX Runtime session the same interface as a torch model"""
+
+    def __init__(self, path, num_threads=None):
+        if onnxruntime is None:
+            raise RuntimeError("onnxruntime is not installed")
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, inputs):
+        outputs = self.session.run(None, {self.input_name: inputs.detach().cpu().numpy()})
+        return torch.from_numpy(outputs[0])
+
+    def eval(self):
+        return self
+
+
+def _trace_and_freeze(model, example):
+    """Trace to TorchScript and freeze, which folds BatchNorm into the preceding convolutions"""
+    with torch.no_grad():
+        traced = torch.jit.trace(model, example)
+    return torch.jit.freeze(traced.eval())
+
+
+def _quantize_static(model, calibration):
+    """Post-training static INT8 quantization (FX graph mode) calibrated on sample inputs"""
+    from torch.ao.quantization import get_default_qconfig_mapping
+    from torch.ao.quantization.quantize_fx import prepare_fx, convert_fx
+
+    example = calibration[0]
+    prepared = prepare_fx(model, get_default_qconfig_mapping('x86'), (example,))
+    with torch.no_grad():
+        for batch in calibration:
+            prepared(batch)
+    return convert_fx(prepared)
+
+
+def build_artifact(model, backend, path, calibration=None):
+    """
+    Compile an eager fp32 model for a backend and save the result at path.
+
+    :param model: eager model in eval mode, on CPU for the INT8 and ONNX backends
+    :param backend: one of BACKENDS other than 'eager'
+    :param calibration: list of input batches, used to calibrate 'int8_static'
+    """
+    example = torch.randn(*INPUT_SHAPE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    if backend == 'torchscript':
+        device = next(model.parameters()).device
+        torch.jit.save(_trace_and_freeze(model, example.to(device)), tmp_path)
+    elif backend == 'int8_dynamic':
+        from torch.ao.quantization import quantize_dynamic
+        quantized = quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        torch.jit.save(_trace_and_freeze(quantized, example), tmp_path)
+    elif backend == 'int8_static':
+        if not calibration:
+            print("No calibration samples for int8_static, calibrating on random inputs")
+            calibration = [torch.randn(*INPUT_SHAPE) for _ in range(8)]
+        quantized = _quantize_static(model, calibration)
+        torch.jit.save(_trace_and_freeze(quantized, example), tmp_path)
+    elif backend == 'onnx':
+        with torch.no_grad():
+            torch.onnx.export(
+                model, example, tmp_path,
+                input_names=['input'], output_names=['logits'],
+                dynamic_axes={'input': {0: 'batch'}, 'logits': {0: 'batch'}},
+                opset_version=17, dynamo=False
+            )
+    else:
+        raise ValueError(f"Unknown inference backend: {backend}")
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_artifact(path, backend, device):
+    if backend == 'onnx':
+        return OnnxRuntimeModel(path)
+    model = torch.jit.load(path, map_location=device)
+    model.eval()
+    return model
+
+
+def prepare_backend(model, backend, weights_path, device, calibration=None):
+    """
+    Return a callable serving model with the selected backend.
+
+    The compiled artifact is cached on disk next to weights_path and rebuilt when the
+    weights file is newer than it. Falls back to the eager model if the backend can't
+    be used on this device.
+    """
+    if backend == 'eager':
+        return model
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend}")
+    if backend in CPU_ONLY_BACKENDS and device.type != 'cpu':
+        print(f"Backend {backend} is CPU-only, using eager mode on {device}")
+        return model
+    if backend == 'onnx' and onnxruntime is None:
+        print("onnxruntime is not installed, using eager mode")
+        return model
+
+    path = artifact_path(weights_path, backend)
+    if not _is_fresh(path, weights_path):
+        print(f"Building {backend} artifact: {path}")
+        started = time.time()
+        build_artifact(model, backend, path, calibration)
+        print(f"Built {backend} artifact in {time.time() - started:.1f}s")
+
+    return load_artifact(path, backend, device)
+
+
+def compare_backends(reference, candidate, samples, batch_size=16):
+    """
+    Accuracy and latency check of a backend against eager mode on a sample set.
+
+    :param reference: eager model
+    :param candidate: model returned by prepare_backend
+    :param samples: tensor of shape (N, C, H, W)
+    :return: dict with top-1 agreement, probability differences and per-image latency
+    """
+    agree = 0
+    max_diff = 0.0
+    total_diff = 0.0
+    reference_time = 0.0
+    candidate_time = 0.0
+
+    with torch.no_grad():
+        for start in range(0, samples.shape[0], batch_size):
+            batch = samples[start:start + batch_size]
+
+            t0 = time.perf_counter()
+            ref = torch.nn.functional.softmax(reference(batch), dim=1).cpu()
+            t1 = time.perf_counter()
+            cand = torch.nn.functional.softmax(candidate(batch), dim=1).cpu()
+            t2 = time.perf_counter()
+
+            reference_time += t1 - t0
+            candidate_time += t2 - t1
+            agree += int((ref.argmax(dim=1) == cand.argmax(dim=1)).sum())
+            diff = (ref - cand).abs()
+            max_diff = max(max_diff, float(diff.max()))
+            total_diff += float(diff.mean()) * batch.shape[0]
+
+    count = samples.shape[0]
+    return {
+        'samples': count,
+        'top1_agreement': agree / count,
+        'max_abs_prob_diff': max_diff,
+        'mean_abs_prob_diff': total_diff / count,
+        'eager_ms_per_image': reference_time / count * 1000,
+        'backend_ms_per_image': candidate_time / count * 1000
+    }
+
+
+def load_sample_tensors(directory, transform, limit=64):
+    """Preprocess up to limit images from a directory into one tensor"""
+    from PIL import Image
+
+    tensors = []
+    for name in sorted(os.listdir(directory)):
+        if len(tensors) >= limit:
+            break
+        if not name.lower().endswith(('.png', '.jpg', '.jpeg')):
+            continue
+        try:
+            img = Image.open(os.path.join(directory, name)).convert('RGB')
+        except OSError:
+            continue
+        tensors.append(transform(img))
+
+    if not tensors:
+        raise ValueError(f"No sample images found in {directory}")
+    return torch.stack(tensors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build an inference backend and check it against eager mode')
+    parser.add_argument('--model', required=True, help='MODELS key, e.g. covid19')
+    parser.add_argument('--backend', required=True, choices=[b for b in BACKENDS if b != 'eager'])
+    parser.add_argument('--samples', default='uploads', help='directory of sample images')
+    parser.add_argument('--limit', type=int, default=64, help='maximum number of sample images')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the cached artifact')
+    args = parser.parse_args()
+
+    from app import MODELS, build_model, test_transform
+
+    device = torch.device('cpu')
+    eager = build_model(args.model, device)
+    if eager is None:
+        raise SystemExit(f"Could not load model {args.model}")
+
+    weights_path = MODELS[args.model]['file']
+    if args.rebuild and os.path.exists(artifact_path(weights_path, args.backend)):
+        os.remove(artifact_path(weights_path, args.backend))
+
+    samples = load_sample_tensors(args.samples, test_transform, args.limit)
+    calibration = list(samples.split(8))
+    candidate = prepare_backend(eager, args.backend, weights_path, device, calibration)
+
+    report = compare_backends(eager, candidate, samples)
+    for key, value in report.items():
+        print(f"{key}: {value:.6f}" if isinstance(value, float) else f"{key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import base64
+import hashlib
+import io
+import threading
+
+from PIL import Image
+
+
+# Pixel size of the image embedded in the report's "Image Analysis" section (3 x 2.5 inches
+# at 200 dpi) and of the header "logo"
+REPORT_BODY_SIZE = (600, 500)
+REPORT_HEADER_SIZE = (100, 60)
+# Longest side of the image sent to Gemini; larger uploads only cost upload time and tokens
+LLM_MAX_SIDE = 1024
+
+
+class IngestError(ValueError):
+    """An upload that isn't an image this app accepts"""
+
+
+def encode_jpeg(img, quality=90):
+    buf = io.BytesIO()
+    img.save(buf, format='JPEG', quality=quality)
+    return buf.getvalue()
+
+
+def report_images(img):
+    """
+    (header JPEG bytes, body JPEG bytes) for the PDF report from a decoded RGB image.
+
+    Either is None if it couldn't be produced.
+    """
+    try:
+        header = encode_jpeg(img.resize(REPORT_HEADER_SIZE, Image.LANCZOS))
+    except Exception:
+        header = None
+    try:
+        # The body image is drawn stretched to 3 x 2.5 inches; more pixels than that add nothing
+        if img.width > REPORT_BODY_SIZE[0] or img.height > REPORT_BODY_SIZE[1]:
+            img = img.resize(REPORT_BODY_SIZE, Image.LANCZOS)
+        body = encode_jpeg(img)
+    except Exception:
+        body = None
+    return header, body
+
+
+class IngestedImage:
+    """
+    One upload, read and decoded once, with everything later stages need derived from it.
+
+    data holds the upload bytes (view() gives a zero-copy memoryview, e.g. for writing it
+    out) and image the decoded RGB image. The model tensor, the JPEG sent to Gemini and
+    the report images are computed from image on first use and kept, so the upload is
+    never read back from disk or decoded again.
+    """
+
+    def __init__(self, data, image, image_format, path=None):
+        self.data = data
+        self.image = image
+        self.format = image_format
+        self.path = path
+        self.sha256 = hashlib.sha256(data).hexdigest()
+        self.lock = threading.Lock()
+        self._tensors = {}
+        self._llm_jpeg = None
+        self._report_images = None
+
+    @property
+    def size(self):
+        return self.image.size
+
+    def view(self):
+        return memoryview(self.data)
+
+    def tensor(self, transform):
+        """transform(image), computed once per transform"""
+        with self.lock:
+            tensor = self._tensors.get(id(transform))
+            if tensor is None:
+                tensor = self._tensors[id(transform)] = transform(self.image)
+            return tensor
+
+    def llm_jpeg(self):
+        """The image as a JPEG no larger than LLM_MAX_SIDE on its longest side"""
+        with self.lock:
+            if self._llm_jpeg is None:
+                img = self.image
+                if max(img.size) > LLM_MAX_SIDE:
+                    img = img.copy()
+                    img.thumbnail((LLM_MAX_SIDE, LLM_MAX_SIDE), Image.LANCZOS)
+                self._llm_jpeg = encode_jpeg(img, quality=85)
+            return self._llm_jpeg
+
+    def llm_part(self):
+        """Inline image part for a Gemini prompt"""
+        return {"mime_type": "image/jpeg", "data": base64.b64encode(self.llm_jpeg()).decode('utf-8')}
+
+    def report_images(self):
+        with self.lock:
+            if self._report_images is None:
+                self._report_images = report_images(self.image)
+            return self._report_images
+
+
+def ingest_image(data, allowed_formats=('JPEG', 'PNG'), max_pixels=50_000_000, path=None):
+    """
+    Validate and decode uploaded image bytes.
+
+    :param allowed_formats: PIL format names accepted, checked against the content, not the filename
+    :param max_pixels: largest width * height accepted, checked before decoding
+    :param path: where the upload is (or will be) stored, if anywhere
+    :raises IngestError: if the bytes aren't an accepted image
+    """
+    if not data:
+        raise IngestError("The uploaded file is empty")
+    try:
+        img = Image.open(io.BytesIO(data))
+    except Exception:
+        raise IngestError("The uploaded file is not a readable image")
+
+    image_format = img.format
+    if image_format not in allowed_formats:
+        raise IngestError(f"Unsupported image format: {image_format or 'unknown'}")
+    width, height = img.size
+    if width * height > max_pixels:
+        raise IngestError(f"Image is too large ({width}x{height})")
+
+    try:
+        img = img.convert('RGB')
+    except Exception:
+        raise IngestError("The uploaded image could not be decoded")
+    return IngestedImage(data, img, image_format, path)
@@ -0,0 +1,169 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+
+
+_non_word = re.compile(r'[^\w\s]+')
+_spaces = re.compile(r'\s+')
+
+
+def normalize_prompt(text):
+    """Lowercase, drop punctuation and collapse whitespace, so trivial variants share a key"""
+    return _spaces.sub(' ', _non_word.sub(' ', text.lower())).strip()
+
+
+# Words a near-duplicate question may add, drop or reorder without changing its meaning
+STOPWORDS = frozenset((
+    'a', 'an', 'the', 'of', 'for', 'to', 'in', 'on', 'and', 'or', 'is', 'are', 'was', 'be',
+    'what', 'whats', 'which', 'how', 'do', 'does', 'can', 'could', 'i', 'my', 'me', 'you',
+    'please', 'tell', 'about', 'some', 'any', 'there'
+))
+
+
+def content_words(text):
+    """Words of normalized text that carry meaning, numbers included"""
+    return {word for word in text.split(' ') if word and word not in STOPWORDS}
+
+
+def shingles(text, n=3):
+    """Character n-grams of normalized text, the features near-duplicate lookups compare"""
+    padded = f" {text} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class _Entry:
+    __slots__ = ('route', 'text', 'response', 'expires_at', 'shingles')
+
+    def __init__(self, route, text, response, expires_at, grams):
+        self.route = route
+        self.text = text
+        self.response = response
+        self.expires_at = expires_at
+        self.shingles = grams
+
+
+class ResponseCache:
+    """
+    LLM answers keyed by route and normalized prompt, with a TTL and LRU eviction.
+
+    get() first looks for the exact normalized prompt. With similar=True it then looks for
+    a cached prompt whose character trigrams overlap enough (Jaccard similarity of at
+    least similarity_threshold), so "What are symptoms of pneumonia?" can be answered from
+    "what are the symptoms of pneumonia". Candidates come from an inverted index of
+    trigram -> entries, so only prompts that share trigrams are compared.
+
+    Trigram overlap alone would match "type 1 diabetes" with "type 2 diabetes", so a near
+    match also needs exactly the same content words (every word, number included, other
+    than STOPWORDS); otherwise it is a miss and the question goes to the LLM.
+
+    :param max_entries: entries kept before the least recently used one is evicted
+    :param ttl: seconds an answer stays valid
+    :param similarity_threshold: minimum Jaccard similarity for a near-duplicate hit
+    """
+
+    def __init__(self, max_entries=1024, ttl=3600, similarity_threshold=0.85, ngram=3):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.ngram = ngram
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        # (route, trigram) -> set of keys of the entries containing it
+        self.index = {}
+        # route -> counters
+        self.counters = {}
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(route, text):
+        return hashlib.sha256(f"{route}\0{text}".encode('utf-8')).hexdigest()
+
+    def _count(self, route, name):
+        counters = self.counters.setdefault(route, {'exact_hits': 0, 'similar_hits': 0, 'misses': 0})
+        counters[name] += 1
+
+    def get(self, route, prompt, similar=False):
+        """The cached answer for prompt on route, or None"""
+        text = normalize_prompt(prompt)
+        key = self.make_key(route, text)
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self._count(route, 'exact_hits')
+                return entry.response
+
+            if similar and self.similarity_threshold:
+                match = self._most_similar(route, text, shingles(text, self.ngram), now)
+                if match is not None:
+                    self.entries.move_to_end(match)
+                    self._count(route, 'similar_hits')
+                    return self.entries[match].response
+
+            self._count(route, 'misses')
+            return None
+
+    def _most_similar(self, route, text, grams, now):
+        words = content_words(text)
+        shared = {}
+        for gram in grams:
+            for key in self.index.get((route, gram), ()):
+                shared[key] = shared.get(key, 0) + 1
+
+        best, best_score = None, self.similarity_threshold
+        for key, common in shared.items():
+            entry = self.entries[key]
+            score = common / (len(grams) + len(entry.shingles) - common)
+            if score >= best_score and entry.expires_at > now and content_words(entry.text) == words:
+                best, best_score = key, score
+        return best
+
+    def put(self, route, prompt, response):
+        text = normalize_prompt(prompt)
+        key = self.make_key(route, text)
+        grams = shingles(text, self.ngram)
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = _Entry(route, text, response, time.time() + self.ttl, grams)
+            for gram in grams:
+                self.index.setdefault((route, gram), set()).add(key)
+            while len(self.entries) > self.max_entries:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        for gram in entry.shingles:
+            keys = self.index.get((entry.route, gram))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.index[(entry.route, gram)]
+
+    def stats(self):
+        with self.lock:
+            routes = {}
+            for route, counters in self.counters.items():
+                hits = counters['exact_hits'] + counters['similar_hits']
+                lookups = hits + counters['misses']
+                routes[route] = dict(counters, hit_rate=(hits / lookups) if lookups else 0.0)
+            return {
+                'entries': len(self.entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'similarity_threshold': self.similarity_threshold,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'routes': routes
+            }
@@ -0,0 +1,348 @@
+import hashlib
+import random
+import threading
+import time
+
+from llm_stream import gemini_text_stream
+
+
+class GatewayError(Exception):
+    """A Gemini call that was refused or failed after its retries"""
+
+
+class CircuitOpen(GatewayError):
+    pass
+
+
+class DeadlineExceeded(GatewayError):
+    pass
+
+
+class TokenBucket:
+    """Allows rate calls per second on average and bursts of up to burst calls"""
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self, deadline, sleep=time.sleep):
+        """Take a token, waiting for one until deadline (a clock() value)"""
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if now + wait > deadline:
+                return False
+            sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Stops calls to an upstream that keeps failing.
+
+    After failure_threshold consecutive failures the circuit opens and calls are refused
+    for reset_timeout seconds; then one trial call is let through (half-open), which
+    closes the circuit on success or opens it again on failure.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.trips = 0
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if self.clock() - self.opened_at < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+
+    def allow(self):
+        with self.lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self.trial_running:
+                self.trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def release_trial(self):
+        """Give up a half-open trial call that was never made or never finished"""
+        with self.lock:
+            self.trial_running = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_running or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self.trial_running:
+                    self.trips += 1
+                self.opened_at = self.clock()
+            self.trial_running = False
+
+
+class _Call:
+    """A call in flight, shared with identical calls that arrive while it runs"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _retryable(error):
+    # response.text raises ValueError when the answer was blocked (e.g. by the safety
+    # filters); asking again gets the same answer and the upstream is healthy
+    if isinstance(error, ValueError):
+        return False
+    # google.api_core errors carry the HTTP status; client errors other than
+    # timeouts and rate limiting won't succeed on a retry
+    code = getattr(error, 'code', None)
+    return not (isinstance(code, int) and 400 <= code < 500 and code not in (408, 429))
+
+
+def _request_options(deadline, now):
+    # The time left before the deadline, and no SDK-level retries: they would ignore the
+    # deadline and multiply with the gateway's own
+    return {'timeout': max(0.1, deadline - now), 'retry': None}
+
+
+def request_key(route, parts):
+    """Identity of a request for coalescing: the route and every prompt part"""
+    digest = hashlib.sha256(route.encode('utf-8'))
+    for part in parts if isinstance(parts, (list, tuple)) else [parts]:
+        if isinstance(part, dict):
+            part = f"{part.get('mime_type')}:{part.get('data')}"
+        digest.update(b'\0')
+        digest.update(str(part).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class LLMGateway:
+    """
+    The one way the app calls Gemini.
+
+    Each route (e.g. 'chat', 'report') has its own concurrency cap and deadline, so a slow
+    upstream ties up at most that many workers per route and never holds one past the
+    deadline. All routes share a token bucket that keeps the request rate under the API
+    quota. Failed calls are retried with exponential backoff and full jitter while the
+    deadline allows; identical calls made while one is in flight wait for its answer
+    instead of calling again. A circuit breaker refuses calls after repeated failures, and
+    callers can pass a fallback that is returned instead of an error.
+
+    Every wait (backoff, rate limit, a free slot, a coalesced call) goes through sleep, so
+    callers on an eventlet hub can pass one that yields to other green threads instead of
+    blocking them all.
+
+    :param model: object with Gemini's generate_content(contents, stream=..., request_options=...)
+    :param routes: route -> {'concurrency': int, 'deadline': seconds}
+    :param sleep: callable(seconds) used for every wait
+    :param clock: monotonic time source for deadlines, the token bucket and the circuit breaker
+    :param poll_interval: seconds between checks while waiting for a slot or a coalesced call
+    """
+
+    def __init__(self, model, routes, rate=5.0, burst=10, max_retries=2, backoff=0.5, max_backoff=8.0,
+                 failure_threshold=5, reset_timeout=30, sleep=time.sleep, clock=time.monotonic,
+                 poll_interval=0.02):
+        self.model = model
+        self.routes = routes
+        self.semaphores = {name: threading.BoundedSemaphore(route['concurrency']) for name, route in routes.items()}
+        self.bucket = TokenBucket(rate, burst, clock)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, clock)
+        self.sleep = sleep
+        self.clock = clock
+        self.poll_interval = poll_interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lock = threading.Lock()
+        self.inflight = {}
+        self.counters = {name: {
+            'calls': 0, 'succeeded': 0, 'failed': 0, 'retries': 0, 'coalesced': 0,
+            'rejected': 0, 'fallbacks': 0, 'in_flight': 0
+        } for name in routes}
+
+    def _count(self, route, name, delta=1):
+        with self.lock:
+            self.counters[route][name] += delta
+
+    def _wait(self, ready, deadline):
+        """Poll ready() until it returns True or deadline passes; returns whether it did"""
+        while not ready():
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                return False
+            self.sleep(min(self.poll_interval, remaining))
+        return True
+
+    def generate(self, route, contents, fallback=None, coalesce=True):
+        """
+        Text of Gemini's answer to contents, or fallback() if the call is refused or fails.
+
+        :raises GatewayError: when the call fails and there is no fallback
+        """
+        self._count(route, 'calls')
+        try:
+            if not coalesce:
+                return self._generate(route, contents)
+
+            key = request_key(route, contents)
+            with self.lock:
+                call = self.inflight.get(key)
+                leader = call is None
+                if leader:
+                    call = self.inflight[key] = _Call()
+            if not leader:
+                self._count(route, 'coalesced')
+                if not self._wait(call.done.is_set, self.clock() + self.routes[route]['deadline']):
+                    raise DeadlineExceeded(f"Gemini call for {route} timed out")
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            try:
+                call.result = self._generate(route, contents)
+                return call.result
+            except Exception as e:
+                call.error = e
+                raise
+            finally:
+                with self.lock:
+                    del self.inflight[key]
+                call.done.set()
+        except GatewayError as e:
+            if fallback is None:
+                raise
+            print(f"Using fallback for {route}: {str(e)}")
+            self._count(route, 'fallbacks')
+            return fallback()
+
+    def _admit(self, route, deadline):
+        """Breaker, concurrency slot and rate token for one call; returns a release function"""
+        if not self.breaker.allow():
+            self._count(route, 'rejected')
+            raise CircuitOpen("Gemini is unavailable, try again shortly")
+        semaphore = self.semaphores[route]
+        if not self._wait(lambda: semaphore.acquire(blocking=False), deadline):
+            # Never reached Gemini, so it says nothing about the upstream
+            self.breaker.release_trial()
+            self._count(route, 'rejected')
+            raise DeadlineExceeded(f"Too many {route} requests in progress")
+        if not self.bucket.acquire(deadline, sleep=self.sleep):
+            semaphore.release()
+            self.breaker.release_trial()
+            self._count(route, 'rejected')
+            raise DeadlineExceeded(f"Gemini rate limit reached for {route}")
+        self._count(route, 'in_flight')
+
+        def release():
+            self._count(route, 'in_flight', -1)
+            semaphore.release()
+        return release
+
+    def _generate(self, route, contents):
+        deadline = self.clock() + self.routes[route]['deadline']
+        attempt = 0
+        while True:
+            release = self._admit(route, deadline)
+            try:
+                response = self.model.generate_content(contents,
+                                                       request_options=_request_options(deadline, self.clock()))
+                text = response.text
+            except BaseException as e:
+                release()
+                if not isinstance(e, Exception):
+                    # Interrupted, not failed
+                    self.breaker.release_trial()
+                    raise
+                retryable = _retryable(e)
+                if retryable:
+                    self.breaker.record_failure()
+                else:
+                    # The request is at fault, not the upstream
+                    self.breaker.record_success()
+                delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                if not retryable or attempt >= self.max_retries or self.clock() + delay >= deadline:
+                    self._count(route, 'failed')
+                    raise GatewayError(f"Gemini call for {route} failed: {str(e)}") from e
+                print(f"Gemini call for {route} failed ({str(e)}), retrying in {delay:.2f}s")
+                self._count(route, 'retries')
+                attempt += 1
+                self.sleep(delay)
+                continue
+
+            release()
+            self.breaker.record_success()
+            self._count(route, 'succeeded')
+            return text
+
+    def stream(self, route, contents):
+        """
+        Yield text chunks as Gemini produces them, under the route's limits.
+
+        Streams aren't retried or coalesced, since part of the answer may already have
+        reached the client. Closing the generator cancels the upstream request.
+        """
+        self._count(route, 'calls')
+        deadline = self.clock() + self.routes[route]['deadline']
+        release = self._admit(route, deadline)
+        chunks = gemini_text_stream(self.model, contents, request_options=_request_options(deadline, self.clock()))
+        settled = False
+        try:
+            for text in chunks:
+                yield text
+            self.breaker.record_success()
+            settled = True
+            self._count(route, 'succeeded')
+        except GeneratorExit:
+            raise
+        except Exception as e:
+            if _retryable(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            settled = True
+            self._count(route, 'failed')
+            raise GatewayError(f"Gemini stream for {route} failed: {str(e)}") from e
+        finally:
+            # A stream the client closed early ends a half-open trial without a verdict
+            if not settled:
+                self.breaker.release_trial()
+            chunks.close()
+            release()
+
+    def stats(self):
+        with self.lock:
+            routes = {name: dict(counters, concurrency=self.routes[name]['concurrency'],
+                                 deadline=self.routes[name]['deadline'])
+                      for name, counters in self.counters.items()}
+        return {
+            'routes': routes,
+            'circuit': self.breaker.state,
+            'circuit_trips': self.breaker.trips,
+            'rate_per_second': self.bucket.rate,
+            'burst': self.bucket.burst
+        }
+
@@ -0,0 +1,86 @@
+import json
+import time
+
+
+def sse_event(data, event=None):
+    """One server-sent event carrying data as JSON"""
+    lines = []
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return '\n'.join(lines) + '\n\n'
+
+
+def _cancel_upstream(response):
+    """Abort a streaming generate_content call that hasn't finished, where the SDK allows it"""
+    # Relies on a private attribute of google-generativeai 0.8.x: GenerateContentResponse
+    # keeps the underlying stream on _iterator, which is a gRPC call with cancel() or, with
+    # the REST transport, a generator with close(). Any of these may change in another
+    # SDK version; then the request is left to finish upstream and nothing breaks here.
+    stream = getattr(response, '_iterator', None)
+    for method in ('cancel', 'close'):
+        stop = getattr(stream, method, None)
+        if callable(stop):
+            try:
+                stop()
+            except Exception as e:
+                print(f"Could not cancel Gemini stream: {str(e)}")
+            return True
+    print("Could not cancel Gemini stream: not supported by this SDK version")
+    return False
+
+
+def gemini_text_stream(model, prompt, request_options=None):
+    """
+    Yield the text of a Gemini answer chunk by chunk as the API produces it.
+
+    Closing the generator early (e.g. the HTTP client went away) cancels the request.
+    """
+    response = model.generate_content(prompt, stream=True, request_options=request_options)
+    finished = False
+    try:
+        for chunk in response:
+            text = getattr(chunk, 'text', '')
+            if text:
+                yield text
+        finished = True
+    finally:
+        if not finished:
+            _cancel_upstream(response)
+
+
+def fake_text_stream(text, chunk_words=3, delay=0.05, sleep=time.sleep):
+    """Local stand-in for gemini_text_stream that yields text a few words at a time"""
+    words = text.split(' ')
+    for start in range(0, len(words), chunk_words):
+        if delay:
+            sleep(delay)
+        yield ' '.join(words[start:start + chunk_words]) + (' ' if start + chunk_words < len(words) else '')
+
+
+def sse_text_stream(chunks, on_complete=None):
+    """
+    Server-sent events for a text stream: a 'chunk' event per piece of text, then 'done'
+    (with on_complete(full_text) merged in, if given) or 'error'.
+
+    If the client disconnects, the server closes this generator, which closes chunks and
+    with it the upstream request.
+    """
+    parts = []
+    try:
+        for text in chunks:
+            parts.append(text)
+            yield sse_event({'text': text}, event='chunk')
+        done = {'chars': sum(len(p) for p in parts)}
+        if on_complete is not None:
+            done.update(on_complete(''.join(parts)))
+        yield sse_event(done, event='done')
+    except GeneratorExit:
+        raise
+    except Exception as e:
+        print(f"Error while streaming response: {str(e)}")
+        yield sse_event({'error': str(e)}, event='error')
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
@@ -0,0 +1,187 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; from a cache lookup (~1 ms) to a slow Gemini report (~1 min)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _escape_help(text):
+    """HELP text escapes only backslashes and newlines"""
+    return str(text).replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonic count per label values, e.g. errors per Socket.IO event"""
+    kind = 'counter'
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def inc(self, *labels, amount=1):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        with self.lock:
+            values = dict(self.values)
+        return [(self.name, _labels(self.labelnames, labels), value) for labels, value in values.items()]
+
+
+class Histogram:
+    """
+    Distribution of observed values per label values.
+
+    Only a bucket count, a sum and a count are updated per observation, under one lock;
+    buckets are made cumulative when rendered.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.lock = threading.Lock()
+        # label values -> [per-bucket counts (last one is +Inf), sum, count]
+        self.values = {}
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.values.get(labels)
+            if series is None:
+                series = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self):
+        with self.lock:
+            values = {labels: (list(counts), total, count) for labels, (counts, total, count) in self.values.items()}
+        samples = []
+        for labels, (counts, total, count) in values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                samples.append((f"{self.name}_bucket",
+                                _labels(self.labelnames, labels, f'le="{_number(bound)}"'), cumulative))
+            samples.append((f"{self.name}_sum", _labels(self.labelnames, labels), total))
+            samples.append((f"{self.name}_count", _labels(self.labelnames, labels), count))
+        return samples
+
+
+class CallbackMetric:
+    """
+    Values read from elsewhere when metrics are scraped, e.g. queue depths or cache hits
+    already counted by a component's stats(). Costs nothing between scrapes.
+
+    :param fn: callable returning a number, or {label values tuple: number} with labelnames
+    :param kind: 'gauge' or 'counter'
+    """
+
+    def __init__(self, name, help, fn, kind='gauge', labelnames=()):
+        self.name = name
+        self.help = help
+        self.fn = fn
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+
+    def samples(self):
+        values = self.fn()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [(self.name, _labels(self.labelnames, labels), value)
+                for labels, value in values.items() if value is not None]
+
+
+class MetricsRegistry:
+    """The app's metrics, rendered for Prometheus by render()"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = []
+
+    def _add(self, metric):
+        with self.lock:
+            self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self._add(Counter(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._add(Histogram(name, help, labelnames, buckets))
+
+    def callback(self, name, help, fn, kind='gauge', labelnames=()):
+        return self._add(CallbackMetric(name, help, fn, kind, labelnames))
+
+    def render(self):
+        with self.lock:
+            metrics = list(self.metrics)
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                print(f"Error collecting metric {metric.name}: {str(e)}")
+                continue
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(f"{name}{labels} {_number(value)}" for name, labels, value in samples)
+        return '\n'.join(lines) + '\n'
+
+
+class StageTimer:
+    """
+    Times the stages of one request into a histogram labelled (route, stage, model).
+
+        timer = StageTimer(stage_seconds, 'predict')
+        with timer.stage('decode'):
+            ...
+
+    model can be set once it is known; stages timed before that are recorded without it.
+    """
+
+    def __init__(self, histogram, route, model=''):
+        self.histogram = histogram
+        self.route = route
+        self.model = model
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram.observe(time.perf_counter() - started, self.route, name, self.model)
+
+    def record(self, name, seconds):
+        """Record a stage timed elsewhere, e.g. from a job's timestamps"""
+        self.histogram.observe(seconds, self.route, name, self.model)
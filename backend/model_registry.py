@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+def model_size_bytes(model):
+    """Resident size of a model's parameters and buffers"""
+    size = 0
+    for collection in ('parameters', 'buffers'):
+        tensors = getattr(model, collection, None)
+        if tensors is None:
+            continue
+        try:
+            size += sum(t.numel() * t.element_size() for t in tensors())
+        except Exception:
+            pass
+    return size
+
+
+class _Entry:
+    __slots__ = ('model', 'size', 'load_seconds', 'loaded_at', 'hits')
+
+    def __init__(self, model, size, load_seconds):
+        self.model = model
+        self.size = size
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self.hits = 0
+
+
+class _Flight:
+    """A load in progress that other callers can wait on"""
+    __slots__ = ('done', 'model', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.model = None
+        self.error = None
+
+
+class ModelRegistry:
+    """
+    Lazily loaded models kept within a memory budget.
+
+    Concurrent first requests for a model share a single load. Once the resident size of
+    all loaded models exceeds the budget, least recently used models are evicted; pinned
+    models are never evicted.
+
+    :param loader: callable(model_key) -> model, raising on failure
+    :param memory_budget_bytes: maximum resident size, or None for no limit
+    :param pinned: model keys that stay resident once loaded
+    :param size_fn: callable(model_key, model) -> resident bytes
+    """
+
+    def __init__(self, loader, memory_budget_bytes=None, pinned=(), size_fn=None):
+        self.loader = loader
+        self.memory_budget_bytes = memory_budget_bytes
+        self.pinned = set(pinned)
+        self.size_fn = size_fn or (lambda key, model: model_size_bytes(model))
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.inflight = {}
+        self.loads = 0
+        self.evictions = 0
+        self.failures = 0
+
+    def get(self, model_key):
+        """Return the model for model_key, loading it at most once across threads"""
+        with self.lock:
+            entry = self.entries.get(model_key)
+            if entry is not None:
+                self.entries.move_to_end(model_key)
+                entry.hits += 1
+                return entry.model
+
+            flight = self.inflight.get(model_key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self.inflight[model_key] = flight
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.model
+
+        started = time.time()
+        try:
+            model = self.loader(model_key)
+            size = self.size_fn(model_key, model)
+        except Exception as e:
+            with self.lock:
+                self.failures += 1
+                del self.inflight[model_key]
+            flight.error = e
+            flight.done.set()
+            raise
+
+        with self.lock:
+            self.entries[model_key] = _Entry(model, size, time.time() - started)
+            self.loads += 1
+            del self.inflight[model_key]
+            self._enforce_budget(keep=model_key)
+        flight.model = model
+        flight.done.set()
+        return model
+
+    def is_loaded(self, model_key):
+        with self.lock:
+            return model_key in self.entries
+
+    def pin(self, model_key):
+        with self.lock:
+            self.pinned.add(model_key)
+
+    def unpin(self, model_key):
+        with self.lock:
+            self.pinned.discard(model_key)
+            self._enforce_budget()
+
+    def evict(self, model_key):
+        """Drop a model so that the next request reloads it"""
+        with self.lock:
+            return self.entries.pop(model_key, None) is not None
+
+    def resident_bytes(self):
+        with self.lock:
+            return sum(e.size for e in self.entries.values())
+
+    def _enforce_budget(self, keep=None):
+        if self.memory_budget_bytes is None:
+            return
+        total = sum(e.size for e in self.entries.values())
+        for key in list(self.entries):
+            if total <= self.memory_budget_bytes:
+                break
+            if key == keep or key in self.pinned:
+                continue
+            total -= self.entries.pop(key).size
+            self.evictions += 1
+            print(f"Evicted model {key} to stay within the memory budget")
+        if total > self.memory_budget_bytes:
+            print(f"Loaded models use {total / 2**20:.1f}MB, over the {self.memory_budget_bytes / 2**20:.1f}MB budget")
+
+    def stats(self):
+        with self.lock:
+            return {
+                'memory_budget_bytes': self.memory_budget_bytes,
+                'resident_bytes': sum(e.size for e in self.entries.values()),
+                'loads': self.loads,
+                'evictions': self.evictions,
+                'failures': self.failures,
+                'loading': sorted(self.inflight),
+                'models': {
+                    key: {
+                        'resident_bytes': e.size,
+                        'load_seconds': round(e.load_seconds, 3),
+                        'loaded_at': e.loaded_at,
+                        'hits': e.hits,
+                        'pinned': key in self.pinned
+                    }
+                    for key, e in self.entries.items()
+                }
+            }
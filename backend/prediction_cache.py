@@ -0,0 +1,222 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+_checksum_lock = threading.Lock()
+_checksum_memo = {}
+
+
+def weights_checksum(path):
+    """
+    SHA-256 of a weights file.
+
+    The digest is memoized against the file's size and mtime, so it is only recomputed
+    when the file on disk actually changes.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 'missing'
+
+    stamp = (st.st_size, st.st_mtime_ns)
+    with _checksum_lock:
+        memo = _checksum_memo.get(path)
+        if memo and memo[0] == stamp:
+            return memo[1]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    checksum = digest.hexdigest()
+
+    with _checksum_lock:
+        _checksum_memo[path] = (stamp, checksum)
+    return checksum
+
+
+class PredictionCache:
+    """
+    Two-tier cache of prediction results keyed by (image SHA-256, model key, weights checksum).
+
+    Entries hold the prediction result, the Gemini report text and the PDF path. The memory
+    tier is an LRU of max_memory_entries entries; the disk tier stores one JSON file per entry
+    under directory, named <model key>.<key>.json, and evicts least recently used files once
+    it grows past max_disk_bytes.
+    """
+
+    def __init__(self, directory, max_memory_entries=512, max_disk_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.lock = threading.RLock()
+        self.memory = OrderedDict()
+        # key -> (file size, model key), ordered from least to most recently used
+        self.disk_index = OrderedDict()
+        self.disk_bytes = 0
+        # model_key -> weights checksum the cached entries were computed with
+        self.model_versions = {}
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_disk_index()
+
+    @staticmethod
+    def make_key(image_sha256, model_key, weights_sum):
+        return hashlib.sha256(f"{image_sha256}:{model_key}:{weights_sum}".encode('utf-8')).hexdigest()
+
+    def _path(self, key, model_key=None):
+        if model_key is None:
+            model_key = self.disk_index[key][1]
+        # Files written before model keys were part of the name have none
+        name = f"{model_key}.{key}.json" if model_key else f"{key}.json"
+        return os.path.join(self.directory, name)
+
+    def _load_disk_index(self):
+        """Rebuild the on-disk LRU order from file modification times"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            model_key, _, key = name[:-len('.json')].rpartition('.')
+            entries.append((st.st_mtime, key, st.st_size, model_key))
+
+        for _, key, size, model_key in sorted(entries):
+            self.disk_index[key] = (size, model_key)
+            self.disk_bytes += size
+
+    def check_model_version(self, model_key, weights_sum):
+        """
+        Drop every entry for model_key if its weights have changed since they were cached;
+        returns True when they had.
+        """
+        with self.lock:
+            previous = self.model_versions.get(model_key)
+            self.model_versions[model_key] = weights_sum
+            if previous is None or previous == weights_sum:
+                return False
+
+            print(f"Weights for {model_key} changed, invalidating cached predictions")
+            self.invalidations += 1
+            for key in [k for k, e in self.memory.items() if e.get('model_key') == model_key]:
+                del self.memory[key]
+            for key in [k for k, (_, m) in self.disk_index.items() if m == model_key]:
+                self._remove_disk(key)
+            return True
+
+    def get(self, key):
+        """Return the cached entry for key, or None"""
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory.move_to_end(key)
+                self.memory_hits += 1
+                # Callers add request-specific fields to what they get; keep them out of the cache
+                return copy.deepcopy(entry)
+
+            if key in self.disk_index:
+                entry = self._read_disk(key)
+                if entry is not None:
+                    self.disk_index.move_to_end(key)
+                    try:
+                        os.utime(self._path(key))
+                    except OSError:
+                        pass
+                    self._remember(key, entry)
+                    self.disk_hits += 1
+                    return copy.deepcopy(entry)
+                self._remove_disk(key)
+
+            self.misses += 1
+            return None
+
+    def put(self, key, entry):
+        """Store an entry in both tiers"""
+        with self.lock:
+            # A copy, like the disk tier, so later changes to the caller's objects aren't cached
+            self._remember(key, copy.deepcopy(entry))
+            self._write_disk(key, entry)
+
+    def update(self, key, **fields):
+        """Merge fields into an existing entry, e.g. once its report has been generated"""
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is None and key in self.disk_index:
+                entry = self._read_disk(key)
+            if entry is None:
+                return
+            entry = dict(entry, **copy.deepcopy(fields))
+            self._remember(key, entry)
+            self._write_disk(key, entry)
+
+    def _remember(self, key, entry):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def _read_disk(self, key):
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, entry):
+        model_key = entry.get('model_key') or ''
+        if key in self.disk_index and self.disk_index[key][1] != model_key:
+            self._remove_disk(key)
+        path = self._path(key, model_key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"Error writing prediction cache entry: {str(e)}")
+            return
+
+        self.disk_bytes += size - self.disk_index.pop(key, (0, None))[0]
+        self.disk_index[key] = (size, model_key)
+        while self.disk_bytes > self.max_disk_bytes and len(self.disk_index) > 1:
+            oldest = next(iter(self.disk_index))
+            self._remove_disk(oldest)
+            self.evictions += 1
+
+    def _remove_disk(self, key):
+        if key not in self.disk_index:
+            return
+        path = self._path(key)
+        self.disk_bytes -= self.disk_index.pop(key)[0]
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self):
+        with self.lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': ((self.memory_hits + self.disk_hits) / lookups) if lookups else 0.0,
+                'memory_entries': len(self.memory),
+                'disk_entries': len(self.disk_index),
+                'disk_bytes': self.disk_bytes,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
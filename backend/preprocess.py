@@ -0,0 +1,139 @@
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+
+
+# torchvision's ImageNet statistics, as used by test_transform
+IMAGENET_MEAN = (0.485, 0.456, 0.406)
+IMAGENET_STD = (0.229, 0.224, 0.225)
+
+
+def tolerance(std=IMAGENET_STD):
+    """
+    Largest difference from test_transform the fast path is allowed.
+
+    Both resize with antialiased bilinear filtering, but PIL and torch round the 8-bit
+    result independently, so a pixel can differ by one level; after normalization that is
+    1 / (255 * std) for the channel with the smallest std (about 0.0175 for ImageNet).
+    """
+    return 1.0 / (255 * min(std)) + 1e-5
+
+
+class Preprocessor:
+    """
+    Tensor replacement for test_transform (Resize, ToTensor, Normalize).
+
+    The decoded image is resized as a uint8 tensor with antialiased bilinear
+    interpolation, and ToTensor's / 255 is folded with Normalize into one multiply-add:
+    x * (1 / (255 * std)) - mean / std. That skips the float image PIL would produce and
+    the separate scale and normalize passes. Output matches test_transform to within
+    tolerance(); see main() to check it on a folder of images.
+
+    Calling it on a PIL image gives one (3, H, W) float tensor, like test_transform.
+    For batches, resize() each image (e.g. in worker threads) and pass the uint8 results
+    to batch(), which copies them into a preallocated uint8 buffer and normalizes the
+    whole batch in one op into a preallocated float buffer (pinned when feeding a GPU).
+    Buffers are per thread and reused, so a batch is only valid until the same thread
+    calls batch() again.
+    """
+
+    def __init__(self, size=(224, 224), mean=IMAGENET_MEAN, std=IMAGENET_STD, device=None):
+        self.size = tuple(size)
+        self.device = torch.device(device or 'cpu')
+        std = torch.tensor(std, dtype=torch.float32).view(3, 1, 1)
+        mean = torch.tensor(mean, dtype=torch.float32).view(3, 1, 1)
+        self.scale = 1.0 / (255.0 * std)
+        self.shift = -mean / std
+        self.pin_memory = self.device.type == 'cuda'
+        self.local = threading.local()
+
+    def resize(self, img):
+        """PIL image -> (3, H, W) uint8 tensor at self.size"""
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        # HWC array viewed as NCHW is channels-last, which is what the uint8 kernel wants
+        pixels = torch.from_numpy(np.array(img)).permute(2, 0, 1).unsqueeze(0)
+        if pixels.shape[-2:] != self.size:
+            pixels = F.interpolate(pixels, size=self.size, mode='bilinear', antialias=True, align_corners=False)
+        return pixels[0]
+
+    def normalize(self, pixels, out=None):
+        """uint8 (..., 3, H, W) -> normalized float, in one fused multiply-add"""
+        if out is None:
+            out = torch.empty(pixels.shape, dtype=torch.float32)
+        out.copy_(pixels)
+        return torch.addcmul(self.shift, out, self.scale, out=out)
+
+    def __call__(self, img):
+        return self.normalize(self.resize(img))
+
+    def _buffers(self, count):
+        """This thread's uint8 and float batch buffers, grown to at least count images"""
+        buffers = getattr(self.local, 'buffers', None)
+        if buffers is None or buffers[0].shape[0] < count:
+            shape = (count, 3) + self.size
+            buffers = (torch.empty(shape, dtype=torch.uint8),
+                       torch.empty(shape, dtype=torch.float32, pin_memory=self.pin_memory))
+            self.local.buffers = buffers
+        return buffers
+
+    def batch(self, resized):
+        """Normalized (N, 3, H, W) batch on self.device from resize() outputs"""
+        pixels, floats = self._buffers(len(resized))
+        pixels, floats = pixels[:len(resized)], floats[:len(resized)]
+        for i, image in enumerate(resized):
+            pixels[i].copy_(image)
+        self.normalize(pixels, out=floats)
+        return floats.to(self.device, non_blocking=self.pin_memory)
+
+
+def main():
+    """Compare Preprocessor with test_transform on sample images: max difference and speed"""
+    from PIL import Image
+    from torchvision import transforms
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--samples', required=True, help='folder of images')
+    parser.add_argument('--limit', type=int, default=64)
+    parser.add_argument('--batch-size', type=int, default=16)
+    args = parser.parse_args()
+
+    reference = transforms.Compose([
+        transforms.Resize((224, 224)),
+        transforms.ToTensor(),
+        transforms.Normalize(mean=IMAGENET_MEAN, std=IMAGENET_STD)
+    ])
+    preprocessor = Preprocessor()
+
+    names = sorted(n for n in os.listdir(args.samples) if n.lower().endswith(('.png', '.jpg', '.jpeg')))
+    images = [Image.open(os.path.join(args.samples, n)).convert('RGB') for n in names[:args.limit]]
+    if not images:
+        parser.error(f"no images in {args.samples}")
+
+    worst = 0.0
+    for img in images:
+        worst = max(worst, (reference(img) - preprocessor(img)).abs().max().item())
+    print(f"{len(images)} images, max abs difference {worst:.5f} (tolerance {tolerance():.5f})")
+
+    started = time.perf_counter()
+    torch.stack([reference(img) for img in images])
+    reference_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for start in range(0, len(images), args.batch_size):
+        preprocessor.batch([preprocessor.resize(img) for img in images[start:start + args.batch_size]])
+    fast_time = time.perf_counter() - started
+
+    print(f"test_transform: {len(images) / reference_time:.1f} images/s")
+    print(f"Preprocessor:   {len(images) / fast_time:.1f} images/s")
+    if worst > tolerance():
+        raise SystemExit("difference exceeds tolerance")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+import threading
+import time
+
+
+def presence_room(user_id):
+    """Socket.IO room of the sockets following a user's status"""
+    return f"presence:{user_id}"
+
+
+class PresenceService:
+    """
+    Online/offline status with coalesced, batched and targeted broadcasts.
+
+    Status changes are buffered per user and flushed every flush_interval seconds, so a
+    user who flaps between states within one interval produces at most one change. A
+    user whose last socket disconnects only goes offline after offline_grace seconds
+    without reconnecting, which absorbs reconnect storms (e.g. after a deploy). Each
+    change is sent as 'user_status_change' to the user's presence room only, i.e. to the
+    sockets that subscribed to that user, instead of to every connected client.
+
+    :param socketio: Flask-SocketIO instance used to emit and run the flush loop
+    :param presence_store: socket id -> user id store (see realtime.py)
+    :param user_directory: where the status column is persisted
+    :param on_change: optional callable(user_id, status) run after a change is applied
+    """
+
+    def __init__(self, socketio, presence_store, user_directory, flush_interval=1.0, offline_grace=5.0,
+                 on_change=None):
+        self.socketio = socketio
+        self.presence_store = presence_store
+        self.user_directory = user_directory
+        self.on_change = on_change
+        self.flush_interval = flush_interval
+        self.offline_grace = offline_grace
+        self.lock = threading.Lock()
+        # user_id -> (status, time of the change, whether it waits out the grace period)
+        self.pending = {}
+        self.started = False
+        self.flushes = 0
+        self.changes_sent = 0
+        self.changes_coalesced = 0
+
+    def start(self):
+        """Start the flush loop on first use, so importing the app doesn't spawn it"""
+        with self.lock:
+            if self.started:
+                return
+            self.started = True
+        self.socketio.start_background_task(self._run)
+
+    def _run(self):
+        while True:
+            self.socketio.sleep(self.flush_interval)
+            try:
+                self.presence_store.refresh()
+                self.flush()
+            except Exception as e:
+                print(f"Presence flush failed: {str(e)}")
+
+    def _mark(self, user_id, status, grace=False):
+        self.start()
+        with self.lock:
+            if user_id in self.pending:
+                self.changes_coalesced += 1
+            self.pending[user_id] = (status, time.time(), grace)
+
+    def connect(self, sid, user_id):
+        """A socket identified as user_id; returns the user's number of open sockets"""
+        # The loop also refreshes this node's presence keys, which must outlive its sockets
+        self.start()
+        connections = self.presence_store.add(sid, user_id)
+        if connections == 1:
+            self._mark(user_id, 'online')
+        return connections
+
+    def disconnect(self, sid):
+        """A socket closed; the user goes offline once all their sockets stay closed"""
+        user_id, remaining = self.presence_store.remove(sid)
+        if user_id and remaining == 0:
+            self._mark(user_id, 'offline', grace=True)
+        return user_id
+
+    def set_status(self, user_id, status):
+        """Explicit status change, e.g. on login or logout"""
+        self._mark(user_id, status)
+
+    def is_online(self, user_id):
+        return self.presence_store.is_online(user_id)
+
+    def snapshot(self, user_ids):
+        """Current status of each user, for a client that just subscribed"""
+        users = self.user_directory.get_many(user_ids)
+        return {uid: users[uid].get('status', 'offline') for uid in user_ids if uid in users}
+
+    def flush(self):
+        """Persist and broadcast the changes that are due; returns the number sent"""
+        now = time.time()
+        with self.lock:
+            due = {}
+            for user_id, (status, changed_at, grace) in list(self.pending.items()):
+                if grace and now - changed_at < self.offline_grace:
+                    continue
+                due[user_id] = (status, changed_at, grace)
+                del self.pending[user_id]
+            self.flushes += 1
+
+        if not due:
+            return 0
+
+        current = self.user_directory.get_many(due)
+        sent = 0
+        for user_id, (status, changed_at, grace) in due.items():
+            # Reconnected during the grace period, possibly on another server
+            if grace and self.presence_store.is_online(user_id):
+                status = 'online'
+            user = current.get(user_id)
+            if user is None or user.get('status', 'offline') == status:
+                with self.lock:
+                    self.changes_coalesced += 1
+                continue
+
+            self.user_directory.update(user_id, status=status)
+            self.socketio.emit('user_status_change', {
+                'user_id': user_id,
+                'status': status,
+                'changed_at': changed_at
+            }, room=presence_room(user_id))
+            sent += 1
+            if self.on_change is not None:
+                self.on_change(user_id, status)
+
+        with self.lock:
+            self.changes_sent += sent
+        return sent
+
+    def stats(self):
+        with self.lock:
+            stats = {
+                'pending': len(self.pending),
+                'flushes': self.flushes,
+                'changes_sent': self.changes_sent,
+                'changes_coalesced': self.changes_coalesced,
+                'flush_interval': self.flush_interval,
+                'offline_grace': self.offline_grace
+            }
+        stats['connections'] = self.presence_store.stats()
+        return stats
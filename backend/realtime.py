@@ -0,0 +1,372 @@
+import inspect
+import pickle
+import queue
+import threading
+import time
+import uuid
+from functools import wraps
+
+import socketio
+from flask_socketio import SocketIO
+
+try:
+    import redis
+except ImportError:  # Only needed for a Redis message queue or presence store
+    redis = None
+
+
+class InProcessPubSubManager(socketio.PubSubManager):
+    """
+    Socket.IO message queue for several servers living in one process.
+
+    Behaves like the Redis/Kombu managers (messages published on a channel reach every
+    server listening on it) without a broker, so multi-node delivery can be exercised in
+    tests and local runs. Select it with SOCKETIO_MESSAGE_QUEUE=memory://<channel>.
+    """
+    name = 'memory'
+
+    _channels = {}
+    _channels_lock = threading.Lock()
+
+    def _publish(self, data):
+        # Serialize like a real broker would, so receivers never share objects with the sender
+        payload = pickle.dumps(data)
+        with self._channels_lock:
+            subscribers = list(self._channels.get(self.channel, ()))
+        for queue in subscribers:
+            queue.put(payload)
+
+    def _listen(self):
+        queue = self.server.eio.create_queue()
+        with self._channels_lock:
+            self._channels.setdefault(self.channel, []).append(queue)
+        while True:
+            yield pickle.loads(queue.get())
+
+
+def socketio_queue_options(url, channel='flask-socketio'):
+    """
+    Keyword arguments for SocketIO() that connect it to the message queue at url.
+
+    redis://, kafka://, zmq+ and kombu URLs go to Flask-SocketIO's own managers;
+    memory://<channel> uses InProcessPubSubManager. No URL means a single node.
+    """
+    if not url:
+        return {}
+    if url.startswith('memory://'):
+        return {'client_manager': InProcessPubSubManager(channel=url[len('memory://'):] or channel)}
+    return {'message_queue': url, 'channel': channel}
+
+
+class InstrumentedSocketIO(SocketIO):
+    """
+    SocketIO that times every event handler registered with on().
+
+    :param event_seconds: histogram labelled (event,) that receives handler durations
+    :param event_errors: counter labelled (event,) incremented when a handler raises
+    """
+
+    def __init__(self, app=None, event_seconds=None, event_errors=None, **kwargs):
+        self.event_seconds = event_seconds
+        self.event_errors = event_errors
+        super().__init__(app, **kwargs)
+
+    def on(self, message, namespace=None):
+        register = super().on(message, namespace)
+        if self.event_seconds is None:
+            return register
+
+        def decorator(handler):
+            # Connect and disconnect handlers are called with auth / a reason and called
+            # again without it on TypeError; call ones that take no arguments without it
+            try:
+                takes_args = bool(inspect.signature(handler).parameters)
+            except (TypeError, ValueError):
+                takes_args = True
+
+            @wraps(handler)
+            def timed(*args):
+                if message in ('connect', 'disconnect') and not takes_args:
+                    args = ()
+                started = time.perf_counter()
+                try:
+                    return handler(*args)
+                except Exception:
+                    if self.event_errors is not None:
+                        self.event_errors.inc(message)
+                    raise
+                finally:
+                    self.event_seconds.observe(time.perf_counter() - started, message)
+
+            register(timed)
+            return handler
+        return decorator
+
+
+def on_hub(socketio):
+    """Whether the calling code runs on eventlet's hub thread (green threads without monkey patching)"""
+    return socketio.async_mode == 'eventlet' and threading.current_thread() is threading.main_thread()
+
+
+def cooperative_sleep(socketio):
+    """
+    sleep(seconds) for code that runs both on the hub and on real OS threads: on the hub it
+    lets other green threads run meanwhile, elsewhere it only blocks the calling thread.
+    """
+    def sleep(seconds):
+        if on_hub(socketio):
+            socketio.sleep(seconds)
+        else:
+            time.sleep(seconds)
+    return sleep
+
+
+class EmitRelay:
+    """
+    Sends Socket.IO events for code running on real OS threads (e.g. the report workers).
+
+    Without monkey patching, eventlet's hub and green threads all live on the main thread
+    and must not be touched from another one. emit() called elsewhere queues the event,
+    and a background task on the hub sends queued events every interval seconds. Emits
+    from the main thread, or with any other async mode, go straight out.
+    """
+
+    def __init__(self, socketio, interval=0.05):
+        self.socketio = socketio
+        self.interval = interval
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.started = False
+
+    def _relayed(self):
+        return self.socketio.async_mode == 'eventlet' and not on_hub(self.socketio)
+
+    def start(self):
+        """Start the relay loop; call from the hub (e.g. a request handler), not a worker thread"""
+        if self._relayed():
+            return
+        with self.lock:
+            if self.started:
+                return
+            self.started = True
+        self.socketio.start_background_task(self._run)
+
+    def _run(self):
+        while True:
+            self.socketio.sleep(self.interval)
+            while True:
+                try:
+                    args, kwargs = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    self.socketio.emit(*args, **kwargs)
+                except Exception as e:
+                    print(f"Error relaying {args[0]}: {str(e)}")
+
+    def emit(self, *args, **kwargs):
+        if self._relayed():
+            self.queue.put((args, kwargs))
+        else:
+            self.socketio.emit(*args, **kwargs)
+
+
+class LocalPresenceStore:
+    """Socket id -> user id for the sockets of this process, with a connection count per user"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sids = {}
+        self.connections = {}
+
+    def add(self, sid, user_id):
+        """Record a socket for user_id; returns the user's number of open sockets"""
+        with self.lock:
+            previous = self.sids.get(sid)
+            if previous == user_id:
+                return self.connections[user_id]
+            if previous is not None:
+                self._release(previous)
+            self.sids[sid] = user_id
+            self.connections[user_id] = self.connections.get(user_id, 0) + 1
+            return self.connections[user_id]
+
+    def remove(self, sid):
+        """Forget a socket; returns (user_id or None, the user's remaining open sockets)"""
+        with self.lock:
+            user_id = self.sids.pop(sid, None)
+            if user_id is None:
+                return None, 0
+            return user_id, self._release(user_id)
+
+    def _release(self, user_id):
+        remaining = self.connections.get(user_id, 1) - 1
+        if remaining > 0:
+            self.connections[user_id] = remaining
+        else:
+            self.connections.pop(user_id, None)
+        return max(remaining, 0)
+
+    def user_for(self, sid):
+        with self.lock:
+            return self.sids.get(sid)
+
+    def is_online(self, user_id):
+        with self.lock:
+            return user_id in self.connections
+
+    def online_user_ids(self):
+        with self.lock:
+            return set(self.connections)
+
+    def refresh(self):
+        """Nothing to keep alive outside this process"""
+
+    def stats(self):
+        with self.lock:
+            return {'backend': 'local', 'sockets': len(self.sids), 'users': len(self.connections)}
+
+
+class RedisPresenceStore:
+    """
+    Presence shared by every node through Redis.
+
+    Each node keeps its own sockets in <prefix>:node:<node id>:sids (socket id -> user id)
+    and its per-user socket counts in <prefix>:node:<node id>:connections, and lists
+    itself in the <prefix>:nodes sorted set scored by when it expires. refresh() pushes
+    that back every node_ttl / 3 seconds; the node's hashes expire with it, so a crashed
+    node's sockets stop counting after node_ttl seconds without anyone cleaning up.
+    A user is online while any live node has a socket for them.
+
+    add() and remove() are Lua scripts, so a socket's hash entry and its user's count
+    change together even when several nodes update the same user at once.
+    """
+
+    # KEYS: this node's sids, this node's connections, the nodes sorted set
+    # ARGV (after the script's own): node id, expiry (ms), ttl (ms), now (ms), node key prefix
+    _HELPERS = """
+        local function release(user)
+            if redis.call('HINCRBY', KEYS[2], user, -1) <= 0 then
+                redis.call('HDEL', KEYS[2], user)
+            end
+        end
+        local function touch(node, expires, ttl)
+            redis.call('ZADD', KEYS[3], expires, node)
+            redis.call('PEXPIRE', KEYS[1], ttl)
+            redis.call('PEXPIRE', KEYS[2], ttl)
+        end
+        local function total(user, now, prefix)
+            local count = 0
+            for _, node in ipairs(redis.call('ZRANGEBYSCORE', KEYS[3], '(' .. now, '+inf')) do
+                count = count + tonumber(redis.call('HGET', prefix .. node .. ':connections', user) or 0)
+            end
+            return count
+        end
+    """
+
+    # ARGV: sid, user id, then the common arguments; returns the user's open sockets on all nodes
+    _ADD = _HELPERS + """
+        local previous = redis.call('HGET', KEYS[1], ARGV[1])
+        if previous ~= ARGV[2] then
+            if previous then release(previous) end
+            redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+            redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+        end
+        touch(ARGV[3], ARGV[4], ARGV[5])
+        return total(ARGV[2], ARGV[6], ARGV[7])
+    """
+
+    # ARGV: sid, then the common arguments; returns {user id, remaining sockets} or nil
+    _REMOVE = _HELPERS + """
+        local user = redis.call('HGET', KEYS[1], ARGV[1])
+        if not user then return nil end
+        redis.call('HDEL', KEYS[1], ARGV[1])
+        release(user)
+        touch(ARGV[2], ARGV[3], ARGV[4])
+        return {user, total(user, ARGV[5], ARGV[6])}
+    """
+
+    def __init__(self, url, prefix='presence', node_ttl=30.0, client=None, clock=time.time):
+        if client is None:
+            if redis is None:
+                raise RuntimeError("The redis package is required for a Redis presence store")
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self.client = client
+        self.clock = clock
+        self.node_id = uuid.uuid4().hex
+        self.node_ttl = node_ttl
+        self.node_prefix = f"{prefix}:node:"
+        self.sids_key = f"{self.node_prefix}{self.node_id}:sids"
+        self.connections_key = f"{self.node_prefix}{self.node_id}:connections"
+        self.nodes_key = f"{prefix}:nodes"
+        self.last_refresh = None
+        self._add = self.client.register_script(self._ADD)
+        self._remove = self.client.register_script(self._REMOVE)
+
+    def _keys(self):
+        return [self.sids_key, self.connections_key, self.nodes_key]
+
+    def _node_args(self):
+        """node id, expiry, ttl, now and key prefix, as the scripts take them"""
+        now = self.clock()
+        self.last_refresh = now
+        ttl = int(self.node_ttl * 1000)
+        return [self.node_id, int(now * 1000) + ttl, ttl, int(now * 1000), self.node_prefix]
+
+    def add(self, sid, user_id):
+        return int(self._add(keys=self._keys(), args=[sid, user_id] + self._node_args()))
+
+    def remove(self, sid):
+        result = self._remove(keys=self._keys(), args=[sid] + self._node_args())
+        if result is None:
+            return None, 0
+        return result[0], int(result[1])
+
+    def refresh(self):
+        """Heartbeat: keep this node's sockets alive and drop expired nodes from the set"""
+        now = self.clock()
+        if self.last_refresh is not None and now - self.last_refresh < self.node_ttl / 3:
+            return
+        self.last_refresh = now
+        ttl = int(self.node_ttl * 1000)
+        pipe = self.client.pipeline()
+        pipe.zadd(self.nodes_key, {self.node_id: int(now * 1000) + ttl})
+        pipe.pexpire(self.sids_key, ttl)
+        pipe.pexpire(self.connections_key, ttl)
+        pipe.zremrangebyscore(self.nodes_key, '-inf', int(now * 1000))
+        pipe.execute()
+
+    def _live_nodes(self):
+        return self.client.zrangebyscore(self.nodes_key, f"({int(self.clock() * 1000)}", '+inf')
+
+    def _per_node(self, command, suffix, *args):
+        """Run command on each live node's key, returning the results"""
+        pipe = self.client.pipeline(transaction=False)
+        for node in self._live_nodes():
+            getattr(pipe, command)(f"{self.node_prefix}{node}:{suffix}", *args)
+        return pipe.execute()
+
+    def user_for(self, sid):
+        return self.client.hget(self.sids_key, sid)
+
+    def is_online(self, user_id):
+        return any(self._per_node('hexists', 'connections', user_id))
+
+    def online_user_ids(self):
+        return set().union(*self._per_node('hkeys', 'connections'))
+
+    def stats(self):
+        return {
+            'backend': 'redis',
+            'node': self.node_id,
+            'nodes': len(self._live_nodes()),
+            'sockets': sum(self._per_node('hlen', 'sids')),
+            'users': len(self.online_user_ids())
+        }
+
+
+def create_presence_store(url=None, node_ttl=30.0):
+    """A Redis presence store for redis:// URLs, otherwise one local to this process"""
+    if url and url.startswith(('redis://', 'rediss://')):
+        return RedisPresenceStore(url, node_ttl=node_ttl)
+    return LocalPresenceStore()
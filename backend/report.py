@@ -5,9 +5,19 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak, Flowable
 from reportlab.lib.units import inch, cm
 from reportlab.pdfgen import canvas
+import argparse
+import copy
 import io
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from PIL import Image as PILImage
+from ingest import IngestedImage, REPORT_BODY_SIZE, REPORT_HEADER_SIZE, report_images
 import os
+import sys
 from datetime import datetime
 
 class HorizontalLine(Flowable):
@@ -23,33 +33,19 @@ class HorizontalLine(Flowable):
         self.canv.setStrokeColor(self.color)
         self.canv.line(0, 0, self.width, 0)
 
-def generate_professional_report(report_data, image_path, save_path, gemini_report_content):
+@lru_cache(maxsize=None)
+def _template():
     """
-    Generate a professional-looking medical report with enhanced formatting.
-    
-    :param report_data: Dictionary containing prediction, confidence, and analysis
-    :param image_path: Path to the uploaded patient image
-    :param save_path: Path to save the generated PDF
-    :param gemini_report_content: Content generated by Gemini API
+    Styles, table styles and fixed paragraphs shared by every report.
+
+    Built once per process; the paragraphs are parsed here and copied into each report
+    (see _static), so only the parts that depend on the report are built per call.
     """
-    # Create document
-    doc = SimpleDocTemplate(
-        save_path,
-        pagesize=letter,
-        leftMargin=1*inch,
-        rightMargin=1*inch,
-        topMargin=1*inch,
-        bottomMargin=1*inch
-    )
-    
-    # Story to hold flowable elements
-    story = []
-    
-    # Create styles
     styles = getSampleStyleSheet()
+    t = {}
     
     # Custom styles
-    title_style = ParagraphStyle(
+    t['title_style'] = ParagraphStyle(
         'Title',
         parent=styles['Heading1'],
         fontSize=16,
@@ -58,7 +54,7 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
         alignment=1  # Center alignment
     )
     
-    heading1_style = ParagraphStyle(
+    t['heading1_style'] = ParagraphStyle(
         'Heading1',
         parent=styles['Heading1'],
         fontSize=14,
@@ -67,7 +63,7 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
         spaceAfter=0.1*inch
     )
     
-    heading2_style = ParagraphStyle(
+    t['heading2_style'] = ParagraphStyle(
         'Heading2',
         parent=styles['Heading2'],
         fontSize=12,
@@ -76,7 +72,7 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
         spaceAfter=0.05*inch
     )
     
-    normal_style = ParagraphStyle(
+    t['normal_style'] = ParagraphStyle(
         'Normal',
         parent=styles['Normal'],
         fontSize=10,
@@ -100,35 +96,143 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
         alignment=1  # Center alignment
     )
     
-    # Header with logo and title
-    # In a real application, you would have a logo image
-    # For now, we'll create a simple header table
+    t['metadata_style'] = ParagraphStyle(
+        'Metadata',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#404040')
+    )
     
-    # Add a logo placeholder (would be your medical organization's logo)
-    logo_path = image_path  # Using the patient image as a logo placeholder for now
+    note_style = ParagraphStyle(
+        'Note',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#555555'),
+        leftIndent=0.2*inch,
+        rightIndent=0.2*inch
+    )
+    
+    # Result box style and table style for each risk color
+    t['result_styles'] = {}
+    t['result_table_styles'] = {}
+    for risk_color in ("#e74c3c", "#f39c12", "#2ecc71"):
+        t['result_styles'][risk_color] = ParagraphStyle(
+            'Result',
+            parent=styles['Normal'],
+            fontSize=11,
+            leading=16,
+            textColor=colors.HexColor('#FFFFFF'),
+            backColor=colors.HexColor(risk_color),
+            borderColor=colors.HexColor(risk_color),
+            borderWidth=1,
+            borderPadding=10,
+            borderRadius=5
+        )
+        t['result_table_styles'][risk_color] = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor(risk_color)),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor(risk_color)),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 10),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+            ('TOPPADDING', (0, 0), (-1, -1), 5),
+        ])
+    
+    t['header_table_style'] = TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ALIGN', (1, 0), (1, 0), 'CENTER'),
+    ])
+    
+    # Metadata and patient tables
+    t['info_table_style'] = TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ])
+    
+    # Fixed paragraphs
+    t['title'] = Paragraph("AI-Powered Medical Diagnosis", t['title_style'])
+    t['metadata_labels'] = [Paragraph(label, t['metadata_style']) for label in ("Report Date:", "Report ID:", "Model:")]
+    # Patient Information (placeholder - in a real system, this would be filled with actual patient data)
+    t['patient_rows'] = [
+        [Paragraph("Patient Name:", info_style), Paragraph("[PATIENT NAME]", info_style)],
+        [Paragraph("Medical Record #:", info_style), Paragraph("[MEDICAL RECORD NUMBER]", info_style)],
+        [Paragraph("Date of Birth:", info_style), Paragraph("[DOB]", info_style)],
+        [Paragraph("Referring Physician:", info_style), Paragraph("[PHYSICIAN NAME]", info_style)]
+    ]
+    t['headings'] = {title: Paragraph(title, t['heading1_style']) for title in (
+        "Patient Information", "Analysis Results", "Image Analysis", "Detailed Medical Analysis"
+    )}
+    t['image_missing'] = Paragraph("Image could not be displayed", t['normal_style'])
+    t['note'] = Paragraph("<b>IMPORTANT NOTE:</b> This report is generated using artificial intelligence and is intended to assist healthcare professionals. It should not be used as the sole basis for medical decision-making. The results should be interpreted in conjunction with clinical findings, patient history, and other diagnostic tests.", note_style)
+    t['disclaimer'] = Paragraph("DISCLAIMER: This report is AI-generated and should not replace professional medical advice. Please consult with a healthcare provider for proper diagnosis and treatment.", disclaimer_style)
+    return t
+
+def _static(paragraph):
+    """Fresh copy of a cached paragraph; layout state is per copy, the parsed text is shared"""
+    return copy.copy(paragraph)
+
+def _prepare_images(image_path):
+    """
+    Decode the patient image once and encode both sizes the report uses.
+
+    :return: (header JPEG bytes, body JPEG bytes), either None if the image can't be read
+    """
     try:
-        # Resize image for header
-        img = PILImage.open(logo_path)
-        img = img.resize((100, 60), PILImage.LANCZOS)
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='JPEG')
-        img_byte_arr = img_byte_arr.getvalue()
-        logo_image = Image(io.BytesIO(img_byte_arr), width=1*inch, height=0.6*inch)
-    except:
-        # If there's an issue with the image, just skip the logo
-        logo_image = None
+        img = PILImage.open(image_path)
+        # For JPEGs, let the decoder downscale by a power of two while decoding
+        img.draft('RGB', REPORT_BODY_SIZE)
+        img = img.convert('RGB')
+    except Exception:
+        return None, None
+    return report_images(img)
+
+def generate_professional_report(report_data, image_path, save_path, gemini_report_content, images=None):
+    """
+    Generate a professional-looking medical report with enhanced formatting.
+    
+    :param report_data: Dictionary containing prediction, confidence, and analysis
+    :param image_path: Path to the uploaded patient image
+    :param save_path: Path to save the generated PDF
+    :param gemini_report_content: Content generated by Gemini API
+    :param images: (header JPEG, body JPEG) already made from the image, e.g. by
+        IngestedImage.report_images(); image_path is not read when given
+    """
+    t = _template()
+    heading2_style = t['heading2_style']
+    normal_style = t['normal_style']
+    
+    # Create document
+    doc = SimpleDocTemplate(
+        save_path,
+        pagesize=letter,
+        leftMargin=1*inch,
+        rightMargin=1*inch,
+        topMargin=1*inch,
+        bottomMargin=1*inch
+    )
+    
+    # Story to hold flowable elements
+    story = []
+    
+    # One decode of the patient image for both the header "logo" and the image section
+    header_jpeg, body_jpeg = images if images is not None else _prepare_images(image_path)
+    
+    # Header with logo and title
+    # In a real application, you would have a logo image; the patient image stands in for it
+    logo_image = Image(io.BytesIO(header_jpeg), width=1*inch, height=0.6*inch) if header_jpeg else None
     
     # Create report header
     if logo_image:
-        header_data = [[logo_image, Paragraph("AI-Powered Medical Diagnosis", title_style)]]
+        header_data = [[logo_image, _static(t['title'])]]
         header_table = Table(header_data, colWidths=[1.2*inch, 4.8*inch])
-        header_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-        ]))
+        header_table.setStyle(t['header_table_style'])
         story.append(header_table)
     else:
-        story.append(Paragraph("AI-Powered Medical Diagnosis", title_style))
+        story.append(_static(t['title']))
     
     story.append(HorizontalLine(450, 2, colors.HexColor('#1a4e8c')))
     story.append(Spacer(1, 0.2*inch))
@@ -137,56 +241,30 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
     current_date = datetime.now().strftime('%B %d, %Y')
     report_id = f"RPT-{datetime.now().strftime('%Y%m%d%H%M%S')}"
     
-    metadata_style = ParagraphStyle(
-        'Metadata',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#404040')
-    )
-    
-    metadata = [
-        [Paragraph("Report Date:", metadata_style), Paragraph(current_date, metadata_style)],
-        [Paragraph("Report ID:", metadata_style), Paragraph(report_id, metadata_style)],
-        [Paragraph("Model:", metadata_style), Paragraph(report_data['display_name'], metadata_style)]
-    ]
+    metadata_style = t['metadata_style']
+    values = (current_date, report_id, report_data['display_name'])
+    metadata = [[_static(label), Paragraph(value, metadata_style)] for label, value in zip(t['metadata_labels'], values)]
     
     metadata_table = Table(metadata, colWidths=[1*inch, 4*inch])
-    metadata_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    metadata_table.setStyle(t['info_table_style'])
     
     story.append(metadata_table)
     story.append(Spacer(1, 0.2*inch))
     
-    # Patient Information (placeholder - in a real system, this would be filled with actual patient data)
-    story.append(Paragraph("Patient Information", heading1_style))
+    # Patient Information
+    story.append(_static(t['headings']["Patient Information"]))
     story.append(HorizontalLine(450, 1, colors.HexColor('#1a4e8c')))
     
-    patient_data = [
-        [Paragraph("Patient Name:", info_style), Paragraph("[PATIENT NAME]", info_style)],
-        [Paragraph("Medical Record #:", info_style), Paragraph("[MEDICAL RECORD NUMBER]", info_style)],
-        [Paragraph("Date of Birth:", info_style), Paragraph("[DOB]", info_style)],
-        [Paragraph("Referring Physician:", info_style), Paragraph("[PHYSICIAN NAME]", info_style)]
-    ]
+    patient_data = [[_static(label), _static(value)] for label, value in t['patient_rows']]
     
     patient_table = Table(patient_data, colWidths=[1.5*inch, 3.5*inch])
-    patient_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    patient_table.setStyle(t['info_table_style'])
     
     story.append(patient_table)
     story.append(Spacer(1, 0.2*inch))
     
     # Analysis Results
-    story.append(Paragraph("Analysis Results", heading1_style))
+    story.append(_static(t['headings']["Analysis Results"]))
     story.append(HorizontalLine(450, 1, colors.HexColor('#1a4e8c')))
     
     # Create a visually distinct box for the analysis result
@@ -198,18 +276,7 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
     # Choose color based on risk level
     risk_color = "#e74c3c" if risk_level == "High Risk" else "#f39c12" if risk_level == "Moderate Risk" else "#2ecc71"
     
-    result_style = ParagraphStyle(
-        'Result',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=16,
-        textColor=colors.HexColor('#FFFFFF'),
-        backColor=colors.HexColor(risk_color),
-        borderColor=colors.HexColor(risk_color),
-        borderWidth=1,
-        borderPadding=10,
-        borderRadius=5
-    )
+    result_style = t['result_styles'][risk_color]
     
     result_table_data = [
         [Paragraph(result_text, result_style)],
@@ -218,35 +285,25 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
     ]
     
     result_table = Table(result_table_data, colWidths=[5*inch])
-    result_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor(risk_color)),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor(risk_color)),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
-    ]))
+    result_table.setStyle(t['result_table_styles'][risk_color])
     
     story.append(result_table)
     story.append(Spacer(1, 0.2*inch))
     
     # Image Analysis
-    story.append(Paragraph("Image Analysis", heading1_style))
+    story.append(_static(t['headings']["Image Analysis"]))
     story.append(HorizontalLine(450, 1, colors.HexColor('#1a4e8c')))
     
     # Add the analyzed image to the report
-    try:
-        img = Image(image_path, width=3*inch, height=2.5*inch)
-        story.append(img)
-    except:
-        story.append(Paragraph("Image could not be displayed", normal_style))
+    if body_jpeg:
+        story.append(Image(io.BytesIO(body_jpeg), width=3*inch, height=2.5*inch))
+    else:
+        story.append(_static(t['image_missing']))
     
     story.append(Spacer(1, 0.2*inch))
     
     # Start detailed analysis section
-    story.append(Paragraph("Detailed Medical Analysis", heading1_style))
+    story.append(_static(t['headings']["Detailed Medical Analysis"]))
     story.append(HorizontalLine(450, 1, colors.HexColor('#1a4e8c')))
     
     # Process the Gemini report content
@@ -292,27 +349,200 @@ def generate_professional_report(report_data, image_path, save_path, gemini_repo
     story.append(HorizontalLine(450, 1, colors.HexColor('#cccccc')))
     story.append(Spacer(1, 0.1*inch))
     
-    note_style = ParagraphStyle(
-        'Note',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#555555'),
-        leftIndent=0.2*inch,
-        rightIndent=0.2*inch
-    )
-    
-    story.append(Paragraph("<b>IMPORTANT NOTE:</b> This report is generated using artificial intelligence and is intended to assist healthcare professionals. It should not be used as the sole basis for medical decision-making. The results should be interpreted in conjunction with clinical findings, patient history, and other diagnostic tests.", note_style))
+    story.append(_static(t['note']))
     
     # Add disclaimer at the bottom
     story.append(Spacer(1, 0.5*inch))
     story.append(HorizontalLine(450, 1, colors.HexColor('#cccccc')))
     story.append(Spacer(1, 0.1*inch))
     
-    disclaimer_text = "DISCLAIMER: This report is AI-generated and should not replace professional medical advice. Please consult with a healthcare provider for proper diagnosis and treatment."
-    story.append(Paragraph(disclaimer_text, disclaimer_style))
+    story.append(_static(t['disclaimer']))
     
     # Build the document
     doc.build(story)
     
     return save_path
 
+
+
+def _mp_context():
+    # fork on Linux: spawn and forkserver re-import the main module in every worker, which
+    # for `python app.py` means loading the whole app; the workers only need this module.
+    # Forking is only safe before the process has other threads, see ReportRenderPool.start()
+    if sys.platform.startswith('linux'):
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def _warm_up():
+    # Build the template in the worker before the first real report
+    _template()
+
+
+class ReportRenderPool:
+    """
+    Renders report PDFs in worker processes, so building them doesn't hold the GIL of the
+    process serving requests.
+
+    render() takes the arguments of generate_professional_report, with either the image
+    path or an IngestedImage, and blocks until the PDF is written; call it from a worker
+    thread (e.g. the report job queue). Only the report's small JPEGs are sent to the
+    workers, which each build the report template once.
+
+    The workers are forked by start(), which must run while the process has no other
+    threads (first thing in __main__): a child forked from a multithreaded process can
+    inherit locks (allocator, logging, ...) held by threads that don't exist in it. If the
+    pool wasn't started, or a worker died and broke it, reports render in the calling
+    thread instead; the pool is never forked again later.
+
+    :param processes: number of worker processes; 0 renders in the calling thread
+    """
+
+    def __init__(self, processes=2):
+        self.processes = processes
+        self.lock = threading.Lock()
+        self.executor = None
+        self.rendered = 0
+        self.rendered_in_process = 0
+        self.broken = False
+
+    def start(self):
+        """Fork the workers; returns whether the pool is running"""
+        if self.processes <= 0:
+            return False
+        with self.lock:
+            if self.executor is not None:
+                return True
+            if threading.active_count() > 1:
+                print("Not starting the report render pool: other threads are already running; "
+                      "reports will render in the report job threads")
+                return False
+            executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=_mp_context())
+            # With fork all workers are started by the first submit, before the pool's own
+            # manager thread
+            for future in [executor.submit(_warm_up) for _ in range(self.processes)]:
+                future.result()
+            self.executor = executor
+            return True
+
+    def render(self, report_data, image, save_path, gemini_report_content):
+        images = None
+        image_path = image
+        if isinstance(image, IngestedImage):
+            images = image.report_images()
+            image_path = image.path
+        
+        with self.lock:
+            executor = self.executor
+        if executor is None:
+            result = generate_professional_report(report_data, image_path, save_path, gemini_report_content, images)
+            with self.lock:
+                self.rendered_in_process += 1
+        else:
+            try:
+                result = executor.submit(generate_professional_report, report_data, image_path,
+                                         save_path, gemini_report_content, images).result()
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); forking a new pool now would copy
+                # the running threads' locks, so later reports render in process
+                with self.lock:
+                    if self.executor is executor:
+                        self.executor = None
+                        self.broken = True
+                raise
+        with self.lock:
+            self.rendered += 1
+        return result
+
+    def stats(self):
+        with self.lock:
+            return {
+                'processes': self.processes,
+                'running': self.executor is not None,
+                'broken': self.broken,
+                'rendered': self.rendered,
+                'rendered_in_process': self.rendered_in_process
+            }
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+def _uncached_report(report_data, image_path, save_path, gemini_report_content):
+    """
+    The render as it was before the template cache, for main()'s baseline.
+
+    Rebuilds the styles and fixed paragraphs on every call, and handles the image the old
+    way: a full decode for the header, and the original file embedded as the body image.
+    """
+    _template.cache_clear()
+    try:
+        img = PILImage.open(image_path)
+        header = io.BytesIO()
+        img.resize(REPORT_HEADER_SIZE, PILImage.LANCZOS).convert('RGB').save(header, format='JPEG')
+        header = header.getvalue()
+    except Exception:
+        header = None
+    with open(image_path, 'rb') as f:
+        body = f.read()
+    return generate_professional_report(report_data, image_path, save_path, gemini_report_content,
+                                        images=(header, body))
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure report PDFs rendered per second')
+    parser.add_argument('--image', required=True, help='patient image to embed')
+    parser.add_argument('--count', type=int, default=50, help='reports to render per run')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 2, help='worker processes for the pooled run')
+    parser.add_argument('--output', default='reports/benchmark', help='directory for the PDFs')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    report_data = {'display_name': 'COVID-19 Analysis', 'prediction': 'Normal', 'confidence': 91.25}
+    content = "\n\n".join(
+        f"**Section {i}:**\n" + "Findings are described in plain language for the patient. " * 12 for i in range(6)
+    )
+
+    def run(label, render):
+        """Render args.count reports and return reports per second"""
+        started = time.perf_counter()
+        futures = [render(report_data, args.image, os.path.join(args.output, f"{label.split()[0]}-{i}.pdf"), content)
+                   for i in range(args.count)]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - started
+        print(f"{label}: {args.count} reports in {elapsed:.2f}s, {args.count / elapsed:.1f} reports/s")
+        return args.count / elapsed
+
+    class _Done:
+        def __init__(self, value):
+            self.value = value
+
+        def result(self):
+            return self.value
+
+    # The old path first: no template cache, image decoded per use
+    uncached = run('uncached', lambda *a: _Done(_uncached_report(*a)))
+
+    # Warm the template cache so the serial run measures steady state, like the workers
+    generate_professional_report(report_data, args.image, os.path.join(args.output, 'warmup.pdf'), content)
+    serial = run('serial', lambda *a: _Done(generate_professional_report(*a)))
+    print(f"template cache and single decode: {serial / uncached:.2f}x the uncached rate")
+
+    pool = ProcessPoolExecutor(max_workers=args.processes, mp_context=_mp_context())
+    try:
+        # Start the workers and build their templates before timing
+        for future in [pool.submit(generate_professional_report, report_data, args.image,
+                                   os.path.join(args.output, f'warmup-{i}.pdf'), content)
+                       for i in range(args.processes)]:
+            future.result()
+        pooled = run(f'pool of {args.processes}', lambda *a: pool.submit(generate_professional_report, *a))
+        print(f"pool of {args.processes}: {pooled / uncached:.2f}x the uncached rate")
+    finally:
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
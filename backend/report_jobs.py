@@ -0,0 +1,149 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ReportJob:
+    """State of one Gemini report + PDF build"""
+
+    def __init__(self, report_data, image, pdf_path, report_url, context=None):
+        self.id = uuid.uuid4().hex
+        self.report_data = report_data
+        # Path of the upload or its IngestedImage; dropped once the job has run
+        self.image = image
+        self.pdf_path = pdf_path
+        self.report_url = report_url
+        # Caller-owned data handed back to on_finished (e.g. a cache key)
+        self.context = context or {}
+        self.status = 'queued'
+        self.report_content = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.done = threading.Event()
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'model_used': self.report_data.get('model_used'),
+            'report_url': self.report_url if self.status == 'completed' else None,
+            'report_content': self.report_content,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class ReportJobQueue:
+    """
+    Worker pool that produces the Gemini report text and the PDF outside the request path.
+
+    :param generate_content: callable(report_data, image) -> report text
+    :param render_pdf: callable(report_data, image, pdf_path, report_text)
+        (image is what was passed to submit(): the upload's path or its IngestedImage)
+    :param on_finished: optional callable(job) run after a job completes or fails
+    :param max_workers: number of report worker threads
+    :param max_jobs: number of jobs kept for status polling before the oldest finished ones are dropped
+    """
+
+    def __init__(self, generate_content, render_pdf, on_finished=None, max_workers=4, max_jobs=1000):
+        self.generate_content = generate_content
+        self.render_pdf = render_pdf
+        self.on_finished = on_finished
+        self.max_jobs = max_jobs
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report-worker')
+
+    def submit(self, report_data, image, pdf_path, report_url, context=None):
+        """Queue a report build and return its job"""
+        job = ReportJob(report_data, image, pdf_path, report_url, context)
+        with self.lock:
+            self.jobs[job.id] = job
+            self._trim()
+        self.executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def pending_count(self):
+        with self.lock:
+            return sum(1 for job in self.jobs.values() if job.status in ('queued', 'running'))
+
+    def _trim(self):
+        """Forget the oldest finished jobs once more than max_jobs are tracked"""
+        if len(self.jobs) <= self.max_jobs:
+            return
+        for job_id in [j.id for j in self.jobs.values() if j.done.is_set()]:
+            if len(self.jobs) <= self.max_jobs:
+                break
+            del self.jobs[job_id]
+
+    def _run(self, job):
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            job.report_content = self.generate_content(job.report_data, job.image)
+            self.render_pdf(job.report_data, job.image, job.pdf_path, job.report_content)
+            job.status = 'completed'
+        except Exception as e:
+            print(f"Error generating report for job {job.id}: {str(e)}")
+            job.status = 'failed'
+            job.error = str(e)
+        finally:
+            # Finished jobs are kept for polling; don't keep the decoded image with them
+            job.image = None
+            job.finished_at = time.time()
+            job.done.set()
+
+        if self.on_finished:
+            try:
+                self.on_finished(job)
+            except Exception as e:
+                print(f"Error notifying report job {job.id}: {str(e)}")
+
+
+def fake_report_content(report_data, image_path):
+    """Local stand-in for the Gemini report, in the same **Section:** format"""
+    model_name = report_data['display_name']
+    prediction = report_data['prediction']
+    confidence = report_data['confidence']
+
+    return (
+        f"**Preliminary {model_name} Report:**\n"
+        f"This is an automatically generated placeholder report.\n\n"
+        f"**Detected Condition:**\n"
+        f"The image was classified as '{prediction}' with {confidence:.2f}% confidence.\n\n"
+        f"**When to Seek Immediate Medical Attention:**\n"
+        f"Consult a healthcare professional to confirm this result."
+    )
+
+
+# Marks template reports, which are shown but never cached
+TEMPLATE_REPORT_NOTE = "The detailed AI-written report is temporarily unavailable."
+
+
+def template_report_content(report_data, image_path=None):
+    """Report text built without Gemini, used when the Gemini call is refused or fails"""
+    model_name = report_data['display_name']
+    prediction = report_data['prediction']
+    confidence = report_data['confidence']
+
+    return (
+        f"**Preliminary {model_name} Report:**\n"
+        f"{TEMPLATE_REPORT_NOTE} This summary contains the model result only.\n\n"
+        f"**Detected Condition:**\n"
+        f"The image was classified as '{prediction}' with {confidence:.2f}% confidence. "
+        f"This is an automated screening result, not a diagnosis.\n\n"
+        f"**Common Treatments and Next Steps:**\n"
+        f"Share this report with a healthcare professional, who can confirm the result and advise on next steps.\n\n"
+        f"**When to Seek Immediate Medical Attention:**\n"
+        f"Seek urgent care if symptoms are severe or getting worse, regardless of this result."
+    )
@@ -0,0 +1,99 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class ExpiryScheduler:
+    """
+    Runs a callback for each key at its deadline.
+
+    Deadlines sit in a min-heap, so the loop only ever looks at the earliest one and each
+    expiry costs O(log n) no matter how many keys are scheduled or have expired before.
+    Rescheduling or cancelling a key leaves its old heap entry behind; stale entries are
+    skipped when they reach the top.
+
+    The loop runs as a Socket.IO background task and waits with socketio.sleep, so it
+    cooperates with eventlet as well as with threads. It wakes at least every tick seconds,
+    which bounds how late a deadline scheduled after the loop went to sleep can fire.
+    """
+
+    def __init__(self, socketio, tick=1.0):
+        self.socketio = socketio
+        self.tick = tick
+        self.lock = threading.Lock()
+        self.heap = []
+        # key -> (sequence number of its live heap entry, callback)
+        self.entries = {}
+        self.counter = itertools.count()
+        self.started = False
+        self.fired = 0
+        self.failures = 0
+
+    def schedule(self, key, deadline, callback):
+        """Call callback(key) at deadline (a time.time() value), replacing any earlier schedule"""
+        with self.lock:
+            seq = next(self.counter)
+            self.entries[key] = (seq, callback)
+            heapq.heappush(self.heap, (deadline, seq, key))
+            start = not self.started
+            self.started = True
+        if start:
+            self.socketio.start_background_task(self._run)
+
+    def cancel(self, key):
+        with self.lock:
+            return self.entries.pop(key, None) is not None
+
+    def _next_due(self, now):
+        """Pop the next live entry that is due, or return the seconds until one will be"""
+        with self.lock:
+            while self.heap:
+                deadline, seq, key = self.heap[0]
+                entry = self.entries.get(key)
+                if entry is None or entry[0] != seq:
+                    heapq.heappop(self.heap)  # cancelled or rescheduled
+                    continue
+                if deadline > now:
+                    return None, deadline - now
+                heapq.heappop(self.heap)
+                del self.entries[key]
+                return (key, entry[1]), 0
+            return None, None
+
+    def run_due(self):
+        """Fire every callback whose deadline has passed; returns how many ran"""
+        fired = 0
+        while True:
+            due, wait = self._next_due(time.time())
+            if due is None:
+                return fired
+            key, callback = due
+            try:
+                callback(key)
+            except Exception as e:
+                self.failures += 1
+                print(f"Scheduled callback for {key} failed: {str(e)}")
+            fired += 1
+            self.fired += 1
+
+    def _run(self):
+        while True:
+            self.run_due()
+            _, wait = self._next_due(time.time())
+            self.socketio.sleep(self.tick if wait is None else min(wait, self.tick))
+
+    def stats(self):
+        with self.lock:
+            next_deadline = None
+            for deadline, seq, key in self.heap:
+                entry = self.entries.get(key)
+                if entry is not None and entry[0] == seq:
+                    next_deadline = deadline if next_deadline is None else min(next_deadline, deadline)
+            return {
+                'scheduled': len(self.entries),
+                'heap_size': len(self.heap),
+                'next_deadline': next_deadline,
+                'fired': self.fired,
+                'failures': self.failures
+            }
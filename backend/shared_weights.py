@@ -0,0 +1,86 @@
+import os
+
+import torch
+
+try:
+    import fcntl
+except ImportError:  # No advisory file locks on Windows
+    fcntl = None
+
+
+MMAP_SUFFIX = '.mmap.pt'
+
+
+def mmap_path(weights_path):
+    """Where the memory-mappable copy of a weights file is kept"""
+    return os.path.splitext(weights_path)[0] + MMAP_SUFFIX
+
+
+def _is_fresh(path, weights_path):
+    try:
+        return os.path.getmtime(path) >= os.path.getmtime(weights_path)
+    except OSError:
+        return False
+
+
+class _ConversionLock:
+    """Cross-process lock so only one worker converts a weights file"""
+
+    def __init__(self, path):
+        self.path = f"{path}.lock"
+        self.handle = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self.handle = open(self.path, 'w')
+            fcntl.flock(self.handle, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self.handle is not None:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+            self.handle.close()
+
+
+def _to_state_dict(loaded):
+    """Accept both full-model and state_dict checkpoints, like load_model() does"""
+    if isinstance(loaded, torch.nn.Module):
+        loaded = loaded.state_dict()
+    return {name: tensor.detach().cpu().contiguous() for name, tensor in loaded.items()}
+
+
+def convert_to_mmap(weights_path):
+    """
+    Save a CPU state_dict copy of weights_path in torch's zip format, which torch.load can map.
+
+    Conversion happens once; other workers wait on the lock and then reuse the file.
+    """
+    path = mmap_path(weights_path)
+    with _ConversionLock(path):
+        if _is_fresh(path, weights_path):
+            return path
+
+        print(f"Converting {weights_path} to memory-mappable weights: {path}")
+        state_dict = _to_state_dict(torch.load(weights_path, map_location='cpu', weights_only=False))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        torch.save(state_dict, tmp_path)
+        os.replace(tmp_path, path)
+    return path
+
+
+def load_mmap_weights(model, weights_path):
+    """
+    Load weights into model as read-only views of a memory-mapped file.
+
+    The parameters alias the mapped pages (load_state_dict(assign=True)), so every worker
+    process that maps the same file shares one physical copy of the weights through the
+    page cache. Pages are mapped copy-on-write, so nothing written at inference time
+    reaches the file.
+    """
+    path = mmap_path(weights_path)
+    if not _is_fresh(path, weights_path):
+        convert_to_mmap(weights_path)
+
+    state_dict = torch.load(path, map_location='cpu', mmap=True, weights_only=True)
+    model.load_state_dict(state_dict, assign=True)
+    return model
@@ -133,24 +133,14 @@ document.addEventListener('DOMContentLoaded', function() {
             document.getElementById('confidence-text').textContent = `${data.confidence.toFixed(1)}%`;
             document.getElementById('confidence-level').style.width = `${data.confidence}%`;
             
-            // Update report content with Gemini-generated content
-            document.getElementById('report-content').innerHTML = data.report_content;
-            
-            // Store the report URL for downloading
-            const reportUrl = data.report_url;
-            
-            // Store the URL in a hidden field (create it if it doesn't exist)
-            let reportUrlField = document.getElementById('report-url');
-            if (!reportUrlField) {
-                reportUrlField = document.createElement('input');
-                reportUrlField.type = 'hidden';
-                reportUrlField.id = 'report-url';
-                document.body.appendChild(reportUrlField);
+            // The report is built in the background; show it now if it is already
+            // done (e.g. a cached result), otherwise poll its job until it is
+            if (data.report_status === 'completed') {
+                showReport(data.report_content, data.report_url);
+            } else {
+                showReport('<p><i class="fas fa-spinner fa-spin"></i> Generating report...</p>', null);
+                pollReportJob(data.report_status_url, data.report_url);
             }
-            reportUrlField.value = reportUrl;
-            
-            // Also store it as a data attribute on the download button
-            document.getElementById('download-report').setAttribute('data-report-url', reportUrl);
             
             // Reset analyze button
             analyzeBtn.disabled = false;
@@ -169,11 +159,58 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     });
     
+    // Show report text and store its PDF URL for downloading (null while it is being built)
+    function showReport(content, reportUrl) {
+        document.getElementById('report-content').innerHTML = content;
+        
+        // Store the URL in a hidden field (create it if it doesn't exist)
+        let reportUrlField = document.getElementById('report-url');
+        if (!reportUrlField) {
+            reportUrlField = document.createElement('input');
+            reportUrlField.type = 'hidden';
+            reportUrlField.id = 'report-url';
+            document.body.appendChild(reportUrlField);
+        }
+        reportUrlField.value = reportUrl || '';
+        
+        // Also store it as a data attribute on the download button
+        document.getElementById('download-report').setAttribute('data-report-url', reportUrl || '');
+    }
+    
+    // Poll a report job from /predict until its report text and PDF are ready
+    let reportPollTimer = null;
+    function pollReportJob(statusUrl, reportUrl) {
+        clearTimeout(reportPollTimer);
+        fetch(statusUrl)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Report job not found');
+            }
+            return response.json();
+        })
+        .then(job => {
+            if (job.status === 'completed') {
+                showReport(job.report_content, job.report_url || reportUrl);
+            } else if (job.status === 'failed') {
+                showReport('<p>The report could not be generated. Please try again.</p>', null);
+            } else {
+                reportPollTimer = setTimeout(() => pollReportJob(statusUrl, reportUrl), 1000);
+            }
+        })
+        .catch(error => {
+            console.error('Error checking report status:', error);
+            showReport('<p>The report could not be generated. Please try again.</p>', null);
+        });
+    }
+    
     // Handle "New Diagnosis" button click
     document.getElementById('new-diagnosis').addEventListener('click', function() {
         resultsSection.classList.add('hidden');
         uploadSection.classList.remove('hidden');
         
+        // Stop polling the previous report
+        clearTimeout(reportPollTimer);
+        
         // Reset the upload area
         uploadedFile = null;
         analyzeBtn.disabled = true;
@@ -197,7 +234,8 @@ document.addEventListener('DOMContentLoaded', function() {
     // Handle "Download Report" button click
     document.getElementById('download-report').addEventListener('click', function() {
         // Get the report URL from the hidden field or data attribute
-        const reportUrl = document.getElementById('report-url').value || this.getAttribute('data-report-url');
+        const reportUrlField = document.getElementById('report-url');
+        const reportUrl = (reportUrlField && reportUrlField.value) || this.getAttribute('data-report-url');
         
         if (reportUrl) {
             // Create a temporary anchor element to trigger the download
@@ -213,7 +251,7 @@ document.addEventListener('DOMContentLoaded', function() {
             downloadLink.click();
             document.body.removeChild(downloadLink);
         } else {
-            alert('No report available for download. Please analyze an image first.');
+            alert('No report available for download yet. Please analyze an image and wait for the report to finish.');
         }
     });
     
@@ -1,3 +1,3 @@
 /*! For license information please see main.5d1c5dc3.js.LICENSE.txt */
-(()=>{"use strict";var e={4:(e,t,n)=>{var r=n(853),a=n(43),l=n(950);function o(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function i(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function s(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function u(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function c(e){if(s(e)!==e)throw Error(o(188))}function d(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=d(e)))return t;e=e.sibling}return null}var f=Object.assign,p=Symbol.for("react.element"),h=Symbol.for("react.transitional.element"),m=Symbol.for("react.portal"),g=Symbol.for("react.fragment"),y=Symbol.for("react.strict_mode"),v=Symbol.for("react.profiler"),b=Symbol.for("react.provider"),w=Symbol.for("react.consumer"),k=Symbol.for("react.context"),S=Symbol.for("react.forward_ref"),x=Symbol.for("react.suspense"),E=Symbol.for("react.suspense_list"),C=Symbol.for("react.memo"),N=Symbol.for("react.lazy");Symbol.for("react.scope");var R=Symbol.for("react.activity");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var P=Symbol.for("react.memo_cache_sentinel");Symbol.for("react.view_transition");var T=Symbol.iterator;function _(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=T&&e[T]||e["@@iterator"])?e:null}var O=Symbol.for("react.client.reference");function L(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===O?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case g:return"Fragment";case v:return"Profiler";case y:return"StrictMode";case x:return"Suspense";case E:return"SuspenseList";case R:return"Activity"}if("object"===typeof e)switch(e.$$typeof){case m:return"Portal";case k:return(e.displayName||"Context")+".Provider";case w:return(e._context.displayName||"Context")+".Consumer";case S:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case C:return null!==(t=e.displayName||null)?t:L(e.type)||"Memo";case N:t=e._payload,e=e._init;try{return L(e(t))}catch(n){}}return null}var j=Array.isArray,z=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,A=l.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,F={pending:!1,data:null,method:null,action:null},D=[],M=-1;function U(e){return{current:e}}function $(e){0>M||(e.current=D[M],D[M]=null,M--)}function I(e,t){M++,D[M]=e.current,e.current=t}var B=U(null),H=U(null),W=U(null),q=U(null);function V(e,t){switch(I(W,t),I(H,e),I(B,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?ad(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)e=ld(t=ad(t),e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}$(B),I(B,e)}function Q(){$(B),$(H),$(W)}function K(e){null!==e.memoizedState&&I(q,e);var t=B.current,n=ld(t,e.type);t!==n&&(I(H,e),I(B,n))}function Y(e){H.current===e&&($(B),$(H)),q.current===e&&($(q),Kd._currentValue=F)}var X=Object.prototype.hasOwnProperty,J=r.unstable_scheduleCallback,G=r.unstable_cancelCallback,Z=r.unstable_shouldYield,ee=r.unstable_requestPaint,te=r.unstable_now,ne=r.unstable_getCurrentPriorityLevel,re=r.unstable_ImmediatePriority,ae=r.unstable_UserBlockingPriority,le=r.unstable_NormalPriority,oe=r.unstable_LowPriority,ie=r.unstable_IdlePriority,se=r.log,ue=r.unstable_setDisableYieldValue,ce=null,de=null;function fe(e){if("function"===typeof se&&ue(e),de&&"function"===typeof de.setStrictMode)try{de.setStrictMode(ce,e)}catch(t){}}var pe=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(he(e)/me|0)|0},he=Math.log,me=Math.LN2;var ge=256,ye=4194304;function ve(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194048&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function be(e,t,n){var r=e.pendingLanes;if(0===r)return 0;var a=0,l=e.suspendedLanes,o=e.pingedLanes;e=e.warmLanes;var i=134217727&r;return 0!==i?0!==(r=i&~l)?a=ve(r):0!==(o&=i)?a=ve(o):n||0!==(n=i&~e)&&(a=ve(n)):0!==(i=r&~l)?a=ve(i):0!==o?a=ve(o):n||0!==(n=r&~e)&&(a=ve(n)),0===a?0:0!==t&&t!==a&&0===(t&l)&&((l=a&-a)>=(n=t&-t)||32===l&&0!==(4194048&n))?t:a}function we(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function ke(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function Se(){var e=ge;return 0===(4194048&(ge<<=1))&&(ge=256),e}function xe(){var e=ye;return 0===(62914560&(ye<<=1))&&(ye=4194304),e}function Ee(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Ce(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function Ne(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-pe(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194090&n}function Re(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-pe(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}function Pe(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Te(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function _e(){var e=A.p;return 0!==e?e:void 0===(e=window.event)?32:cf(e.type)}var Oe=Math.random().toString(36).slice(2),Le="__reactFiber$"+Oe,je="__reactProps$"+Oe,ze="__reactContainer$"+Oe,Ae="__reactEvents$"+Oe,Fe="__reactListeners$"+Oe,De="__reactHandles$"+Oe,Me="__reactResources$"+Oe,Ue="__reactMarker$"+Oe;function $e(e){delete e[Le],delete e[je],delete e[Ae],delete e[Fe],delete e[De]}function Ie(e){var t=e[Le];if(t)return t;for(var n=e.parentNode;n;){if(t=n[ze]||n[Le]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=bd(e);null!==e;){if(n=e[Le])return n;e=bd(e)}return t}n=(e=n).parentNode}return null}function Be(e){if(e=e[Le]||e[ze]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function He(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(o(33))}function We(e){var t=e[Me];return t||(t=e[Me]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function qe(e){e[Ue]=!0}var Ve=new Set,Qe={};function Ke(e,t){Ye(e,t),Ye(e+"Capture",t)}function Ye(e,t){for(Qe[e]=t,e=0;e<t.length;e++)Ve.add(t[e])}var Xe,Je,Ge=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Ze={},et={};function tt(e,t,n){if(a=t,X.call(et,a)||!X.call(Ze,a)&&(Ge.test(a)?et[a]=!0:(Ze[a]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var a}function nt(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function rt(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function at(e){if(void 0===Xe)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Xe=t&&t[1]||"",Je=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+Xe+e+Je}var lt=!1;function ot(e,t){if(!e||lt)return"";lt=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(a){var r=a}Reflect.construct(e,[],n)}else{try{n.call()}catch(l){r=l}e.call(n.prototype)}}else{try{throw Error()}catch(o){r=o}(n=e())&&"function"===typeof n.catch&&n.catch((function(){}))}}catch(i){if(i&&r&&"string"===typeof i.stack)return[i.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var a=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");a&&a.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var l=r.DetermineComponentFrameRoot(),o=l[0],i=l[1];if(o&&i){var s=o.split("\n"),u=i.split("\n");for(a=r=0;r<s.length&&!s[r].includes("DetermineComponentFrameRoot");)r++;for(;a<u.length&&!u[a].includes("DetermineComponentFrameRoot");)a++;if(r===s.length||a===u.length)for(r=s.length-1,a=u.length-1;1<=r&&0<=a&&s[r]!==u[a];)a--;for(;1<=r&&0<=a;r--,a--)if(s[r]!==u[a]){if(1!==r||1!==a)do{if(r--,0>--a||s[r]!==u[a]){var c="\n"+s[r].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=r&&0<=a);break}}}finally{lt=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?at(n):""}function it(e){switch(e.tag){case 26:case 27:case 5:return at(e.type);case 16:return at("Lazy");case 13:return at("Suspense");case 19:return at("SuspenseList");case 0:case 15:return ot(e.type,!1);case 11:return ot(e.type.render,!1);case 1:return ot(e.type,!0);case 31:return at("Activity");default:return""}}function st(e){try{var t="";do{t+=it(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function ut(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ct(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function dt(e){e._valueTracker||(e._valueTracker=function(e){var t=ct(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var a=n.get,l=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,l.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function ft(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ct(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function pt(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var ht=/[\n"\\]/g;function mt(e){return e.replace(ht,(function(e){return"\\"+e.charCodeAt(0).toString(16)+" "}))}function gt(e,t,n,r,a,l,o,i){e.name="",null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o?e.type=o:e.removeAttribute("type"),null!=t?"number"===o?(0===t&&""===e.value||e.value!=t)&&(e.value=""+ut(t)):e.value!==""+ut(t)&&(e.value=""+ut(t)):"submit"!==o&&"reset"!==o||e.removeAttribute("value"),null!=t?vt(e,o,ut(t)):null!=n?vt(e,o,ut(n)):null!=r&&e.removeAttribute("value"),null==a&&null!=l&&(e.defaultChecked=!!l),null!=a&&(e.checked=a&&"function"!==typeof a&&"symbol"!==typeof a),null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i?e.name=""+ut(i):e.removeAttribute("name")}function yt(e,t,n,r,a,l,o,i){if(null!=l&&"function"!==typeof l&&"symbol"!==typeof l&&"boolean"!==typeof l&&(e.type=l),null!=t||null!=n){if(!("submit"!==l&&"reset"!==l||void 0!==t&&null!==t))return;n=null!=n?""+ut(n):"",t=null!=t?""+ut(t):n,i||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:a)&&"symbol"!==typeof r&&!!r,e.checked=i?e.checked:!!r,e.defaultChecked=!!r,null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o&&(e.name=o)}function vt(e,t,n){"number"===t&&pt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function bt(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ut(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function wt(e,t,n){null==t||((t=""+ut(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+ut(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function kt(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(o(92));if(j(r)){if(1<r.length)throw Error(o(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=ut(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function St(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var xt=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Et(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||xt.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function Ct(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(o(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var a in t)r=t[a],t.hasOwnProperty(a)&&n[a]!==r&&Et(e,a,r)}else for(var l in t)t.hasOwnProperty(l)&&Et(e,l,t[l])}function Nt(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Rt=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Pt=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Tt(e){return Pt.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var _t=null;function Ot(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Lt=null,jt=null;function zt(e){var t=Be(e);if(t&&(e=t.stateNode)){var n=e[je]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+mt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=r[je]||null;if(!a)throw Error(o(90));gt(r,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&ft(r)}break e;case"textarea":wt(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&bt(e,!!n.multiple,t,!1)}}}var At=!1;function Ft(e,t,n){if(At)return e(t,n);At=!0;try{return e(t)}finally{if(At=!1,(null!==Lt||null!==jt)&&(Iu(),Lt&&(t=Lt,e=jt,jt=Lt=null,zt(t),e)))for(t=0;t<e.length;t++)zt(e[t])}}function Dt(e,t){var n=e.stateNode;if(null===n)return null;var r=n[je]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var Mt=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),Ut=!1;if(Mt)try{var $t={};Object.defineProperty($t,"passive",{get:function(){Ut=!0}}),window.addEventListener("test",$t,$t),window.removeEventListener("test",$t,$t)}catch(zf){Ut=!1}var It=null,Bt=null,Ht=null;function Wt(){if(Ht)return Ht;var e,t,n=Bt,r=n.length,a="value"in It?It.value:It.textContent,l=a.length;for(e=0;e<r&&n[e]===a[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===a[l-t];t++);return Ht=a.slice(e,1<t?1-t:void 0)}function qt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function Vt(){return!0}function Qt(){return!1}function Kt(e){function t(t,n,r,a,l){for(var o in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=l,this.currentTarget=null,e)e.hasOwnProperty(o)&&(t=e[o],this[o]=t?t(a):a[o]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?Vt:Qt,this.isPropagationStopped=Qt,this}return f(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=Vt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=Vt)},persist:function(){},isPersistent:Vt}),t}var Yt,Xt,Jt,Gt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Zt=Kt(Gt),en=f({},Gt,{view:0,detail:0}),tn=Kt(en),nn=f({},en,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:hn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Jt&&(Jt&&"mousemove"===e.type?(Yt=e.screenX-Jt.screenX,Xt=e.screenY-Jt.screenY):Xt=Yt=0,Jt=e),Yt)},movementY:function(e){return"movementY"in e?e.movementY:Xt}}),rn=Kt(nn),an=Kt(f({},nn,{dataTransfer:0})),ln=Kt(f({},en,{relatedTarget:0})),on=Kt(f({},Gt,{animationName:0,elapsedTime:0,pseudoElement:0})),sn=Kt(f({},Gt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),un=Kt(f({},Gt,{data:0})),cn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},dn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function pn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function hn(){return pn}var mn=Kt(f({},en,{key:function(e){if(e.key){var t=cn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=qt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?dn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:hn,charCode:function(e){return"keypress"===e.type?qt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?qt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),gn=Kt(f({},nn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),yn=Kt(f({},en,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:hn})),vn=Kt(f({},Gt,{propertyName:0,elapsedTime:0,pseudoElement:0})),bn=Kt(f({},nn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),wn=Kt(f({},Gt,{newState:0,oldState:0})),kn=[9,13,27,32],Sn=Mt&&"CompositionEvent"in window,xn=null;Mt&&"documentMode"in document&&(xn=document.documentMode);var En=Mt&&"TextEvent"in window&&!xn,Cn=Mt&&(!Sn||xn&&8<xn&&11>=xn),Nn=String.fromCharCode(32),Rn=!1;function Pn(e,t){switch(e){case"keyup":return-1!==kn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Tn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var _n=!1;var On={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ln(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!On[e.type]:"textarea"===t}function jn(e,t,n,r){Lt?jt?jt.push(r):jt=[r]:Lt=r,0<(t=Wc(t,"onChange")).length&&(n=new Zt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var zn=null,An=null;function Fn(e){Fc(e,0)}function Dn(e){if(ft(He(e)))return e}function Mn(e,t){if("change"===e)return t}var Un=!1;if(Mt){var $n;if(Mt){var In="oninput"in document;if(!In){var Bn=document.createElement("div");Bn.setAttribute("oninput","return;"),In="function"===typeof Bn.oninput}$n=In}else $n=!1;Un=$n&&(!document.documentMode||9<document.documentMode)}function Hn(){zn&&(zn.detachEvent("onpropertychange",Wn),An=zn=null)}function Wn(e){if("value"===e.propertyName&&Dn(An)){var t=[];jn(t,An,e,Ot(e)),Ft(Fn,t)}}function qn(e,t,n){"focusin"===e?(Hn(),An=n,(zn=t).attachEvent("onpropertychange",Wn)):"focusout"===e&&Hn()}function Vn(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Dn(An)}function Qn(e,t){if("click"===e)return Dn(t)}function Kn(e,t){if("input"===e||"change"===e)return Dn(t)}var Yn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Xn(e,t){if(Yn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!X.call(t,a)||!Yn(e[a],t[a]))return!1}return!0}function Jn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Gn(e,t){var n,r=Jn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Jn(r)}}function Zn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Zn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function er(e){for(var t=pt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=pt((e=t.contentWindow).document)}return t}function tr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var nr=Mt&&"documentMode"in document&&11>=document.documentMode,rr=null,ar=null,lr=null,or=!1;function ir(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;or||null==rr||rr!==pt(r)||("selectionStart"in(r=rr)&&tr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},lr&&Xn(lr,r)||(lr=r,0<(r=Wc(ar,"onSelect")).length&&(t=new Zt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function sr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var ur={animationend:sr("Animation","AnimationEnd"),animationiteration:sr("Animation","AnimationIteration"),animationstart:sr("Animation","AnimationStart"),transitionrun:sr("Transition","TransitionRun"),transitionstart:sr("Transition","TransitionStart"),transitioncancel:sr("Transition","TransitionCancel"),transitionend:sr("Transition","TransitionEnd")},cr={},dr={};function fr(e){if(cr[e])return cr[e];if(!ur[e])return e;var t,n=ur[e];for(t in n)if(n.hasOwnProperty(t)&&t in dr)return cr[e]=n[t];return e}Mt&&(dr=document.createElement("div").style,"AnimationEvent"in window||(delete ur.animationend.animation,delete ur.animationiteration.animation,delete ur.animationstart.animation),"TransitionEvent"in window||delete ur.transitionend.transition);var pr=fr("animationend"),hr=fr("animationiteration"),mr=fr("animationstart"),gr=fr("transitionrun"),yr=fr("transitionstart"),vr=fr("transitioncancel"),br=fr("transitionend"),wr=new Map,kr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Sr(e,t){wr.set(e,t),Ke(t,[e])}kr.push("scrollEnd");var xr=new WeakMap;function Er(e,t){if("object"===typeof e&&null!==e){var n=xr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:st(t)},xr.set(e,t),t)}return{value:e,source:t,stack:st(t)}}var Cr=[],Nr=0,Rr=0;function Pr(){for(var e=Nr,t=Rr=Nr=0;t<e;){var n=Cr[t];Cr[t++]=null;var r=Cr[t];Cr[t++]=null;var a=Cr[t];Cr[t++]=null;var l=Cr[t];if(Cr[t++]=null,null!==r&&null!==a){var o=r.pending;null===o?a.next=a:(a.next=o.next,o.next=a),r.pending=a}0!==l&&Lr(n,a,l)}}function Tr(e,t,n,r){Cr[Nr++]=e,Cr[Nr++]=t,Cr[Nr++]=n,Cr[Nr++]=r,Rr|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function _r(e,t,n,r){return Tr(e,t,n,r),jr(e)}function Or(e,t){return Tr(e,null,null,t),jr(e)}function Lr(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var a=!1,l=e.return;null!==l;)l.childLanes|=n,null!==(r=l.alternate)&&(r.childLanes|=n),22===l.tag&&(null===(e=l.stateNode)||1&e._visibility||(a=!0)),e=l,l=l.return;return 3===e.tag?(l=e.stateNode,a&&null!==t&&(a=31-pe(n),null===(r=(e=l.hiddenUpdates)[a])?e[a]=[t]:r.push(t),t.lane=536870912|n),l):null}function jr(e){if(50<Lu)throw Lu=0,ju=null,Error(o(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var zr={};function Ar(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Fr(e,t,n,r){return new Ar(e,t,n,r)}function Dr(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Mr(e,t){var n=e.alternate;return null===n?((n=Fr(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=65011712&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Ur(e,t){e.flags&=65011714;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function $r(e,t,n,r,a,l){var i=0;if(r=e,"function"===typeof e)Dr(e)&&(i=1);else if("string"===typeof e)i=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,B.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case R:return(e=Fr(31,n,t,a)).elementType=R,e.lanes=l,e;case g:return Ir(n.children,a,l,t);case y:i=8,a|=24;break;case v:return(e=Fr(12,n,t,2|a)).elementType=v,e.lanes=l,e;case x:return(e=Fr(13,n,t,a)).elementType=x,e.lanes=l,e;case E:return(e=Fr(19,n,t,a)).elementType=E,e.lanes=l,e;default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case b:case k:i=10;break e;case w:i=9;break e;case S:i=11;break e;case C:i=14;break e;case N:i=16,r=null;break e}i=29,n=Error(o(130,null===e?"null":typeof e,"")),r=null}return(t=Fr(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function Ir(e,t,n,r){return(e=Fr(7,e,r,t)).lanes=n,e}function Br(e,t,n){return(e=Fr(6,e,null,t)).lanes=n,e}function Hr(e,t,n){return(t=Fr(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var Wr=[],qr=0,Vr=null,Qr=0,Kr=[],Yr=0,Xr=null,Jr=1,Gr="";function Zr(e,t){Wr[qr++]=Qr,Wr[qr++]=Vr,Vr=e,Qr=t}function ea(e,t,n){Kr[Yr++]=Jr,Kr[Yr++]=Gr,Kr[Yr++]=Xr,Xr=e;var r=Jr;e=Gr;var a=32-pe(r)-1;r&=~(1<<a),n+=1;var l=32-pe(t)+a;if(30<l){var o=a-a%5;l=(r&(1<<o)-1).toString(32),r>>=o,a-=o,Jr=1<<32-pe(t)+a|n<<a|r,Gr=l+e}else Jr=1<<l|n<<a|r,Gr=e}function ta(e){null!==e.return&&(Zr(e,1),ea(e,1,0))}function na(e){for(;e===Vr;)Vr=Wr[--qr],Wr[qr]=null,Qr=Wr[--qr],Wr[qr]=null;for(;e===Xr;)Xr=Kr[--Yr],Kr[Yr]=null,Gr=Kr[--Yr],Kr[Yr]=null,Jr=Kr[--Yr],Kr[Yr]=null}var ra=null,aa=null,la=!1,oa=null,ia=!1,sa=Error(o(519));function ua(e){throw ma(Er(Error(o(418,"")),e)),sa}function ca(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[Le]=e,t[je]=r,n){case"dialog":Dc("cancel",t),Dc("close",t);break;case"iframe":case"object":case"embed":Dc("load",t);break;case"video":case"audio":for(n=0;n<zc.length;n++)Dc(zc[n],t);break;case"source":Dc("error",t);break;case"img":case"image":case"link":Dc("error",t),Dc("load",t);break;case"details":Dc("toggle",t);break;case"input":Dc("invalid",t),yt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),dt(t);break;case"select":Dc("invalid",t);break;case"textarea":Dc("invalid",t),kt(t,r.value,r.defaultValue,r.children),dt(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Xc(t.textContent,n)?(null!=r.popover&&(Dc("beforetoggle",t),Dc("toggle",t)),null!=r.onScroll&&Dc("scroll",t),null!=r.onScrollEnd&&Dc("scrollend",t),null!=r.onClick&&(t.onclick=Jc),t=!0):t=!1,t||ua(e)}function da(e){for(ra=e.return;ra;)switch(ra.tag){case 5:case 13:return void(ia=!1);case 27:case 3:return void(ia=!0);default:ra=ra.return}}function fa(e){if(e!==ra)return!1;if(!la)return da(e),la=!0,!1;var t,n=e.tag;if((t=3!==n&&27!==n)&&((t=5===n)&&(t=!("form"!==(t=e.type)&&"button"!==t)||od(e.type,e.memoizedProps)),t=!t),t&&aa&&ua(e),da(e),13===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){aa=yd(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}aa=null}}else 27===n?(n=aa,pd(e.type)?(e=vd,vd=null,aa=e):aa=n):aa=ra?yd(e.stateNode.nextSibling):null;return!0}function pa(){aa=ra=null,la=!1}function ha(){var e=oa;return null!==e&&(null===bu?bu=e:bu.push.apply(bu,e),oa=null),e}function ma(e){null===oa?oa=[e]:oa.push(e)}var ga=U(null),ya=null,va=null;function ba(e,t,n){I(ga,t._currentValue),t._currentValue=n}function wa(e){e._currentValue=ga.current,$(ga)}function ka(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Sa(e,t,n,r){var a=e.child;for(null!==a&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){var i=a.child;l=l.firstContext;e:for(;null!==l;){var s=l;l=a;for(var u=0;u<t.length;u++)if(s.context===t[u]){l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),ka(l.return,n,e),r||(i=null);break e}l=s.next}}else if(18===a.tag){if(null===(i=a.return))throw Error(o(341));i.lanes|=n,null!==(l=i.alternate)&&(l.lanes|=n),ka(i,n,e),i=null}else i=a.child;if(null!==i)i.return=a;else for(i=a;null!==i;){if(i===e){i=null;break}if(null!==(a=i.sibling)){a.return=i.return,i=a;break}i=i.return}a=i}}function xa(e,t,n,r){e=null;for(var a=t,l=!1;null!==a;){if(!l)if(0!==(524288&a.flags))l=!0;else if(0!==(262144&a.flags))break;if(10===a.tag){var i=a.alternate;if(null===i)throw Error(o(387));if(null!==(i=i.memoizedProps)){var s=a.type;Yn(a.pendingProps.value,i.value)||(null!==e?e.push(s):e=[s])}}else if(a===q.current){if(null===(i=a.alternate))throw Error(o(387));i.memoizedState.memoizedState!==a.memoizedState.memoizedState&&(null!==e?e.push(Kd):e=[Kd])}a=a.return}null!==e&&Sa(t,e,n,r),t.flags|=262144}function Ea(e){for(e=e.firstContext;null!==e;){if(!Yn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Ca(e){ya=e,va=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function Na(e){return Pa(ya,e)}function Ra(e,t){return null===ya&&Ca(e),Pa(e,t)}function Pa(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===va){if(null===e)throw Error(o(308));va=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else va=va.next=t;return n}var Ta="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach((function(e){return e()}))}},_a=r.unstable_scheduleCallback,Oa=r.unstable_NormalPriority,La={$$typeof:k,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function ja(){return{controller:new Ta,data:new Map,refCount:0}}function za(e){e.refCount--,0===e.refCount&&_a(Oa,(function(){e.controller.abort()}))}var Aa=null,Fa=0,Da=0,Ma=null;function Ua(){if(0===--Fa&&null!==Aa){null!==Ma&&(Ma.status="fulfilled");var e=Aa;Aa=null,Da=0,Ma=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var $a=z.S;z.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===Aa){var n=Aa=[];Fa=0,Da=Tc(),Ma={status:"pending",value:void 0,then:function(e){n.push(e)}}}Fa++,t.then(Ua,Ua)}(0,t),null!==$a&&$a(e,t)};var Ia=U(null);function Ba(){var e=Ia.current;return null!==e?e:ru.pooledCache}function Ha(e,t){I(Ia,null===t?Ia.current:t.pool)}function Wa(){var e=Ba();return null===e?null:{parent:La._currentValue,pool:e}}var qa=Error(o(460)),Va=Error(o(474)),Qa=Error(o(542)),Ka={then:function(){}};function Ya(e){return"fulfilled"===(e=e.status)||"rejected"===e}function Xa(){}function Ja(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(Xa,Xa),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e;default:if("string"===typeof t.status)t.then(Xa,Xa);else{if(null!==(e=ru)&&100<e.shellSuspendCounter)throw Error(o(482));(e=t).status="pending",e.then((function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}}),(function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}}))}switch(t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e}throw Ga=t,qa}}var Ga=null;function Za(){if(null===Ga)throw Error(o(459));var e=Ga;return Ga=null,e}function el(e){if(e===qa||e===Qa)throw Error(o(483))}var tl=!1;function nl(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function rl(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function al(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function ll(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&nu)){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,t=jr(e),Lr(e,null,n),t}return Tr(e,r,t,n),jr(e)}function ol(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194048&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Re(e,n)}}function il(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,l=null;if(null!==(n=n.firstBaseUpdate)){do{var o={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===l?a=l=o:l=l.next=o,n=n.next}while(null!==n);null===l?a=l=t:l=l.next=t}else a=l=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:l,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var sl=!1;function ul(){if(sl){if(null!==Ma)throw Ma}}function cl(e,t,n,r){sl=!1;var a=e.updateQueue;tl=!1;var l=a.firstBaseUpdate,o=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var s=i,u=s.next;s.next=null,null===o?l=u:o.next=u,o=s;var c=e.alternate;null!==c&&((i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=u:i.next=u,c.lastBaseUpdate=s))}if(null!==l){var d=a.baseState;for(o=0,c=u=s=null,i=l;;){var p=-536870913&i.lane,h=p!==i.lane;if(h?(lu&p)===p:(r&p)===p){0!==p&&p===Da&&(sl=!0),null!==c&&(c=c.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});e:{var m=e,g=i;p=t;var y=n;switch(g.tag){case 1:if("function"===typeof(m=g.payload)){d=m.call(y,d,p);break e}d=m;break e;case 3:m.flags=-65537&m.flags|128;case 0:if(null===(p="function"===typeof(m=g.payload)?m.call(y,d,p):m)||void 0===p)break e;d=f({},d,p);break e;case 2:tl=!0}}null!==(p=i.callback)&&(e.flags|=64,h&&(e.flags|=8192),null===(h=a.callbacks)?a.callbacks=[p]:h.push(p))}else h={lane:p,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(u=c=h,s=d):c=c.next=h,o|=p;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(h=i).next,h.next=null,a.lastBaseUpdate=h,a.shared.pending=null}}null===c&&(s=d),a.baseState=s,a.firstBaseUpdate=u,a.lastBaseUpdate=c,null===l&&(a.shared.lanes=0),pu|=o,e.lanes=o,e.memoizedState=d}}function dl(e,t){if("function"!==typeof e)throw Error(o(191,e));e.call(t)}function fl(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)dl(n[e],t)}var pl=U(null),hl=U(0);function ml(e,t){I(hl,e=du),I(pl,t),du=e|t.baseLanes}function gl(){I(hl,du),I(pl,pl.current)}function yl(){du=hl.current,$(pl),$(hl)}var vl=0,bl=null,wl=null,kl=null,Sl=!1,xl=!1,El=!1,Cl=0,Nl=0,Rl=null,Pl=0;function Tl(){throw Error(o(321))}function _l(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Yn(e[n],t[n]))return!1;return!0}function Ol(e,t,n,r,a,l){return vl=l,bl=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,z.H=null===e||null===e.memoizedState?Vo:Qo,El=!1,l=n(r,a),El=!1,xl&&(l=jl(t,n,r,a)),Ll(e),l}function Ll(e){z.H=qo;var t=null!==wl&&null!==wl.next;if(vl=0,kl=wl=bl=null,Sl=!1,Nl=0,Rl=null,t)throw Error(o(300));null===e||Ri||null!==(e=e.dependencies)&&Ea(e)&&(Ri=!0)}function jl(e,t,n,r){bl=e;var a=0;do{if(xl&&(Rl=null),Nl=0,xl=!1,25<=a)throw Error(o(301));if(a+=1,kl=wl=null,null!=e.updateQueue){var l=e.updateQueue;l.lastEffect=null,l.events=null,l.stores=null,null!=l.memoCache&&(l.memoCache.index=0)}z.H=Ko,l=t(n,r)}while(xl);return l}function zl(){var e=z.H,t=e.useState()[0];return t="function"===typeof t.then?$l(t):t,e=e.useState()[0],(null!==wl?wl.memoizedState:null)!==e&&(bl.flags|=1024),t}function Al(){var e=0!==Cl;return Cl=0,e}function Fl(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function Dl(e){if(Sl){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}Sl=!1}vl=0,kl=wl=bl=null,xl=!1,Nl=Cl=0,Rl=null}function Ml(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===kl?bl.memoizedState=kl=e:kl=kl.next=e,kl}function Ul(){if(null===wl){var e=bl.alternate;e=null!==e?e.memoizedState:null}else e=wl.next;var t=null===kl?bl.memoizedState:kl.next;if(null!==t)kl=t,wl=e;else{if(null===e){if(null===bl.alternate)throw Error(o(467));throw Error(o(310))}e={memoizedState:(wl=e).memoizedState,baseState:wl.baseState,baseQueue:wl.baseQueue,queue:wl.queue,next:null},null===kl?bl.memoizedState=kl=e:kl=kl.next=e}return kl}function $l(e){var t=Nl;return Nl+=1,null===Rl&&(Rl=[]),e=Ja(Rl,e,t),t=bl,null===(null===kl?t.memoizedState:kl.next)&&(t=t.alternate,z.H=null===t||null===t.memoizedState?Vo:Qo),e}function Il(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return $l(e);if(e.$$typeof===k)return Na(e)}throw Error(o(438,String(e)))}function Bl(e){var t=null,n=bl.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=bl.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map((function(e){return e.slice()})),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},bl.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=P;return t.index++,n}function Hl(e,t){return"function"===typeof t?t(e):t}function Wl(e){return ql(Ul(),wl,e)}function ql(e,t,n){var r=e.queue;if(null===r)throw Error(o(311));r.lastRenderedReducer=n;var a=e.baseQueue,l=r.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}t.baseQueue=a=l,r.pending=null}if(l=e.baseState,null===a)e.memoizedState=l;else{var s=i=null,u=null,c=t=a.next,d=!1;do{var f=-536870913&c.lane;if(f!==c.lane?(lu&f)===f:(vl&f)===f){var p=c.revertLane;if(0===p)null!==u&&(u=u.next={lane:0,revertLane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),f===Da&&(d=!0);else{if((vl&p)===p){c=c.next,p===Da&&(d=!0);continue}f={lane:0,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(s=u=f,i=l):u=u.next=f,bl.lanes|=p,pu|=p}f=c.action,El&&n(l,f),l=c.hasEagerState?c.eagerState:n(l,f)}else p={lane:f,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(s=u=p,i=l):u=u.next=p,bl.lanes|=f,pu|=f;c=c.next}while(null!==c&&c!==t);if(null===u?i=l:u.next=s,!Yn(l,e.memoizedState)&&(Ri=!0,d&&null!==(n=Ma)))throw n;e.memoizedState=l,e.baseState=i,e.baseQueue=u,r.lastRenderedState=l}return null===a&&(r.lanes=0),[e.memoizedState,r.dispatch]}function Vl(e){var t=Ul(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);Yn(l,t.memoizedState)||(Ri=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function Ql(e,t,n){var r=bl,a=Ul(),l=la;if(l){if(void 0===n)throw Error(o(407));n=n()}else n=t();var i=!Yn((wl||a).memoizedState,n);if(i&&(a.memoizedState=n,Ri=!0),a=a.queue,yo(2048,8,Xl.bind(null,r,a,e),[e]),a.getSnapshot!==t||i||null!==kl&&1&kl.memoizedState.tag){if(r.flags|=2048,ho(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,a,n,t),null),null===ru)throw Error(o(349));l||0!==(124&vl)||Kl(r,t,n)}return n}function Kl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=bl.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},bl.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Yl(e,t,n,r){t.value=n,t.getSnapshot=r,Jl(t)&&Gl(e)}function Xl(e,t,n){return n((function(){Jl(t)&&Gl(e)}))}function Jl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Yn(e,n)}catch(r){return!0}}function Gl(e){var t=Or(e,2);null!==t&&Fu(t,e,2)}function Zl(e){var t=Ml();if("function"===typeof e){var n=e;if(e=n(),El){fe(!0);try{n()}finally{fe(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Hl,lastRenderedState:e},t}function eo(e,t,n,r){return e.baseState=n,ql(e,wl,"function"===typeof r?r:Hl)}function to(e,t,n,r,a){if(Bo(e))throw Error(o(485));if(null!==(e=t.action)){var l={payload:a,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){l.listeners.push(e)}};null!==z.T?n(!0):l.isTransition=!1,r(l),null===(n=t.pending)?(l.next=t.pending=l,no(t,l)):(l.next=n.next,t.pending=n.next=l)}}function no(e,t){var n=t.action,r=t.payload,a=e.state;if(t.isTransition){var l=z.T,o={};z.T=o;try{var i=n(a,r),s=z.S;null!==s&&s(o,i),ro(e,t,i)}catch(u){lo(e,t,u)}finally{z.T=l}}else try{ro(e,t,l=n(a,r))}catch(c){lo(e,t,c)}}function ro(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then((function(n){ao(e,t,n)}),(function(n){return lo(e,t,n)})):ao(e,t,n)}function ao(e,t,n){t.status="fulfilled",t.value=n,oo(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,no(e,n)))}function lo(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,oo(t),t=t.next}while(t!==r)}e.action=null}function oo(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function io(e,t){return t}function so(e,t){if(la){var n=ru.formState;if(null!==n){e:{var r=bl;if(la){if(aa){t:{for(var a=aa,l=ia;8!==a.nodeType;){if(!l){a=null;break t}if(null===(a=yd(a.nextSibling))){a=null;break t}}a="F!"===(l=a.data)||"F"===l?a:null}if(a){aa=yd(a.nextSibling),r="F!"===a.data;break e}}ua(r)}r=!1}r&&(t=n[0])}}return(n=Ml()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:io,lastRenderedState:t},n.queue=r,n=Uo.bind(null,bl,r),r.dispatch=n,r=Zl(!1),l=Io.bind(null,bl,!1,r.queue),a={state:t,dispatch:null,action:e,pending:null},(r=Ml()).queue=a,n=to.bind(null,bl,a,l,n),a.dispatch=n,r.memoizedState=e,[t,n,!1]}function uo(e){return co(Ul(),wl,e)}function co(e,t,n){if(t=ql(e,t,io)[0],e=Wl(Hl)[0],"object"===typeof t&&null!==t&&"function"===typeof t.then)try{var r=$l(t)}catch(o){if(o===qa)throw Qa;throw o}else r=t;var a=(t=Ul()).queue,l=a.dispatch;return n!==t.memoizedState&&(bl.flags|=2048,ho(9,{destroy:void 0,resource:void 0},fo.bind(null,a,n),null)),[r,l,e]}function fo(e,t){e.action=t}function po(e){var t=Ul(),n=wl;if(null!==n)return co(t,n,e);Ul(),t=t.memoizedState;var r=(n=Ul()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function ho(e,t,n,r){return e={tag:e,create:n,deps:r,inst:t,next:null},null===(t=bl.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},bl.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function mo(){return Ul().memoizedState}function go(e,t,n,r){var a=Ml();r=void 0===r?null:r,bl.flags|=e,a.memoizedState=ho(1|t,{destroy:void 0,resource:void 0},n,r)}function yo(e,t,n,r){var a=Ul();r=void 0===r?null:r;var l=a.memoizedState.inst;null!==wl&&null!==r&&_l(r,wl.memoizedState.deps)?a.memoizedState=ho(t,l,n,r):(bl.flags|=e,a.memoizedState=ho(1|t,l,n,r))}function vo(e,t){go(8390656,8,e,t)}function bo(e,t){yo(2048,8,e,t)}function wo(e,t){return yo(4,2,e,t)}function ko(e,t){return yo(4,4,e,t)}function So(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function xo(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,yo(4,4,So.bind(null,t,e),n)}function Eo(){}function Co(e,t){var n=Ul();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&_l(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function No(e,t){var n=Ul();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&_l(t,r[1]))return r[0];if(r=e(),El){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r}function Ro(e,t,n){return void 0===n||0!==(1073741824&vl)?e.memoizedState=t:(e.memoizedState=n,e=Au(),bl.lanes|=e,pu|=e,n)}function Po(e,t,n,r){return Yn(n,t)?n:null!==pl.current?(e=Ro(e,n,r),Yn(e,t)||(Ri=!0),e):0===(42&vl)?(Ri=!0,e.memoizedState=n):(e=Au(),bl.lanes|=e,pu|=e,t)}function To(e,t,n,r,a){var l=A.p;A.p=0!==l&&8>l?l:8;var o=z.T,i={};z.T=i,Io(e,!1,t,n);try{var s=a(),u=z.S;if(null!==u&&u(i,s),null!==s&&"object"===typeof s&&"function"===typeof s.then)$o(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then((function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)}),(function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)})),r}(s,r),zu());else $o(e,t,r,zu())}catch(c){$o(e,t,{then:function(){},status:"rejected",reason:c},zu())}finally{A.p=l,z.T=o}}function _o(){}function Oo(e,t,n,r){if(5!==e.tag)throw Error(o(476));var a=Lo(e).queue;To(e,a,t,F,null===n?_o:function(){return jo(e),n(r)})}function Lo(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:F,baseState:F,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Hl,lastRenderedState:F},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Hl,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function jo(e){$o(e,Lo(e).next.queue,{},zu())}function zo(){return Na(Kd)}function Ao(){return Ul().memoizedState}function Fo(){return Ul().memoizedState}function Do(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=zu(),r=ll(t,e=al(n),n);return null!==r&&(Fu(r,t,n),ol(r,t,n)),t={cache:ja()},void(e.payload=t)}t=t.return}}function Mo(e,t,n){var r=zu();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},Bo(e)?Ho(t,n):null!==(n=_r(e,t,n,r))&&(Fu(n,e,r),Wo(n,t,r))}function Uo(e,t,n){$o(e,t,n,zu())}function $o(e,t,n,r){var a={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(Bo(e))Ho(t,a);else{var l=e.alternate;if(0===e.lanes&&(null===l||0===l.lanes)&&null!==(l=t.lastRenderedReducer))try{var o=t.lastRenderedState,i=l(o,n);if(a.hasEagerState=!0,a.eagerState=i,Yn(i,o))return Tr(e,t,a,0),null===ru&&Pr(),!1}catch(s){}if(null!==(n=_r(e,t,a,r)))return Fu(n,e,r),Wo(n,t,r),!0}return!1}function Io(e,t,n,r){if(r={lane:2,revertLane:Tc(),action:r,hasEagerState:!1,eagerState:null,next:null},Bo(e)){if(t)throw Error(o(479))}else null!==(t=_r(e,n,r,2))&&Fu(t,e,2)}function Bo(e){var t=e.alternate;return e===bl||null!==t&&t===bl}function Ho(e,t){xl=Sl=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Wo(e,t,n){if(0!==(4194048&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Re(e,n)}}var qo={readContext:Na,use:Il,useCallback:Tl,useContext:Tl,useEffect:Tl,useImperativeHandle:Tl,useLayoutEffect:Tl,useInsertionEffect:Tl,useMemo:Tl,useReducer:Tl,useRef:Tl,useState:Tl,useDebugValue:Tl,useDeferredValue:Tl,useTransition:Tl,useSyncExternalStore:Tl,useId:Tl,useHostTransitionStatus:Tl,useFormState:Tl,useActionState:Tl,useOptimistic:Tl,useMemoCache:Tl,useCacheRefresh:Tl},Vo={readContext:Na,use:Il,useCallback:function(e,t){return Ml().memoizedState=[e,void 0===t?null:t],e},useContext:Na,useEffect:vo,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,go(4194308,4,So.bind(null,t,e),n)},useLayoutEffect:function(e,t){return go(4194308,4,e,t)},useInsertionEffect:function(e,t){go(4,2,e,t)},useMemo:function(e,t){var n=Ml();t=void 0===t?null:t;var r=e();if(El){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=Ml();if(void 0!==n){var a=n(t);if(El){fe(!0);try{n(t)}finally{fe(!1)}}}else a=t;return r.memoizedState=r.baseState=a,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:a},r.queue=e,e=e.dispatch=Mo.bind(null,bl,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Ml().memoizedState=e},useState:function(e){var t=(e=Zl(e)).queue,n=Uo.bind(null,bl,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:Eo,useDeferredValue:function(e,t){return Ro(Ml(),e,t)},useTransition:function(){var e=Zl(!1);return e=To.bind(null,bl,e.queue,!0,!1),Ml().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=bl,a=Ml();if(la){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===ru)throw Error(o(349));0!==(124&lu)||Kl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,vo(Xl.bind(null,r,l,e),[e]),r.flags|=2048,ho(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,l,n,t),null),n},useId:function(){var e=Ml(),t=ru.identifierPrefix;if(la){var n=Gr;t="\xab"+t+"R"+(n=(Jr&~(1<<32-pe(Jr)-1)).toString(32)+n),0<(n=Cl++)&&(t+="H"+n.toString(32)),t+="\xbb"}else t="\xab"+t+"r"+(n=Pl++).toString(32)+"\xbb";return e.memoizedState=t},useHostTransitionStatus:zo,useFormState:so,useActionState:so,useOptimistic:function(e){var t=Ml();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=Io.bind(null,bl,!0,n),n.dispatch=t,[e,t]},useMemoCache:Bl,useCacheRefresh:function(){return Ml().memoizedState=Do.bind(null,bl)}},Qo={readContext:Na,use:Il,useCallback:Co,useContext:Na,useEffect:bo,useImperativeHandle:xo,useInsertionEffect:wo,useLayoutEffect:ko,useMemo:No,useReducer:Wl,useRef:mo,useState:function(){return Wl(Hl)},useDebugValue:Eo,useDeferredValue:function(e,t){return Po(Ul(),wl.memoizedState,e,t)},useTransition:function(){var e=Wl(Hl)[0],t=Ul().memoizedState;return["boolean"===typeof e?e:$l(e),t]},useSyncExternalStore:Ql,useId:Ao,useHostTransitionStatus:zo,useFormState:uo,useActionState:uo,useOptimistic:function(e,t){return eo(Ul(),0,e,t)},useMemoCache:Bl,useCacheRefresh:Fo},Ko={readContext:Na,use:Il,useCallback:Co,useContext:Na,useEffect:bo,useImperativeHandle:xo,useInsertionEffect:wo,useLayoutEffect:ko,useMemo:No,useReducer:Vl,useRef:mo,useState:function(){return Vl(Hl)},useDebugValue:Eo,useDeferredValue:function(e,t){var n=Ul();return null===wl?Ro(n,e,t):Po(n,wl.memoizedState,e,t)},useTransition:function(){var e=Vl(Hl)[0],t=Ul().memoizedState;return["boolean"===typeof e?e:$l(e),t]},useSyncExternalStore:Ql,useId:Ao,useHostTransitionStatus:zo,useFormState:po,useActionState:po,useOptimistic:function(e,t){var n=Ul();return null!==wl?eo(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:Bl,useCacheRefresh:Fo},Yo=null,Xo=0;function Jo(e){var t=Xo;return Xo+=1,null===Yo&&(Yo=[]),Ja(Yo,e,t)}function Go(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function Zo(e,t){if(t.$$typeof===p)throw Error(o(525));throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ei(e){return(0,e._init)(e._payload)}function ti(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function a(e,t){return(e=Mr(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=67108866,n):r:(t.flags|=67108866,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=67108866),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Br(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function u(e,t,n,r){var l=n.type;return l===g?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===l||"object"===typeof l&&null!==l&&l.$$typeof===N&&ei(l)===t.type)?(Go(t=a(t,n.props),n),t.return=e,t):(Go(t=$r(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Hr(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function d(e,t,n,r,l){return null===t||7!==t.tag?((t=Ir(n,e.mode,r,l)).return=e,t):((t=a(t,n)).return=e,t)}function f(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Br(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case h:return Go(n=$r(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case m:return(t=Hr(t,e.mode,n)).return=e,t;case N:return f(e,t=(0,t._init)(t._payload),n)}if(j(t)||_(t))return(t=Ir(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return f(e,Jo(t),n);if(t.$$typeof===k)return f(e,Ra(e,t),n);Zo(e,t)}return null}function p(e,t,n,r){var a=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==a?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case h:return n.key===a?u(e,t,n,r):null;case m:return n.key===a?c(e,t,n,r):null;case N:return p(e,t,n=(a=n._init)(n._payload),r)}if(j(n)||_(n))return null!==a?null:d(e,t,n,r,null);if("function"===typeof n.then)return p(e,t,Jo(n),r);if(n.$$typeof===k)return p(e,t,Ra(e,n),r);Zo(e,n)}return null}function y(e,t,n,r,a){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return s(t,e=e.get(n)||null,""+r,a);if("object"===typeof r&&null!==r){switch(r.$$typeof){case h:return u(t,e=e.get(null===r.key?n:r.key)||null,r,a);case m:return c(t,e=e.get(null===r.key?n:r.key)||null,r,a);case N:return y(e,t,n,r=(0,r._init)(r._payload),a)}if(j(r)||_(r))return d(t,e=e.get(n)||null,r,a,null);if("function"===typeof r.then)return y(e,t,n,Jo(r),a);if(r.$$typeof===k)return y(e,t,n,Ra(t,r),a);Zo(t,r)}return null}function v(s,u,c,d){if("object"===typeof c&&null!==c&&c.type===g&&null===c.key&&(c=c.props.children),"object"===typeof c&&null!==c){switch(c.$$typeof){case h:e:{for(var b=c.key;null!==u;){if(u.key===b){if((b=c.type)===g){if(7===u.tag){n(s,u.sibling),(d=a(u,c.props.children)).return=s,s=d;break e}}else if(u.elementType===b||"object"===typeof b&&null!==b&&b.$$typeof===N&&ei(b)===u.type){n(s,u.sibling),Go(d=a(u,c.props),c),d.return=s,s=d;break e}n(s,u);break}t(s,u),u=u.sibling}c.type===g?((d=Ir(c.props.children,s.mode,d,c.key)).return=s,s=d):(Go(d=$r(c.type,c.key,c.props,null,s.mode,d),c),d.return=s,s=d)}return i(s);case m:e:{for(b=c.key;null!==u;){if(u.key===b){if(4===u.tag&&u.stateNode.containerInfo===c.containerInfo&&u.stateNode.implementation===c.implementation){n(s,u.sibling),(d=a(u,c.children||[])).return=s,s=d;break e}n(s,u);break}t(s,u),u=u.sibling}(d=Hr(c,s.mode,d)).return=s,s=d}return i(s);case N:return v(s,u,c=(b=c._init)(c._payload),d)}if(j(c))return function(a,o,i,s){for(var u=null,c=null,d=o,h=o=0,m=null;null!==d&&h<i.length;h++){d.index>h?(m=d,d=null):m=d.sibling;var g=p(a,d,i[h],s);if(null===g){null===d&&(d=m);break}e&&d&&null===g.alternate&&t(a,d),o=l(g,o,h),null===c?u=g:c.sibling=g,c=g,d=m}if(h===i.length)return n(a,d),la&&Zr(a,h),u;if(null===d){for(;h<i.length;h++)null!==(d=f(a,i[h],s))&&(o=l(d,o,h),null===c?u=d:c.sibling=d,c=d);return la&&Zr(a,h),u}for(d=r(d);h<i.length;h++)null!==(m=y(d,a,h,i[h],s))&&(e&&null!==m.alternate&&d.delete(null===m.key?h:m.key),o=l(m,o,h),null===c?u=m:c.sibling=m,c=m);return e&&d.forEach((function(e){return t(a,e)})),la&&Zr(a,h),u}(s,u,c,d);if(_(c)){if("function"!==typeof(b=_(c)))throw Error(o(150));return function(a,i,s,u){if(null==s)throw Error(o(151));for(var c=null,d=null,h=i,m=i=0,g=null,v=s.next();null!==h&&!v.done;m++,v=s.next()){h.index>m?(g=h,h=null):g=h.sibling;var b=p(a,h,v.value,u);if(null===b){null===h&&(h=g);break}e&&h&&null===b.alternate&&t(a,h),i=l(b,i,m),null===d?c=b:d.sibling=b,d=b,h=g}if(v.done)return n(a,h),la&&Zr(a,m),c;if(null===h){for(;!v.done;m++,v=s.next())null!==(v=f(a,v.value,u))&&(i=l(v,i,m),null===d?c=v:d.sibling=v,d=v);return la&&Zr(a,m),c}for(h=r(h);!v.done;m++,v=s.next())null!==(v=y(h,a,m,v.value,u))&&(e&&null!==v.alternate&&h.delete(null===v.key?m:v.key),i=l(v,i,m),null===d?c=v:d.sibling=v,d=v);return e&&h.forEach((function(e){return t(a,e)})),la&&Zr(a,m),c}(s,u,c=b.call(c),d)}if("function"===typeof c.then)return v(s,u,Jo(c),d);if(c.$$typeof===k)return v(s,u,Ra(s,c),d);Zo(s,c)}return"string"===typeof c&&""!==c||"number"===typeof c||"bigint"===typeof c?(c=""+c,null!==u&&6===u.tag?(n(s,u.sibling),(d=a(u,c)).return=s,s=d):(n(s,u),(d=Br(c,s.mode,d)).return=s,s=d),i(s)):n(s,u)}return function(e,t,n,r){try{Xo=0;var a=v(e,t,n,r);return Yo=null,a}catch(o){if(o===qa||o===Qa)throw o;var l=Fr(29,o,null,e.mode);return l.lanes=r,l.return=e,l}}}var ni=ti(!0),ri=ti(!1),ai=U(null),li=null;function oi(e){var t=e.alternate;I(ci,1&ci.current),I(ai,e),null===li&&(null===t||null!==pl.current||null!==t.memoizedState)&&(li=e)}function ii(e){if(22===e.tag){if(I(ci,ci.current),I(ai,e),null===li){var t=e.alternate;null!==t&&null!==t.memoizedState&&(li=e)}}else si()}function si(){I(ci,ci.current),I(ai,ai.current)}function ui(e){$(ai),li===e&&(li=null),$(ci)}var ci=U(0);function di(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||gd(n)))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function fi(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:f({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var pi={enqueueSetState:function(e,t,n){e=e._reactInternals;var r=zu(),a=al(r);a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Fu(t,e,r),ol(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=zu(),a=al(r);a.tag=1,a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Fu(t,e,r),ol(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=zu(),r=al(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=ll(e,r,n))&&(Fu(t,e,n),ol(t,e,n))}};function hi(e,t,n,r,a,l,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,l,o):!t.prototype||!t.prototype.isPureReactComponent||(!Xn(n,r)||!Xn(a,l))}function mi(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&pi.enqueueReplaceState(t,t.state,null)}function gi(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var a in n===t&&(n=f({},n)),e)void 0===n[a]&&(n[a]=e[a]);return n}var yi="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function vi(e){yi(e)}function bi(e){console.error(e)}function wi(e){yi(e)}function ki(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout((function(){throw n}))}}function Si(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout((function(){throw r}))}}function xi(e,t,n){return(n=al(n)).tag=3,n.payload={element:null},n.callback=function(){ki(e,t)},n}function Ei(e){return(e=al(e)).tag=3,e}function Ci(e,t,n,r){var a=n.type.getDerivedStateFromError;if("function"===typeof a){var l=r.value;e.payload=function(){return a(l)},e.callback=function(){Si(t,n,r)}}var o=n.stateNode;null!==o&&"function"===typeof o.componentDidCatch&&(e.callback=function(){Si(t,n,r),"function"!==typeof a&&(null===Eu?Eu=new Set([this]):Eu.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var Ni=Error(o(461)),Ri=!1;function Pi(e,t,n,r){t.child=null===e?ri(t,null,n,r):ni(t,e.child,n,r)}function Ti(e,t,n,r,a){n=n.render;var l=t.ref;if("ref"in r){var o={};for(var i in r)"ref"!==i&&(o[i]=r[i])}else o=r;return Ca(t),r=Ol(e,t,n,o,l,a),i=Al(),null===e||Ri?(la&&i&&ta(t),t.flags|=1,Pi(e,t,r,a),t.child):(Fl(e,t,a),Yi(e,t,a))}function _i(e,t,n,r,a){if(null===e){var l=n.type;return"function"!==typeof l||Dr(l)||void 0!==l.defaultProps||null!==n.compare?((e=$r(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=l,Oi(e,t,l,r,a))}if(l=e.child,!Xi(e,a)){var o=l.memoizedProps;if((n=null!==(n=n.compare)?n:Xn)(o,r)&&e.ref===t.ref)return Yi(e,t,a)}return t.flags|=1,(e=Mr(l,r)).ref=t.ref,e.return=t,t.child=e}function Oi(e,t,n,r,a){if(null!==e){var l=e.memoizedProps;if(Xn(l,r)&&e.ref===t.ref){if(Ri=!1,t.pendingProps=r=l,!Xi(e,a))return t.lanes=e.lanes,Yi(e,t,a);0!==(131072&e.flags)&&(Ri=!0)}}return Ai(e,t,n,r,a)}function Li(e,t,n){var r=t.pendingProps,a=r.children,l=null!==e?e.memoizedState:null;if("hidden"===r.mode){if(0!==(128&t.flags)){if(r=null!==l?l.baseLanes|n:n,null!==e){for(a=t.child=e.child,l=0;null!==a;)l=l|a.lanes|a.childLanes,a=a.sibling;t.childLanes=l&~r}else t.childLanes=0,t.child=null;return ji(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,ji(e,t,null!==l?l.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Ha(0,null!==l?l.cachePool:null),null!==l?ml(t,l):gl(),ii(t)}else null!==l?(Ha(0,l.cachePool),ml(t,l),si(),t.memoizedState=null):(null!==e&&Ha(0,null),gl(),si());return Pi(e,t,a,n),t.child}function ji(e,t,n,r){var a=Ba();return a=null===a?null:{parent:La._currentValue,pool:a},t.memoizedState={baseLanes:n,cachePool:a},null!==e&&Ha(0,null),gl(),ii(t),null!==e&&xa(e,t,r,!0),null}function zi(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=4194816);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(o(284));null!==e&&e.ref===n||(t.flags|=4194816)}}function Ai(e,t,n,r,a){return Ca(t),n=Ol(e,t,n,r,void 0,a),r=Al(),null===e||Ri?(la&&r&&ta(t),t.flags|=1,Pi(e,t,n,a),t.child):(Fl(e,t,a),Yi(e,t,a))}function Fi(e,t,n,r,a,l){return Ca(t),t.updateQueue=null,n=jl(t,r,n,a),Ll(e),r=Al(),null===e||Ri?(la&&r&&ta(t),t.flags|=1,Pi(e,t,n,l),t.child):(Fl(e,t,l),Yi(e,t,l))}function Di(e,t,n,r,a){if(Ca(t),null===t.stateNode){var l=zr,o=n.contextType;"object"===typeof o&&null!==o&&(l=Na(o)),l=new n(r,l),t.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,l.updater=pi,t.stateNode=l,l._reactInternals=t,(l=t.stateNode).props=r,l.state=t.memoizedState,l.refs={},nl(t),o=n.contextType,l.context="object"===typeof o&&null!==o?Na(o):zr,l.state=t.memoizedState,"function"===typeof(o=n.getDerivedStateFromProps)&&(fi(t,n,o,r),l.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(o=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),o!==l.state&&pi.enqueueReplaceState(l,l.state,null),cl(t,r,l,a),ul(),l.state=t.memoizedState),"function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){l=t.stateNode;var i=t.memoizedProps,s=gi(n,i);l.props=s;var u=l.context,c=n.contextType;o=zr,"object"===typeof c&&null!==c&&(o=Na(c));var d=n.getDerivedStateFromProps;c="function"===typeof d||"function"===typeof l.getSnapshotBeforeUpdate,i=t.pendingProps!==i,c||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(i||u!==o)&&mi(t,l,r,o),tl=!1;var f=t.memoizedState;l.state=f,cl(t,r,l,a),ul(),u=t.memoizedState,i||f!==u||tl?("function"===typeof d&&(fi(t,n,d,r),u=t.memoizedState),(s=tl||hi(t,n,s,r,f,u,o))?(c||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||("function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"===typeof l.componentDidMount&&(t.flags|=4194308)):("function"===typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),l.props=r,l.state=u,l.context=o,r=s):("function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,rl(e,t),c=gi(n,o=t.memoizedProps),l.props=c,d=t.pendingProps,f=l.context,u=n.contextType,s=zr,"object"===typeof u&&null!==u&&(s=Na(u)),(u="function"===typeof(i=n.getDerivedStateFromProps)||"function"===typeof l.getSnapshotBeforeUpdate)||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(o!==d||f!==s)&&mi(t,l,r,s),tl=!1,f=t.memoizedState,l.state=f,cl(t,r,l,a),ul();var p=t.memoizedState;o!==d||f!==p||tl||null!==e&&null!==e.dependencies&&Ea(e.dependencies)?("function"===typeof i&&(fi(t,n,i,r),p=t.memoizedState),(c=tl||hi(t,n,c,r,f,p,s)||null!==e&&null!==e.dependencies&&Ea(e.dependencies))?(u||"function"!==typeof l.UNSAFE_componentWillUpdate&&"function"!==typeof l.componentWillUpdate||("function"===typeof l.componentWillUpdate&&l.componentWillUpdate(r,p,s),"function"===typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,p,s)),"function"===typeof l.componentDidUpdate&&(t.flags|=4),"function"===typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),l.props=r,l.state=p,l.context=s,r=c):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return l=r,zi(e,t),r=0!==(128&t.flags),l||r?(l=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:l.render(),t.flags|=1,null!==e&&r?(t.child=ni(t,e.child,null,a),t.child=ni(t,null,n,a)):Pi(e,t,n,a),t.memoizedState=l.state,e=t.child):e=Yi(e,t,a),e}function Mi(e,t,n,r){return pa(),t.flags|=256,Pi(e,t,n,r),t.child}var Ui={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function $i(e){return{baseLanes:e,cachePool:Wa()}}function Ii(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=gu),e}function Bi(e,t,n){var r,a=t.pendingProps,l=!1,i=0!==(128&t.flags);if((r=i)||(r=(null===e||null!==e.memoizedState)&&0!==(2&ci.current)),r&&(l=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(la){if(l?oi(t):si(),la){var s,u=aa;if(s=u){e:{for(s=u,u=ia;8!==s.nodeType;){if(!u){u=null;break e}if(null===(s=yd(s.nextSibling))){u=null;break e}}u=s}null!==u?(t.memoizedState={dehydrated:u,treeContext:null!==Xr?{id:Jr,overflow:Gr}:null,retryLane:536870912,hydrationErrors:null},(s=Fr(18,null,null,0)).stateNode=u,s.return=t,t.child=s,ra=t,aa=null,s=!0):s=!1}s||ua(t)}if(null!==(u=t.memoizedState)&&null!==(u=u.dehydrated))return gd(u)?t.lanes=32:t.lanes=536870912,null;ui(t)}return u=a.children,a=a.fallback,l?(si(),u=Wi({mode:"hidden",children:u},l=t.mode),a=Ir(a,l,n,null),u.return=t,a.return=t,u.sibling=a,t.child=u,(l=t.child).memoizedState=$i(n),l.childLanes=Ii(e,r,n),t.memoizedState=Ui,a):(oi(t),Hi(t,u))}if(null!==(s=e.memoizedState)&&null!==(u=s.dehydrated)){if(i)256&t.flags?(oi(t),t.flags&=-257,t=qi(e,t,n)):null!==t.memoizedState?(si(),t.child=e.child,t.flags|=128,t=null):(si(),l=a.fallback,u=t.mode,a=Wi({mode:"visible",children:a.children},u),(l=Ir(l,u,n,null)).flags|=2,a.return=t,l.return=t,a.sibling=l,t.child=a,ni(t,e.child,null,n),(a=t.child).memoizedState=$i(n),a.childLanes=Ii(e,r,n),t.memoizedState=Ui,t=l);else if(oi(t),gd(u)){if(r=u.nextSibling&&u.nextSibling.dataset)var c=r.dgst;r=c,(a=Error(o(419))).stack="",a.digest=r,ma({value:a,source:null,stack:null}),t=qi(e,t,n)}else if(Ri||xa(e,t,n,!1),r=0!==(n&e.childLanes),Ri||r){if(null!==(r=ru)&&(0!==(a=0!==((a=0!==(42&(a=n&-n))?1:Pe(a))&(r.suspendedLanes|n))?0:a)&&a!==s.retryLane))throw s.retryLane=a,Or(e,a),Fu(r,e,a),Ni;"$?"===u.data||Qu(),t=qi(e,t,n)}else"$?"===u.data?(t.flags|=192,t.child=e.child,t=null):(e=s.treeContext,aa=yd(u.nextSibling),ra=t,la=!0,oa=null,ia=!1,null!==e&&(Kr[Yr++]=Jr,Kr[Yr++]=Gr,Kr[Yr++]=Xr,Jr=e.id,Gr=e.overflow,Xr=t),(t=Hi(t,a.children)).flags|=4096);return t}return l?(si(),l=a.fallback,u=t.mode,c=(s=e.child).sibling,(a=Mr(s,{mode:"hidden",children:a.children})).subtreeFlags=65011712&s.subtreeFlags,null!==c?l=Mr(c,l):(l=Ir(l,u,n,null)).flags|=2,l.return=t,a.return=t,a.sibling=l,t.child=a,a=l,l=t.child,null===(u=e.child.memoizedState)?u=$i(n):(null!==(s=u.cachePool)?(c=La._currentValue,s=s.parent!==c?{parent:c,pool:c}:s):s=Wa(),u={baseLanes:u.baseLanes|n,cachePool:s}),l.memoizedState=u,l.childLanes=Ii(e,r,n),t.memoizedState=Ui,a):(oi(t),e=(n=e.child).sibling,(n=Mr(n,{mode:"visible",children:a.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function Hi(e,t){return(t=Wi({mode:"visible",children:t},e.mode)).return=e,e.child=t}function Wi(e,t){return(e=Fr(22,e,null,t)).lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function qi(e,t,n){return ni(t,e.child,null,n),(e=Hi(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Vi(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),ka(e.return,t,n)}function Qi(e,t,n,r,a){var l=e.memoizedState;null===l?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(l.isBackwards=t,l.rendering=null,l.renderingStartTime=0,l.last=r,l.tail=n,l.tailMode=a)}function Ki(e,t,n){var r=t.pendingProps,a=r.revealOrder,l=r.tail;if(Pi(e,t,r.children,n),0!==(2&(r=ci.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Vi(e,n,t);else if(19===e.tag)Vi(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(I(ci,r),a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===di(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),Qi(t,!1,a,n,l);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===di(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}Qi(t,!0,n,null,l);break;case"together":Qi(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Yi(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),pu|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(xa(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Mr(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Mr(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Xi(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Ea(e))}function Ji(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)Ri=!0;else{if(!Xi(e,n)&&0===(128&t.flags))return Ri=!1,function(e,t,n){switch(t.tag){case 3:V(t,t.stateNode.containerInfo),ba(0,La,e.memoizedState.cache),pa();break;case 27:case 5:K(t);break;case 4:V(t,t.stateNode.containerInfo);break;case 10:ba(0,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(oi(t),t.flags|=128,null):0!==(n&t.child.childLanes)?Bi(e,t,n):(oi(t),null!==(e=Yi(e,t,n))?e.sibling:null);oi(t);break;case 19:var a=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(xa(e,t,n,!1),r=0!==(n&t.childLanes)),a){if(r)return Ki(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),I(ci,ci.current),r)break;return null;case 22:case 23:return t.lanes=0,Li(e,t,n);case 24:ba(0,La,e.memoizedState.cache)}return Yi(e,t,n)}(e,t,n);Ri=0!==(131072&e.flags)}else Ri=!1,la&&0!==(1048576&t.flags)&&ea(t,Qr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,a=r._init;if(r=a(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((a=r.$$typeof)===S){t.tag=11,t=Ti(null,t,r,e,n);break e}if(a===C){t.tag=14,t=_i(null,t,r,e,n);break e}}throw t=L(r)||r,Error(o(306,t,""))}Dr(r)?(e=gi(r,e),t.tag=1,t=Di(null,t,r,e,n)):(t.tag=0,t=Ai(null,t,r,e,n))}return t;case 0:return Ai(e,t,t.type,t.pendingProps,n);case 1:return Di(e,t,r=t.type,a=gi(r,t.pendingProps),n);case 3:e:{if(V(t,t.stateNode.containerInfo),null===e)throw Error(o(387));r=t.pendingProps;var l=t.memoizedState;a=l.element,rl(e,t),cl(t,r,null,n);var i=t.memoizedState;if(r=i.cache,ba(0,La,r),r!==l.cache&&Sa(t,[La],n,!0),ul(),r=i.element,l.isDehydrated){if(l={element:r,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=l,t.memoizedState=l,256&t.flags){t=Mi(e,t,r,n);break e}if(r!==a){ma(a=Er(Error(o(424)),t)),t=Mi(e,t,r,n);break e}if(9===(e=t.stateNode.containerInfo).nodeType)e=e.body;else e="HTML"===e.nodeName?e.ownerDocument.body:e;for(aa=yd(e.firstChild),ra=t,la=!0,oa=null,ia=!0,n=ri(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(pa(),r===a){t=Yi(e,t,n);break e}Pi(e,t,r,n)}t=t.child}return t;case 26:return zi(e,t),null===e?(n=Pd(t.type,null,t.pendingProps,null))?t.memoizedState=n:la||(n=t.type,e=t.pendingProps,(r=rd(W.current).createElement(n))[Le]=t,r[je]=e,ed(r,n,e),qe(r),t.stateNode=r):t.memoizedState=Pd(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return K(t),null===e&&la&&(r=t.stateNode=wd(t.type,t.pendingProps,W.current),ra=t,ia=!0,a=aa,pd(t.type)?(vd=a,aa=yd(r.firstChild)):aa=a),Pi(e,t,t.pendingProps.children,n),zi(e,t),null===e&&(t.flags|=4194304),t.child;case 5:return null===e&&la&&((a=r=aa)&&(null!==(r=function(e,t,n,r){for(;1===e.nodeType;){var a=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[Ue])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(l=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(l!==a.rel||e.getAttribute("href")!==(null==a.href||""===a.href?null:a.href)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin)||e.getAttribute("title")!==(null==a.title?null:a.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((l=e.getAttribute("src"))!==(null==a.src?null:a.src)||e.getAttribute("type")!==(null==a.type?null:a.type)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin))&&l&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var l=null==a.name?null:""+a.name;if("hidden"===a.type&&e.getAttribute("name")===l)return e}if(null===(e=yd(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,ia))?(t.stateNode=r,ra=t,aa=yd(r.firstChild),ia=!1,a=!0):a=!1),a||ua(t)),K(t),a=t.type,l=t.pendingProps,i=null!==e?e.memoizedProps:null,r=l.children,od(a,l)?r=null:null!==i&&od(a,i)&&(t.flags|=32),null!==t.memoizedState&&(a=Ol(e,t,zl,null,null,n),Kd._currentValue=a),zi(e,t),Pi(e,t,r,n),t.child;case 6:return null===e&&la&&((e=n=aa)&&(null!==(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=yd(e.nextSibling)))return null}return e}(n,t.pendingProps,ia))?(t.stateNode=n,ra=t,aa=null,e=!0):e=!1),e||ua(t)),null;case 13:return Bi(e,t,n);case 4:return V(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=ni(t,null,r,n):Pi(e,t,r,n),t.child;case 11:return Ti(e,t,t.type,t.pendingProps,n);case 7:return Pi(e,t,t.pendingProps,n),t.child;case 8:case 12:return Pi(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,ba(0,t.type,r.value),Pi(e,t,r.children,n),t.child;case 9:return a=t.type._context,r=t.pendingProps.children,Ca(t),r=r(a=Na(a)),t.flags|=1,Pi(e,t,r,n),t.child;case 14:return _i(e,t,t.type,t.pendingProps,n);case 15:return Oi(e,t,t.type,t.pendingProps,n);case 19:return Ki(e,t,n);case 31:return r=t.pendingProps,n=t.mode,r={mode:r.mode,children:r.children},null===e?((n=Wi(r,n)).ref=t.ref,t.child=n,n.return=t,t=n):((n=Mr(e.child,r)).ref=t.ref,t.child=n,n.return=t,t=n),t;case 22:return Li(e,t,n);case 24:return Ca(t),r=Na(La),null===e?(null===(a=Ba())&&(a=ru,l=ja(),a.pooledCache=l,l.refCount++,null!==l&&(a.pooledCacheLanes|=n),a=l),t.memoizedState={parent:r,cache:a},nl(t),ba(0,La,a)):(0!==(e.lanes&n)&&(rl(e,t),cl(t,null,null,n),ul()),a=e.memoizedState,l=t.memoizedState,a.parent!==r?(a={parent:r,cache:r},t.memoizedState=a,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=a),ba(0,La,r)):(r=l.cache,ba(0,La,r),r!==a.cache&&Sa(t,[La],n,!0))),Pi(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}function Gi(e){e.flags|=4}function Zi(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!Id(t)){if(null!==(t=ai.current)&&((4194048&lu)===lu?null!==li:(62914560&lu)!==lu&&0===(536870912&lu)||t!==li))throw Ga=Ka,Va;e.flags|=8192}}function es(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?xe():536870912,e.lanes|=t,yu|=t)}function ts(e,t){if(!la)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ns(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=65011712&a.subtreeFlags,r|=65011712&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function rs(e,t,n){var r=t.pendingProps;switch(na(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return ns(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),wa(La),Q(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(fa(t)?Gi(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,ha())),ns(t),null;case 26:return n=t.memoizedState,null===e?(Gi(t),null!==n?(ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217)):n?n!==e.memoizedState?(Gi(t),ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217):(e.memoizedProps!==r&&Gi(t),ns(t),t.flags&=-16777217),null;case 27:Y(t),n=W.current;var a=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Gi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}e=B.current,fa(t)?ca(t):(e=wd(a,r,n),t.stateNode=e,Gi(t))}return ns(t),null;case 5:if(Y(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Gi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}if(e=B.current,fa(t))ca(t);else{switch(a=rd(W.current),e){case 1:e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=a.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?a.createElement("select",{is:r.is}):a.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?a.createElement(n,{is:r.is}):a.createElement(n)}}e[Le]=t,e[je]=r;e:for(a=t.child;null!==a;){if(5===a.tag||6===a.tag)e.appendChild(a.stateNode);else if(4!==a.tag&&27!==a.tag&&null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break e;for(;null===a.sibling;){if(null===a.return||a.return===t)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}t.stateNode=e;e:switch(ed(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&Gi(t)}}return ns(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&Gi(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(e=W.current,fa(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(a=ra))switch(a.tag){case 27:case 5:r=a.memoizedProps}e[Le]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Xc(e.nodeValue,n)))||ua(t)}else(e=rd(e).createTextNode(r))[Le]=t,t.stateNode=e}return ns(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(a=fa(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[Le]=t}else pa(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;ns(t),a=!1}else a=ha(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=a),a=!0;if(!a)return 256&t.flags?(ui(t),t):(ui(t),null)}if(ui(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){a=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(a=r.alternate.memoizedState.cachePool.pool);var l=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(l=r.memoizedState.cachePool.pool),l!==a&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),es(t,t.updateQueue),ns(t),null;case 4:return Q(),null===e&&$c(t.stateNode.containerInfo),ns(t),null;case 10:return wa(t.type),ns(t),null;case 19:if($(ci),null===(a=t.memoizedState))return ns(t),null;if(r=0!==(128&t.flags),null===(l=a.rendering))if(r)ts(a,!1);else{if(0!==fu||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(l=di(e))){for(t.flags|=128,ts(a,!1),e=l.updateQueue,t.updateQueue=e,es(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Ur(n,e),n=n.sibling;return I(ci,1&ci.current|2),t.child}e=e.sibling}null!==a.tail&&te()>Su&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=di(l))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,es(t,e),ts(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!la)return ns(t),null}else 2*te()-a.renderingStartTime>Su&&536870912!==n&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304);a.isBackwards?(l.sibling=t.child,t.child=l):(null!==(e=a.last)?e.sibling=l:t.child=l,a.last=l)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=te(),t.sibling=null,e=ci.current,I(ci,r?1&e|2:1&e),t):(ns(t),null);case 22:case 23:return ui(t),yl(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(ns(t),6&t.subtreeFlags&&(t.flags|=8192)):ns(t),null!==(n=t.updateQueue)&&es(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&$(Ia),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),wa(La),ns(t),null;case 25:case 30:return null}throw Error(o(156,t.tag))}function as(e,t){switch(na(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return wa(La),Q(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return Y(t),null;case 13:if(ui(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));pa()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return $(ci),null;case 4:return Q(),null;case 10:return wa(t.type),null;case 22:case 23:return ui(t),yl(),null!==e&&$(Ia),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return wa(La),null;default:return null}}function ls(e,t){switch(na(t),t.tag){case 3:wa(La),Q();break;case 26:case 27:case 5:Y(t);break;case 4:Q();break;case 13:ui(t);break;case 19:$(ci);break;case 10:wa(t.type);break;case 22:case 23:ui(t),yl(),null!==e&&$(Ia);break;case 24:wa(La)}}function os(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var a=r.next;n=a;do{if((n.tag&e)===e){r=void 0;var l=n.create,o=n.inst;r=l(),o.destroy=r}n=n.next}while(n!==a)}}catch(i){cc(t,t.return,i)}}function is(e,t,n){try{var r=t.updateQueue,a=null!==r?r.lastEffect:null;if(null!==a){var l=a.next;r=l;do{if((r.tag&e)===e){var o=r.inst,i=o.destroy;if(void 0!==i){o.destroy=void 0,a=t;var s=n,u=i;try{u()}catch(c){cc(a,s,c)}}}r=r.next}while(r!==l)}}catch(c){cc(t,t.return,c)}}function ss(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{fl(t,n)}catch(r){cc(e,e.return,r)}}}function us(e,t,n){n.props=gi(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){cc(e,t,r)}}function cs(e,t){try{var n=e.ref;if(null!==n){switch(e.tag){case 26:case 27:case 5:var r=e.stateNode;break;default:r=e.stateNode}"function"===typeof n?e.refCleanup=n(r):n.current=r}}catch(a){cc(e,t,a)}}function ds(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(a){cc(e,t,a)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(l){cc(e,t,l)}else n.current=null}function fs(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(a){cc(e,e.return,a)}}function ps(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var a=null,l=null,i=null,s=null,u=null,c=null,d=null;for(h in n){var f=n[h];if(n.hasOwnProperty(h)&&null!=f)switch(h){case"checked":case"value":break;case"defaultValue":u=f;default:r.hasOwnProperty(h)||Gc(e,t,h,null,r,f)}}for(var p in r){var h=r[p];if(f=n[p],r.hasOwnProperty(p)&&(null!=h||null!=f))switch(p){case"type":l=h;break;case"name":a=h;break;case"checked":c=h;break;case"defaultChecked":d=h;break;case"value":i=h;break;case"defaultValue":s=h;break;case"children":case"dangerouslySetInnerHTML":if(null!=h)throw Error(o(137,t));break;default:h!==f&&Gc(e,t,p,h,r,f)}}return void gt(e,i,s,u,c,d,l,a);case"select":for(l in h=i=s=p=null,n)if(u=n[l],n.hasOwnProperty(l)&&null!=u)switch(l){case"value":break;case"multiple":h=u;default:r.hasOwnProperty(l)||Gc(e,t,l,null,r,u)}for(a in r)if(l=r[a],u=n[a],r.hasOwnProperty(a)&&(null!=l||null!=u))switch(a){case"value":p=l;break;case"defaultValue":s=l;break;case"multiple":i=l;default:l!==u&&Gc(e,t,a,l,r,u)}return t=s,n=i,r=h,void(null!=p?bt(e,!!n,p,!1):!!r!==!!n&&(null!=t?bt(e,!!n,t,!0):bt(e,!!n,n?[]:"",!1)));case"textarea":for(s in h=p=null,n)if(a=n[s],n.hasOwnProperty(s)&&null!=a&&!r.hasOwnProperty(s))switch(s){case"value":case"children":break;default:Gc(e,t,s,null,r,a)}for(i in r)if(a=r[i],l=n[i],r.hasOwnProperty(i)&&(null!=a||null!=l))switch(i){case"value":p=a;break;case"defaultValue":h=a;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=a)throw Error(o(91));break;default:a!==l&&Gc(e,t,i,a,r,l)}return void wt(e,p,h);case"option":for(var m in n)if(p=n[m],n.hasOwnProperty(m)&&null!=p&&!r.hasOwnProperty(m))if("selected"===m)e.selected=!1;else Gc(e,t,m,null,r,p);for(u in r)if(p=r[u],h=n[u],r.hasOwnProperty(u)&&p!==h&&(null!=p||null!=h))if("selected"===u)e.selected=p&&"function"!==typeof p&&"symbol"!==typeof p;else Gc(e,t,u,p,r,h);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var g in n)p=n[g],n.hasOwnProperty(g)&&null!=p&&!r.hasOwnProperty(g)&&Gc(e,t,g,null,r,p);for(c in r)if(p=r[c],h=n[c],r.hasOwnProperty(c)&&p!==h&&(null!=p||null!=h))switch(c){case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(o(137,t));break;default:Gc(e,t,c,p,r,h)}return;default:if(Nt(t)){for(var y in n)p=n[y],n.hasOwnProperty(y)&&void 0!==p&&!r.hasOwnProperty(y)&&Zc(e,t,y,void 0,r,p);for(d in r)p=r[d],h=n[d],!r.hasOwnProperty(d)||p===h||void 0===p&&void 0===h||Zc(e,t,d,p,r,h);return}}for(var v in n)p=n[v],n.hasOwnProperty(v)&&null!=p&&!r.hasOwnProperty(v)&&Gc(e,t,v,null,r,p);for(f in r)p=r[f],h=n[f],!r.hasOwnProperty(f)||p===h||null==p&&null==h||Gc(e,t,f,p,r,h)}(r,e.type,n,t),r[je]=t}catch(a){cc(e,e.return,a)}}function hs(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag&&pd(e.type)||4===e.tag}function ms(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||hs(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(27===e.tag&&pd(e.type))continue e;if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function gs(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?(9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).insertBefore(e,t):((t=9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Jc));else if(4!==r&&(27===r&&pd(e.type)&&(n=e.stateNode,t=null),null!==(e=e.child)))for(gs(e,t,n),e=e.sibling;null!==e;)gs(e,t,n),e=e.sibling}function ys(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&(27===r&&pd(e.type)&&(n=e.stateNode),null!==(e=e.child)))for(ys(e,t,n),e=e.sibling;null!==e;)ys(e,t,n),e=e.sibling}function vs(e){var t=e.stateNode,n=e.memoizedProps;try{for(var r=e.type,a=t.attributes;a.length;)t.removeAttributeNode(a[0]);ed(t,r,n),t[Le]=e,t[je]=n}catch(l){cc(e,e.return,l)}}var bs=!1,ws=!1,ks=!1,Ss="function"===typeof WeakSet?WeakSet:Set,xs=null;function Es(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:Ds(e,n),4&r&&os(5,n);break;case 1:if(Ds(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(o){cc(n,n.return,o)}else{var a=gi(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(a,t,e.__reactInternalSnapshotBeforeUpdate)}catch(i){cc(n,n.return,i)}}64&r&&ss(n),512&r&&cs(n,n.return);break;case 3:if(Ds(e,n),64&r&&null!==(e=n.updateQueue)){if(t=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:t=n.child.stateNode}try{fl(e,t)}catch(o){cc(n,n.return,o)}}break;case 27:null===t&&4&r&&vs(n);case 26:case 5:Ds(e,n),null===t&&4&r&&fs(n),512&r&&cs(n,n.return);break;case 12:Ds(e,n);break;case 13:Ds(e,n),4&r&&_s(e,n),64&r&&(null!==(e=n.memoizedState)&&(null!==(e=e.dehydrated)&&function(e,t){var n=e.ownerDocument;if("$?"!==e.data||"complete"===n.readyState)t();else{var r=function(){t(),n.removeEventListener("DOMContentLoaded",r)};n.addEventListener("DOMContentLoaded",r),e._reactRetry=r}}(e,n=hc.bind(null,n))));break;case 22:if(!(r=null!==n.memoizedState||bs)){t=null!==t&&null!==t.memoizedState||ws,a=bs;var l=ws;bs=r,(ws=t)&&!l?Us(e,n,0!==(8772&n.subtreeFlags)):Ds(e,n),bs=a,ws=l}break;case 30:break;default:Ds(e,n)}}function Cs(e){var t=e.alternate;null!==t&&(e.alternate=null,Cs(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&$e(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Ns=null,Rs=!1;function Ps(e,t,n){for(n=n.child;null!==n;)Ts(e,t,n),n=n.sibling}function Ts(e,t,n){if(de&&"function"===typeof de.onCommitFiberUnmount)try{de.onCommitFiberUnmount(ce,n)}catch(l){}switch(n.tag){case 26:ws||ds(n,t),Ps(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:ws||ds(n,t);var r=Ns,a=Rs;pd(n.type)&&(Ns=n.stateNode,Rs=!1),Ps(e,t,n),kd(n.stateNode),Ns=r,Rs=a;break;case 5:ws||ds(n,t);case 6:if(r=Ns,a=Rs,Ns=null,Ps(e,t,n),Rs=a,null!==(Ns=r))if(Rs)try{(9===Ns.nodeType?Ns.body:"HTML"===Ns.nodeName?Ns.ownerDocument.body:Ns).removeChild(n.stateNode)}catch(o){cc(n,t,o)}else try{Ns.removeChild(n.stateNode)}catch(o){cc(n,t,o)}break;case 18:null!==Ns&&(Rs?(hd(9===(e=Ns).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,n.stateNode),Pf(e)):hd(Ns,n.stateNode));break;case 4:r=Ns,a=Rs,Ns=n.stateNode.containerInfo,Rs=!0,Ps(e,t,n),Ns=r,Rs=a;break;case 0:case 11:case 14:case 15:ws||is(2,n,t),ws||is(4,n,t),Ps(e,t,n);break;case 1:ws||(ds(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&us(n,t,r)),Ps(e,t,n);break;case 21:Ps(e,t,n);break;case 22:ws=(r=ws)||null!==n.memoizedState,Ps(e,t,n),ws=r;break;default:Ps(e,t,n)}}function _s(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{Pf(e)}catch(n){cc(t,t.return,n)}}function Os(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new Ss),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new Ss),t;default:throw Error(o(435,e.tag))}}(e);t.forEach((function(t){var r=mc.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}function Ls(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r],l=e,i=t,s=i;e:for(;null!==s;){switch(s.tag){case 27:if(pd(s.type)){Ns=s.stateNode,Rs=!1;break e}break;case 5:Ns=s.stateNode,Rs=!1;break e;case 3:case 4:Ns=s.stateNode.containerInfo,Rs=!0;break e}s=s.return}if(null===Ns)throw Error(o(160));Ts(l,i,a),Ns=null,Rs=!1,null!==(l=a.alternate)&&(l.return=null),a.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)zs(t,e),t=t.sibling}var js=null;function zs(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Ls(t,e),As(e),4&r&&(is(3,e,e.return),os(3,e),is(5,e,e.return));break;case 1:Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),64&r&&bs&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var a=js;if(Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),4&r){var l=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,a=a.ownerDocument||a;t:switch(r){case"title":(!(l=a.getElementsByTagName("title")[0])||l[Ue]||l[Le]||"http://www.w3.org/2000/svg"===l.namespaceURI||l.hasAttribute("itemprop"))&&(l=a.createElement(r),a.head.insertBefore(l,a.querySelector("head > title"))),ed(l,r,n),l[Le]=e,qe(l),r=l;break e;case"link":var i=Ud("link","href",a).get(r+(n.href||""));if(i)for(var s=0;s<i.length;s++)if((l=i[s]).getAttribute("href")===(null==n.href||""===n.href?null:n.href)&&l.getAttribute("rel")===(null==n.rel?null:n.rel)&&l.getAttribute("title")===(null==n.title?null:n.title)&&l.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;case"meta":if(i=Ud("meta","content",a).get(r+(n.content||"")))for(s=0;s<i.length;s++)if((l=i[s]).getAttribute("content")===(null==n.content?null:""+n.content)&&l.getAttribute("name")===(null==n.name?null:n.name)&&l.getAttribute("property")===(null==n.property?null:n.property)&&l.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&l.getAttribute("charset")===(null==n.charSet?null:n.charSet)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;default:throw Error(o(468,r))}l[Le]=e,qe(l),r=l}e.stateNode=r}else $d(a,e.type,e.stateNode);else e.stateNode=zd(a,r,e.memoizedProps);else l!==r?(null===l?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):l.count--,null===r?$d(a,e.type,e.stateNode):zd(a,r,e.memoizedProps)):null===r&&null!==e.stateNode&&ps(e,e.memoizedProps,n.memoizedProps)}break;case 27:Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),null!==n&&4&r&&ps(e,e.memoizedProps,n.memoizedProps);break;case 5:if(Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),32&e.flags){a=e.stateNode;try{St(a,"")}catch(h){cc(e,e.return,h)}}4&r&&null!=e.stateNode&&ps(e,a=e.memoizedProps,null!==n?n.memoizedProps:a),1024&r&&(ks=!0);break;case 6:if(Ls(t,e),As(e),4&r){if(null===e.stateNode)throw Error(o(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(h){cc(e,e.return,h)}}break;case 3:if(Md=null,a=js,js=Ed(t.containerInfo),Ls(t,e),js=a,As(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Pf(t.containerInfo)}catch(h){cc(e,e.return,h)}ks&&(ks=!1,Fs(e));break;case 4:r=js,js=Ed(e.stateNode.containerInfo),Ls(t,e),As(e),js=r;break;case 12:default:Ls(t,e),As(e);break;case 13:Ls(t,e),As(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(ku=te()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Os(e,r)));break;case 22:a=null!==e.memoizedState;var u=null!==n&&null!==n.memoizedState,c=bs,d=ws;if(bs=c||a,ws=d||u,Ls(t,e),ws=d,bs=c,As(e),8192&r)e:for(t=e.stateNode,t._visibility=a?-2&t._visibility:1|t._visibility,a&&(null===n||u||bs||ws||Ms(e)),n=null,t=e;;){if(5===t.tag||26===t.tag){if(null===n){u=n=t;try{if(l=u.stateNode,a)"function"===typeof(i=l.style).setProperty?i.setProperty("display","none","important"):i.display="none";else{s=u.stateNode;var f=u.memoizedProps.style,p=void 0!==f&&null!==f&&f.hasOwnProperty("display")?f.display:null;s.style.display=null==p||"boolean"===typeof p?"":(""+p).trim()}}catch(h){cc(u,u.return,h)}}}else if(6===t.tag){if(null===n){u=t;try{u.stateNode.nodeValue=a?"":u.memoizedProps}catch(h){cc(u,u.return,h)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,Os(e,n))));break;case 19:Ls(t,e),As(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Os(e,r)));case 30:case 21:}}function As(e){var t=e.flags;if(2&t){try{for(var n,r=e.return;null!==r;){if(hs(r)){n=r;break}r=r.return}if(null==n)throw Error(o(160));switch(n.tag){case 27:var a=n.stateNode;ys(e,ms(e),a);break;case 5:var l=n.stateNode;32&n.flags&&(St(l,""),n.flags&=-33),ys(e,ms(e),l);break;case 3:case 4:var i=n.stateNode.containerInfo;gs(e,ms(e),i);break;default:throw Error(o(161))}}catch(s){cc(e,e.return,s)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function Fs(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;Fs(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function Ds(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)Es(e,t.alternate,t),t=t.sibling}function Ms(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:is(4,t,t.return),Ms(t);break;case 1:ds(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&us(t,t.return,n),Ms(t);break;case 27:kd(t.stateNode);case 26:case 5:ds(t,t.return),Ms(t);break;case 22:null===t.memoizedState&&Ms(t);break;default:Ms(t)}e=e.sibling}}function Us(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,a=e,l=t,o=l.flags;switch(l.tag){case 0:case 11:case 15:Us(a,l,n),os(4,l);break;case 1:if(Us(a,l,n),"function"===typeof(a=(r=l).stateNode).componentDidMount)try{a.componentDidMount()}catch(u){cc(r,r.return,u)}if(null!==(a=(r=l).updateQueue)){var i=r.stateNode;try{var s=a.shared.hiddenCallbacks;if(null!==s)for(a.shared.hiddenCallbacks=null,a=0;a<s.length;a++)dl(s[a],i)}catch(u){cc(r,r.return,u)}}n&&64&o&&ss(l),cs(l,l.return);break;case 27:vs(l);case 26:case 5:Us(a,l,n),n&&null===r&&4&o&&fs(l),cs(l,l.return);break;case 12:Us(a,l,n);break;case 13:Us(a,l,n),n&&4&o&&_s(a,l);break;case 22:null===l.memoizedState&&Us(a,l,n),cs(l,l.return);break;case 30:break;default:Us(a,l,n)}t=t.sibling}}function $s(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&za(n))}function Is(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&za(e))}function Bs(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Hs(e,t,n,r),t=t.sibling}function Hs(e,t,n,r){var a=t.flags;switch(t.tag){case 0:case 11:case 15:Bs(e,t,n,r),2048&a&&os(9,t);break;case 1:case 13:default:Bs(e,t,n,r);break;case 3:Bs(e,t,n,r),2048&a&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&za(e)));break;case 12:if(2048&a){Bs(e,t,n,r),e=t.stateNode;try{var l=t.memoizedProps,o=l.id,i=l.onPostCommit;"function"===typeof i&&i(o,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(s){cc(t,t.return,s)}}else Bs(e,t,n,r);break;case 23:break;case 22:l=t.stateNode,o=t.alternate,null!==t.memoizedState?2&l._visibility?Bs(e,t,n,r):qs(e,t):2&l._visibility?Bs(e,t,n,r):(l._visibility|=2,Ws(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&a&&$s(o,t);break;case 24:Bs(e,t,n,r),2048&a&&Is(t.alternate,t)}}function Ws(e,t,n,r,a){for(a=a&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var l=e,o=t,i=n,s=r,u=o.flags;switch(o.tag){case 0:case 11:case 15:Ws(l,o,i,s,a),os(8,o);break;case 23:break;case 22:var c=o.stateNode;null!==o.memoizedState?2&c._visibility?Ws(l,o,i,s,a):qs(l,o):(c._visibility|=2,Ws(l,o,i,s,a)),a&&2048&u&&$s(o.alternate,o);break;case 24:Ws(l,o,i,s,a),a&&2048&u&&Is(o.alternate,o);break;default:Ws(l,o,i,s,a)}t=t.sibling}}function qs(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,a=r.flags;switch(r.tag){case 22:qs(n,r),2048&a&&$s(r.alternate,r);break;case 24:qs(n,r),2048&a&&Is(r.alternate,r);break;default:qs(n,r)}t=t.sibling}}var Vs=8192;function Qs(e){if(e.subtreeFlags&Vs)for(e=e.child;null!==e;)Ks(e),e=e.sibling}function Ks(e){switch(e.tag){case 26:Qs(e),e.flags&Vs&&null!==e.memoizedState&&function(e,t,n){if(null===Bd)throw Error(o(475));var r=Bd;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var a=Td(n.href),l=e.querySelector(_d(a));if(l)return null!==(e=l._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=Wd.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=l,void qe(l);l=e.ownerDocument||e,n=Od(n),(a=Sd.get(a))&&Fd(n,a),qe(l=l.createElement("link"));var i=l;i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",n),t.instance=l}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=Wd.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(js,e.memoizedState,e.memoizedProps);break;case 5:default:Qs(e);break;case 3:case 4:var t=js;js=Ed(e.stateNode.containerInfo),Qs(e),js=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=Vs,Vs=16777216,Qs(e),Vs=t):Qs(e))}}function Ys(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Xs(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];xs=r,Zs(r,e)}Ys(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Js(e),e=e.sibling}function Js(e){switch(e.tag){case 0:case 11:case 15:Xs(e),2048&e.flags&&is(9,e,e.return);break;case 3:case 12:default:Xs(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&2&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-3,Gs(e)):Xs(e)}}function Gs(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];xs=r,Zs(r,e)}Ys(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:is(8,t,t.return),Gs(t);break;case 22:2&(n=t.stateNode)._visibility&&(n._visibility&=-3,Gs(t));break;default:Gs(t)}e=e.sibling}}function Zs(e,t){for(;null!==xs;){var n=xs;switch(n.tag){case 0:case 11:case 15:is(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:za(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,xs=r;else e:for(n=e;null!==xs;){var a=(r=xs).sibling,l=r.return;if(Cs(r),r===n){xs=null;break e}if(null!==a){a.return=l,xs=a;break e}xs=l}}}var eu={getCacheForType:function(e){var t=Na(La),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},tu="function"===typeof WeakMap?WeakMap:Map,nu=0,ru=null,au=null,lu=0,ou=0,iu=null,su=!1,uu=!1,cu=!1,du=0,fu=0,pu=0,hu=0,mu=0,gu=0,yu=0,vu=null,bu=null,wu=!1,ku=0,Su=1/0,xu=null,Eu=null,Cu=0,Nu=null,Ru=null,Pu=0,Tu=0,_u=null,Ou=null,Lu=0,ju=null;function zu(){if(0!==(2&nu)&&0!==lu)return lu&-lu;if(null!==z.T){return 0!==Da?Da:Tc()}return _e()}function Au(){0===gu&&(gu=0===(536870912&lu)||la?Se():536870912);var e=ai.current;return null!==e&&(e.flags|=32),gu}function Fu(e,t,n){(e!==ru||2!==ou&&9!==ou)&&null===e.cancelPendingCommit||(Hu(e,0),$u(e,lu,gu,!1)),Ce(e,n),0!==(2&nu)&&e===ru||(e===ru&&(0===(2&nu)&&(hu|=n),4===fu&&$u(e,lu,gu,!1)),Sc(e))}function Du(e,t,n){if(0!==(6&nu))throw Error(o(327));for(var r=!n&&0===(124&t)&&0===(t&e.expiredLanes)||we(e,t),a=r?function(e,t){var n=nu;nu|=2;var r=qu(),a=Vu();ru!==e||lu!==t?(xu=null,Su=te()+500,Hu(e,t)):uu=we(e,t);e:for(;;)try{if(0!==ou&&null!==au){t=au;var l=iu;t:switch(ou){case 1:ou=0,iu=null,Zu(e,t,l,1);break;case 2:case 9:if(Ya(l)){ou=0,iu=null,Gu(t);break}t=function(){2!==ou&&9!==ou||ru!==e||(ou=7),Sc(e)},l.then(t,t);break e;case 3:ou=7;break e;case 4:ou=5;break e;case 7:Ya(l)?(ou=0,iu=null,Gu(t)):(ou=0,iu=null,Zu(e,t,l,7));break;case 5:var i=null;switch(au.tag){case 26:i=au.memoizedState;case 5:case 27:var s=au;if(!i||Id(i)){ou=0,iu=null;var u=s.sibling;if(null!==u)au=u;else{var c=s.return;null!==c?(au=c,ec(c)):au=null}break t}}ou=0,iu=null,Zu(e,t,l,5);break;case 6:ou=0,iu=null,Zu(e,t,l,6);break;case 8:Bu(),fu=6;break e;default:throw Error(o(462))}}Xu();break}catch(d){Wu(e,d)}return va=ya=null,z.H=r,z.A=a,nu=n,null!==au?0:(ru=null,lu=0,Pr(),fu)}(e,t):Ku(e,t,!0),l=r;;){if(0===a){uu&&!r&&$u(e,t,0,!1);break}if(n=e.current.alternate,!l||Uu(n)){if(2===a){if(l=t,e.errorRecoveryDisabledLanes&l)var i=0;else i=0!==(i=-536870913&e.pendingLanes)?i:536870912&i?536870912:0;if(0!==i){t=i;e:{var s=e;a=vu;var u=s.current.memoizedState.isDehydrated;if(u&&(Hu(s,i).flags|=256),2!==(i=Ku(s,i,!1))){if(cu&&!u){s.errorRecoveryDisabledLanes|=l,hu|=l,a=4;break e}l=bu,bu=a,null!==l&&(null===bu?bu=l:bu.push.apply(bu,l))}a=i}if(l=!1,2!==a)continue}}if(1===a){Hu(e,0),$u(e,t,0,!0);break}e:{switch(r=e,l=a){case 0:case 1:throw Error(o(345));case 4:if((4194048&t)!==t)break;case 6:$u(r,t,gu,!su);break e;case 2:bu=null;break;case 3:case 5:break;default:throw Error(o(329))}if((62914560&t)===t&&10<(a=ku+300-te())){if($u(r,t,gu,!su),0!==be(r,0,!0))break e;r.timeoutHandle=sd(Mu.bind(null,r,n,bu,xu,wu,t,gu,hu,yu,su,l,2,-0,0),a)}else Mu(r,n,bu,xu,wu,t,gu,hu,yu,su,l,0,-0,0)}break}a=Ku(e,t,!1),l=!1}Sc(e)}function Mu(e,t,n,r,a,l,i,s,u,c,d,f,p,h){if(e.timeoutHandle=-1,(8192&(f=t.subtreeFlags)||16785408===(16785408&f))&&(Bd={stylesheets:null,count:0,unsuspend:Hd},Ks(t),null!==(f=function(){if(null===Bd)throw Error(o(475));var e=Bd;return e.stylesheets&&0===e.count&&Vd(e,e.stylesheets),0<e.count?function(t){var n=setTimeout((function(){if(e.stylesheets&&Vd(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}}),6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=f(nc.bind(null,e,t,l,n,r,a,i,s,u,d,1,p,h)),void $u(e,l,i,!c);nc(e,t,l,n,r,a,i,s,u)}function Uu(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var a=n[r],l=a.getSnapshot;a=a.value;try{if(!Yn(l(),a))return!1}catch(o){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function $u(e,t,n,r){t&=~mu,t&=~hu,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var a=t;0<a;){var l=31-pe(a),o=1<<l;r[l]=-1,a&=~o}0!==n&&Ne(e,n,t)}function Iu(){return 0!==(6&nu)||(xc(0,!1),!1)}function Bu(){if(null!==au){if(0===ou)var e=au.return;else va=ya=null,Dl(e=au),Yo=null,Xo=0,e=au;for(;null!==e;)ls(e.alternate,e),e=e.return;au=null}}function Hu(e,t){var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,ud(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Bu(),ru=e,au=n=Mr(e.current,null),lu=t,ou=0,iu=null,su=!1,uu=we(e,t),cu=!1,yu=gu=mu=hu=pu=fu=0,bu=vu=null,wu=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var a=31-pe(r),l=1<<a;t|=e[a],r&=~l}return du=t,Pr(),n}function Wu(e,t){bl=null,z.H=qo,t===qa||t===Qa?(t=Za(),ou=3):t===Va?(t=Za(),ou=4):ou=t===Ni?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,iu=t,null===au&&(fu=1,ki(e,Er(t,e.current)))}function qu(){var e=z.H;return z.H=qo,null===e?qo:e}function Vu(){var e=z.A;return z.A=eu,e}function Qu(){fu=4,su||(4194048&lu)!==lu&&null!==ai.current||(uu=!0),0===(134217727&pu)&&0===(134217727&hu)||null===ru||$u(ru,lu,gu,!1)}function Ku(e,t,n){var r=nu;nu|=2;var a=qu(),l=Vu();ru===e&&lu===t||(xu=null,Hu(e,t)),t=!1;var o=fu;e:for(;;)try{if(0!==ou&&null!==au){var i=au,s=iu;switch(ou){case 8:Bu(),o=6;break e;case 3:case 2:case 9:case 6:null===ai.current&&(t=!0);var u=ou;if(ou=0,iu=null,Zu(e,i,s,u),n&&uu){o=0;break e}break;default:u=ou,ou=0,iu=null,Zu(e,i,s,u)}}Yu(),o=fu;break}catch(c){Wu(e,c)}return t&&e.shellSuspendCounter++,va=ya=null,nu=r,z.H=a,z.A=l,null===au&&(ru=null,lu=0,Pr()),o}function Yu(){for(;null!==au;)Ju(au)}function Xu(){for(;null!==au&&!Z();)Ju(au)}function Ju(e){var t=Ji(e.alternate,e,du);e.memoizedProps=e.pendingProps,null===t?ec(e):au=t}function Gu(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Fi(n,t,t.pendingProps,t.type,void 0,lu);break;case 11:t=Fi(n,t,t.pendingProps,t.type.render,t.ref,lu);break;case 5:Dl(t);default:ls(n,t),t=Ji(n,t=au=Ur(t,du),du)}e.memoizedProps=e.pendingProps,null===t?ec(e):au=t}function Zu(e,t,n,r){va=ya=null,Dl(t),Yo=null,Xo=0;var a=t.return;try{if(function(e,t,n,r,a){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&xa(t,n,a,!0),null!==(n=ai.current)){switch(n.tag){case 13:return null===li?Qu():null===n.alternate&&0===fu&&(fu=3),n.flags&=-257,n.flags|=65536,n.lanes=a,r===Ka?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),dc(e,r,a)),!1;case 22:return n.flags|=65536,r===Ka?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),dc(e,r,a)),!1}throw Error(o(435,n.tag))}return dc(e,r,a),Qu(),!1}if(la)return null!==(t=ai.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=a,r!==sa&&ma(Er(e=Error(o(422),{cause:r}),n))):(r!==sa&&ma(Er(t=Error(o(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,a&=-a,e.lanes|=a,r=Er(r,n),il(e,a=xi(e.stateNode,r,a)),4!==fu&&(fu=2)),!1;var l=Error(o(520),{cause:r});if(l=Er(l,n),null===vu?vu=[l]:vu.push(l),4!==fu&&(fu=2),null===t)return!0;r=Er(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=a&-a,n.lanes|=e,il(n,e=xi(n.stateNode,r,e)),!1;case 1:if(t=n.type,l=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==l&&"function"===typeof l.componentDidCatch&&(null===Eu||!Eu.has(l))))return n.flags|=65536,a&=-a,n.lanes|=a,Ci(a=Ei(a),e,n,r),il(n,a),!1}n=n.return}while(null!==n);return!1}(e,a,t,n,lu))return fu=1,ki(e,Er(n,e.current)),void(au=null)}catch(l){if(null!==a)throw au=a,l;return fu=1,ki(e,Er(n,e.current)),void(au=null)}32768&t.flags?(la||1===r?e=!0:uu||0!==(536870912&lu)?e=!1:(su=e=!0,(2===r||9===r||3===r||6===r)&&(null!==(r=ai.current)&&13===r.tag&&(r.flags|=16384))),tc(t,e)):ec(t)}function ec(e){var t=e;do{if(0!==(32768&t.flags))return void tc(t,su);e=t.return;var n=rs(t.alternate,t,du);if(null!==n)return void(au=n);if(null!==(t=t.sibling))return void(au=t);au=t=e}while(null!==t);0===fu&&(fu=5)}function tc(e,t){do{var n=as(e.alternate,e);if(null!==n)return n.flags&=32767,void(au=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(au=e);au=e=n}while(null!==e);fu=6,au=null}function nc(e,t,n,r,a,l,i,s,u){e.cancelPendingCommit=null;do{ic()}while(0!==Cu);if(0!==(6&nu))throw Error(o(327));if(null!==t){if(t===e.current)throw Error(o(177));if(l=t.lanes|t.childLanes,function(e,t,n,r,a,l){var o=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var i=e.entanglements,s=e.expirationTimes,u=e.hiddenUpdates;for(n=o&~n;0<n;){var c=31-pe(n),d=1<<c;i[c]=0,s[c]=-1;var f=u[c];if(null!==f)for(u[c]=null,c=0;c<f.length;c++){var p=f[c];null!==p&&(p.lane&=-536870913)}n&=~d}0!==r&&Ne(e,r,0),0!==l&&0===a&&0!==e.tag&&(e.suspendedLanes|=l&~(o&~t))}(e,n,l|=Rr,i,s,u),e===ru&&(au=ru=null,lu=0),Ru=t,Nu=e,Pu=n,Tu=l,_u=a,Ou=r,0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?(e.callbackNode=null,e.callbackPriority=0,J(le,(function(){return sc(),null}))):(e.callbackNode=null,e.callbackPriority=0),r=0!==(13878&t.flags),0!==(13878&t.subtreeFlags)||r){r=z.T,z.T=null,a=A.p,A.p=2,i=nu,nu|=4;try{!function(e,t){if(e=e.containerInfo,td=nf,tr(e=er(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(g){n=null;break e}var i=0,s=-1,u=-1,c=0,d=0,f=e,p=null;t:for(;;){for(var h;f!==n||0!==a&&3!==f.nodeType||(s=i+a),f!==l||0!==r&&3!==f.nodeType||(u=i+r),3===f.nodeType&&(i+=f.nodeValue.length),null!==(h=f.firstChild);)p=f,f=h;for(;;){if(f===e)break t;if(p===n&&++c===a&&(s=i),p===l&&++d===r&&(u=i),null!==(h=f.nextSibling))break;p=(f=p).parentNode}f=h}n=-1===s||-1===u?null:{start:s,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(nd={focusedElem:e,selectionRange:n},nf=!1,xs=t;null!==xs;)if(e=(t=xs).child,0!==(1024&t.subtreeFlags)&&null!==e)e.return=t,xs=e;else for(;null!==xs;){switch(l=(t=xs).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==l){e=void 0,n=t,a=l.memoizedProps,l=l.memoizedState,r=n.stateNode;try{var m=gi(n.type,a,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(m,l),r.__reactInternalSnapshotBeforeUpdate=e}catch(y){cc(n,n.return,y)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))md(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":md(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(o(163))}if(null!==(e=t.sibling)){e.return=t.return,xs=e;break}xs=t.return}}(e,t)}finally{nu=i,A.p=a,z.T=r}}Cu=1,rc(),ac(),lc()}}function rc(){if(1===Cu){Cu=0;var e=Nu,t=Ru,n=0!==(13878&t.flags);if(0!==(13878&t.subtreeFlags)||n){n=z.T,z.T=null;var r=A.p;A.p=2;var a=nu;nu|=4;try{zs(t,e);var l=nd,o=er(e.containerInfo),i=l.focusedElem,s=l.selectionRange;if(o!==i&&i&&i.ownerDocument&&Zn(i.ownerDocument.documentElement,i)){if(null!==s&&tr(i)){var u=s.start,c=s.end;if(void 0===c&&(c=u),"selectionStart"in i)i.selectionStart=u,i.selectionEnd=Math.min(c,i.value.length);else{var d=i.ownerDocument||document,f=d&&d.defaultView||window;if(f.getSelection){var p=f.getSelection(),h=i.textContent.length,m=Math.min(s.start,h),g=void 0===s.end?m:Math.min(s.end,h);!p.extend&&m>g&&(o=g,g=m,m=o);var y=Gn(i,m),v=Gn(i,g);if(y&&v&&(1!==p.rangeCount||p.anchorNode!==y.node||p.anchorOffset!==y.offset||p.focusNode!==v.node||p.focusOffset!==v.offset)){var b=d.createRange();b.setStart(y.node,y.offset),p.removeAllRanges(),m>g?(p.addRange(b),p.extend(v.node,v.offset)):(b.setEnd(v.node,v.offset),p.addRange(b))}}}}for(d=[],p=i;p=p.parentNode;)1===p.nodeType&&d.push({element:p,left:p.scrollLeft,top:p.scrollTop});for("function"===typeof i.focus&&i.focus(),i=0;i<d.length;i++){var w=d[i];w.element.scrollLeft=w.left,w.element.scrollTop=w.top}}nf=!!td,nd=td=null}finally{nu=a,A.p=r,z.T=n}}e.current=t,Cu=2}}function ac(){if(2===Cu){Cu=0;var e=Nu,t=Ru,n=0!==(8772&t.flags);if(0!==(8772&t.subtreeFlags)||n){n=z.T,z.T=null;var r=A.p;A.p=2;var a=nu;nu|=4;try{Es(e,t.alternate,t)}finally{nu=a,A.p=r,z.T=n}}Cu=3}}function lc(){if(4===Cu||3===Cu){Cu=0,ee();var e=Nu,t=Ru,n=Pu,r=Ou;0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?Cu=5:(Cu=0,Ru=Nu=null,oc(e,e.pendingLanes));var a=e.pendingLanes;if(0===a&&(Eu=null),Te(n),t=t.stateNode,de&&"function"===typeof de.onCommitFiberRoot)try{de.onCommitFiberRoot(ce,t,void 0,128===(128&t.current.flags))}catch(s){}if(null!==r){t=z.T,a=A.p,A.p=2,z.T=null;try{for(var l=e.onRecoverableError,o=0;o<r.length;o++){var i=r[o];l(i.value,{componentStack:i.stack})}}finally{z.T=t,A.p=a}}0!==(3&Pu)&&ic(),Sc(e),a=e.pendingLanes,0!==(4194090&n)&&0!==(42&a)?e===ju?Lu++:(Lu=0,ju=e):Lu=0,xc(0,!1)}}function oc(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,za(t)))}function ic(e){return rc(),ac(),lc(),sc()}function sc(){if(5!==Cu)return!1;var e=Nu,t=Tu;Tu=0;var n=Te(Pu),r=z.T,a=A.p;try{A.p=32>n?32:n,z.T=null,n=_u,_u=null;var l=Nu,i=Pu;if(Cu=0,Ru=Nu=null,Pu=0,0!==(6&nu))throw Error(o(331));var s=nu;if(nu|=4,Js(l.current),Hs(l,l.current,i,n),nu=s,xc(0,!1),de&&"function"===typeof de.onPostCommitFiberRoot)try{de.onPostCommitFiberRoot(ce,l)}catch(u){}return!0}finally{A.p=a,z.T=r,oc(e,t)}}function uc(e,t,n){t=Er(n,t),null!==(e=ll(e,t=xi(e.stateNode,t,2),2))&&(Ce(e,2),Sc(e))}function cc(e,t,n){if(3===e.tag)uc(e,e,n);else for(;null!==t;){if(3===t.tag){uc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Eu||!Eu.has(r))){e=Er(n,e),null!==(r=ll(t,n=Ei(2),2))&&(Ci(n,r,t,e),Ce(r,2),Sc(r));break}}t=t.return}}function dc(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new tu;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(cu=!0,a.add(n),e=fc.bind(null,e,t,n),t.then(e,e))}function fc(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,ru===e&&(lu&n)===n&&(4===fu||3===fu&&(62914560&lu)===lu&&300>te()-ku?0===(2&nu)&&Hu(e,0):mu|=n,yu===lu&&(yu=0)),Sc(e)}function pc(e,t){0===t&&(t=xe()),null!==(e=Or(e,t))&&(Ce(e,t),Sc(e))}function hc(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),pc(e,n)}function mc(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(o(314))}null!==r&&r.delete(t),pc(e,n)}var gc=null,yc=null,vc=!1,bc=!1,wc=!1,kc=0;function Sc(e){e!==yc&&null===e.next&&(null===yc?gc=yc=e:yc=yc.next=e),bc=!0,vc||(vc=!0,dd((function(){0!==(6&nu)?J(re,Ec):Cc()})))}function xc(e,t){if(!wc&&bc){wc=!0;do{for(var n=!1,r=gc;null!==r;){if(!t)if(0!==e){var a=r.pendingLanes;if(0===a)var l=0;else{var o=r.suspendedLanes,i=r.pingedLanes;l=(1<<31-pe(42|e)+1)-1,l=201326741&(l&=a&~(o&~i))?201326741&l|1:l?2|l:0}0!==l&&(n=!0,Pc(r,l))}else l=lu,0===(3&(l=be(r,r===ru?l:0,null!==r.cancelPendingCommit||-1!==r.timeoutHandle)))||we(r,l)||(n=!0,Pc(r,l));r=r.next}}while(n);wc=!1}}function Ec(){Cc()}function Cc(){bc=vc=!1;var e=0;0!==kc&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==id&&(id=e,!0);return id=null,!1}()&&(e=kc),kc=0);for(var t=te(),n=null,r=gc;null!==r;){var a=r.next,l=Nc(r,t);0===l?(r.next=null,null===n?gc=a:n.next=a,null===a&&(yc=n)):(n=r,(0!==e||0!==(3&l))&&(bc=!0)),r=a}xc(e,!1)}function Nc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,l=-62914561&e.pendingLanes;0<l;){var o=31-pe(l),i=1<<o,s=a[o];-1===s?0!==(i&n)&&0===(i&r)||(a[o]=ke(i,t)):s<=t&&(e.expiredLanes|=i),l&=~i}if(n=lu,n=be(e,e===(t=ru)?n:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle),r=e.callbackNode,0===n||e===t&&(2===ou||9===ou)||null!==e.cancelPendingCommit)return null!==r&&null!==r&&G(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||we(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&G(r),Te(n)){case 2:case 8:n=ae;break;case 32:default:n=le;break;case 268435456:n=ie}return r=Rc.bind(null,e),n=J(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&G(r),e.callbackPriority=2,e.callbackNode=null,2}function Rc(e,t){if(0!==Cu&&5!==Cu)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(ic()&&e.callbackNode!==n)return null;var r=lu;return 0===(r=be(e,e===ru?r:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle))?null:(Du(e,r,t),Nc(e,te()),null!=e.callbackNode&&e.callbackNode===n?Rc.bind(null,e):null)}function Pc(e,t){if(ic())return null;Du(e,t,!0)}function Tc(){return 0===kc&&(kc=Se()),kc}function _c(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Tt(""+e)}function Oc(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var Lc=0;Lc<kr.length;Lc++){var jc=kr[Lc];Sr(jc.toLowerCase(),"on"+(jc[0].toUpperCase()+jc.slice(1)))}Sr(pr,"onAnimationEnd"),Sr(hr,"onAnimationIteration"),Sr(mr,"onAnimationStart"),Sr("dblclick","onDoubleClick"),Sr("focusin","onFocus"),Sr("focusout","onBlur"),Sr(gr,"onTransitionRun"),Sr(yr,"onTransitionStart"),Sr(vr,"onTransitionCancel"),Sr(br,"onTransitionEnd"),Ye("onMouseEnter",["mouseout","mouseover"]),Ye("onMouseLeave",["mouseout","mouseover"]),Ye("onPointerEnter",["pointerout","pointerover"]),Ye("onPointerLeave",["pointerout","pointerover"]),Ke("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ke("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ke("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ke("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ke("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ke("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var zc="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ac=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(zc));function Fc(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var l=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],s=i.instance,u=i.currentTarget;if(i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=u;try{l(a)}catch(c){yi(c)}a.currentTarget=null,l=s}else for(o=0;o<r.length;o++){if(s=(i=r[o]).instance,u=i.currentTarget,i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=u;try{l(a)}catch(c){yi(c)}a.currentTarget=null,l=s}}}}function Dc(e,t){var n=t[Ae];void 0===n&&(n=t[Ae]=new Set);var r=e+"__bubble";n.has(r)||(Ic(t,e,2,!1),n.add(r))}function Mc(e,t,n){var r=0;t&&(r|=4),Ic(n,e,r,t)}var Uc="_reactListening"+Math.random().toString(36).slice(2);function $c(e){if(!e[Uc]){e[Uc]=!0,Ve.forEach((function(t){"selectionchange"!==t&&(Ac.has(t)||Mc(t,!1,e),Mc(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Uc]||(t[Uc]=!0,Mc("selectionchange",!1,t))}}function Ic(e,t,n,r){switch(cf(t)){case 2:var a=rf;break;case 8:a=af;break;default:a=lf}n=a.bind(null,t,n,e),a=void 0,!Ut||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function Bc(e,t,n,r,a){var l=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===a)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&o.stateNode.containerInfo===a)return;o=o.return}for(;null!==i;){if(null===(o=Ie(i)))return;if(5===(u=o.tag)||6===u||26===u||27===u){r=l=o;continue e}i=i.parentNode}}r=r.return}Ft((function(){var r=l,a=Ot(n),o=[];e:{var i=wr.get(e);if(void 0!==i){var u=Zt,c=e;switch(e){case"keypress":if(0===qt(n))break e;case"keydown":case"keyup":u=mn;break;case"focusin":c="focus",u=ln;break;case"focusout":c="blur",u=ln;break;case"beforeblur":case"afterblur":u=ln;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=rn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=an;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=yn;break;case pr:case hr:case mr:u=on;break;case br:u=vn;break;case"scroll":case"scrollend":u=tn;break;case"wheel":u=bn;break;case"copy":case"cut":case"paste":u=sn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=gn;break;case"toggle":case"beforetoggle":u=wn}var d=0!==(4&t),f=!d&&("scroll"===e||"scrollend"===e),p=d?null!==i?i+"Capture":null:i;d=[];for(var h,m=r;null!==m;){var g=m;if(h=g.stateNode,5!==(g=g.tag)&&26!==g&&27!==g||null===h||null===p||null!=(g=Dt(m,p))&&d.push(Hc(m,g,h)),f)break;m=m.return}0<d.length&&(i=new u(i,c,null,n,a),o.push({event:i,listeners:d}))}}if(0===(7&t)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===_t||!(c=n.relatedTarget||n.fromElement)||!Ie(c)&&!c[ze])&&(u||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(c=(c=n.relatedTarget||n.toElement)?Ie(c):null)&&(f=s(c),d=c.tag,c!==f||5!==d&&27!==d&&6!==d)&&(c=null)):(u=null,c=r),u!==c)){if(d=rn,g="onMouseLeave",p="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(d=gn,g="onPointerLeave",p="onPointerEnter",m="pointer"),f=null==u?i:He(u),h=null==c?i:He(c),(i=new d(g,m+"leave",u,n,a)).target=f,i.relatedTarget=h,g=null,Ie(a)===r&&((d=new d(p,m+"enter",c,n,a)).target=h,d.relatedTarget=f,g=d),f=g,u&&c)e:{for(p=c,m=0,h=d=u;h;h=qc(h))m++;for(h=0,g=p;g;g=qc(g))h++;for(;0<m-h;)d=qc(d),m--;for(;0<h-m;)p=qc(p),h--;for(;m--;){if(d===p||null!==p&&d===p.alternate)break e;d=qc(d),p=qc(p)}d=null}else d=null;null!==u&&Vc(o,i,u,d,!1),null!==c&&null!==f&&Vc(o,f,c,d,!0)}if("select"===(u=(i=r?He(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var y=Mn;else if(Ln(i))if(Un)y=Kn;else{y=Vn;var v=qn}else!(u=i.nodeName)||"input"!==u.toLowerCase()||"checkbox"!==i.type&&"radio"!==i.type?r&&Nt(r.elementType)&&(y=Mn):y=Qn;switch(y&&(y=y(e,r))?jn(o,y,n,a):(v&&v(e,i,r),"focusout"===e&&r&&"number"===i.type&&null!=r.memoizedProps.value&&vt(i,"number",i.value)),v=r?He(r):window,e){case"focusin":(Ln(v)||"true"===v.contentEditable)&&(rr=v,ar=r,lr=null);break;case"focusout":lr=ar=rr=null;break;case"mousedown":or=!0;break;case"contextmenu":case"mouseup":case"dragend":or=!1,ir(o,n,a);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":ir(o,n,a)}var b;if(Sn)e:{switch(e){case"compositionstart":var w="onCompositionStart";break e;case"compositionend":w="onCompositionEnd";break e;case"compositionupdate":w="onCompositionUpdate";break e}w=void 0}else _n?Pn(e,n)&&(w="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(w="onCompositionStart");w&&(Cn&&"ko"!==n.locale&&(_n||"onCompositionStart"!==w?"onCompositionEnd"===w&&_n&&(b=Wt()):(Bt="value"in(It=a)?It.value:It.textContent,_n=!0)),0<(v=Wc(r,w)).length&&(w=new un(w,e,null,n,a),o.push({event:w,listeners:v}),b?w.data=b:null!==(b=Tn(n))&&(w.data=b))),(b=En?function(e,t){switch(e){case"compositionend":return Tn(t);case"keypress":return 32!==t.which?null:(Rn=!0,Nn);case"textInput":return(e=t.data)===Nn&&Rn?null:e;default:return null}}(e,n):function(e,t){if(_n)return"compositionend"===e||!Sn&&Pn(e,t)?(e=Wt(),Ht=Bt=It=null,_n=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Cn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(w=Wc(r,"onBeforeInput")).length&&(v=new un("onBeforeInput","beforeinput",null,n,a),o.push({event:v,listeners:w}),v.data=b)),function(e,t,n,r,a){if("submit"===t&&n&&n.stateNode===a){var l=_c((a[je]||null).action),o=r.submitter;o&&null!==(t=(t=o[je]||null)?_c(t.formAction):o.getAttribute("formAction"))&&(l=t,o=null);var i=new Zt("action","action",null,r,a);e.push({event:i,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==kc){var e=o?Oc(a,o):new FormData(a);Oo(n,{pending:!0,data:e,method:a.method,action:l},null,e)}}else"function"===typeof l&&(i.preventDefault(),e=o?Oc(a,o):new FormData(a),Oo(n,{pending:!0,data:e,method:a.method,action:l},l,e))},currentTarget:a}]})}}(o,e,r,n,a)}Fc(o,t)}))}function Hc(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Wc(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,l=a.stateNode;if(5!==(a=a.tag)&&26!==a&&27!==a||null===l||(null!=(a=Dt(e,n))&&r.unshift(Hc(e,a,l)),null!=(a=Dt(e,t))&&r.push(Hc(e,a,l))),3===e.tag)return r;e=e.return}return[]}function qc(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function Vc(e,t,n,r,a){for(var l=t._reactName,o=[];null!==n&&n!==r;){var i=n,s=i.alternate,u=i.stateNode;if(i=i.tag,null!==s&&s===r)break;5!==i&&26!==i&&27!==i||null===u||(s=u,a?null!=(u=Dt(n,l))&&o.unshift(Hc(n,u,s)):a||null!=(u=Dt(n,l))&&o.push(Hc(n,u,s))),n=n.return}0!==o.length&&e.push({event:t,listeners:o})}var Qc=/\r\n?/g,Kc=/\u0000|\uFFFD/g;function Yc(e){return("string"===typeof e?e:""+e).replace(Qc,"\n").replace(Kc,"")}function Xc(e,t){return t=Yc(t),Yc(e)===t}function Jc(){}function Gc(e,t,n,r,a,l){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||St(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&St(e,""+r);break;case"className":nt(e,"class",r);break;case"tabIndex":nt(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":nt(e,n,r);break;case"style":Ct(e,r,l);break;case"data":if("object"!==t){nt(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof l&&("formAction"===n?("input"!==t&&Gc(e,t,"name",a.name,a,null),Gc(e,t,"formEncType",a.formEncType,a,null),Gc(e,t,"formMethod",a.formMethod,a,null),Gc(e,t,"formTarget",a.formTarget,a,null)):(Gc(e,t,"encType",a.encType,a,null),Gc(e,t,"method",a.method,a,null),Gc(e,t,"target",a.target,a,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Jc);break;case"onScroll":null!=r&&Dc("scroll",e);break;case"onScrollEnd":null!=r&&Dc("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Tt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Dc("beforetoggle",e),Dc("toggle",e),tt(e,"popover",r);break;case"xlinkActuate":rt(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":rt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":rt(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":rt(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":rt(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":rt(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":rt(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":rt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":rt(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":tt(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&tt(e,n=Rt.get(n)||n,r)}}function Zc(e,t,n,r,a,l){switch(n){case"style":Ct(e,r,l);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"children":"string"===typeof r?St(e,r):("number"===typeof r||"bigint"===typeof r)&&St(e,""+r);break;case"onScroll":null!=r&&Dc("scroll",e);break;case"onScrollEnd":null!=r&&Dc("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Jc);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:Qe.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(a=n.endsWith("Capture"),t=n.slice(2,a?n.length-7:void 0),"function"===typeof(l=null!=(l=e[je]||null)?l[n]:null)&&e.removeEventListener(t,l,a),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):tt(e,n,r):("function"!==typeof l&&null!==l&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,a)))}}function ed(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Dc("error",e),Dc("load",e);var r,a=!1,l=!1;for(r in n)if(n.hasOwnProperty(r)){var i=n[r];if(null!=i)switch(r){case"src":a=!0;break;case"srcSet":l=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Gc(e,t,r,i,n,null)}}return l&&Gc(e,t,"srcSet",n.srcSet,n,null),void(a&&Gc(e,t,"src",n.src,n,null));case"input":Dc("invalid",e);var s=r=i=l=null,u=null,c=null;for(a in n)if(n.hasOwnProperty(a)){var d=n[a];if(null!=d)switch(a){case"name":l=d;break;case"type":i=d;break;case"checked":u=d;break;case"defaultChecked":c=d;break;case"value":r=d;break;case"defaultValue":s=d;break;case"children":case"dangerouslySetInnerHTML":if(null!=d)throw Error(o(137,t));break;default:Gc(e,t,a,d,n,null)}}return yt(e,r,s,u,c,i,l,!1),void dt(e);case"select":for(l in Dc("invalid",e),a=i=r=null,n)if(n.hasOwnProperty(l)&&null!=(s=n[l]))switch(l){case"value":r=s;break;case"defaultValue":i=s;break;case"multiple":a=s;default:Gc(e,t,l,s,n,null)}return t=r,n=i,e.multiple=!!a,void(null!=t?bt(e,!!a,t,!1):null!=n&&bt(e,!!a,n,!0));case"textarea":for(i in Dc("invalid",e),r=l=a=null,n)if(n.hasOwnProperty(i)&&null!=(s=n[i]))switch(i){case"value":a=s;break;case"defaultValue":l=s;break;case"children":r=s;break;case"dangerouslySetInnerHTML":if(null!=s)throw Error(o(91));break;default:Gc(e,t,i,s,n,null)}return kt(e,a,l,r),void dt(e);case"option":for(u in n)if(n.hasOwnProperty(u)&&null!=(a=n[u]))if("selected"===u)e.selected=a&&"function"!==typeof a&&"symbol"!==typeof a;else Gc(e,t,u,a,n,null);return;case"dialog":Dc("beforetoggle",e),Dc("toggle",e),Dc("cancel",e),Dc("close",e);break;case"iframe":case"object":Dc("load",e);break;case"video":case"audio":for(a=0;a<zc.length;a++)Dc(zc[a],e);break;case"image":Dc("error",e),Dc("load",e);break;case"details":Dc("toggle",e);break;case"embed":case"source":case"link":Dc("error",e),Dc("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(c in n)if(n.hasOwnProperty(c)&&null!=(a=n[c]))switch(c){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Gc(e,t,c,a,n,null)}return;default:if(Nt(t)){for(d in n)n.hasOwnProperty(d)&&(void 0!==(a=n[d])&&Zc(e,t,d,a,n,void 0));return}}for(s in n)n.hasOwnProperty(s)&&(null!=(a=n[s])&&Gc(e,t,s,a,n,null))}var td=null,nd=null;function rd(e){return 9===e.nodeType?e:e.ownerDocument}function ad(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function ld(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function od(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var id=null;var sd="function"===typeof setTimeout?setTimeout:void 0,ud="function"===typeof clearTimeout?clearTimeout:void 0,cd="function"===typeof Promise?Promise:void 0,dd="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof cd?function(e){return cd.resolve(null).then(e).catch(fd)}:sd;function fd(e){setTimeout((function(){throw e}))}function pd(e){return"head"===e}function hd(e,t){var n=t,r=0,a=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&8===l.nodeType)if("/$"===(n=l.data)){if(0<r&&8>r){n=r;var o=e.ownerDocument;if(1&n&&kd(o.documentElement),2&n&&kd(o.body),4&n)for(kd(n=o.head),o=n.firstChild;o;){var i=o.nextSibling,s=o.nodeName;o[Ue]||"SCRIPT"===s||"STYLE"===s||"LINK"===s&&"stylesheet"===o.rel.toLowerCase()||n.removeChild(o),o=i}}if(0===a)return e.removeChild(l),void Pf(t);a--}else"$"===n||"$?"===n||"$!"===n?a++:r=n.charCodeAt(0)-48;else r=0;n=l}while(n);Pf(t)}function md(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":md(n),$e(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function gd(e){return"$!"===e.data||"$?"===e.data&&"complete"===e.ownerDocument.readyState}function yd(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}var vd=null;function bd(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function wd(e,t,n){switch(t=rd(n),e){case"html":if(!(e=t.documentElement))throw Error(o(452));return e;case"head":if(!(e=t.head))throw Error(o(453));return e;case"body":if(!(e=t.body))throw Error(o(454));return e;default:throw Error(o(451))}}function kd(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);$e(e)}var Sd=new Map,xd=new Set;function Ed(e){return"function"===typeof e.getRootNode?e.getRootNode():9===e.nodeType?e:e.ownerDocument}var Cd=A.d;A.d={f:function(){var e=Cd.f(),t=Iu();return e||t},r:function(e){var t=Be(e);null!==t&&5===t.tag&&"form"===t.type?jo(t):Cd.r(e)},D:function(e){Cd.D(e),Rd("dns-prefetch",e,null)},C:function(e,t){Cd.C(e,t),Rd("preconnect",e,t)},L:function(e,t,n){Cd.L(e,t,n);var r=Nd;if(r&&e&&t){var a='link[rel="preload"][as="'+mt(t)+'"]';"image"===t&&n&&n.imageSrcSet?(a+='[imagesrcset="'+mt(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(a+='[imagesizes="'+mt(n.imageSizes)+'"]')):a+='[href="'+mt(e)+'"]';var l=a;switch(t){case"style":l=Td(e);break;case"script":l=Ld(e)}Sd.has(l)||(e=f({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),Sd.set(l,e),null!==r.querySelector(a)||"style"===t&&r.querySelector(_d(l))||"script"===t&&r.querySelector(jd(l))||(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}},m:function(e,t){Cd.m(e,t);var n=Nd;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",a='link[rel="modulepreload"][as="'+mt(r)+'"][href="'+mt(e)+'"]',l=a;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":l=Ld(e)}if(!Sd.has(l)&&(e=f({rel:"modulepreload",href:e},t),Sd.set(l,e),null===n.querySelector(a))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(jd(l)))return}ed(r=n.createElement("link"),"link",e),qe(r),n.head.appendChild(r)}}},X:function(e,t){Cd.X(e,t);var n=Nd;if(n&&e){var r=We(n).hoistableScripts,a=Ld(e),l=r.get(a);l||((l=n.querySelector(jd(a)))||(e=f({src:e,async:!0},t),(t=Sd.get(a))&&Dd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}},S:function(e,t,n){Cd.S(e,t,n);var r=Nd;if(r&&e){var a=We(r).hoistableStyles,l=Td(e);t=t||"default";var o=a.get(l);if(!o){var i={loading:0,preload:null};if(o=r.querySelector(_d(l)))i.loading=5;else{e=f({rel:"stylesheet",href:e,"data-precedence":t},n),(n=Sd.get(l))&&Fd(e,n);var s=o=r.createElement("link");qe(s),ed(s,"link",e),s._p=new Promise((function(e,t){s.onload=e,s.onerror=t})),s.addEventListener("load",(function(){i.loading|=1})),s.addEventListener("error",(function(){i.loading|=2})),i.loading|=4,Ad(o,t,r)}o={type:"stylesheet",instance:o,count:1,state:i},a.set(l,o)}}},M:function(e,t){Cd.M(e,t);var n=Nd;if(n&&e){var r=We(n).hoistableScripts,a=Ld(e),l=r.get(a);l||((l=n.querySelector(jd(a)))||(e=f({src:e,async:!0,type:"module"},t),(t=Sd.get(a))&&Dd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}}};var Nd="undefined"===typeof document?null:document;function Rd(e,t,n){var r=Nd;if(r&&"string"===typeof t&&t){var a=mt(t);a='link[rel="'+e+'"][href="'+a+'"]',"string"===typeof n&&(a+='[crossorigin="'+n+'"]'),xd.has(a)||(xd.add(a),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(a)&&(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}}function Pd(e,t,n,r){var a,l,i,s,u=(u=W.current)?Ed(u):null;if(!u)throw Error(o(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=Td(n.href),(r=(n=We(u).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=Td(n.href);var c=We(u).hoistableStyles,d=c.get(e);if(d||(u=u.ownerDocument||u,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},c.set(e,d),(c=u.querySelector(_d(e)))&&!c._p&&(d.instance=c,d.state.loading=5),Sd.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},Sd.set(e,n),c||(a=u,l=e,i=n,s=d.state,a.querySelector('link[rel="preload"][as="style"]['+l+"]")?s.loading=1:(l=a.createElement("link"),s.preload=l,l.addEventListener("load",(function(){return s.loading|=1})),l.addEventListener("error",(function(){return s.loading|=2})),ed(l,"link",i),qe(l),a.head.appendChild(l))))),t&&null===r)throw Error(o(528,""));return d}if(t&&null!==r)throw Error(o(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Ld(n),(r=(n=We(u).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,e))}}function Td(e){return'href="'+mt(e)+'"'}function _d(e){return'link[rel="stylesheet"]['+e+"]"}function Od(e){return f({},e,{"data-precedence":e.precedence,precedence:null})}function Ld(e){return'[src="'+mt(e)+'"]'}function jd(e){return"script[async]"+e}function zd(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+mt(n.href)+'"]');if(r)return t.instance=r,qe(r),r;var a=f({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return qe(r=(e.ownerDocument||e).createElement("style")),ed(r,"style",a),Ad(r,n.precedence,e),t.instance=r;case"stylesheet":a=Td(n.href);var l=e.querySelector(_d(a));if(l)return t.state.loading|=4,t.instance=l,qe(l),l;r=Od(n),(a=Sd.get(a))&&Fd(r,a),qe(l=(e.ownerDocument||e).createElement("link"));var i=l;return i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",r),t.state.loading|=4,Ad(l,n.precedence,e),t.instance=l;case"script":return l=Ld(n.src),(a=e.querySelector(jd(l)))?(t.instance=a,qe(a),a):(r=n,(a=Sd.get(l))&&Dd(r=f({},n),a),qe(a=(e=e.ownerDocument||e).createElement("script")),ed(a,"link",r),e.head.appendChild(a),t.instance=a);case"void":return null;default:throw Error(o(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,Ad(r,n.precedence,e));return t.instance}function Ad(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),a=r.length?r[r.length-1]:null,l=a,o=0;o<r.length;o++){var i=r[o];if(i.dataset.precedence===t)l=i;else if(l!==a)break}l?l.parentNode.insertBefore(e,l.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Fd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function Dd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var Md=null;function Ud(e,t,n){if(null===Md){var r=new Map,a=Md=new Map;a.set(n,r)}else(r=(a=Md).get(n))||(r=new Map,a.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),a=0;a<n.length;a++){var l=n[a];if(!(l[Ue]||l[Le]||"link"===e&&"stylesheet"===l.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==l.namespaceURI){var o=l.getAttribute(t)||"";o=e+o;var i=r.get(o);i?i.push(l):r.set(o,[l])}}return r}function $d(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function Id(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Bd=null;function Hd(){}function Wd(){if(this.count--,0===this.count)if(this.stylesheets)Vd(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var qd=null;function Vd(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,qd=new Map,t.forEach(Qd,e),qd=null,Wd.call(e))}function Qd(e,t){if(!(4&t.state.loading)){var n=qd.get(e);if(n)var r=n.get(null);else{n=new Map,qd.set(e,n);for(var a=e.querySelectorAll("link[data-precedence],style[data-precedence]"),l=0;l<a.length;l++){var o=a[l];"LINK"!==o.nodeName&&"not all"===o.getAttribute("media")||(n.set(o.dataset.precedence,o),r=o)}r&&n.set(null,r)}o=(a=t.instance).getAttribute("data-precedence"),(l=n.get(o)||r)===r&&n.set(null,a),n.set(o,a),this.count++,r=Wd.bind(this),a.addEventListener("load",r),a.addEventListener("error",r),l?l.parentNode.insertBefore(a,l.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(a,e.firstChild),t.state.loading|=4}}var Kd={$$typeof:k,Provider:null,Consumer:null,_currentValue:F,_currentValue2:F,_threadCount:0};function Yd(e,t,n,r,a,l,o,i){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ee(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ee(0),this.hiddenUpdates=Ee(null),this.identifierPrefix=r,this.onUncaughtError=a,this.onCaughtError=l,this.onRecoverableError=o,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function Xd(e,t,n,r,a,l,o,i,s,u,c,d){return e=new Yd(e,t,n,o,i,s,u,d),t=1,!0===l&&(t|=24),l=Fr(3,null,null,t),e.current=l,l.stateNode=e,(t=ja()).refCount++,e.pooledCache=t,t.refCount++,l.memoizedState={element:r,isDehydrated:n,cache:t},nl(l),e}function Jd(e){return e?e=zr:zr}function Gd(e,t,n,r,a,l){a=Jd(a),null===r.context?r.context=a:r.pendingContext=a,(r=al(t)).payload={element:n},null!==(l=void 0===l?null:l)&&(r.callback=l),null!==(n=ll(e,r,t))&&(Fu(n,0,t),ol(n,e,t))}function Zd(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function ef(e,t){Zd(e,t),(e=e.alternate)&&Zd(e,t)}function tf(e){if(13===e.tag){var t=Or(e,67108864);null!==t&&Fu(t,0,67108864),ef(e,67108864)}}var nf=!0;function rf(e,t,n,r){var a=z.T;z.T=null;var l=A.p;try{A.p=2,lf(e,t,n,r)}finally{A.p=l,z.T=a}}function af(e,t,n,r){var a=z.T;z.T=null;var l=A.p;try{A.p=8,lf(e,t,n,r)}finally{A.p=l,z.T=a}}function lf(e,t,n,r){if(nf){var a=of(r);if(null===a)Bc(e,t,r,sf,n),bf(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return ff=wf(ff,e,t,n,r,a),!0;case"dragenter":return pf=wf(pf,e,t,n,r,a),!0;case"mouseover":return hf=wf(hf,e,t,n,r,a),!0;case"pointerover":var l=a.pointerId;return mf.set(l,wf(mf.get(l)||null,e,t,n,r,a)),!0;case"gotpointercapture":return l=a.pointerId,gf.set(l,wf(gf.get(l)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(bf(e,r),4&t&&-1<vf.indexOf(e)){for(;null!==a;){var l=Be(a);if(null!==l)switch(l.tag){case 3:if((l=l.stateNode).current.memoizedState.isDehydrated){var o=ve(l.pendingLanes);if(0!==o){var i=l;for(i.pendingLanes|=2,i.entangledLanes|=2;o;){var s=1<<31-pe(o);i.entanglements[1]|=s,o&=~s}Sc(l),0===(6&nu)&&(Su=te()+500,xc(0,!1))}}break;case 13:null!==(i=Or(l,2))&&Fu(i,0,2),Iu(),ef(l,2)}if(null===(l=of(r))&&Bc(e,t,r,sf,n),l===a)break;a=l}null!==a&&r.stopPropagation()}else Bc(e,t,r,null,n)}}function of(e){return uf(e=Ot(e))}var sf=null;function uf(e){if(sf=null,null!==(e=Ie(e))){var t=s(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=u(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return sf=e,null}function cf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ne()){case re:return 2;case ae:return 8;case le:case oe:return 32;case ie:return 268435456;default:return 32}default:return 32}}var df=!1,ff=null,pf=null,hf=null,mf=new Map,gf=new Map,yf=[],vf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function bf(e,t){switch(e){case"focusin":case"focusout":ff=null;break;case"dragenter":case"dragleave":pf=null;break;case"mouseover":case"mouseout":hf=null;break;case"pointerover":case"pointerout":mf.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":gf.delete(t.pointerId)}}function wf(e,t,n,r,a,l){return null===e||e.nativeEvent!==l?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:l,targetContainers:[a]},null!==t&&(null!==(t=Be(t))&&tf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function kf(e){var t=Ie(e.target);if(null!==t){var n=s(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=u(n)))return e.blockedOn=t,void function(e,t){var n=A.p;try{return A.p=e,t()}finally{A.p=n}}(e.priority,(function(){if(13===n.tag){var e=zu();e=Pe(e);var t=Or(n,e);null!==t&&Fu(t,0,e),ef(n,e)}}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Sf(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=of(e.nativeEvent);if(null!==n)return null!==(t=Be(n))&&tf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);_t=r,n.target.dispatchEvent(r),_t=null,t.shift()}return!0}function xf(e,t,n){Sf(e)&&n.delete(t)}function Ef(){df=!1,null!==ff&&Sf(ff)&&(ff=null),null!==pf&&Sf(pf)&&(pf=null),null!==hf&&Sf(hf)&&(hf=null),mf.forEach(xf),gf.forEach(xf)}function Cf(e,t){e.blockedOn===t&&(e.blockedOn=null,df||(df=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,Ef)))}var Nf=null;function Rf(e){Nf!==e&&(Nf=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,(function(){Nf===e&&(Nf=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],a=e[t+2];if("function"!==typeof r){if(null===uf(r||n))continue;break}var l=Be(n);null!==l&&(e.splice(t,3),t-=3,Oo(l,{pending:!0,data:a,method:n.method,action:r},r,a))}})))}function Pf(e){function t(t){return Cf(t,e)}null!==ff&&Cf(ff,e),null!==pf&&Cf(pf,e),null!==hf&&Cf(hf,e),mf.forEach(t),gf.forEach(t);for(var n=0;n<yf.length;n++){var r=yf[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<yf.length&&null===(n=yf[0]).blockedOn;)kf(n),null===n.blockedOn&&yf.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var a=n[r],l=n[r+1],o=a[je]||null;if("function"===typeof l)o||Rf(n);else if(o){var i=null;if(l&&l.hasAttribute("formAction")){if(a=l,o=l[je]||null)i=o.formAction;else if(null!==uf(a))continue}else i=o.action;"function"===typeof i?n[r+1]=i:(n.splice(r,3),r-=3),Rf(n)}}}function Tf(e){this._internalRoot=e}function _f(e){this._internalRoot=e}_f.prototype.render=Tf.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Gd(t.current,zu(),e,t,null,null)},_f.prototype.unmount=Tf.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;Gd(e.current,2,null,e,null,null),Iu(),t[ze]=null}},_f.prototype.unstable_scheduleHydration=function(e){if(e){var t=_e();e={blockedOn:null,target:e,priority:t};for(var n=0;n<yf.length&&0!==t&&t<yf[n].priority;n++);yf.splice(n,0,e),0===n&&kf(e)}};var Of=a.version;if("19.1.0"!==Of)throw Error(o(527,Of,"19.1.0"));A.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=s(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return c(a),e;if(l===r)return c(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,u=a.child;u;){if(u===n){i=!0,n=a,r=l;break}if(u===r){i=!0,r=a,n=l;break}u=u.sibling}if(!i){for(u=l.child;u;){if(u===n){i=!0,n=l,r=a;break}if(u===r){i=!0,r=l,n=a;break}u=u.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?d(e):null)?null:e.stateNode};var Lf={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:z,reconcilerVersion:"19.1.0"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var jf=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!jf.isDisabled&&jf.supportsFiber)try{ce=jf.inject(Lf),de=jf}catch(Af){}}t.createRoot=function(e,t){if(!i(e))throw Error(o(299));var n=!1,r="",a=vi,l=bi,s=wi;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(a=t.onUncaughtError),void 0!==t.onCaughtError&&(l=t.onCaughtError),void 0!==t.onRecoverableError&&(s=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Xd(e,1,!1,null,0,n,r,a,l,s,0,null),e[ze]=t.current,$c(e),new Tf(t)},t.hydrateRoot=function(e,t,n){if(!i(e))throw Error(o(299));var r=!1,a="",l=vi,s=bi,u=wi,c=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onUncaughtError&&(l=n.onUncaughtError),void 0!==n.onCaughtError&&(s=n.onCaughtError),void 0!==n.onRecoverableError&&(u=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(c=n.formState)),(t=Xd(e,1,!0,t,0,r,a,l,s,u,0,c)).context=Jd(null),n=t.current,(a=al(r=Pe(r=zu()))).callback=null,ll(n,a,r),n=r,t.current.lanes=n,Ce(t,n),Sc(t),e[ze]=t.current,$c(e),new _f(t)},t.version="19.1.0"},43:(e,t,n)=>{e.exports=n(288)},288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),l=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.consumer"),s=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),p=Symbol.iterator;var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},m=Object.assign,g={};function y(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}function v(){}function b(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}y.prototype.isReactComponent={},y.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},y.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=y.prototype;var w=b.prototype=new v;w.constructor=b,m(w,y.prototype),w.isPureReactComponent=!0;var k=Array.isArray,S={H:null,A:null,T:null,S:null,V:null},x=Object.prototype.hasOwnProperty;function E(e,t,r,a,l,o){return r=o.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:o}}function C(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var N=/\/+/g;function R(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function P(){}function T(e,t,a,l,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var s,u,c=!1;if(null===e)c=!0;else switch(i){case"bigint":case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0;break;case f:return T((c=e._init)(e._payload),t,a,l,o)}}if(c)return o=o(e),c=""===l?"."+R(e,0):l,k(o)?(a="",null!=c&&(a=c.replace(N,"$&/")+"/"),T(o,t,a,"",(function(e){return e}))):null!=o&&(C(o)&&(s=o,u=a+(null==o.key||e&&e.key===o.key?"":(""+o.key).replace(N,"$&/")+"/")+c,o=E(s.type,u,void 0,0,0,s.props)),t.push(o)),1;c=0;var d,h=""===l?".":l+":";if(k(e))for(var m=0;m<e.length;m++)c+=T(l=e[m],t,a,i=h+R(l,m),o);else if("function"===typeof(m=null===(d=e)||"object"!==typeof d?null:"function"===typeof(d=p&&d[p]||d["@@iterator"])?d:null))for(e=m.call(e),m=0;!(l=e.next()).done;)c+=T(l=l.value,t,a,i=h+R(l,m++),o);else if("object"===i){if("function"===typeof e.then)return T(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(P,P):(e.status="pending",e.then((function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)}),(function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)}))),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,a,l,o);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return c}function _(e,t,n){if(null==e)return e;var r=[],a=0;return T(e,r,"","",(function(e){return t.call(n,e,a++)})),r}function O(e){if(-1===e._status){var t=e._result;(t=t()).then((function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)}),(function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)})),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var L="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function j(){}t.Children={map:_,forEach:function(e,t,n){_(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return _(e,(function(){t++})),t},toArray:function(e){return _(e,(function(e){return e}))||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=y,t.Fragment=a,t.Profiler=o,t.PureComponent=b,t.StrictMode=l,t.Suspense=c,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=S,t.__COMPILER_RUNTIME={__proto__:null,c:function(e){return S.H.useMemoCache(e)}},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=m({},e.props),a=e.key;if(null!=t)for(l in void 0!==t.ref&&void 0,void 0!==t.key&&(a=""+t.key),t)!x.call(t,l)||"key"===l||"__self"===l||"__source"===l||"ref"===l&&void 0===t.ref||(r[l]=t[l]);var l=arguments.length-2;if(1===l)r.children=n;else if(1<l){for(var o=Array(l),i=0;i<l;i++)o[i]=arguments[i+2];r.children=o}return E(e.type,a,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:i,_context:e},e},t.createElement=function(e,t,n){var r,a={},l=null;if(null!=t)for(r in void 0!==t.key&&(l=""+t.key),t)x.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(a[r]=t[r]);var o=arguments.length-2;if(1===o)a.children=n;else if(1<o){for(var i=Array(o),s=0;s<o;s++)i[s]=arguments[s+2];a.children=i}if(e&&e.defaultProps)for(r in o=e.defaultProps)void 0===a[r]&&(a[r]=o[r]);return E(e,l,void 0,0,0,a)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:u,render:e}},t.isValidElement=C,t.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:O}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=S.T,n={};S.T=n;try{var r=e(),a=S.S;null!==a&&a(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(j,L)}catch(l){L(l)}finally{S.T=t}},t.unstable_useCacheRefresh=function(){return S.H.useCacheRefresh()},t.use=function(e){return S.H.use(e)},t.useActionState=function(e,t,n){return S.H.useActionState(e,t,n)},t.useCallback=function(e,t){return S.H.useCallback(e,t)},t.useContext=function(e){return S.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return S.H.useDeferredValue(e,t)},t.useEffect=function(e,t,n){var r=S.H;if("function"===typeof n)throw Error("useEffect CRUD overload is not enabled in this build of React.");return r.useEffect(e,t)},t.useId=function(){return S.H.useId()},t.useImperativeHandle=function(e,t,n){return S.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return S.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return S.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return S.H.useMemo(e,t)},t.useOptimistic=function(e,t){return S.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return S.H.useReducer(e,t,n)},t.useRef=function(e){return S.H.useRef(e)},t.useState=function(e){return S.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return S.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return S.H.useTransition()},t.version="19.1.0"},358:(e,t)=>{const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,r=/^[\u0021-\u003A\u003C-\u007E]*$/,a=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,l=/^[\u0020-\u003A\u003D-\u007E]*$/,o=Object.prototype.toString,i=(()=>{const e=function(){};return e.prototype=Object.create(null),e})();function s(e,t,n){do{const n=e.charCodeAt(t);if(32!==n&&9!==n)return t}while(++t<n);return n}function u(e,t,n){for(;t>n;){const n=e.charCodeAt(--t);if(32!==n&&9!==n)return t+1}return n}function c(e){if(-1===e.indexOf("%"))return e;try{return decodeURIComponent(e)}catch(t){return e}}},391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(4)},579:(e,t,n)=>{e.exports=n(799)},672:(e,t,n)=>{var r=n(43);function a(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(){}var o={d:{f:l,r:function(){throw Error(a(522))},D:l,C:l,L:l,m:l,X:l,S:l,M:l},p:0,findDOMNode:null},i=Symbol.for("react.portal");var s=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function u(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=o,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(a(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:i,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=s.T,n=o.p;try{if(s.T=null,o.p=2,e)return e()}finally{s.T=t,o.p=n,o.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,o.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&o.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=u(n,t.crossOrigin),a="string"===typeof t.integrity?t.integrity:void 0,l="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?o.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:a,fetchPriority:l}):"script"===n&&o.d.X(e,{crossOrigin:r,integrity:a,fetchPriority:l,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=u(t.as,t.crossOrigin);o.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&o.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=u(n,t.crossOrigin);o.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=u(t.as,t.crossOrigin);o.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else o.d.m(e)},t.requestFormReset=function(e){o.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return s.H.useFormState(e,t,n)},t.useFormStatus=function(){return s.H.useHostTransitionStatus()},t.version="19.1.0"},799:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.fragment");function a(e,t,r){var a=null;if(void 0!==r&&(a=""+r),void 0!==t.key&&(a=""+t.key),"key"in t)for(var l in r={},t)"key"!==l&&(r[l]=t[l]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:a,ref:void 0!==t?t:null,props:r}}t.Fragment=r,t.jsx=a,t.jsxs=a},853:(e,t,n)=>{e.exports=n(896)},896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<l(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,o=a>>>1;r<o;){var i=2*(r+1)-1,s=e[i],u=i+1,c=e[u];if(0>l(s,n))u<a&&0>l(c,s)?(e[r]=c,e[u]=n,r=u):(e[r]=s,e[i]=n,r=i);else{if(!(u<a&&0>l(c,n)))break e;e[r]=c,e[u]=n,r=u}}}return t}function l(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var o=performance;t.unstable_now=function(){return o.now()}}else{var i=Date,s=i.now();t.unstable_now=function(){return i.now()-s}}var u=[],c=[],d=1,f=null,p=3,h=!1,m=!1,g=!1,y=!1,v="function"===typeof setTimeout?setTimeout:null,b="function"===typeof clearTimeout?clearTimeout:null,w="undefined"!==typeof setImmediate?setImmediate:null;function k(e){for(var t=r(c);null!==t;){if(null===t.callback)a(c);else{if(!(t.startTime<=e))break;a(c),t.sortIndex=t.expirationTime,n(u,t)}t=r(c)}}function S(e){if(g=!1,k(e),!m)if(null!==r(u))m=!0,E||(E=!0,x());else{var t=r(c);null!==t&&L(S,t.startTime-e)}}var x,E=!1,C=-1,N=5,R=-1;function P(){return!!y||!(t.unstable_now()-R<N)}function T(){if(y=!1,E){var e=t.unstable_now();R=e;var n=!0;try{e:{m=!1,g&&(g=!1,b(C),C=-1),h=!0;var l=p;try{t:{for(k(e),f=r(u);null!==f&&!(f.expirationTime>e&&P());){var o=f.callback;if("function"===typeof o){f.callback=null,p=f.priorityLevel;var i=o(f.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof i){f.callback=i,k(e),n=!0;break t}f===r(u)&&a(u),k(e)}else a(u);f=r(u)}if(null!==f)n=!0;else{var s=r(c);null!==s&&L(S,s.startTime-e),n=!1}}break e}finally{f=null,p=l,h=!1}n=void 0}}finally{n?x():E=!1}}}if("function"===typeof w)x=function(){w(T)};else if("undefined"!==typeof MessageChannel){var _=new MessageChannel,O=_.port2;_.port1.onmessage=T,x=function(){O.postMessage(null)}}else x=function(){v(T,0)};function L(e,n){C=v((function(){e(t.unstable_now())}),n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):N=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return p},t.unstable_next=function(e){switch(p){case 1:case 2:case 3:var t=3;break;default:t=p}var n=p;p=t;try{return e()}finally{p=n}},t.unstable_requestPaint=function(){y=!0},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=p;p=e;try{return t()}finally{p=n}},t.unstable_scheduleCallback=function(e,a,l){var o=t.unstable_now();switch("object"===typeof l&&null!==l?l="number"===typeof(l=l.delay)&&0<l?o+l:o:l=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:d++,callback:a,priorityLevel:e,startTime:l,expirationTime:i=l+i,sortIndex:-1},l>o?(e.sortIndex=l,n(c,e),null===r(u)&&e===r(c)&&(g?(b(C),C=-1):g=!0,L(S,l-o))):(e.sortIndex=i,n(u,e),m||h||(m=!0,E||(E=!0,x()))),e},t.unstable_shouldYield=P,t.unstable_wrapCallback=function(e){var t=p;return function(){var n=p;p=t;try{return e.apply(this,arguments)}finally{p=n}}}},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(672)}},t={};function n(r){var a=t[r];if(void 0!==a)return a.exports;var l=t[r]={exports:{}};return e[r](l,l.exports,n),l.exports}n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})};var r={};n.r(r),n.d(r,{hasBrowserEnv:()=>wn,hasStandardBrowserEnv:()=>Sn,hasStandardBrowserWebWorkerEnv:()=>xn,navigator:()=>kn,origin:()=>En});var a=n(43),l=n(391),o=(n(358),"popstate");function i(){return h((function(e,t){let{pathname:n,search:r,hash:a}=e.location;return d("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")}),(function(e,t){return"string"===typeof t?t:f(t)}),null,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{})}function s(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}function u(e,t){if(!e){"undefined"!==typeof console&&console.warn(t);try{throw new Error(t)}catch(n){}}}function c(e,t){return{usr:e.state,key:e.key,idx:t}}function d(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3?arguments[3]:void 0;return{pathname:"string"===typeof e?e:e.pathname,search:"",hash:"",..."string"===typeof t?p(t):t,state:n,key:t&&t.key||r||Math.random().toString(36).substring(2,10)}}function f(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function p(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function h(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},{window:a=document.defaultView,v5Compat:l=!1}=r,i=a.history,u="POP",p=null,h=m();function m(){return(i.state||{idx:null}).idx}function g(){u="POP";let e=m(),t=null==e?null:e-h;h=e,p&&p({action:u,location:v.location,delta:t})}function y(e){let t="null"!==a.location.origin?a.location.origin:a.location.href,n="string"===typeof e?e:f(e);return n=n.replace(/ $/,"%20"),s(t,`No window.location.(origin|href) available to create URL for href: ${n}`),new URL(n,t)}null==h&&(h=0,i.replaceState({...i.state,idx:h},""));let v={get action(){return u},get location(){return e(a,i)},listen(e){if(p)throw new Error("A history only accepts one active listener");return a.addEventListener(o,g),p=e,()=>{a.removeEventListener(o,g),p=null}},createHref:e=>t(a,e),createURL:y,encodeLocation(e){let t=y(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){u="PUSH";let r=d(v.location,e,t);n&&n(r,e),h=m()+1;let o=c(r,h),s=v.createHref(r);try{i.pushState(o,"",s)}catch(f){if(f instanceof DOMException&&"DataCloneError"===f.name)throw f;a.location.assign(s)}l&&p&&p({action:u,location:v.location,delta:1})},replace:function(e,t){u="REPLACE";let r=d(v.location,e,t);n&&n(r,e),h=m();let a=c(r,h),o=v.createHref(r);i.replaceState(a,"",o),l&&p&&p({action:u,location:v.location,delta:0})},go:e=>i.go(e)};return v}new WeakMap;function m(e,t){return g(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:"/",!1)}function g(e,t,n,r){let a=_(("string"===typeof t?p(t):t).pathname||"/",n);if(null==a)return null;let l=y(e);!function(e){e.sort(((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){let n=e.length===t.length&&e.slice(0,-1).every(((e,n)=>e===t[n]));return n?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map((e=>e.childrenIndex)),t.routesMeta.map((e=>e.childrenIndex)))))}(l);let o=null;for(let i=0;null==o&&i<l.length;++i){let e=T(a);o=R(l[i],e,r)}return o}function y(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"",a=(e,a,l)=>{let o={relativePath:void 0===l?e.path||"":l,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};o.relativePath.startsWith("/")&&(s(o.relativePath.startsWith(r),`Absolute route path "${o.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),o.relativePath=o.relativePath.slice(r.length));let i=A([r,o.relativePath]),u=n.concat(o);e.children&&e.children.length>0&&(s(!0!==e.index,`Index routes must not have child routes. Please remove all child routes from route path "${i}".`),y(e.children,t,u,i)),(null!=e.path||e.index)&&t.push({path:i,score:N(i,e.index),routesMeta:u})};return e.forEach(((e,t)=>{if(""!==e.path&&e.path?.includes("?"))for(let n of v(e.path))a(e,t,n);else a(e,t)})),t}function v(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),l=n.replace(/\?$/,"");if(0===r.length)return a?[l,""]:[l];let o=v(r.join("/")),i=[];return i.push(...o.map((e=>""===e?l:[l,e].join("/")))),a&&i.push(...o),i.map((t=>e.startsWith("/")&&""===t?"/":t))}var b=/^:[\w-]+$/,w=3,k=2,S=1,x=10,E=-2,C=e=>"*"===e;function N(e,t){let n=e.split("/"),r=n.length;return n.some(C)&&(r+=E),t&&(r+=k),n.filter((e=>!C(e))).reduce(((e,t)=>e+(b.test(t)?w:""===t?S:x)),r)}function R(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],{routesMeta:r}=e,a={},l="/",o=[];for(let i=0;i<r.length;++i){let e=r[i],s=i===r.length-1,u="/"===l?t:t.slice(l.length)||"/",c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:s},u),d=e.route;if(!c&&s&&n&&!r[r.length-1].route.index&&(c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:!1},u)),!c)return null;Object.assign(a,c.params),o.push({params:a,pathname:A([l,c.pathname]),pathnameBase:F(A([l,c.pathnameBase])),route:d}),"/"!==c.pathnameBase&&(l=A([l,c.pathnameBase]))}return o}function P(e,t){"string"===typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];u("*"===e||!e.endsWith("*")||e.endsWith("/*"),`Route path "${e}" will be treated as if it were "${e.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${e.replace(/\*$/,"/*")}".`);let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,((e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)")));e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))");let l=new RegExp(a,t?void 0:"i");return[l,r]}(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let l=a[0],o=l.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce(((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";o=l.slice(0,l.length-e.length).replace(/(.)\/+$/,"$1")}const s=i[n];return e[r]=a&&!s?void 0:(s||"").replace(/%2F/g,"/"),e}),{}),pathname:l,pathnameBase:o,pattern:e}}function T(e){try{return e.split("/").map((e=>decodeURIComponent(e).replace(/\//g,"%2F"))).join("/")}catch(t){return u(!1,`The URL path "${e}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${t}).`),e}}function _(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}function O(e,t,n,r){return`Cannot include a '${e}' character in a manually specified \`to.${t}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${n}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function L(e){return e.filter(((e,t)=>0===t||e.route.path&&e.route.path.length>0))}function j(e){let t=L(e);return t.map(((e,n)=>n===t.length-1?e.pathname:e.pathnameBase))}function z(e,t,n){let r,a=arguments.length>3&&void 0!==arguments[3]&&arguments[3];"string"===typeof e?r=p(e):(r={...e},s(!r.pathname||!r.pathname.includes("?"),O("?","pathname","search",r)),s(!r.pathname||!r.pathname.includes("#"),O("#","pathname","hash",r)),s(!r.search||!r.search.includes("#"),O("#","search","hash",r)));let l,o=""===e||""===r.pathname,i=o?"/":r.pathname;if(null==i)l=n;else{let e=t.length-1;if(!a&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;r.pathname=t.join("/")}l=e>=0?t[e]:"/"}let u=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"/",{pathname:n,search:r="",hash:a=""}="string"===typeof e?p(e):e,l=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach((e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)})),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:l,search:D(r),hash:M(a)}}(r,l),c=i&&"/"!==i&&i.endsWith("/"),d=(o||"."===i)&&n.endsWith("/");return u.pathname.endsWith("/")||!c&&!d||(u.pathname+="/"),u}var A=e=>e.join("/").replace(/\/\/+/g,"/"),F=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),D=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",M=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function U(e){return null!=e&&"number"===typeof e.status&&"string"===typeof e.statusText&&"boolean"===typeof e.internal&&"data"in e}var $=["POST","PUT","PATCH","DELETE"],I=(new Set($),["GET",...$]);new Set(I),Symbol("ResetLoaderData");var B=a.createContext(null);B.displayName="DataRouter";var H=a.createContext(null);H.displayName="DataRouterState";var W=a.createContext({isTransitioning:!1});W.displayName="ViewTransition";var q=a.createContext(new Map);q.displayName="Fetchers";var V=a.createContext(null);V.displayName="Await";var Q=a.createContext(null);Q.displayName="Navigation";var K=a.createContext(null);K.displayName="Location";var Y=a.createContext({outlet:null,matches:[],isDataRoute:!1});Y.displayName="Route";var X=a.createContext(null);X.displayName="RouteError";function J(){return null!=a.useContext(K)}function G(){return s(J(),"useLocation() may be used only in the context of a <Router> component."),a.useContext(K).location}var Z="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function ee(e){a.useContext(Q).static||a.useLayoutEffect(e)}function te(){let{isDataRoute:e}=a.useContext(Y);return e?function(){let{router:e}=ce("useNavigate"),t=fe("useNavigate"),n=a.useRef(!1);ee((()=>{n.current=!0}));let r=a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};u(n.current,Z),n.current&&("number"===typeof r?e.navigate(r):await e.navigate(r,{fromRouteId:t,...a}))}),[e,t]);return r}():function(){s(J(),"useNavigate() may be used only in the context of a <Router> component.");let e=a.useContext(B),{basename:t,navigator:n}=a.useContext(Q),{matches:r}=a.useContext(Y),{pathname:l}=G(),o=JSON.stringify(j(r)),i=a.useRef(!1);ee((()=>{i.current=!0}));let c=a.useCallback((function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(u(i.current,Z),!i.current)return;if("number"===typeof r)return void n.go(r);let s=z(r,JSON.parse(o),l,"path"===a.relative);null==e&&"/"!==t&&(s.pathname="/"===s.pathname?t:A([t,s.pathname])),(a.replace?n.replace:n.push)(s,a.state,a)}),[t,n,o,l,e]);return c}()}a.createContext(null);function ne(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{matches:n}=a.useContext(Y),{pathname:r}=G(),l=JSON.stringify(j(n));return a.useMemo((()=>z(e,JSON.parse(l),r,"path"===t)),[e,l,r,t])}function re(e,t,n,r){s(J(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:l,static:o}=a.useContext(Q),{matches:i}=a.useContext(Y),c=i[i.length-1],d=c?c.params:{},f=c?c.pathname:"/",h=c?c.pathnameBase:"/",g=c&&c.route;{let e=g&&g.path||"";me(f,!g||e.endsWith("*")||e.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${f}" (under <Route path="${e}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.\n\nPlease change the parent <Route path="${e}"> to <Route path="${"/"===e?"*":`${e}/*`}">.`)}let y,v=G();if(t){let e="string"===typeof t?p(t):t;s("/"===h||e.pathname?.startsWith(h),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${h}" but pathname "${e.pathname}" was given in the \`location\` prop.`),y=e}else y=v;let b=y.pathname||"/",w=b;if("/"!==h){let e=h.replace(/^\//,"").split("/");w="/"+b.replace(/^\//,"").split("/").slice(e.length).join("/")}let k=!o&&n&&n.matches&&n.matches.length>0?n.matches:m(e,{pathname:w});u(g||null!=k,`No routes matched location "${y.pathname}${y.search}${y.hash}" `),u(null==k||void 0!==k[k.length-1].route.element||void 0!==k[k.length-1].route.Component||void 0!==k[k.length-1].route.lazy,`Matched leaf route at location "${y.pathname}${y.search}${y.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let S=se(k&&k.map((e=>Object.assign({},e,{params:Object.assign({},d,e.params),pathname:A([h,l.encodeLocation?l.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?h:A([h,l.encodeLocation?l.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])}))),i,n,r);return t&&S?a.createElement(K.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...y},navigationType:"POP"}},S):S}function ae(){let e=pe(),t=U(e)?`${e.status} ${e.statusText}`:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:r},o={padding:"2px 4px",backgroundColor:r},i=null;return console.error("Error handled by React Router default ErrorBoundary:",e),i=a.createElement(a.Fragment,null,a.createElement("p",null,"\ud83d\udcbf Hey developer \ud83d\udc4b"),a.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",a.createElement("code",{style:o},"ErrorBoundary")," or"," ",a.createElement("code",{style:o},"errorElement")," prop on your route.")),a.createElement(a.Fragment,null,a.createElement("h2",null,"Unexpected Application Error!"),a.createElement("h3",{style:{fontStyle:"italic"}},t),n?a.createElement("pre",{style:l},n):null,i)}var le=a.createElement(ae,null),oe=class extends a.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?a.createElement(Y.Provider,{value:this.props.routeContext},a.createElement(X.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function ie(e){let{routeContext:t,match:n,children:r}=e,l=a.useContext(B);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),a.createElement(Y.Provider,{value:t},r)}function se(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null;if(null==e){if(!n)return null;if(n.errors)e=n.matches;else{if(0!==t.length||n.initialized||!(n.matches.length>0))return null;e=n.matches}}let r=e,l=n?.errors;if(null!=l){let e=r.findIndex((e=>e.route.id&&void 0!==l?.[e.route.id]));s(e>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(l).join(",")}`),r=r.slice(0,Math.min(r.length,e+1))}let o=!1,i=-1;if(n)for(let a=0;a<r.length;a++){let e=r[a];if((e.route.HydrateFallback||e.route.hydrateFallbackElement)&&(i=a),e.route.id){let{loaderData:t,errors:a}=n,l=e.route.loader&&!t.hasOwnProperty(e.route.id)&&(!a||void 0===a[e.route.id]);if(e.route.lazy||l){o=!0,r=i>=0?r.slice(0,i+1):[r[0]];break}}}return r.reduceRight(((e,s,u)=>{let c,d=!1,f=null,p=null;n&&(c=l&&s.route.id?l[s.route.id]:void 0,f=s.route.errorElement||le,o&&(i<0&&0===u?(me("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),d=!0,p=null):i===u&&(d=!0,p=s.route.hydrateFallbackElement||null)));let h=t.concat(r.slice(0,u+1)),m=()=>{let t;return t=c?f:d?p:s.route.Component?a.createElement(s.route.Component,null):s.route.element?s.route.element:e,a.createElement(ie,{match:s,routeContext:{outlet:e,matches:h,isDataRoute:null!=n},children:t})};return n&&(s.route.ErrorBoundary||s.route.errorElement||0===u)?a.createElement(oe,{location:n.location,revalidation:n.revalidation,component:f,error:c,children:m(),routeContext:{outlet:null,matches:h,isDataRoute:!0}}):m()}),null)}function ue(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function ce(e){let t=a.useContext(B);return s(t,ue(e)),t}function de(e){let t=a.useContext(H);return s(t,ue(e)),t}function fe(e){let t=function(e){let t=a.useContext(Y);return s(t,ue(e)),t}(e),n=t.matches[t.matches.length-1];return s(n.route.id,`${e} can only be used on routes that contain a unique "id"`),n.route.id}function pe(){let e=a.useContext(X),t=de("useRouteError"),n=fe("useRouteError");return void 0!==e?e:t.errors?.[n]}var he={};function me(e,t,n){t||he[e]||(he[e]=!0,u(!1,n))}a.memo((function(e){let{routes:t,future:n,state:r}=e;return re(t,void 0,r,n)}));function ge(e){s(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function ye(e){let{basename:t="/",children:n=null,location:r,navigationType:l="POP",navigator:o,static:i=!1}=e;s(!J(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let c=t.replace(/^\/*/,"/"),d=a.useMemo((()=>({basename:c,navigator:o,static:i,future:{}})),[c,o,i]);"string"===typeof r&&(r=p(r));let{pathname:f="/",search:h="",hash:m="",state:g=null,key:y="default"}=r,v=a.useMemo((()=>{let e=_(f,c);return null==e?null:{location:{pathname:e,search:h,hash:m,state:g,key:y},navigationType:l}}),[c,f,h,m,g,y,l]);return u(null!=v,`<Router basename="${c}"> is not able to match the URL "${f}${h}${m}" because it does not start with the basename, so the <Router> won't render anything.`),null==v?null:a.createElement(Q.Provider,{value:d},a.createElement(K.Provider,{children:n,value:v}))}function ve(e){let{children:t,location:n}=e;return re(be(t),n)}a.Component;function be(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=[];return a.Children.forEach(e,((e,r)=>{if(!a.isValidElement(e))return;let l=[...t,r];if(e.type===a.Fragment)return void n.push.apply(n,be(e.props.children,l));s(e.type===ge,`[${"string"===typeof e.type?e.type:e.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),s(!e.props.index||!e.props.children,"An index route cannot have child routes.");let o={id:e.props.id||l.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,hydrateFallbackElement:e.props.hydrateFallbackElement,HydrateFallback:e.props.HydrateFallback,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:!0===e.props.hasErrorBoundary||null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=be(e.props.children,l)),n.push(o)})),n}var we="get",ke="application/x-www-form-urlencoded";function Se(e){return null!=e&&"string"===typeof e.tagName}var xe=null;var Ee=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Ce(e){return null==e||Ee.has(e)?e:(u(!1,`"${e}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${ke}"`),null)}function Ne(e,t){let n,r,a,l,o;if(Se(i=e)&&"form"===i.tagName.toLowerCase()){let o=e.getAttribute("action");r=o?_(o,t):null,n=e.getAttribute("method")||we,a=Ce(e.getAttribute("enctype"))||ke,l=new FormData(e)}else if(function(e){return Se(e)&&"button"===e.tagName.toLowerCase()}(e)||function(e){return Se(e)&&"input"===e.tagName.toLowerCase()}(e)&&("submit"===e.type||"image"===e.type)){let o=e.form;if(null==o)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let i=e.getAttribute("formaction")||o.getAttribute("action");if(r=i?_(i,t):null,n=e.getAttribute("formmethod")||o.getAttribute("method")||we,a=Ce(e.getAttribute("formenctype"))||Ce(o.getAttribute("enctype"))||ke,l=new FormData(o,e),!function(){if(null===xe)try{new FormData(document.createElement("form"),0),xe=!1}catch(e){xe=!0}return xe}()){let{name:t,type:n,value:r}=e;if("image"===n){let e=t?`${t}.`:"";l.append(`${e}x`,"0"),l.append(`${e}y`,"0")}else t&&l.append(t,r)}}else{if(Se(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=we,r=null,a=ke,o=e}var i;return l&&"text/plain"===a&&(o=l,l=void 0),{action:r,method:n.toLowerCase(),encType:a,formData:l,body:o}}function Re(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}async function Pe(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error(`Error loading route module \`${e.module}\`, reloading page...`),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise((()=>{}))}}function Te(e){return null!=e&&"string"===typeof e.page}function _e(e){return null!=e&&(null==e.href?"preload"===e.rel&&"string"===typeof e.imageSrcSet&&"string"===typeof e.imageSizes:"string"===typeof e.rel&&"string"===typeof e.href)}function Oe(e,t,n,r,a,l){let o=(e,t)=>!n[t]||e.route.id!==n[t].route.id,i=(e,t)=>n[t].pathname!==e.pathname||n[t].route.path?.endsWith("*")&&n[t].params["*"]!==e.params["*"];return"assets"===l?t.filter(((e,t)=>o(e,t)||i(e,t))):"data"===l?t.filter(((t,l)=>{let s=r.routes[t.route.id];if(!s||!s.hasLoader)return!1;if(o(t,l)||i(t,l))return!0;if(t.route.shouldRevalidate){let r=t.route.shouldRevalidate({currentUrl:new URL(a.pathname+a.search+a.hash,window.origin),currentParams:n[0]?.params||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if("boolean"===typeof r)return r}return!0})):[]}function Le(e,t){let{includeHydrateFallback:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return r=e.map((e=>{let r=t.routes[e.route.id];if(!r)return[];let a=[r.module];return r.clientActionModule&&(a=a.concat(r.clientActionModule)),r.clientLoaderModule&&(a=a.concat(r.clientLoaderModule)),n&&r.hydrateFallbackModule&&(a=a.concat(r.hydrateFallbackModule)),r.imports&&(a=a.concat(r.imports)),a})).flat(1),[...new Set(r)];var r}function je(e,t){let n=new Set,r=new Set(t);return e.reduce(((e,a)=>{if(t&&!Te(a)&&"script"===a.as&&a.href&&r.has(a.href))return e;let l=JSON.stringify(function(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}(a));return n.has(l)||(n.add(l),e.push({key:l,link:a})),e}),[])}function ze(e){return{__html:e}}Symbol("SingleFetchRedirect");function Ae(e,t){let n="string"===typeof e?new URL(e,"undefined"===typeof window?"server://singlefetch/":window.location.origin):e;return"/"===n.pathname?n.pathname="_root.data":t&&"/"===_(n.pathname,t)?n.pathname=`${t.replace(/\/$/,"")}/_root.data`:n.pathname=`${n.pathname.replace(/\/$/,"")}.data`,n}a.Component;function Fe(e){let{error:t,isOutsideRemixApp:n}=e;console.error(t);let r,l=a.createElement("script",{dangerouslySetInnerHTML:{__html:'\n        console.log(\n          "\ud83d\udcbf Hey developer \ud83d\udc4b. You can provide a way better UX than this when your app throws errors. Check out https://remix.run/guides/errors for more information."\n        );\n      '}});if(U(t))return a.createElement(De,{title:"Unhandled Thrown Response!"},a.createElement("h1",{style:{fontSize:"24px"}},t.status," ",t.statusText),l);if(t instanceof Error)r=t;else{let e=null==t?"Unknown Error":"object"===typeof t&&"toString"in t?t.toString():JSON.stringify(t);r=new Error(e)}return a.createElement(De,{title:"Application Error!",isOutsideRemixApp:n},a.createElement("h1",{style:{fontSize:"24px"}},"Application Error"),a.createElement("pre",{style:{padding:"2rem",background:"hsla(10, 50%, 50%, 0.1)",color:"red",overflow:"auto"}},r.stack),l)}function De(e){let{title:t,renderScripts:n,isOutsideRemixApp:r,children:l}=e,{routeModules:o}=Be();return o.root?.Layout&&!r?l:a.createElement("html",{lang:"en"},a.createElement("head",null,a.createElement("meta",{charSet:"utf-8"}),a.createElement("meta",{name:"viewport",content:"width=device-width,initial-scale=1,viewport-fit=cover"}),a.createElement("title",null,t)),a.createElement("body",null,a.createElement("main",{style:{fontFamily:"system-ui, sans-serif",padding:"2rem"}},l,n?a.createElement(Ye,null):null)))}function Me(e){return!0===e}function Ue(){let e=a.useContext(B);return Re(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function $e(){let e=a.useContext(H);return Re(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var Ie=a.createContext(void 0);function Be(){let e=a.useContext(Ie);return Re(e,"You must render this element inside a <HydratedRouter> element"),e}function He(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function We(e,t,n){if(n&&!Ke)return[e[0]];if(t){let n=e.findIndex((e=>void 0!==t[e.route.id]));return e.slice(0,n+1)}return e}function qe(e){let{page:t,...n}=e,{router:r}=Ue(),l=a.useMemo((()=>m(r.routes,t,r.basename)),[r.routes,t,r.basename]);return l?a.createElement(Qe,{page:t,matches:l,...n}):null}function Ve(e){let{manifest:t,routeModules:n}=Be(),[r,l]=a.useState([]);return a.useEffect((()=>{let r=!1;return async function(e,t,n){return je((await Promise.all(e.map((async e=>{let r=t.routes[e.route.id];if(r){let e=await Pe(r,n);return e.links?e.links():[]}return[]})))).flat(1).filter(_e).filter((e=>"stylesheet"===e.rel||"preload"===e.rel)).map((e=>"stylesheet"===e.rel?{...e,rel:"prefetch",as:"style"}:{...e,rel:"prefetch"})))}(e,t,n).then((e=>{r||l(e)})),()=>{r=!0}}),[e,t,n]),r}function Qe(e){let{page:t,matches:n,...r}=e,l=G(),{manifest:o,routeModules:i}=Be(),{basename:s}=Ue(),{loaderData:u,matches:c}=$e(),d=a.useMemo((()=>Oe(t,n,c,o,l,"data")),[t,n,c,o,l]),f=a.useMemo((()=>Oe(t,n,c,o,l,"assets")),[t,n,c,o,l]),p=a.useMemo((()=>{if(t===l.pathname+l.search+l.hash)return[];let e=new Set,r=!1;if(n.forEach((t=>{let n=o.routes[t.route.id];n&&n.hasLoader&&(!d.some((e=>e.route.id===t.route.id))&&t.route.id in u&&i[t.route.id]?.shouldRevalidate||n.hasClientLoader?r=!0:e.add(t.route.id))})),0===e.size)return[];let a=Ae(t,s);return r&&e.size>0&&a.searchParams.set("_routes",n.filter((t=>e.has(t.route.id))).map((e=>e.route.id)).join(",")),[a.pathname+a.search]}),[s,u,l,o,d,n,t,i]),h=a.useMemo((()=>Le(f,o)),[f,o]),m=Ve(f);return a.createElement(a.Fragment,null,p.map((e=>a.createElement("link",{key:e,rel:"prefetch",as:"fetch",href:e,...r}))),h.map((e=>a.createElement("link",{key:e,rel:"modulepreload",href:e,...r}))),m.map((e=>{let{key:t,link:n}=e;return a.createElement("link",{key:t,...n})})))}Ie.displayName="FrameworkContext";var Ke=!1;function Ye(e){let{manifest:t,serverHandoffString:n,isSpaMode:r,ssr:l,renderMeta:o}=Be(),{router:i,static:s,staticContext:u}=Ue(),{matches:c}=$e(),d=Me(l);o&&(o.didRenderScripts=!0);let f=We(c,null,r);a.useEffect((()=>{Ke=!0}),[]);let p=a.useMemo((()=>{let r=u?`window.__reactRouterContext = ${n};window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());`:" ",l=s?`${t.hmr?.runtime?`import ${JSON.stringify(t.hmr.runtime)};`:""}${d?"":`import ${JSON.stringify(t.url)}`};\n${f.map(((e,n)=>{let r=`route${n}`,a=t.routes[e.route.id];Re(a,`Route ${e.route.id} not found in manifest`);let{clientActionModule:l,clientLoaderModule:o,clientMiddlewareModule:i,hydrateFallbackModule:s,module:u}=a,c=[...l?[{module:l,varName:`${r}_clientAction`}]:[],...o?[{module:o,varName:`${r}_clientLoader`}]:[],...i?[{module:i,varName:`${r}_clientMiddleware`}]:[],...s?[{module:s,varName:`${r}_HydrateFallback`}]:[],{module:u,varName:`${r}_main`}];return 1===c.length?`import * as ${r} from ${JSON.stringify(u)};`:[c.map((e=>`import * as ${e.varName} from "${e.module}";`)).join("\n"),`const ${r} = {${c.map((e=>`...${e.varName}`)).join(",")}};`].join("\n")})).join("\n")}\n  ${d?`window.__reactRouterManifest = ${JSON.stringify(function(e,t){let n=new Set(t.state.matches.map((e=>e.route.id))),r=t.state.location.pathname.split("/").filter(Boolean),a=["/"];for(r.pop();r.length>0;)a.push(`/${r.join("/")}`),r.pop();a.forEach((e=>{let r=m(t.routes,e,t.basename);r&&r.forEach((e=>n.add(e.route.id)))}));let l=[...n].reduce(((t,n)=>Object.assign(t,{[n]:e.routes[n]})),{});return{...e,routes:l}}(t,i),null,2)};`:""}\n  window.__reactRouterRouteModules = {${f.map(((e,t)=>`${JSON.stringify(e.route.id)}:route${t}`)).join(",")}};\n\nimport(${JSON.stringify(t.entry.module)});`:" ";return a.createElement(a.Fragment,null,a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:ze(r),type:void 0}),a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:ze(l),type:"module",async:!0}))}),[]),h=Ke?[]:t.entry.imports.concat(Le(f,t,{includeHydrateFallback:!0}));return Ke?null:a.createElement(a.Fragment,null,d?null:a.createElement("link",{rel:"modulepreload",href:t.url,crossOrigin:e.crossOrigin}),a.createElement("link",{rel:"modulepreload",href:t.entry.module,crossOrigin:e.crossOrigin}),(g=h,[...new Set(g)]).map((t=>a.createElement("link",{key:t,rel:"modulepreload",href:t,crossOrigin:e.crossOrigin}))),p);var g}function Xe(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return e=>{t.forEach((t=>{"function"===typeof t?t(e):null!=t&&(t.current=e)}))}}var Je="undefined"!==typeof window&&"undefined"!==typeof window.document&&"undefined"!==typeof window.document.createElement;try{Je&&(window.__reactRouterVersion="7.4.1")}catch(Qr){}function Ge(e){let{basename:t,children:n,window:r}=e,l=a.useRef();null==l.current&&(l.current=i({window:r,v5Compat:!0}));let o=l.current,[s,u]=a.useState({action:o.action,location:o.location}),c=a.useCallback((e=>{a.startTransition((()=>u(e)))}),[u]);return a.useLayoutEffect((()=>o.listen(c)),[o,c]),a.createElement(ye,{basename:t,children:n,location:s.location,navigationType:s.action,navigator:o})}var Ze=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,et=a.forwardRef((function(e,t){let n,{onClick:r,discover:l="render",prefetch:o="none",relative:i,reloadDocument:c,replace:d,state:p,target:h,to:m,preventScrollReset:g,viewTransition:y,...v}=e,{basename:b}=a.useContext(Q),w="string"===typeof m&&Ze.test(m),k=!1;if("string"===typeof m&&w&&(n=m,Je))try{let e=new URL(window.location.href),t=m.startsWith("//")?new URL(e.protocol+m):new URL(m),n=_(t.pathname,b);t.origin===e.origin&&null!=n?m=n+t.search+t.hash:k=!0}catch(Qr){u(!1,`<Link to="${m}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let S=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};s(J(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:r}=a.useContext(Q),{hash:l,pathname:o,search:i}=ne(e,{relative:t}),u=o;return"/"!==n&&(u="/"===o?n:A([n,o])),r.createHref({pathname:u,search:i,hash:l})}(m,{relative:i}),[x,E,C]=function(e,t){let n=a.useContext(Ie),[r,l]=a.useState(!1),[o,i]=a.useState(!1),{onFocus:s,onBlur:u,onMouseEnter:c,onMouseLeave:d,onTouchStart:f}=t,p=a.useRef(null);a.useEffect((()=>{if("render"===e&&i(!0),"viewport"===e){let e=new IntersectionObserver((e=>{e.forEach((e=>{i(e.isIntersecting)}))}),{threshold:.5});return p.current&&e.observe(p.current),()=>{e.disconnect()}}}),[e]),a.useEffect((()=>{if(r){let e=setTimeout((()=>{i(!0)}),100);return()=>{clearTimeout(e)}}}),[r]);let h=()=>{l(!0)},m=()=>{l(!1),i(!1)};return n?"intent"!==e?[o,p,{}]:[o,p,{onFocus:He(s,h),onBlur:He(u,m),onMouseEnter:He(c,h),onMouseLeave:He(d,m),onTouchStart:He(f,h)}]:[!1,p,{}]}(o,v),N=function(e){let{target:t,replace:n,state:r,preventScrollReset:l,relative:o,viewTransition:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},s=te(),u=G(),c=ne(e,{relative:o});return a.useCallback((a=>{if(function(e,t){return 0===e.button&&(!t||"_self"===t)&&!function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)}(a,t)){a.preventDefault();let t=void 0!==n?n:f(u)===f(c);s(e,{replace:t,state:r,preventScrollReset:l,relative:o,viewTransition:i})}}),[u,s,c,n,r,t,e,l,o,i])}(m,{replace:d,state:p,target:h,preventScrollReset:g,relative:i,viewTransition:y});let R=a.createElement("a",{...v,...C,href:n||S,onClick:k||c?r:function(e){r&&r(e),e.defaultPrevented||N(e)},ref:Xe(t,E),target:h,"data-discover":w||"render"!==l?void 0:"true"});return x&&!w?a.createElement(a.Fragment,null,R,a.createElement(qe,{page:S})):R}));et.displayName="Link",a.forwardRef((function(e,t){let{"aria-current":n="page",caseSensitive:r=!1,className:l="",end:o=!1,style:i,to:u,viewTransition:c,children:d,...f}=e,p=ne(u,{relative:f.relative}),h=G(),m=a.useContext(H),{navigator:g,basename:y}=a.useContext(Q),v=null!=m&&function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=a.useContext(W);s(null!=n,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=rt("useViewTransitionState"),l=ne(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=_(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=_(n.nextLocation.pathname,r)||n.nextLocation.pathname;return null!=P(l.pathname,i)||null!=P(l.pathname,o)}(p)&&!0===c,b=g.encodeLocation?g.encodeLocation(p).pathname:p.pathname,w=h.pathname,k=m&&m.navigation&&m.navigation.location?m.navigation.location.pathname:null;r||(w=w.toLowerCase(),k=k?k.toLowerCase():null,b=b.toLowerCase()),k&&y&&(k=_(k,y)||k);const S="/"!==b&&b.endsWith("/")?b.length-1:b.length;let x,E=w===b||!o&&w.startsWith(b)&&"/"===w.charAt(S),C=null!=k&&(k===b||!o&&k.startsWith(b)&&"/"===k.charAt(b.length)),N={isActive:E,isPending:C,isTransitioning:v},R=E?n:void 0;x="function"===typeof l?l(N):[l,E?"active":null,C?"pending":null,v?"transitioning":null].filter(Boolean).join(" ");let T="function"===typeof i?i(N):i;return a.createElement(et,{...f,"aria-current":R,className:x,ref:t,style:T,to:u,viewTransition:c},"function"===typeof d?d(N):d)})).displayName="NavLink";var tt=a.forwardRef(((e,t)=>{let{discover:n="render",fetcherKey:r,navigate:l,reloadDocument:o,replace:i,state:u,method:c=we,action:d,onSubmit:p,relative:h,preventScrollReset:m,viewTransition:g,...y}=e,v=ot(),b=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{basename:n}=a.useContext(Q),r=a.useContext(Y);s(r,"useFormAction must be used inside a RouteContext");let[l]=r.matches.slice(-1),o={...ne(e||".",{relative:t})},i=G();if(null==e){o.search=i.search;let e=new URLSearchParams(o.search),t=e.getAll("index");if(t.some((e=>""===e))){e.delete("index"),t.filter((e=>e)).forEach((t=>e.append("index",t)));let n=e.toString();o.search=n?`?${n}`:""}}e&&"."!==e||!l.route.index||(o.search=o.search?o.search.replace(/^\?/,"?index&"):"?index");"/"!==n&&(o.pathname="/"===o.pathname?n:A([n,o.pathname]));return f(o)}(d,{relative:h}),w="get"===c.toLowerCase()?"get":"post",k="string"===typeof d&&Ze.test(d);return a.createElement("form",{ref:t,method:w,action:b,onSubmit:o?p:e=>{if(p&&p(e),e.defaultPrevented)return;e.preventDefault();let t=e.nativeEvent.submitter,n=t?.getAttribute("formmethod")||c;v(t||e.currentTarget,{fetcherKey:r,method:n,navigate:l,replace:i,state:u,relative:h,preventScrollReset:m,viewTransition:g})},...y,"data-discover":k||"render"!==n?void 0:"true"})}));function nt(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function rt(e){let t=a.useContext(B);return s(t,nt(e)),t}tt.displayName="Form";var at=0,lt=()=>`__${String(++at)}__`;function ot(){let{router:e}=rt("useSubmit"),{basename:t}=a.useContext(Q),n=fe("useRouteId");return a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{action:l,method:o,encType:i,formData:s,body:u}=Ne(r,t);if(!1===a.navigate){let t=a.fetcherKey||lt();await e.fetch(t,n,a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:u,formMethod:a.method||o,formEncType:a.encType||i,flushSync:a.flushSync})}else await e.navigate(a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:u,formMethod:a.method||o,formEncType:a.encType||i,replace:a.replace,state:a.state,fromRouteId:n,flushSync:a.flushSync,viewTransition:a.viewTransition})}),[e,t,n])}new TextEncoder;const it=e=>{const t=(e=>e.replace(/^([A-Z])|[\s-_]+(\w)/g,((e,t,n)=>n?n.toUpperCase():t.toLowerCase())))(e);return t.charAt(0).toUpperCase()+t.slice(1)},st=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.filter(((e,t,n)=>Boolean(e)&&""!==e.trim()&&n.indexOf(e)===t)).join(" ").trim()};var ut={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const ct=(0,a.forwardRef)(((e,t)=>{let{color:n="currentColor",size:r=24,strokeWidth:l=2,absoluteStrokeWidth:o,className:i="",children:s,iconNode:u,...c}=e;return(0,a.createElement)("svg",{ref:t,...ut,width:r,height:r,stroke:n,strokeWidth:o?24*Number(l)/Number(r):l,className:st("lucide",i),...c},[...u.map((e=>{let[t,n]=e;return(0,a.createElement)(t,n)})),...Array.isArray(s)?s:[s]])})),dt=(e,t)=>{const n=(0,a.forwardRef)(((n,r)=>{let{className:l,...o}=n;return(0,a.createElement)(ct,{ref:r,iconNode:t,className:st(`lucide-${i=it(e),i.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase()}`,`lucide-${e}`,l),...o});var i}));return n.displayName=it(e),n},ft=dt("x",[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]]),pt=dt("menu",[["line",{x1:"4",x2:"20",y1:"12",y2:"12",key:"1e0a9i"}],["line",{x1:"4",x2:"20",y1:"6",y2:"6",key:"1owob3"}],["line",{x1:"4",x2:"20",y1:"18",y2:"18",key:"yk5zj1"}]]);var ht=n(579);const mt=()=>{const[e,t]=(0,a.useState)(!1);return(0,ht.jsx)("header",{className:"header",children:(0,ht.jsxs)("div",{className:"header-container",children:[(0,ht.jsx)(et,{to:"/",className:"logo",children:(0,ht.jsx)("h1",{children:"MedDiagnosis AI"})}),(0,ht.jsx)("button",{className:"menu-toggle",onClick:()=>t(!e),children:e?(0,ht.jsx)(ft,{size:24}):(0,ht.jsx)(pt,{size:24})}),(0,ht.jsx)("nav",{className:"main-nav "+(e?"open":""),children:(0,ht.jsxs)("ul",{children:[(0,ht.jsx)("li",{children:(0,ht.jsx)(et,{to:"/",onClick:()=>t(!1),children:"Home"})}),(0,ht.jsx)("li",{children:(0,ht.jsx)(et,{to:"/symptom-checker",onClick:()=>t(!1),children:"Symptom Checker"})}),(0,ht.jsx)("li",{children:(0,ht.jsx)(et,{to:"/chat",onClick:()=>t(!1),children:"Chat with AI"})})]})})]})})},gt=()=>(0,ht.jsx)("footer",{className:"footer",children:(0,ht.jsxs)("div",{className:"footer-container",children:[(0,ht.jsxs)("p",{children:["\xa9 ",(new Date).getFullYear()," MedDiagnosis AI. All rights reserved."]}),(0,ht.jsx)("p",{className:"disclaimer",children:"This application is for educational purposes only. Always consult with a healthcare professional for medical advice."})]})});function yt(e,t){return function(){return e.apply(t,arguments)}}const{toString:vt}=Object.prototype,{getPrototypeOf:bt}=Object,wt=(kt=Object.create(null),e=>{const t=vt.call(e);return kt[t]||(kt[t]=t.slice(8,-1).toLowerCase())});var kt;const St=e=>(e=e.toLowerCase(),t=>wt(t)===e),xt=e=>t=>typeof t===e,{isArray:Et}=Array,Ct=xt("undefined");const Nt=St("ArrayBuffer");const Rt=xt("string"),Pt=xt("function"),Tt=xt("number"),_t=e=>null!==e&&"object"===typeof e,Ot=e=>{if("object"!==wt(e))return!1;const t=bt(e);return(null===t||t===Object.prototype||null===Object.getPrototypeOf(t))&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)},Lt=St("Date"),jt=St("File"),zt=St("Blob"),At=St("FileList"),Ft=St("URLSearchParams"),[Dt,Mt,Ut,$t]=["ReadableStream","Request","Response","Headers"].map(St);function It(e,t){let n,r,{allOwnKeys:a=!1}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(null!==e&&"undefined"!==typeof e)if("object"!==typeof e&&(e=[e]),Et(e))for(n=0,r=e.length;n<r;n++)t.call(null,e[n],n,e);else{const r=a?Object.getOwnPropertyNames(e):Object.keys(e),l=r.length;let o;for(n=0;n<l;n++)o=r[n],t.call(null,e[o],o,e)}}function Bt(e,t){t=t.toLowerCase();const n=Object.keys(e);let r,a=n.length;for(;a-- >0;)if(r=n[a],t===r.toLowerCase())return r;return null}const Ht="undefined"!==typeof globalThis?globalThis:"undefined"!==typeof self?self:"undefined"!==typeof window?window:global,Wt=e=>!Ct(e)&&e!==Ht;const qt=(Vt="undefined"!==typeof Uint8Array&&bt(Uint8Array),e=>Vt&&e instanceof Vt);var Vt;const Qt=St("HTMLFormElement"),Kt=(e=>{let{hasOwnProperty:t}=e;return(e,n)=>t.call(e,n)})(Object.prototype),Yt=St("RegExp"),Xt=(e,t)=>{const n=Object.getOwnPropertyDescriptors(e),r={};It(n,((n,a)=>{let l;!1!==(l=t(n,a,e))&&(r[a]=l||n)})),Object.defineProperties(e,r)};const Jt=St("AsyncFunction"),Gt=((e,t)=>{return e?setImmediate:t?(n=`axios@${Math.random()}`,r=[],Ht.addEventListener("message",(e=>{let{source:t,data:a}=e;t===Ht&&a===n&&r.length&&r.shift()()}),!1),e=>{r.push(e),Ht.postMessage(n,"*")}):e=>setTimeout(e);var n,r})("function"===typeof setImmediate,Pt(Ht.postMessage)),Zt="undefined"!==typeof queueMicrotask?queueMicrotask.bind(Ht):"undefined"!==typeof process&&process.nextTick||Gt,en={isArray:Et,isArrayBuffer:Nt,isBuffer:function(e){return null!==e&&!Ct(e)&&null!==e.constructor&&!Ct(e.constructor)&&Pt(e.constructor.isBuffer)&&e.constructor.isBuffer(e)},isFormData:e=>{let t;return e&&("function"===typeof FormData&&e instanceof FormData||Pt(e.append)&&("formdata"===(t=wt(e))||"object"===t&&Pt(e.toString)&&"[object FormData]"===e.toString()))},isArrayBufferView:function(e){let t;return t="undefined"!==typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView(e):e&&e.buffer&&Nt(e.buffer),t},isString:Rt,isNumber:Tt,isBoolean:e=>!0===e||!1===e,isObject:_t,isPlainObject:Ot,isReadableStream:Dt,isRequest:Mt,isResponse:Ut,isHeaders:$t,isUndefined:Ct,isDate:Lt,isFile:jt,isBlob:zt,isRegExp:Yt,isFunction:Pt,isStream:e=>_t(e)&&Pt(e.pipe),isURLSearchParams:Ft,isTypedArray:qt,isFileList:At,forEach:It,merge:function e(){const{caseless:t}=Wt(this)&&this||{},n={},r=(r,a)=>{const l=t&&Bt(n,a)||a;Ot(n[l])&&Ot(r)?n[l]=e(n[l],r):Ot(r)?n[l]=e({},r):Et(r)?n[l]=r.slice():n[l]=r};for(let a=0,l=arguments.length;a<l;a++)arguments[a]&&It(arguments[a],r);return n},extend:function(e,t,n){let{allOwnKeys:r}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};return It(t,((t,r)=>{n&&Pt(t)?e[r]=yt(t,n):e[r]=t}),{allOwnKeys:r}),e},trim:e=>e.trim?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,""),stripBOM:e=>(65279===e.charCodeAt(0)&&(e=e.slice(1)),e),inherits:(e,t,n,r)=>{e.prototype=Object.create(t.prototype,r),e.prototype.constructor=e,Object.defineProperty(e,"super",{value:t.prototype}),n&&Object.assign(e.prototype,n)},toFlatObject:(e,t,n,r)=>{let a,l,o;const i={};if(t=t||{},null==e)return t;do{for(a=Object.getOwnPropertyNames(e),l=a.length;l-- >0;)o=a[l],r&&!r(o,e,t)||i[o]||(t[o]=e[o],i[o]=!0);e=!1!==n&&bt(e)}while(e&&(!n||n(e,t))&&e!==Object.prototype);return t},kindOf:wt,kindOfTest:St,endsWith:(e,t,n)=>{e=String(e),(void 0===n||n>e.length)&&(n=e.length),n-=t.length;const r=e.indexOf(t,n);return-1!==r&&r===n},toArray:e=>{if(!e)return null;if(Et(e))return e;let t=e.length;if(!Tt(t))return null;const n=new Array(t);for(;t-- >0;)n[t]=e[t];return n},forEachEntry:(e,t)=>{const n=(e&&e[Symbol.iterator]).call(e);let r;for(;(r=n.next())&&!r.done;){const n=r.value;t.call(e,n[0],n[1])}},matchAll:(e,t)=>{let n;const r=[];for(;null!==(n=e.exec(t));)r.push(n);return r},isHTMLForm:Qt,hasOwnProperty:Kt,hasOwnProp:Kt,reduceDescriptors:Xt,freezeMethods:e=>{Xt(e,((t,n)=>{if(Pt(e)&&-1!==["arguments","caller","callee"].indexOf(n))return!1;const r=e[n];Pt(r)&&(t.enumerable=!1,"writable"in t?t.writable=!1:t.set||(t.set=()=>{throw Error("Can not rewrite read-only method '"+n+"'")}))}))},toObjectSet:(e,t)=>{const n={},r=e=>{e.forEach((e=>{n[e]=!0}))};return Et(e)?r(e):r(String(e).split(t)),n},toCamelCase:e=>e.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,(function(e,t,n){return t.toUpperCase()+n})),noop:()=>{},toFiniteNumber:(e,t)=>null!=e&&Number.isFinite(e=+e)?e:t,findKey:Bt,global:Ht,isContextDefined:Wt,isSpecCompliantForm:function(e){return!!(e&&Pt(e.append)&&"FormData"===e[Symbol.toStringTag]&&e[Symbol.iterator])},toJSONObject:e=>{const t=new Array(10),n=(e,r)=>{if(_t(e)){if(t.indexOf(e)>=0)return;if(!("toJSON"in e)){t[r]=e;const a=Et(e)?[]:{};return It(e,((e,t)=>{const l=n(e,r+1);!Ct(l)&&(a[t]=l)})),t[r]=void 0,a}}return e};return n(e,0)},isAsyncFn:Jt,isThenable:e=>e&&(_t(e)||Pt(e))&&Pt(e.then)&&Pt(e.catch),setImmediate:Gt,asap:Zt};function tn(e,t,n,r,a){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack,this.message=e,this.name="AxiosError",t&&(this.code=t),n&&(this.config=n),r&&(this.request=r),a&&(this.response=a,this.status=a.status?a.status:null)}en.inherits(tn,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:en.toJSONObject(this.config),code:this.code,status:this.status}}});const nn=tn.prototype,rn={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach((e=>{rn[e]={value:e}})),Object.defineProperties(tn,rn),Object.defineProperty(nn,"isAxiosError",{value:!0}),tn.from=(e,t,n,r,a,l)=>{const o=Object.create(nn);return en.toFlatObject(e,o,(function(e){return e!==Error.prototype}),(e=>"isAxiosError"!==e)),tn.call(o,e.message,t,n,r,a),o.cause=e,o.name=e.name,l&&Object.assign(o,l),o};const an=tn;function ln(e){return en.isPlainObject(e)||en.isArray(e)}function on(e){return en.endsWith(e,"[]")?e.slice(0,-2):e}function sn(e,t,n){return e?e.concat(t).map((function(e,t){return e=on(e),!n&&t?"["+e+"]":e})).join(n?".":""):t}const un=en.toFlatObject(en,{},null,(function(e){return/^is[A-Z]/.test(e)}));const cn=function(e,t,n){if(!en.isObject(e))throw new TypeError("target must be an object");t=t||new FormData;const r=(n=en.toFlatObject(n,{metaTokens:!0,dots:!1,indexes:!1},!1,(function(e,t){return!en.isUndefined(t[e])}))).metaTokens,a=n.visitor||u,l=n.dots,o=n.indexes,i=(n.Blob||"undefined"!==typeof Blob&&Blob)&&en.isSpecCompliantForm(t);if(!en.isFunction(a))throw new TypeError("visitor must be a function");function s(e){if(null===e)return"";if(en.isDate(e))return e.toISOString();if(!i&&en.isBlob(e))throw new an("Blob is not supported. Use a Buffer instead.");return en.isArrayBuffer(e)||en.isTypedArray(e)?i&&"function"===typeof Blob?new Blob([e]):Buffer.from(e):e}function u(e,n,a){let i=e;if(e&&!a&&"object"===typeof e)if(en.endsWith(n,"{}"))n=r?n:n.slice(0,-2),e=JSON.stringify(e);else if(en.isArray(e)&&function(e){return en.isArray(e)&&!e.some(ln)}(e)||(en.isFileList(e)||en.endsWith(n,"[]"))&&(i=en.toArray(e)))return n=on(n),i.forEach((function(e,r){!en.isUndefined(e)&&null!==e&&t.append(!0===o?sn([n],r,l):null===o?n:n+"[]",s(e))})),!1;return!!ln(e)||(t.append(sn(a,n,l),s(e)),!1)}const c=[],d=Object.assign(un,{defaultVisitor:u,convertValue:s,isVisitable:ln});if(!en.isObject(e))throw new TypeError("data must be an object");return function e(n,r){if(!en.isUndefined(n)){if(-1!==c.indexOf(n))throw Error("Circular reference detected in "+r.join("."));c.push(n),en.forEach(n,(function(n,l){!0===(!(en.isUndefined(n)||null===n)&&a.call(t,n,en.isString(l)?l.trim():l,r,d))&&e(n,r?r.concat(l):[l])})),c.pop()}}(e),t};function dn(e){const t={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(e).replace(/[!'()~]|%20|%00/g,(function(e){return t[e]}))}function fn(e,t){this._pairs=[],e&&cn(e,this,t)}const pn=fn.prototype;pn.append=function(e,t){this._pairs.push([e,t])},pn.toString=function(e){const t=e?function(t){return e.call(this,t,dn)}:dn;return this._pairs.map((function(e){return t(e[0])+"="+t(e[1])}),"").join("&")};const hn=fn;function mn(e){return encodeURIComponent(e).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+").replace(/%5B/gi,"[").replace(/%5D/gi,"]")}function gn(e,t,n){if(!t)return e;const r=n&&n.encode||mn;en.isFunction(n)&&(n={serialize:n});const a=n&&n.serialize;let l;if(l=a?a(t,n):en.isURLSearchParams(t)?t.toString():new hn(t,n).toString(r),l){const t=e.indexOf("#");-1!==t&&(e=e.slice(0,t)),e+=(-1===e.indexOf("?")?"?":"&")+l}return e}const yn=class{constructor(){this.handlers=[]}use(e,t,n){return this.handlers.push({fulfilled:e,rejected:t,synchronous:!!n&&n.synchronous,runWhen:n?n.runWhen:null}),this.handlers.length-1}eject(e){this.handlers[e]&&(this.handlers[e]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(e){en.forEach(this.handlers,(function(t){null!==t&&e(t)}))}},vn={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1},bn={isBrowser:!0,classes:{URLSearchParams:"undefined"!==typeof URLSearchParams?URLSearchParams:hn,FormData:"undefined"!==typeof FormData?FormData:null,Blob:"undefined"!==typeof Blob?Blob:null},protocols:["http","https","file","blob","url","data"]},wn="undefined"!==typeof window&&"undefined"!==typeof document,kn="object"===typeof navigator&&navigator||void 0,Sn=wn&&(!kn||["ReactNative","NativeScript","NS"].indexOf(kn.product)<0),xn="undefined"!==typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope&&"function"===typeof self.importScripts,En=wn&&window.location.href||"http://localhost",Cn={...r,...bn};const Nn=function(e){function t(e,n,r,a){let l=e[a++];if("__proto__"===l)return!0;const o=Number.isFinite(+l),i=a>=e.length;if(l=!l&&en.isArray(r)?r.length:l,i)return en.hasOwnProp(r,l)?r[l]=[r[l],n]:r[l]=n,!o;r[l]&&en.isObject(r[l])||(r[l]=[]);return t(e,n,r[l],a)&&en.isArray(r[l])&&(r[l]=function(e){const t={},n=Object.keys(e);let r;const a=n.length;let l;for(r=0;r<a;r++)l=n[r],t[l]=e[l];return t}(r[l])),!o}if(en.isFormData(e)&&en.isFunction(e.entries)){const n={};return en.forEachEntry(e,((e,r)=>{t(function(e){return en.matchAll(/\w+|\[(\w*)]/g,e).map((e=>"[]"===e[0]?"":e[1]||e[0]))}(e),r,n,0)})),n}return null};const Rn={transitional:vn,adapter:["xhr","http","fetch"],transformRequest:[function(e,t){const n=t.getContentType()||"",r=n.indexOf("application/json")>-1,a=en.isObject(e);a&&en.isHTMLForm(e)&&(e=new FormData(e));if(en.isFormData(e))return r?JSON.stringify(Nn(e)):e;if(en.isArrayBuffer(e)||en.isBuffer(e)||en.isStream(e)||en.isFile(e)||en.isBlob(e)||en.isReadableStream(e))return e;if(en.isArrayBufferView(e))return e.buffer;if(en.isURLSearchParams(e))return t.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),e.toString();let l;if(a){if(n.indexOf("application/x-www-form-urlencoded")>-1)return function(e,t){return cn(e,new Cn.classes.URLSearchParams,Object.assign({visitor:function(e,t,n,r){return Cn.isNode&&en.isBuffer(e)?(this.append(t,e.toString("base64")),!1):r.defaultVisitor.apply(this,arguments)}},t))}(e,this.formSerializer).toString();if((l=en.isFileList(e))||n.indexOf("multipart/form-data")>-1){const t=this.env&&this.env.FormData;return cn(l?{"files[]":e}:e,t&&new t,this.formSerializer)}}return a||r?(t.setContentType("application/json",!1),function(e,t,n){if(en.isString(e))try{return(t||JSON.parse)(e),en.trim(e)}catch(Qr){if("SyntaxError"!==Qr.name)throw Qr}return(n||JSON.stringify)(e)}(e)):e}],transformResponse:[function(e){const t=this.transitional||Rn.transitional,n=t&&t.forcedJSONParsing,r="json"===this.responseType;if(en.isResponse(e)||en.isReadableStream(e))return e;if(e&&en.isString(e)&&(n&&!this.responseType||r)){const n=!(t&&t.silentJSONParsing)&&r;try{return JSON.parse(e)}catch(Qr){if(n){if("SyntaxError"===Qr.name)throw an.from(Qr,an.ERR_BAD_RESPONSE,this,null,this.response);throw Qr}}}return e}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:Cn.classes.FormData,Blob:Cn.classes.Blob},validateStatus:function(e){return e>=200&&e<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};en.forEach(["delete","get","head","post","put","patch"],(e=>{Rn.headers[e]={}}));const Pn=Rn,Tn=en.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),_n=Symbol("internals");function On(e){return e&&String(e).trim().toLowerCase()}function Ln(e){return!1===e||null==e?e:en.isArray(e)?e.map(Ln):String(e)}function jn(e,t,n,r,a){return en.isFunction(r)?r.call(this,t,n):(a&&(t=n),en.isString(t)?en.isString(r)?-1!==t.indexOf(r):en.isRegExp(r)?r.test(t):void 0:void 0)}class zn{constructor(e){e&&this.set(e)}set(e,t,n){const r=this;function a(e,t,n){const a=On(t);if(!a)throw new Error("header name must be a non-empty string");const l=en.findKey(r,a);(!l||void 0===r[l]||!0===n||void 0===n&&!1!==r[l])&&(r[l||t]=Ln(e))}const l=(e,t)=>en.forEach(e,((e,n)=>a(e,n,t)));if(en.isPlainObject(e)||e instanceof this.constructor)l(e,t);else if(en.isString(e)&&(e=e.trim())&&!/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(e.trim()))l((e=>{const t={};let n,r,a;return e&&e.split("\n").forEach((function(e){a=e.indexOf(":"),n=e.substring(0,a).trim().toLowerCase(),r=e.substring(a+1).trim(),!n||t[n]&&Tn[n]||("set-cookie"===n?t[n]?t[n].push(r):t[n]=[r]:t[n]=t[n]?t[n]+", "+r:r)})),t})(e),t);else if(en.isHeaders(e))for(const[o,i]of e.entries())a(i,o,n);else null!=e&&a(t,e,n);return this}get(e,t){if(e=On(e)){const n=en.findKey(this,e);if(n){const e=this[n];if(!t)return e;if(!0===t)return function(e){const t=Object.create(null),n=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let r;for(;r=n.exec(e);)t[r[1]]=r[2];return t}(e);if(en.isFunction(t))return t.call(this,e,n);if(en.isRegExp(t))return t.exec(e);throw new TypeError("parser must be boolean|regexp|function")}}}has(e,t){if(e=On(e)){const n=en.findKey(this,e);return!(!n||void 0===this[n]||t&&!jn(0,this[n],n,t))}return!1}delete(e,t){const n=this;let r=!1;function a(e){if(e=On(e)){const a=en.findKey(n,e);!a||t&&!jn(0,n[a],a,t)||(delete n[a],r=!0)}}return en.isArray(e)?e.forEach(a):a(e),r}clear(e){const t=Object.keys(this);let n=t.length,r=!1;for(;n--;){const a=t[n];e&&!jn(0,this[a],a,e,!0)||(delete this[a],r=!0)}return r}normalize(e){const t=this,n={};return en.forEach(this,((r,a)=>{const l=en.findKey(n,a);if(l)return t[l]=Ln(r),void delete t[a];const o=e?function(e){return e.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,((e,t,n)=>t.toUpperCase()+n))}(a):String(a).trim();o!==a&&delete t[a],t[o]=Ln(r),n[o]=!0})),this}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.constructor.concat(this,...t)}toJSON(e){const t=Object.create(null);return en.forEach(this,((n,r)=>{null!=n&&!1!==n&&(t[r]=e&&en.isArray(n)?n.join(", "):n)})),t}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map((e=>{let[t,n]=e;return t+": "+n})).join("\n")}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(e){return e instanceof this?e:new this(e)}static concat(e){const t=new this(e);for(var n=arguments.length,r=new Array(n>1?n-1:0),a=1;a<n;a++)r[a-1]=arguments[a];return r.forEach((e=>t.set(e))),t}static accessor(e){const t=(this[_n]=this[_n]={accessors:{}}).accessors,n=this.prototype;function r(e){const r=On(e);t[r]||(!function(e,t){const n=en.toCamelCase(" "+t);["get","set","has"].forEach((r=>{Object.defineProperty(e,r+n,{value:function(e,n,a){return this[r].call(this,t,e,n,a)},configurable:!0})}))}(n,e),t[r]=!0)}return en.isArray(e)?e.forEach(r):r(e),this}}zn.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]),en.reduceDescriptors(zn.prototype,((e,t)=>{let{value:n}=e,r=t[0].toUpperCase()+t.slice(1);return{get:()=>n,set(e){this[r]=e}}})),en.freezeMethods(zn);const An=zn;function Fn(e,t){const n=this||Pn,r=t||n,a=An.from(r.headers);let l=r.data;return en.forEach(e,(function(e){l=e.call(n,l,a.normalize(),t?t.status:void 0)})),a.normalize(),l}function Dn(e){return!(!e||!e.__CANCEL__)}function Mn(e,t,n){an.call(this,null==e?"canceled":e,an.ERR_CANCELED,t,n),this.name="CanceledError"}en.inherits(Mn,an,{__CANCEL__:!0});const Un=Mn;function $n(e,t,n){const r=n.config.validateStatus;n.status&&r&&!r(n.status)?t(new an("Request failed with status code "+n.status,[an.ERR_BAD_REQUEST,an.ERR_BAD_RESPONSE][Math.floor(n.status/100)-4],n.config,n.request,n)):e(n)}const In=function(e,t){e=e||10;const n=new Array(e),r=new Array(e);let a,l=0,o=0;return t=void 0!==t?t:1e3,function(i){const s=Date.now(),u=r[o];a||(a=s),n[l]=i,r[l]=s;let c=o,d=0;for(;c!==l;)d+=n[c++],c%=e;if(l=(l+1)%e,l===o&&(o=(o+1)%e),s-a<t)return;const f=u&&s-u;return f?Math.round(1e3*d/f):void 0}};const Bn=function(e,t){let n,r,a=0,l=1e3/t;const o=function(t){let l=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Date.now();a=l,n=null,r&&(clearTimeout(r),r=null),e.apply(null,t)};return[function(){const e=Date.now(),t=e-a;for(var i=arguments.length,s=new Array(i),u=0;u<i;u++)s[u]=arguments[u];t>=l?o(s,e):(n=s,r||(r=setTimeout((()=>{r=null,o(n)}),l-t)))},()=>n&&o(n)]},Hn=function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:3,r=0;const a=In(50,250);return Bn((n=>{const l=n.loaded,o=n.lengthComputable?n.total:void 0,i=l-r,s=a(i);r=l;e({loaded:l,total:o,progress:o?l/o:void 0,bytes:i,rate:s||void 0,estimated:s&&o&&l<=o?(o-l)/s:void 0,event:n,lengthComputable:null!=o,[t?"download":"upload"]:!0})}),n)},Wn=(e,t)=>{const n=null!=e;return[r=>t[0]({lengthComputable:n,total:e,loaded:r}),t[1]]},qn=e=>function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return en.asap((()=>e(...n)))},Vn=Cn.hasStandardBrowserEnv?((e,t)=>n=>(n=new URL(n,Cn.origin),e.protocol===n.protocol&&e.host===n.host&&(t||e.port===n.port)))(new URL(Cn.origin),Cn.navigator&&/(msie|trident)/i.test(Cn.navigator.userAgent)):()=>!0,Qn=Cn.hasStandardBrowserEnv?{write(e,t,n,r,a,l){const o=[e+"="+encodeURIComponent(t)];en.isNumber(n)&&o.push("expires="+new Date(n).toGMTString()),en.isString(r)&&o.push("path="+r),en.isString(a)&&o.push("domain="+a),!0===l&&o.push("secure"),document.cookie=o.join("; ")},read(e){const t=document.cookie.match(new RegExp("(^|;\\s*)("+e+")=([^;]*)"));return t?decodeURIComponent(t[3]):null},remove(e){this.write(e,"",Date.now()-864e5)}}:{write(){},read:()=>null,remove(){}};function Kn(e,t,n){let r=!/^([a-z][a-z\d+\-.]*:)?\/\//i.test(t);return e&&(r||0==n)?function(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}(e,t):t}const Yn=e=>e instanceof An?{...e}:e;function Xn(e,t){t=t||{};const n={};function r(e,t,n,r){return en.isPlainObject(e)&&en.isPlainObject(t)?en.merge.call({caseless:r},e,t):en.isPlainObject(t)?en.merge({},t):en.isArray(t)?t.slice():t}function a(e,t,n,a){return en.isUndefined(t)?en.isUndefined(e)?void 0:r(void 0,e,0,a):r(e,t,0,a)}function l(e,t){if(!en.isUndefined(t))return r(void 0,t)}function o(e,t){return en.isUndefined(t)?en.isUndefined(e)?void 0:r(void 0,e):r(void 0,t)}function i(n,a,l){return l in t?r(n,a):l in e?r(void 0,n):void 0}const s={url:l,method:l,data:l,baseURL:o,transformRequest:o,transformResponse:o,paramsSerializer:o,timeout:o,timeoutMessage:o,withCredentials:o,withXSRFToken:o,adapter:o,responseType:o,xsrfCookieName:o,xsrfHeaderName:o,onUploadProgress:o,onDownloadProgress:o,decompress:o,maxContentLength:o,maxBodyLength:o,beforeRedirect:o,transport:o,httpAgent:o,httpsAgent:o,cancelToken:o,socketPath:o,responseEncoding:o,validateStatus:i,headers:(e,t,n)=>a(Yn(e),Yn(t),0,!0)};return en.forEach(Object.keys(Object.assign({},e,t)),(function(r){const l=s[r]||a,o=l(e[r],t[r],r);en.isUndefined(o)&&l!==i||(n[r]=o)})),n}const Jn=e=>{const t=Xn({},e);let n,{data:r,withXSRFToken:a,xsrfHeaderName:l,xsrfCookieName:o,headers:i,auth:s}=t;if(t.headers=i=An.from(i),t.url=gn(Kn(t.baseURL,t.url,t.allowAbsoluteUrls),e.params,e.paramsSerializer),s&&i.set("Authorization","Basic "+btoa((s.username||"")+":"+(s.password?unescape(encodeURIComponent(s.password)):""))),en.isFormData(r))if(Cn.hasStandardBrowserEnv||Cn.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if(!1!==(n=i.getContentType())){const[e,...t]=n?n.split(";").map((e=>e.trim())).filter(Boolean):[];i.setContentType([e||"multipart/form-data",...t].join("; "))}if(Cn.hasStandardBrowserEnv&&(a&&en.isFunction(a)&&(a=a(t)),a||!1!==a&&Vn(t.url))){const e=l&&o&&Qn.read(o);e&&i.set(l,e)}return t},Gn="undefined"!==typeof XMLHttpRequest&&function(e){return new Promise((function(t,n){const r=Jn(e);let a=r.data;const l=An.from(r.headers).normalize();let o,i,s,u,c,{responseType:d,onUploadProgress:f,onDownloadProgress:p}=r;function h(){u&&u(),c&&c(),r.cancelToken&&r.cancelToken.unsubscribe(o),r.signal&&r.signal.removeEventListener("abort",o)}let m=new XMLHttpRequest;function g(){if(!m)return;const r=An.from("getAllResponseHeaders"in m&&m.getAllResponseHeaders());$n((function(e){t(e),h()}),(function(e){n(e),h()}),{data:d&&"text"!==d&&"json"!==d?m.response:m.responseText,status:m.status,statusText:m.statusText,headers:r,config:e,request:m}),m=null}m.open(r.method.toUpperCase(),r.url,!0),m.timeout=r.timeout,"onloadend"in m?m.onloadend=g:m.onreadystatechange=function(){m&&4===m.readyState&&(0!==m.status||m.responseURL&&0===m.responseURL.indexOf("file:"))&&setTimeout(g)},m.onabort=function(){m&&(n(new an("Request aborted",an.ECONNABORTED,e,m)),m=null)},m.onerror=function(){n(new an("Network Error",an.ERR_NETWORK,e,m)),m=null},m.ontimeout=function(){let t=r.timeout?"timeout of "+r.timeout+"ms exceeded":"timeout exceeded";const a=r.transitional||vn;r.timeoutErrorMessage&&(t=r.timeoutErrorMessage),n(new an(t,a.clarifyTimeoutError?an.ETIMEDOUT:an.ECONNABORTED,e,m)),m=null},void 0===a&&l.setContentType(null),"setRequestHeader"in m&&en.forEach(l.toJSON(),(function(e,t){m.setRequestHeader(t,e)})),en.isUndefined(r.withCredentials)||(m.withCredentials=!!r.withCredentials),d&&"json"!==d&&(m.responseType=r.responseType),p&&([s,c]=Hn(p,!0),m.addEventListener("progress",s)),f&&m.upload&&([i,u]=Hn(f),m.upload.addEventListener("progress",i),m.upload.addEventListener("loadend",u)),(r.cancelToken||r.signal)&&(o=t=>{m&&(n(!t||t.type?new Un(null,e,m):t),m.abort(),m=null)},r.cancelToken&&r.cancelToken.subscribe(o),r.signal&&(r.signal.aborted?o():r.signal.addEventListener("abort",o)));const y=function(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}(r.url);y&&-1===Cn.protocols.indexOf(y)?n(new an("Unsupported protocol "+y+":",an.ERR_BAD_REQUEST,e)):m.send(a||null)}))},Zn=(e,t)=>{const{length:n}=e=e?e.filter(Boolean):[];if(t||n){let n,r=new AbortController;const a=function(e){if(!n){n=!0,o();const t=e instanceof Error?e:this.reason;r.abort(t instanceof an?t:new Un(t instanceof Error?t.message:t))}};let l=t&&setTimeout((()=>{l=null,a(new an(`timeout ${t} of ms exceeded`,an.ETIMEDOUT))}),t);const o=()=>{e&&(l&&clearTimeout(l),l=null,e.forEach((e=>{e.unsubscribe?e.unsubscribe(a):e.removeEventListener("abort",a)})),e=null)};e.forEach((e=>e.addEventListener("abort",a)));const{signal:i}=r;return i.unsubscribe=()=>en.asap(o),i}},er=function*(e,t){let n=e.byteLength;if(!t||n<t)return void(yield e);let r,a=0;for(;a<n;)r=a+t,yield e.slice(a,r),a=r},tr=async function*(e){if(e[Symbol.asyncIterator])return void(yield*e);const t=e.getReader();try{for(;;){const{done:e,value:n}=await t.read();if(e)break;yield n}}finally{await t.cancel()}},nr=(e,t,n,r)=>{const a=async function*(e,t){for await(const n of tr(e))yield*er(n,t)}(e,t);let l,o=0,i=e=>{l||(l=!0,r&&r(e))};return new ReadableStream({async pull(e){try{const{done:t,value:r}=await a.next();if(t)return i(),void e.close();let l=r.byteLength;if(n){let e=o+=l;n(e)}e.enqueue(new Uint8Array(r))}catch(t){throw i(t),t}},cancel:e=>(i(e),a.return())},{highWaterMark:2})},rr="function"===typeof fetch&&"function"===typeof Request&&"function"===typeof Response,ar=rr&&"function"===typeof ReadableStream,lr=rr&&("function"===typeof TextEncoder?(e=>t=>e.encode(t))(new TextEncoder):async e=>new Uint8Array(await new Response(e).arrayBuffer())),or=function(e){try{for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return!!e(...n)}catch(Qr){return!1}},ir=ar&&or((()=>{let e=!1;const t=new Request(Cn.origin,{body:new ReadableStream,method:"POST",get duplex(){return e=!0,"half"}}).headers.has("Content-Type");return e&&!t})),sr=ar&&or((()=>en.isReadableStream(new Response("").body))),ur={stream:sr&&(e=>e.body)};var cr;rr&&(cr=new Response,["text","arrayBuffer","blob","formData","stream"].forEach((e=>{!ur[e]&&(ur[e]=en.isFunction(cr[e])?t=>t[e]():(t,n)=>{throw new an(`Response type '${e}' is not supported`,an.ERR_NOT_SUPPORT,n)})})));const dr=async(e,t)=>{const n=en.toFiniteNumber(e.getContentLength());return null==n?(async e=>{if(null==e)return 0;if(en.isBlob(e))return e.size;if(en.isSpecCompliantForm(e)){const t=new Request(Cn.origin,{method:"POST",body:e});return(await t.arrayBuffer()).byteLength}return en.isArrayBufferView(e)||en.isArrayBuffer(e)?e.byteLength:(en.isURLSearchParams(e)&&(e+=""),en.isString(e)?(await lr(e)).byteLength:void 0)})(t):n},fr=rr&&(async e=>{let{url:t,method:n,data:r,signal:a,cancelToken:l,timeout:o,onDownloadProgress:i,onUploadProgress:s,responseType:u,headers:c,withCredentials:d="same-origin",fetchOptions:f}=Jn(e);u=u?(u+"").toLowerCase():"text";let p,h=Zn([a,l&&l.toAbortSignal()],o);const m=h&&h.unsubscribe&&(()=>{h.unsubscribe()});let g;try{if(s&&ir&&"get"!==n&&"head"!==n&&0!==(g=await dr(c,r))){let e,n=new Request(t,{method:"POST",body:r,duplex:"half"});if(en.isFormData(r)&&(e=n.headers.get("content-type"))&&c.setContentType(e),n.body){const[e,t]=Wn(g,Hn(qn(s)));r=nr(n.body,65536,e,t)}}en.isString(d)||(d=d?"include":"omit");const a="credentials"in Request.prototype;p=new Request(t,{...f,signal:h,method:n.toUpperCase(),headers:c.normalize().toJSON(),body:r,duplex:"half",credentials:a?d:void 0});let l=await fetch(p);const o=sr&&("stream"===u||"response"===u);if(sr&&(i||o&&m)){const e={};["status","statusText","headers"].forEach((t=>{e[t]=l[t]}));const t=en.toFiniteNumber(l.headers.get("content-length")),[n,r]=i&&Wn(t,Hn(qn(i),!0))||[];l=new Response(nr(l.body,65536,n,(()=>{r&&r(),m&&m()})),e)}u=u||"text";let y=await ur[en.findKey(ur,u)||"text"](l,e);return!o&&m&&m(),await new Promise(((t,n)=>{$n(t,n,{data:y,headers:An.from(l.headers),status:l.status,statusText:l.statusText,config:e,request:p})}))}catch(y){if(m&&m(),y&&"TypeError"===y.name&&/fetch/i.test(y.message))throw Object.assign(new an("Network Error",an.ERR_NETWORK,e,p),{cause:y.cause||y});throw an.from(y,y&&y.code,e,p)}}),pr={http:null,xhr:Gn,fetch:fr};en.forEach(pr,((e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch(Qr){}Object.defineProperty(e,"adapterName",{value:t})}}));const hr=e=>`- ${e}`,mr=e=>en.isFunction(e)||null===e||!1===e,gr=e=>{e=en.isArray(e)?e:[e];const{length:t}=e;let n,r;const a={};for(let l=0;l<t;l++){let t;if(n=e[l],r=n,!mr(n)&&(r=pr[(t=String(n)).toLowerCase()],void 0===r))throw new an(`Unknown adapter '${t}'`);if(r)break;a[t||"#"+l]=r}if(!r){const e=Object.entries(a).map((e=>{let[t,n]=e;return`adapter ${t} `+(!1===n?"is not supported by the environment":"is not available in the build")}));let n=t?e.length>1?"since :\n"+e.map(hr).join("\n"):" "+hr(e[0]):"as no adapter specified";throw new an("There is no suitable adapter to dispatch the request "+n,"ERR_NOT_SUPPORT")}return r};function yr(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new Un(null,e)}function vr(e){yr(e),e.headers=An.from(e.headers),e.data=Fn.call(e,e.transformRequest),-1!==["post","put","patch"].indexOf(e.method)&&e.headers.setContentType("application/x-www-form-urlencoded",!1);return gr(e.adapter||Pn.adapter)(e).then((function(t){return yr(e),t.data=Fn.call(e,e.transformResponse,t),t.headers=An.from(t.headers),t}),(function(t){return Dn(t)||(yr(e),t&&t.response&&(t.response.data=Fn.call(e,e.transformResponse,t.response),t.response.headers=An.from(t.response.headers))),Promise.reject(t)}))}const br="1.8.4",wr={};["object","boolean","number","function","string","symbol"].forEach(((e,t)=>{wr[e]=function(n){return typeof n===e||"a"+(t<1?"n ":" ")+e}}));const kr={};wr.transitional=function(e,t,n){function r(e,t){return"[Axios v1.8.4] Transitional option '"+e+"'"+t+(n?". "+n:"")}return(n,a,l)=>{if(!1===e)throw new an(r(a," has been removed"+(t?" in "+t:"")),an.ERR_DEPRECATED);return t&&!kr[a]&&(kr[a]=!0,console.warn(r(a," has been deprecated since v"+t+" and will be removed in the near future"))),!e||e(n,a,l)}},wr.spelling=function(e){return(t,n)=>(console.warn(`${n} is likely a misspelling of ${e}`),!0)};const Sr={assertOptions:function(e,t,n){if("object"!==typeof e)throw new an("options must be an object",an.ERR_BAD_OPTION_VALUE);const r=Object.keys(e);let a=r.length;for(;a-- >0;){const l=r[a],o=t[l];if(o){const t=e[l],n=void 0===t||o(t,l,e);if(!0!==n)throw new an("option "+l+" must be "+n,an.ERR_BAD_OPTION_VALUE)}else if(!0!==n)throw new an("Unknown option "+l,an.ERR_BAD_OPTION)}},validators:wr},xr=Sr.validators;class Er{constructor(e){this.defaults=e,this.interceptors={request:new yn,response:new yn}}async request(e,t){try{return await this._request(e,t)}catch(n){if(n instanceof Error){let e={};Error.captureStackTrace?Error.captureStackTrace(e):e=new Error;const t=e.stack?e.stack.replace(/^.+\n/,""):"";try{n.stack?t&&!String(n.stack).endsWith(t.replace(/^.+\n.+\n/,""))&&(n.stack+="\n"+t):n.stack=t}catch(Qr){}}throw n}}_request(e,t){"string"===typeof e?(t=t||{}).url=e:t=e||{},t=Xn(this.defaults,t);const{transitional:n,paramsSerializer:r,headers:a}=t;void 0!==n&&Sr.assertOptions(n,{silentJSONParsing:xr.transitional(xr.boolean),forcedJSONParsing:xr.transitional(xr.boolean),clarifyTimeoutError:xr.transitional(xr.boolean)},!1),null!=r&&(en.isFunction(r)?t.paramsSerializer={serialize:r}:Sr.assertOptions(r,{encode:xr.function,serialize:xr.function},!0)),void 0!==t.allowAbsoluteUrls||(void 0!==this.defaults.allowAbsoluteUrls?t.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:t.allowAbsoluteUrls=!0),Sr.assertOptions(t,{baseUrl:xr.spelling("baseURL"),withXsrfToken:xr.spelling("withXSRFToken")},!0),t.method=(t.method||this.defaults.method||"get").toLowerCase();let l=a&&en.merge(a.common,a[t.method]);a&&en.forEach(["delete","get","head","post","put","patch","common"],(e=>{delete a[e]})),t.headers=An.concat(l,a);const o=[];let i=!0;this.interceptors.request.forEach((function(e){"function"===typeof e.runWhen&&!1===e.runWhen(t)||(i=i&&e.synchronous,o.unshift(e.fulfilled,e.rejected))}));const s=[];let u;this.interceptors.response.forEach((function(e){s.push(e.fulfilled,e.rejected)}));let c,d=0;if(!i){const e=[vr.bind(this),void 0];for(e.unshift.apply(e,o),e.push.apply(e,s),c=e.length,u=Promise.resolve(t);d<c;)u=u.then(e[d++],e[d++]);return u}c=o.length;let f=t;for(d=0;d<c;){const e=o[d++],t=o[d++];try{f=e(f)}catch(p){t.call(this,p);break}}try{u=vr.call(this,f)}catch(p){return Promise.reject(p)}for(d=0,c=s.length;d<c;)u=u.then(s[d++],s[d++]);return u}getUri(e){return gn(Kn((e=Xn(this.defaults,e)).baseURL,e.url,e.allowAbsoluteUrls),e.params,e.paramsSerializer)}}en.forEach(["delete","get","head","options"],(function(e){Er.prototype[e]=function(t,n){return this.request(Xn(n||{},{method:e,url:t,data:(n||{}).data}))}})),en.forEach(["post","put","patch"],(function(e){function t(t){return function(n,r,a){return this.request(Xn(a||{},{method:e,headers:t?{"Content-Type":"multipart/form-data"}:{},url:n,data:r}))}}Er.prototype[e]=t(),Er.prototype[e+"Form"]=t(!0)}));const Cr=Er;class Nr{constructor(e){if("function"!==typeof e)throw new TypeError("executor must be a function.");let t;this.promise=new Promise((function(e){t=e}));const n=this;this.promise.then((e=>{if(!n._listeners)return;let t=n._listeners.length;for(;t-- >0;)n._listeners[t](e);n._listeners=null})),this.promise.then=e=>{let t;const r=new Promise((e=>{n.subscribe(e),t=e})).then(e);return r.cancel=function(){n.unsubscribe(t)},r},e((function(e,r,a){n.reason||(n.reason=new Un(e,r,a),t(n.reason))}))}throwIfRequested(){if(this.reason)throw this.reason}subscribe(e){this.reason?e(this.reason):this._listeners?this._listeners.push(e):this._listeners=[e]}unsubscribe(e){if(!this._listeners)return;const t=this._listeners.indexOf(e);-1!==t&&this._listeners.splice(t,1)}toAbortSignal(){const e=new AbortController,t=t=>{e.abort(t)};return this.subscribe(t),e.signal.unsubscribe=()=>this.unsubscribe(t),e.signal}static source(){let e;return{token:new Nr((function(t){e=t})),cancel:e}}}const Rr=Nr;const Pr={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Pr).forEach((e=>{let[t,n]=e;Pr[n]=t}));const Tr=Pr;const _r=function e(t){const n=new Cr(t),r=yt(Cr.prototype.request,n);return en.extend(r,Cr.prototype,n,{allOwnKeys:!0}),en.extend(r,n,null,{allOwnKeys:!0}),r.create=function(n){return e(Xn(t,n))},r}(Pn);_r.Axios=Cr,_r.CanceledError=Un,_r.CancelToken=Rr,_r.isCancel=Dn,_r.VERSION=br,_r.toFormData=cn,_r.AxiosError=an,_r.Cancel=_r.CanceledError,_r.all=function(e){return Promise.all(e)},_r.spread=function(e){return function(t){return e.apply(null,t)}},_r.isAxiosError=function(e){return en.isObject(e)&&!0===e.isAxiosError},_r.mergeConfig=Xn,_r.AxiosHeaders=An,_r.formToJSON=e=>Nn(en.isHTMLForm(e)?new FormData(e):e),_r.getAdapter=gr,_r.HttpStatusCode=Tr,_r.default=_r;const Or=_r,Lr=(0,a.createContext)(),jr=e=>{let{children:t}=e;const[n,r]=(0,a.useState)({}),[l,o]=(0,a.useState)(!0),[i,s]=(0,a.useState)(null);return(0,a.useEffect)((()=>{(async()=>{try{const e=await Or.get("http://localhost:5000/api/models");r(e.data),o(!1)}catch(e){s("Failed to load models"),o(!1)}})()}),[]),(0,ht.jsx)(Lr.Provider,{value:{models:n,loading:l,error:i},children:t})},zr=e=>{let{model:t,onClick:n,selected:r}=e;return(0,ht.jsx)("div",{className:"model-card "+(r?"selected":""),onClick:()=>n(t.key),children:(0,ht.jsxs)("div",{className:"model-card-content",children:[(0,ht.jsx)("h3",{children:t.display_name}),(0,ht.jsx)("p",{children:t.description}),(0,ht.jsxs)("div",{className:"model-classes",children:[(0,ht.jsx)("strong",{children:"Detects: "}),t.classes.join(", ")]})]})})},Ar=dt("upload",[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"17 8 12 3 7 8",key:"t8dd8p"}],["line",{x1:"12",x2:"12",y1:"3",y2:"15",key:"widbto"}]]),Fr=e=>{let{onImageSelect:t}=e;const[n,r]=(0,a.useState)(null),[l,o]=(0,a.useState)(!1),i=e=>{e.preventDefault(),e.stopPropagation(),"dragenter"===e.type||"dragover"===e.type?o(!0):"dragleave"===e.type&&o(!1)},s=e=>{const n=new FileReader;n.onload=n=>{r(n.target.result),t(e)},n.readAsDataURL(e)};return(0,ht.jsx)("div",{className:"image-upload-container",children:n?(0,ht.jsxs)("div",{className:"image-preview",children:[(0,ht.jsx)("img",{src:n,alt:"Preview"}),(0,ht.jsx)("button",{className:"remove-image",onClick:()=>{r(null),t(null)},children:(0,ht.jsx)(ft,{size:20})})]}):(0,ht.jsx)("div",{className:"dropzone "+(l?"active":""),onDragEnter:i,onDragOver:i,onDragLeave:i,onDrop:e=>{e.preventDefault(),e.stopPropagation(),o(!1),e.dataTransfer.files&&e.dataTransfer.files[0]&&s(e.dataTransfer.files[0])},children:(0,ht.jsxs)("div",{className:"dropzone-content",children:[(0,ht.jsx)(Ar,{size:48}),(0,ht.jsx)("p",{children:"Drag and drop an image here or click to select"}),(0,ht.jsx)("input",{type:"file",id:"image-upload",accept:"image/png, image/jpeg, image/jpg",onChange:e=>{e.target.files&&e.target.files[0]&&s(e.target.files[0])}}),(0,ht.jsx)("label",{htmlFor:"image-upload",className:"upload-button",children:"Select Image"})]})})})},Dr=dt("loader",[["path",{d:"M12 2v4",key:"3427ic"}],["path",{d:"m16.2 7.8 2.9-2.9",key:"r700ao"}],["path",{d:"M18 12h4",key:"wj9ykh"}],["path",{d:"m16.2 16.2 2.9 2.9",key:"1bxg5t"}],["path",{d:"M12 18v4",key:"jadmvz"}],["path",{d:"m4.9 19.1 2.9-2.9",key:"bwix9q"}],["path",{d:"M2 12h4",key:"j09sii"}],["path",{d:"m4.9 4.9 2.9 2.9",key:"giyufr"}]]),Mr=()=>{const{models:e,loading:t}=(0,a.useContext)(Lr),[n,r]=(0,a.useState)(null),[l,o]=(0,a.useState)(null),[i,s]=(0,a.useState)(null),[u,c]=(0,a.useState)(!1),[d,f]=(0,a.useState)(null),p=(te(),G());(0,a.useEffect)((()=>{const t=new URLSearchParams(p.search).get("model");t&&e[t]?r(t):Object.keys(e).length>0&&!n&&r(Object.keys(e)[0])}),[p.search,e,n]);const h=e=>{r(e),s(null)};return t?(0,ht.jsxs)("div",{className:"loading-container",children:[(0,ht.jsx)(Dr,{size:48,className:"spinner"}),(0,ht.jsx)("p",{children:"Loading models..."})]}):(0,ht.jsxs)("div",{className:"home-container",children:[(0,ht.jsxs)("section",{className:"hero",children:[(0,ht.jsx)("h1",{children:"AI-Powered Medical Diagnosis"}),(0,ht.jsx)("p",{children:"Upload medical images for instant analysis using our advanced AI models"})]}),(0,ht.jsxs)("section",{className:"model-selection",children:[(0,ht.jsx)("h2",{children:"1. Select a Diagnostic Model"}),(0,ht.jsx)("div",{className:"model-grid",children:Object.entries(e).map((e=>{let[t,r]=e;return(0,ht.jsx)(zr,{model:{...r,key:t},onClick:h,selected:n===t},t)}))})]}),(0,ht.jsxs)("section",{className:"image-section",children:[(0,ht.jsx)("h2",{children:"2. Upload a Medical Image"}),(0,ht.jsx)(Fr,{onImageSelect:e=>{o(e),s(null),f(null)}})]}),(0,ht.jsxs)("section",{className:"action-section",children:[(0,ht.jsx)("button",{className:"analyze-button",onClick:async()=>{if(n&&l){c(!0),f(null);try{const e=new FormData;e.append("file",l),e.append("model",n);const t=await Or.post("http://localhost:5000/predict",e);s(t.data)}catch(r){var e,t;f((null===(e=r.response)||void 0===e||null===(t=e.data)||void 0===t?void 0:t.error)||"Failed to process the image. Please try again."),console.error(r)}finally{c(!1)}}else f("Please select a model and upload an image.")},disabled:u||!n||!l,children:u?(0,ht.jsxs)(ht.Fragment,{children:[(0,ht.jsx)(Dr,{size:20,className:"spinner"}),"Analyzing..."]}):"Analyze Image"}),d&&(0,ht.jsx)("p",{className:"error-message",children:d})]}),i&&(0,ht.jsxs)("section",{className:"results-section",children:[(0,ht.jsx)("h2",{children:"Analysis Results"}),(0,ht.jsxs)("div",{className:"result-card",children:[(0,ht.jsxs)("div",{className:"result-header",children:[(0,ht.jsxs)("h3",{children:["Diagnosis: ",i.prediction]}),(0,ht.jsxs)("span",{className:"confidence",children:["Confidence: ",i.confidence.toFixed(2),"%"]})]}),(0,ht.jsxs)("div",{className:"result-details",children:[(0,ht.jsx)("h4",{children:"Probability Distribution:"}),(0,ht.jsx)("div",{className:"probability-bars",children:Object.entries(i.probabilities).map((e=>{let[t,n]=e;return(0,ht.jsxs)("div",{className:"probability-item",children:[(0,ht.jsx)("div",{className:"probability-label",children:t}),(0,ht.jsxs)("div",{className:"probability-bar-container",children:[(0,ht.jsx)("div",{className:"probability-bar",style:{width:`${n}%`}}),(0,ht.jsxs)("span",{className:"probability-value",children:[n.toFixed(2),"%"]})]})]},t)}))})]}),i.report_content&&(0,ht.jsxs)("div",{className:"report-preview",children:[(0,ht.jsx)("h4",{children:"Report Summary:"}),(0,ht.jsx)("div",{className:"report-content",children:i.report_content.split("\n\n").map(((e,t)=>(0,ht.jsx)("p",{children:e},t)))})]}),(0,ht.jsx)("div",{className:"result-actions",children:(0,ht.jsx)("button",{onClick:()=>{i&&i.report_url&&window.open(`http://localhost:5000${i.report_url}`,"_blank")},className:"view-report-button",children:"View Full Report"})})]})]})]})},Ur=dt("send",[["path",{d:"M14.536 21.686a.5.5 0 0 0 .937-.024l6.5-19a.496.496 0 0 0-.635-.635l-19 6.5a.5.5 0 0 0-.024.937l7.93 3.18a2 2 0 0 1 1.112 1.11z",key:"1ffxy3"}],["path",{d:"m21.854 2.147-10.94 10.939",key:"12cjpa"}]]),$r=()=>{const[e,t]=(0,a.useState)([]),[n,r]=(0,a.useState)(""),[l,o]=(0,a.useState)(!1),i=(0,a.useRef)(null);(0,a.useEffect)((()=>{(()=>{var e;null===(e=i.current)||void 0===e||e.scrollIntoView({behavior:"smooth"})})()}),[e]);return(0,ht.jsxs)("div",{className:"chat-container",children:[(0,ht.jsxs)("div",{className:"messages",children:[0===e.length?(0,ht.jsxs)("div",{className:"welcome-message",children:[(0,ht.jsx)("h3",{children:"Welcome to MedDiagnosis AI Chat"}),(0,ht.jsx)("p",{children:"Ask me any questions about medical conditions, symptoms, or how to use our diagnostic tools."})]}):e.map(((e,t)=>(0,ht.jsx)("div",{className:`message ${e.sender} ${e.error?"error":""}`,children:(0,ht.jsx)("div",{className:"message-content",children:e.text})},t))),l&&(0,ht.jsx)("div",{className:"message bot",children:(0,ht.jsx)("div",{className:"message-content",children:(0,ht.jsxs)("div",{className:"typing-indicator",children:[(0,ht.jsx)("span",{}),(0,ht.jsx)("span",{}),(0,ht.jsx)("span",{})]})})}),(0,ht.jsx)("div",{ref:i})]}),(0,ht.jsxs)("form",{className:"chat-input",onSubmit:async e=>{if(e.preventDefault(),!n.trim())return;const a=n;r(""),o(!0),t((e=>[...e,{text:a,sender:"user"}]));try{const e=await Or.post("http://localhost:5000/api/chat",{message:a});t((t=>[...t,{text:e.data.response,sender:"bot"}]))}catch(l){console.error("Error sending message:",l),t((e=>[...e,{text:"Sorry, there was an error processing your request. Please try again.",sender:"bot",error:!0}]))}finally{o(!1)}},children:[(0,ht.jsx)("input",{type:"text",value:n,onChange:e=>r(e.target.value),placeholder:"Type your message...",disabled:l}),(0,ht.jsx)("button",{type:"submit",disabled:l||!n.trim(),children:(0,ht.jsx)(Ur,{size:20})})]})]})},Ir=()=>(0,ht.jsxs)("div",{className:"chat-interface",children:[(0,ht.jsxs)("div",{className:"chat-header",children:[(0,ht.jsx)("h1",{children:"Medical AI Assistant"}),(0,ht.jsx)("p",{children:"Ask questions about medical conditions, symptoms, or how to use our diagnostic tools"})]}),(0,ht.jsx)($r,{})]}),Br=e=>{let{onSubmit:t}=e;const[n,r]=(0,a.useState)(""),[l,o]=(0,a.useState)(""),[i,s]=(0,a.useState)(""),[u,c]=(0,a.useState)(""),[d,f]=(0,a.useState)(!1);return(0,ht.jsxs)("form",{className:"symptom-form",onSubmit:async e=>{e.preventDefault(),f(!0);try{const e=await Or.post("http://localhost:5000/api/check-symptoms",{symptoms:n,age:l,gender:i,medicalHistory:u});t(e.data)}catch(r){console.error("Error checking symptoms:",r)}finally{f(!1)}},children:[(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"symptoms",children:"Describe your symptoms:"}),(0,ht.jsx)("textarea",{id:"symptoms",value:n,onChange:e=>r(e.target.value),required:!0,placeholder:"Describe your symptoms in detail. Include when they started, severity, and any factors that make them better or worse.",rows:5})]}),(0,ht.jsxs)("div",{className:"form-row",children:[(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"age",children:"Age:"}),(0,ht.jsx)("input",{type:"number",id:"age",value:l,onChange:e=>o(e.target.value),min:"0",max:"120",placeholder:"Enter your age"})]}),(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"gender",children:"Gender:"}),(0,ht.jsxs)("select",{id:"gender",value:i,onChange:e=>s(e.target.value),children:[(0,ht.jsx)("option",{value:"",children:"Select gender"}),(0,ht.jsx)("option",{value:"male",children:"Male"}),(0,ht.jsx)("option",{value:"female",children:"Female"}),(0,ht.jsx)("option",{value:"other",children:"Other"}),(0,ht.jsx)("option",{value:"prefer-not-to-say",children:"Prefer not to say"})]})]})]}),(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"medicalHistory",children:"Medical History (optional):"}),(0,ht.jsx)("textarea",{id:"medicalHistory",value:u,onChange:e=>c(e.target.value),placeholder:"List any existing medical conditions, medications, allergies, or relevant family history.",rows:3})]}),(0,ht.jsx)("button",{type:"submit",className:"submit-button",disabled:d||!n.trim(),children:d?"Analyzing...":"Analyze Symptoms"})]})},Hr=e=>{let{result:t}=e;return t?(0,ht.jsxs)("div",{className:"diagnosis-result",children:[(0,ht.jsxs)("div",{className:"result-content",children:[(0,ht.jsx)("h2",{children:"Symptom Analysis"}),(0,ht.jsx)("div",{className:"analysis-text",children:t.analysis.split("\n").map(((e,t)=>(0,ht.jsx)("p",{children:e},t)))})]}),t.recommended_models&&t.recommended_models.length>0&&(0,ht.jsxs)("div",{className:"recommended-models",children:[(0,ht.jsx)("h3",{children:"Recommended Diagnostic Models"}),(0,ht.jsx)("p",{children:"Based on your symptoms, these diagnostic models might be helpful:"}),(0,ht.jsx)("div",{className:"model-cards",children:t.recommended_models.map((e=>(0,ht.jsxs)("div",{className:"recommended-model",children:[(0,ht.jsx)(zr,{model:e,onClick:()=>{}}),(0,ht.jsx)(et,{to:`/?model=${e.key}`,className:"use-model-button",children:"Use This Model"})]},e.key)))})]})]}):null},Wr=()=>{const[e,t]=(0,a.useState)(null);return(0,ht.jsxs)("div",{className:"symptom-checker",children:[(0,ht.jsxs)("div",{className:"symptom-checker-header",children:[(0,ht.jsx)("h1",{children:"Symptom Checker"}),(0,ht.jsx)("p",{children:"Describe your symptoms to get a preliminary analysis and recommendations"})]}),(0,ht.jsx)("div",{className:"symptom-checker-content",children:e?(0,ht.jsxs)("div",{className:"analysis-result",children:[(0,ht.jsx)(Hr,{result:e}),(0,ht.jsx)("button",{onClick:()=>t(null),className:"back-button",children:"Check New Symptoms"})]}):(0,ht.jsx)(Br,{onSubmit:e=>{t(e)}})})]})},qr=()=>{const{reportId:e}=function(){let{matches:e}=a.useContext(Y),t=e[e.length-1];return t?t.params:{}}(),[t,n]=(0,a.useState)(null);return(0,a.useEffect)((()=>{e&&n(`/reports/${e}`)}),[e]),(0,ht.jsx)("div",{className:"report-viewer",children:t?(0,ht.jsx)("iframe",{src:t,title:"Medical Report",className:"report-frame"}):(0,ht.jsxs)("div",{className:"report-error",children:[(0,ht.jsx)("h2",{children:"Report Not Found"}),(0,ht.jsx)("p",{children:"The requested report could not be loaded."})]})})};const Vr=function(){return(0,ht.jsx)(jr,{children:(0,ht.jsx)(Ge,{children:(0,ht.jsxs)("div",{className:"app",children:[(0,ht.jsx)(mt,{}),(0,ht.jsx)("main",{className:"main-content",children:(0,ht.jsxs)(ve,{children:[(0,ht.jsx)(ge,{path:"/",element:(0,ht.jsx)(Mr,{})}),(0,ht.jsx)(ge,{path:"/chat",element:(0,ht.jsx)(Ir,{})}),(0,ht.jsx)(ge,{path:"/symptom-checker",element:(0,ht.jsx)(Wr,{})}),(0,ht.jsx)(ge,{path:"/report/:reportId",element:(0,ht.jsx)(qr,{})})]})}),(0,ht.jsx)(gt,{})]})})})};l.createRoot(document.getElementById("root")).render((0,ht.jsx)(a.StrictMode,{children:(0,ht.jsx)(Vr,{})}))})();
+(()=>{"use strict";var e={4:(e,t,n)=>{var r=n(853),a=n(43),l=n(950);function o(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function i(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function s(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function u(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function c(e){if(s(e)!==e)throw Error(o(188))}function d(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=d(e)))return t;e=e.sibling}return null}var f=Object.assign,p=Symbol.for("react.element"),h=Symbol.for("react.transitional.element"),m=Symbol.for("react.portal"),g=Symbol.for("react.fragment"),y=Symbol.for("react.strict_mode"),v=Symbol.for("react.profiler"),b=Symbol.for("react.provider"),w=Symbol.for("react.consumer"),k=Symbol.for("react.context"),S=Symbol.for("react.forward_ref"),x=Symbol.for("react.suspense"),E=Symbol.for("react.suspense_list"),C=Symbol.for("react.memo"),N=Symbol.for("react.lazy");Symbol.for("react.scope");var R=Symbol.for("react.activity");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var P=Symbol.for("react.memo_cache_sentinel");Symbol.for("react.view_transition");var T=Symbol.iterator;function _(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=T&&e[T]||e["@@iterator"])?e:null}var O=Symbol.for("react.client.reference");function L(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===O?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case g:return"Fragment";case v:return"Profiler";case y:return"StrictMode";case x:return"Suspense";case E:return"SuspenseList";case R:return"Activity"}if("object"===typeof e)switch(e.$$typeof){case m:return"Portal";case k:return(e.displayName||"Context")+".Provider";case w:return(e._context.displayName||"Context")+".Consumer";case S:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case C:return null!==(t=e.displayName||null)?t:L(e.type)||"Memo";case N:t=e._payload,e=e._init;try{return L(e(t))}catch(n){}}return null}var j=Array.isArray,z=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,A=l.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,F={pending:!1,data:null,method:null,action:null},D=[],M=-1;function U(e){return{current:e}}function $(e){0>M||(e.current=D[M],D[M]=null,M--)}function I(e,t){M++,D[M]=e.current,e.current=t}var B=U(null),H=U(null),W=U(null),q=U(null);function V(e,t){switch(I(W,t),I(H,e),I(B,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?ad(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)e=ld(t=ad(t),e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}$(B),I(B,e)}function Q(){$(B),$(H),$(W)}function K(e){null!==e.memoizedState&&I(q,e);var t=B.current,n=ld(t,e.type);t!==n&&(I(H,e),I(B,n))}function Y(e){H.current===e&&($(B),$(H)),q.current===e&&($(q),Kd._currentValue=F)}var X=Object.prototype.hasOwnProperty,J=r.unstable_scheduleCallback,G=r.unstable_cancelCallback,Z=r.unstable_shouldYield,ee=r.unstable_requestPaint,te=r.unstable_now,ne=r.unstable_getCurrentPriorityLevel,re=r.unstable_ImmediatePriority,ae=r.unstable_UserBlockingPriority,le=r.unstable_NormalPriority,oe=r.unstable_LowPriority,ie=r.unstable_IdlePriority,se=r.log,ue=r.unstable_setDisableYieldValue,ce=null,de=null;function fe(e){if("function"===typeof se&&ue(e),de&&"function"===typeof de.setStrictMode)try{de.setStrictMode(ce,e)}catch(t){}}var pe=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(he(e)/me|0)|0},he=Math.log,me=Math.LN2;var ge=256,ye=4194304;function ve(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194048&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function be(e,t,n){var r=e.pendingLanes;if(0===r)return 0;var a=0,l=e.suspendedLanes,o=e.pingedLanes;e=e.warmLanes;var i=134217727&r;return 0!==i?0!==(r=i&~l)?a=ve(r):0!==(o&=i)?a=ve(o):n||0!==(n=i&~e)&&(a=ve(n)):0!==(i=r&~l)?a=ve(i):0!==o?a=ve(o):n||0!==(n=r&~e)&&(a=ve(n)),0===a?0:0!==t&&t!==a&&0===(t&l)&&((l=a&-a)>=(n=t&-t)||32===l&&0!==(4194048&n))?t:a}function we(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function ke(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function Se(){var e=ge;return 0===(4194048&(ge<<=1))&&(ge=256),e}function xe(){var e=ye;return 0===(62914560&(ye<<=1))&&(ye=4194304),e}function Ee(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Ce(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function Ne(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-pe(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194090&n}function Re(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-pe(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}function Pe(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Te(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function _e(){var e=A.p;return 0!==e?e:void 0===(e=window.event)?32:cf(e.type)}var Oe=Math.random().toString(36).slice(2),Le="__reactFiber$"+Oe,je="__reactProps$"+Oe,ze="__reactContainer$"+Oe,Ae="__reactEvents$"+Oe,Fe="__reactListeners$"+Oe,De="__reactHandles$"+Oe,Me="__reactResources$"+Oe,Ue="__reactMarker$"+Oe;function $e(e){delete e[Le],delete e[je],delete e[Ae],delete e[Fe],delete e[De]}function Ie(e){var t=e[Le];if(t)return t;for(var n=e.parentNode;n;){if(t=n[ze]||n[Le]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=bd(e);null!==e;){if(n=e[Le])return n;e=bd(e)}return t}n=(e=n).parentNode}return null}function Be(e){if(e=e[Le]||e[ze]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function He(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(o(33))}function We(e){var t=e[Me];return t||(t=e[Me]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function qe(e){e[Ue]=!0}var Ve=new Set,Qe={};function Ke(e,t){Ye(e,t),Ye(e+"Capture",t)}function Ye(e,t){for(Qe[e]=t,e=0;e<t.length;e++)Ve.add(t[e])}var Xe,Je,Ge=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Ze={},et={};function tt(e,t,n){if(a=t,X.call(et,a)||!X.call(Ze,a)&&(Ge.test(a)?et[a]=!0:(Ze[a]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var a}function nt(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function rt(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function at(e){if(void 0===Xe)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Xe=t&&t[1]||"",Je=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+Xe+e+Je}var lt=!1;function ot(e,t){if(!e||lt)return"";lt=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(a){var r=a}Reflect.construct(e,[],n)}else{try{n.call()}catch(l){r=l}e.call(n.prototype)}}else{try{throw Error()}catch(o){r=o}(n=e())&&"function"===typeof n.catch&&n.catch((function(){}))}}catch(i){if(i&&r&&"string"===typeof i.stack)return[i.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var a=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");a&&a.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var l=r.DetermineComponentFrameRoot(),o=l[0],i=l[1];if(o&&i){var s=o.split("\n"),u=i.split("\n");for(a=r=0;r<s.length&&!s[r].includes("DetermineComponentFrameRoot");)r++;for(;a<u.length&&!u[a].includes("DetermineComponentFrameRoot");)a++;if(r===s.length||a===u.length)for(r=s.length-1,a=u.length-1;1<=r&&0<=a&&s[r]!==u[a];)a--;for(;1<=r&&0<=a;r--,a--)if(s[r]!==u[a]){if(1!==r||1!==a)do{if(r--,0>--a||s[r]!==u[a]){var c="\n"+s[r].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=r&&0<=a);break}}}finally{lt=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?at(n):""}function it(e){switch(e.tag){case 26:case 27:case 5:return at(e.type);case 16:return at("Lazy");case 13:return at("Suspense");case 19:return at("SuspenseList");case 0:case 15:return ot(e.type,!1);case 11:return ot(e.type.render,!1);case 1:return ot(e.type,!0);case 31:return at("Activity");default:return""}}function st(e){try{var t="";do{t+=it(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function ut(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ct(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function dt(e){e._valueTracker||(e._valueTracker=function(e){var t=ct(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var a=n.get,l=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,l.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function ft(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ct(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function pt(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var ht=/[\n"\\]/g;function mt(e){return e.replace(ht,(function(e){return"\\"+e.charCodeAt(0).toString(16)+" "}))}function gt(e,t,n,r,a,l,o,i){e.name="",null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o?e.type=o:e.removeAttribute("type"),null!=t?"number"===o?(0===t&&""===e.value||e.value!=t)&&(e.value=""+ut(t)):e.value!==""+ut(t)&&(e.value=""+ut(t)):"submit"!==o&&"reset"!==o||e.removeAttribute("value"),null!=t?vt(e,o,ut(t)):null!=n?vt(e,o,ut(n)):null!=r&&e.removeAttribute("value"),null==a&&null!=l&&(e.defaultChecked=!!l),null!=a&&(e.checked=a&&"function"!==typeof a&&"symbol"!==typeof a),null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i?e.name=""+ut(i):e.removeAttribute("name")}function yt(e,t,n,r,a,l,o,i){if(null!=l&&"function"!==typeof l&&"symbol"!==typeof l&&"boolean"!==typeof l&&(e.type=l),null!=t||null!=n){if(!("submit"!==l&&"reset"!==l||void 0!==t&&null!==t))return;n=null!=n?""+ut(n):"",t=null!=t?""+ut(t):n,i||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:a)&&"symbol"!==typeof r&&!!r,e.checked=i?e.checked:!!r,e.defaultChecked=!!r,null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o&&(e.name=o)}function vt(e,t,n){"number"===t&&pt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function bt(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ut(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function wt(e,t,n){null==t||((t=""+ut(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+ut(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function kt(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(o(92));if(j(r)){if(1<r.length)throw Error(o(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=ut(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function St(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var xt=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Et(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||xt.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function Ct(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(o(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var a in t)r=t[a],t.hasOwnProperty(a)&&n[a]!==r&&Et(e,a,r)}else for(var l in t)t.hasOwnProperty(l)&&Et(e,l,t[l])}function Nt(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Rt=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Pt=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Tt(e){return Pt.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var _t=null;function Ot(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Lt=null,jt=null;function zt(e){var t=Be(e);if(t&&(e=t.stateNode)){var n=e[je]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+mt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=r[je]||null;if(!a)throw Error(o(90));gt(r,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&ft(r)}break e;case"textarea":wt(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&bt(e,!!n.multiple,t,!1)}}}var At=!1;function Ft(e,t,n){if(At)return e(t,n);At=!0;try{return e(t)}finally{if(At=!1,(null!==Lt||null!==jt)&&(Iu(),Lt&&(t=Lt,e=jt,jt=Lt=null,zt(t),e)))for(t=0;t<e.length;t++)zt(e[t])}}function Dt(e,t){var n=e.stateNode;if(null===n)return null;var r=n[je]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var Mt=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),Ut=!1;if(Mt)try{var $t={};Object.defineProperty($t,"passive",{get:function(){Ut=!0}}),window.addEventListener("test",$t,$t),window.removeEventListener("test",$t,$t)}catch(zf){Ut=!1}var It=null,Bt=null,Ht=null;function Wt(){if(Ht)return Ht;var e,t,n=Bt,r=n.length,a="value"in It?It.value:It.textContent,l=a.length;for(e=0;e<r&&n[e]===a[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===a[l-t];t++);return Ht=a.slice(e,1<t?1-t:void 0)}function qt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function Vt(){return!0}function Qt(){return!1}function Kt(e){function t(t,n,r,a,l){for(var o in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=l,this.currentTarget=null,e)e.hasOwnProperty(o)&&(t=e[o],this[o]=t?t(a):a[o]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?Vt:Qt,this.isPropagationStopped=Qt,this}return f(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=Vt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=Vt)},persist:function(){},isPersistent:Vt}),t}var Yt,Xt,Jt,Gt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Zt=Kt(Gt),en=f({},Gt,{view:0,detail:0}),tn=Kt(en),nn=f({},en,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:hn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Jt&&(Jt&&"mousemove"===e.type?(Yt=e.screenX-Jt.screenX,Xt=e.screenY-Jt.screenY):Xt=Yt=0,Jt=e),Yt)},movementY:function(e){return"movementY"in e?e.movementY:Xt}}),rn=Kt(nn),an=Kt(f({},nn,{dataTransfer:0})),ln=Kt(f({},en,{relatedTarget:0})),on=Kt(f({},Gt,{animationName:0,elapsedTime:0,pseudoElement:0})),sn=Kt(f({},Gt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),un=Kt(f({},Gt,{data:0})),cn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},dn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function pn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function hn(){return pn}var mn=Kt(f({},en,{key:function(e){if(e.key){var t=cn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=qt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?dn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:hn,charCode:function(e){return"keypress"===e.type?qt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?qt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),gn=Kt(f({},nn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),yn=Kt(f({},en,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:hn})),vn=Kt(f({},Gt,{propertyName:0,elapsedTime:0,pseudoElement:0})),bn=Kt(f({},nn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),wn=Kt(f({},Gt,{newState:0,oldState:0})),kn=[9,13,27,32],Sn=Mt&&"CompositionEvent"in window,xn=null;Mt&&"documentMode"in document&&(xn=document.documentMode);var En=Mt&&"TextEvent"in window&&!xn,Cn=Mt&&(!Sn||xn&&8<xn&&11>=xn),Nn=String.fromCharCode(32),Rn=!1;function Pn(e,t){switch(e){case"keyup":return-1!==kn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Tn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var _n=!1;var On={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ln(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!On[e.type]:"textarea"===t}function jn(e,t,n,r){Lt?jt?jt.push(r):jt=[r]:Lt=r,0<(t=Wc(t,"onChange")).length&&(n=new Zt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var zn=null,An=null;function Fn(e){Fc(e,0)}function Dn(e){if(ft(He(e)))return e}function Mn(e,t){if("change"===e)return t}var Un=!1;if(Mt){var $n;if(Mt){var In="oninput"in document;if(!In){var Bn=document.createElement("div");Bn.setAttribute("oninput","return;"),In="function"===typeof Bn.oninput}$n=In}else $n=!1;Un=$n&&(!document.documentMode||9<document.documentMode)}function Hn(){zn&&(zn.detachEvent("onpropertychange",Wn),An=zn=null)}function Wn(e){if("value"===e.propertyName&&Dn(An)){var t=[];jn(t,An,e,Ot(e)),Ft(Fn,t)}}function qn(e,t,n){"focusin"===e?(Hn(),An=n,(zn=t).attachEvent("onpropertychange",Wn)):"focusout"===e&&Hn()}function Vn(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Dn(An)}function Qn(e,t){if("click"===e)return Dn(t)}function Kn(e,t){if("input"===e||"change"===e)return Dn(t)}var Yn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Xn(e,t){if(Yn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!X.call(t,a)||!Yn(e[a],t[a]))return!1}return!0}function Jn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Gn(e,t){var n,r=Jn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Jn(r)}}function Zn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Zn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function er(e){for(var t=pt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=pt((e=t.contentWindow).document)}return t}function tr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var nr=Mt&&"documentMode"in document&&11>=document.documentMode,rr=null,ar=null,lr=null,or=!1;function ir(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;or||null==rr||rr!==pt(r)||("selectionStart"in(r=rr)&&tr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},lr&&Xn(lr,r)||(lr=r,0<(r=Wc(ar,"onSelect")).length&&(t=new Zt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function sr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var ur={animationend:sr("Animation","AnimationEnd"),animationiteration:sr("Animation","AnimationIteration"),animationstart:sr("Animation","AnimationStart"),transitionrun:sr("Transition","TransitionRun"),transitionstart:sr("Transition","TransitionStart"),transitioncancel:sr("Transition","TransitionCancel"),transitionend:sr("Transition","TransitionEnd")},cr={},dr={};function fr(e){if(cr[e])return cr[e];if(!ur[e])return e;var t,n=ur[e];for(t in n)if(n.hasOwnProperty(t)&&t in dr)return cr[e]=n[t];return e}Mt&&(dr=document.createElement("div").style,"AnimationEvent"in window||(delete ur.animationend.animation,delete ur.animationiteration.animation,delete ur.animationstart.animation),"TransitionEvent"in window||delete ur.transitionend.transition);var pr=fr("animationend"),hr=fr("animationiteration"),mr=fr("animationstart"),gr=fr("transitionrun"),yr=fr("transitionstart"),vr=fr("transitioncancel"),br=fr("transitionend"),wr=new Map,kr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Sr(e,t){wr.set(e,t),Ke(t,[e])}kr.push("scrollEnd");var xr=new WeakMap;function Er(e,t){if("object"===typeof e&&null!==e){var n=xr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:st(t)},xr.set(e,t),t)}return{value:e,source:t,stack:st(t)}}var Cr=[],Nr=0,Rr=0;function Pr(){for(var e=Nr,t=Rr=Nr=0;t<e;){var n=Cr[t];Cr[t++]=null;var r=Cr[t];Cr[t++]=null;var a=Cr[t];Cr[t++]=null;var l=Cr[t];if(Cr[t++]=null,null!==r&&null!==a){var o=r.pending;null===o?a.next=a:(a.next=o.next,o.next=a),r.pending=a}0!==l&&Lr(n,a,l)}}function Tr(e,t,n,r){Cr[Nr++]=e,Cr[Nr++]=t,Cr[Nr++]=n,Cr[Nr++]=r,Rr|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function _r(e,t,n,r){return Tr(e,t,n,r),jr(e)}function Or(e,t){return Tr(e,null,null,t),jr(e)}function Lr(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var a=!1,l=e.return;null!==l;)l.childLanes|=n,null!==(r=l.alternate)&&(r.childLanes|=n),22===l.tag&&(null===(e=l.stateNode)||1&e._visibility||(a=!0)),e=l,l=l.return;return 3===e.tag?(l=e.stateNode,a&&null!==t&&(a=31-pe(n),null===(r=(e=l.hiddenUpdates)[a])?e[a]=[t]:r.push(t),t.lane=536870912|n),l):null}function jr(e){if(50<Lu)throw Lu=0,ju=null,Error(o(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var zr={};function Ar(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Fr(e,t,n,r){return new Ar(e,t,n,r)}function Dr(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Mr(e,t){var n=e.alternate;return null===n?((n=Fr(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=65011712&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Ur(e,t){e.flags&=65011714;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function $r(e,t,n,r,a,l){var i=0;if(r=e,"function"===typeof e)Dr(e)&&(i=1);else if("string"===typeof e)i=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,B.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case R:return(e=Fr(31,n,t,a)).elementType=R,e.lanes=l,e;case g:return Ir(n.children,a,l,t);case y:i=8,a|=24;break;case v:return(e=Fr(12,n,t,2|a)).elementType=v,e.lanes=l,e;case x:return(e=Fr(13,n,t,a)).elementType=x,e.lanes=l,e;case E:return(e=Fr(19,n,t,a)).elementType=E,e.lanes=l,e;default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case b:case k:i=10;break e;case w:i=9;break e;case S:i=11;break e;case C:i=14;break e;case N:i=16,r=null;break e}i=29,n=Error(o(130,null===e?"null":typeof e,"")),r=null}return(t=Fr(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function Ir(e,t,n,r){return(e=Fr(7,e,r,t)).lanes=n,e}function Br(e,t,n){return(e=Fr(6,e,null,t)).lanes=n,e}function Hr(e,t,n){return(t=Fr(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var Wr=[],qr=0,Vr=null,Qr=0,Kr=[],Yr=0,Xr=null,Jr=1,Gr="";function Zr(e,t){Wr[qr++]=Qr,Wr[qr++]=Vr,Vr=e,Qr=t}function ea(e,t,n){Kr[Yr++]=Jr,Kr[Yr++]=Gr,Kr[Yr++]=Xr,Xr=e;var r=Jr;e=Gr;var a=32-pe(r)-1;r&=~(1<<a),n+=1;var l=32-pe(t)+a;if(30<l){var o=a-a%5;l=(r&(1<<o)-1).toString(32),r>>=o,a-=o,Jr=1<<32-pe(t)+a|n<<a|r,Gr=l+e}else Jr=1<<l|n<<a|r,Gr=e}function ta(e){null!==e.return&&(Zr(e,1),ea(e,1,0))}function na(e){for(;e===Vr;)Vr=Wr[--qr],Wr[qr]=null,Qr=Wr[--qr],Wr[qr]=null;for(;e===Xr;)Xr=Kr[--Yr],Kr[Yr]=null,Gr=Kr[--Yr],Kr[Yr]=null,Jr=Kr[--Yr],Kr[Yr]=null}var ra=null,aa=null,la=!1,oa=null,ia=!1,sa=Error(o(519));function ua(e){throw ma(Er(Error(o(418,"")),e)),sa}function ca(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[Le]=e,t[je]=r,n){case"dialog":Dc("cancel",t),Dc("close",t);break;case"iframe":case"object":case"embed":Dc("load",t);break;case"video":case"audio":for(n=0;n<zc.length;n++)Dc(zc[n],t);break;case"source":Dc("error",t);break;case"img":case"image":case"link":Dc("error",t),Dc("load",t);break;case"details":Dc("toggle",t);break;case"input":Dc("invalid",t),yt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),dt(t);break;case"select":Dc("invalid",t);break;case"textarea":Dc("invalid",t),kt(t,r.value,r.defaultValue,r.children),dt(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Xc(t.textContent,n)?(null!=r.popover&&(Dc("beforetoggle",t),Dc("toggle",t)),null!=r.onScroll&&Dc("scroll",t),null!=r.onScrollEnd&&Dc("scrollend",t),null!=r.onClick&&(t.onclick=Jc),t=!0):t=!1,t||ua(e)}function da(e){for(ra=e.return;ra;)switch(ra.tag){case 5:case 13:return void(ia=!1);case 27:case 3:return void(ia=!0);default:ra=ra.return}}function fa(e){if(e!==ra)return!1;if(!la)return da(e),la=!0,!1;var t,n=e.tag;if((t=3!==n&&27!==n)&&((t=5===n)&&(t=!("form"!==(t=e.type)&&"button"!==t)||od(e.type,e.memoizedProps)),t=!t),t&&aa&&ua(e),da(e),13===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){aa=yd(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}aa=null}}else 27===n?(n=aa,pd(e.type)?(e=vd,vd=null,aa=e):aa=n):aa=ra?yd(e.stateNode.nextSibling):null;return!0}function pa(){aa=ra=null,la=!1}function ha(){var e=oa;return null!==e&&(null===bu?bu=e:bu.push.apply(bu,e),oa=null),e}function ma(e){null===oa?oa=[e]:oa.push(e)}var ga=U(null),ya=null,va=null;function ba(e,t,n){I(ga,t._currentValue),t._currentValue=n}function wa(e){e._currentValue=ga.current,$(ga)}function ka(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Sa(e,t,n,r){var a=e.child;for(null!==a&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){var i=a.child;l=l.firstContext;e:for(;null!==l;){var s=l;l=a;for(var u=0;u<t.length;u++)if(s.context===t[u]){l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),ka(l.return,n,e),r||(i=null);break e}l=s.next}}else if(18===a.tag){if(null===(i=a.return))throw Error(o(341));i.lanes|=n,null!==(l=i.alternate)&&(l.lanes|=n),ka(i,n,e),i=null}else i=a.child;if(null!==i)i.return=a;else for(i=a;null!==i;){if(i===e){i=null;break}if(null!==(a=i.sibling)){a.return=i.return,i=a;break}i=i.return}a=i}}function xa(e,t,n,r){e=null;for(var a=t,l=!1;null!==a;){if(!l)if(0!==(524288&a.flags))l=!0;else if(0!==(262144&a.flags))break;if(10===a.tag){var i=a.alternate;if(null===i)throw Error(o(387));if(null!==(i=i.memoizedProps)){var s=a.type;Yn(a.pendingProps.value,i.value)||(null!==e?e.push(s):e=[s])}}else if(a===q.current){if(null===(i=a.alternate))throw Error(o(387));i.memoizedState.memoizedState!==a.memoizedState.memoizedState&&(null!==e?e.push(Kd):e=[Kd])}a=a.return}null!==e&&Sa(t,e,n,r),t.flags|=262144}function Ea(e){for(e=e.firstContext;null!==e;){if(!Yn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Ca(e){ya=e,va=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function Na(e){return Pa(ya,e)}function Ra(e,t){return null===ya&&Ca(e),Pa(e,t)}function Pa(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===va){if(null===e)throw Error(o(308));va=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else va=va.next=t;return n}var Ta="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach((function(e){return e()}))}},_a=r.unstable_scheduleCallback,Oa=r.unstable_NormalPriority,La={$$typeof:k,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function ja(){return{controller:new Ta,data:new Map,refCount:0}}function za(e){e.refCount--,0===e.refCount&&_a(Oa,(function(){e.controller.abort()}))}var Aa=null,Fa=0,Da=0,Ma=null;function Ua(){if(0===--Fa&&null!==Aa){null!==Ma&&(Ma.status="fulfilled");var e=Aa;Aa=null,Da=0,Ma=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var $a=z.S;z.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===Aa){var n=Aa=[];Fa=0,Da=Tc(),Ma={status:"pending",value:void 0,then:function(e){n.push(e)}}}Fa++,t.then(Ua,Ua)}(0,t),null!==$a&&$a(e,t)};var Ia=U(null);function Ba(){var e=Ia.current;return null!==e?e:ru.pooledCache}function Ha(e,t){I(Ia,null===t?Ia.current:t.pool)}function Wa(){var e=Ba();return null===e?null:{parent:La._currentValue,pool:e}}var qa=Error(o(460)),Va=Error(o(474)),Qa=Error(o(542)),Ka={then:function(){}};function Ya(e){return"fulfilled"===(e=e.status)||"rejected"===e}function Xa(){}function Ja(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(Xa,Xa),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e;default:if("string"===typeof t.status)t.then(Xa,Xa);else{if(null!==(e=ru)&&100<e.shellSuspendCounter)throw Error(o(482));(e=t).status="pending",e.then((function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}}),(function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}}))}switch(t.status){case"fulfilled":return t.value;case"rejected":throw el(e=t.reason),e}throw Ga=t,qa}}var Ga=null;function Za(){if(null===Ga)throw Error(o(459));var e=Ga;return Ga=null,e}function el(e){if(e===qa||e===Qa)throw Error(o(483))}var tl=!1;function nl(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function rl(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function al(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function ll(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&nu)){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,t=jr(e),Lr(e,null,n),t}return Tr(e,r,t,n),jr(e)}function ol(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194048&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Re(e,n)}}function il(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,l=null;if(null!==(n=n.firstBaseUpdate)){do{var o={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===l?a=l=o:l=l.next=o,n=n.next}while(null!==n);null===l?a=l=t:l=l.next=t}else a=l=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:l,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var sl=!1;function ul(){if(sl){if(null!==Ma)throw Ma}}function cl(e,t,n,r){sl=!1;var a=e.updateQueue;tl=!1;var l=a.firstBaseUpdate,o=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var s=i,u=s.next;s.next=null,null===o?l=u:o.next=u,o=s;var c=e.alternate;null!==c&&((i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=u:i.next=u,c.lastBaseUpdate=s))}if(null!==l){var d=a.baseState;for(o=0,c=u=s=null,i=l;;){var p=-536870913&i.lane,h=p!==i.lane;if(h?(lu&p)===p:(r&p)===p){0!==p&&p===Da&&(sl=!0),null!==c&&(c=c.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});e:{var m=e,g=i;p=t;var y=n;switch(g.tag){case 1:if("function"===typeof(m=g.payload)){d=m.call(y,d,p);break e}d=m;break e;case 3:m.flags=-65537&m.flags|128;case 0:if(null===(p="function"===typeof(m=g.payload)?m.call(y,d,p):m)||void 0===p)break e;d=f({},d,p);break e;case 2:tl=!0}}null!==(p=i.callback)&&(e.flags|=64,h&&(e.flags|=8192),null===(h=a.callbacks)?a.callbacks=[p]:h.push(p))}else h={lane:p,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(u=c=h,s=d):c=c.next=h,o|=p;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(h=i).next,h.next=null,a.lastBaseUpdate=h,a.shared.pending=null}}null===c&&(s=d),a.baseState=s,a.firstBaseUpdate=u,a.lastBaseUpdate=c,null===l&&(a.shared.lanes=0),pu|=o,e.lanes=o,e.memoizedState=d}}function dl(e,t){if("function"!==typeof e)throw Error(o(191,e));e.call(t)}function fl(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)dl(n[e],t)}var pl=U(null),hl=U(0);function ml(e,t){I(hl,e=du),I(pl,t),du=e|t.baseLanes}function gl(){I(hl,du),I(pl,pl.current)}function yl(){du=hl.current,$(pl),$(hl)}var vl=0,bl=null,wl=null,kl=null,Sl=!1,xl=!1,El=!1,Cl=0,Nl=0,Rl=null,Pl=0;function Tl(){throw Error(o(321))}function _l(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Yn(e[n],t[n]))return!1;return!0}function Ol(e,t,n,r,a,l){return vl=l,bl=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,z.H=null===e||null===e.memoizedState?Vo:Qo,El=!1,l=n(r,a),El=!1,xl&&(l=jl(t,n,r,a)),Ll(e),l}function Ll(e){z.H=qo;var t=null!==wl&&null!==wl.next;if(vl=0,kl=wl=bl=null,Sl=!1,Nl=0,Rl=null,t)throw Error(o(300));null===e||Ri||null!==(e=e.dependencies)&&Ea(e)&&(Ri=!0)}function jl(e,t,n,r){bl=e;var a=0;do{if(xl&&(Rl=null),Nl=0,xl=!1,25<=a)throw Error(o(301));if(a+=1,kl=wl=null,null!=e.updateQueue){var l=e.updateQueue;l.lastEffect=null,l.events=null,l.stores=null,null!=l.memoCache&&(l.memoCache.index=0)}z.H=Ko,l=t(n,r)}while(xl);return l}function zl(){var e=z.H,t=e.useState()[0];return t="function"===typeof t.then?$l(t):t,e=e.useState()[0],(null!==wl?wl.memoizedState:null)!==e&&(bl.flags|=1024),t}function Al(){var e=0!==Cl;return Cl=0,e}function Fl(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function Dl(e){if(Sl){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}Sl=!1}vl=0,kl=wl=bl=null,xl=!1,Nl=Cl=0,Rl=null}function Ml(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===kl?bl.memoizedState=kl=e:kl=kl.next=e,kl}function Ul(){if(null===wl){var e=bl.alternate;e=null!==e?e.memoizedState:null}else e=wl.next;var t=null===kl?bl.memoizedState:kl.next;if(null!==t)kl=t,wl=e;else{if(null===e){if(null===bl.alternate)throw Error(o(467));throw Error(o(310))}e={memoizedState:(wl=e).memoizedState,baseState:wl.baseState,baseQueue:wl.baseQueue,queue:wl.queue,next:null},null===kl?bl.memoizedState=kl=e:kl=kl.next=e}return kl}function $l(e){var t=Nl;return Nl+=1,null===Rl&&(Rl=[]),e=Ja(Rl,e,t),t=bl,null===(null===kl?t.memoizedState:kl.next)&&(t=t.alternate,z.H=null===t||null===t.memoizedState?Vo:Qo),e}function Il(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return $l(e);if(e.$$typeof===k)return Na(e)}throw Error(o(438,String(e)))}function Bl(e){var t=null,n=bl.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=bl.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map((function(e){return e.slice()})),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},bl.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=P;return t.index++,n}function Hl(e,t){return"function"===typeof t?t(e):t}function Wl(e){return ql(Ul(),wl,e)}function ql(e,t,n){var r=e.queue;if(null===r)throw Error(o(311));r.lastRenderedReducer=n;var a=e.baseQueue,l=r.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}t.baseQueue=a=l,r.pending=null}if(l=e.baseState,null===a)e.memoizedState=l;else{var s=i=null,u=null,c=t=a.next,d=!1;do{var f=-536870913&c.lane;if(f!==c.lane?(lu&f)===f:(vl&f)===f){var p=c.revertLane;if(0===p)null!==u&&(u=u.next={lane:0,revertLane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),f===Da&&(d=!0);else{if((vl&p)===p){c=c.next,p===Da&&(d=!0);continue}f={lane:0,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(s=u=f,i=l):u=u.next=f,bl.lanes|=p,pu|=p}f=c.action,El&&n(l,f),l=c.hasEagerState?c.eagerState:n(l,f)}else p={lane:f,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(s=u=p,i=l):u=u.next=p,bl.lanes|=f,pu|=f;c=c.next}while(null!==c&&c!==t);if(null===u?i=l:u.next=s,!Yn(l,e.memoizedState)&&(Ri=!0,d&&null!==(n=Ma)))throw n;e.memoizedState=l,e.baseState=i,e.baseQueue=u,r.lastRenderedState=l}return null===a&&(r.lanes=0),[e.memoizedState,r.dispatch]}function Vl(e){var t=Ul(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);Yn(l,t.memoizedState)||(Ri=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function Ql(e,t,n){var r=bl,a=Ul(),l=la;if(l){if(void 0===n)throw Error(o(407));n=n()}else n=t();var i=!Yn((wl||a).memoizedState,n);if(i&&(a.memoizedState=n,Ri=!0),a=a.queue,yo(2048,8,Xl.bind(null,r,a,e),[e]),a.getSnapshot!==t||i||null!==kl&&1&kl.memoizedState.tag){if(r.flags|=2048,ho(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,a,n,t),null),null===ru)throw Error(o(349));l||0!==(124&vl)||Kl(r,t,n)}return n}function Kl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=bl.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},bl.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Yl(e,t,n,r){t.value=n,t.getSnapshot=r,Jl(t)&&Gl(e)}function Xl(e,t,n){return n((function(){Jl(t)&&Gl(e)}))}function Jl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Yn(e,n)}catch(r){return!0}}function Gl(e){var t=Or(e,2);null!==t&&Fu(t,e,2)}function Zl(e){var t=Ml();if("function"===typeof e){var n=e;if(e=n(),El){fe(!0);try{n()}finally{fe(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Hl,lastRenderedState:e},t}function eo(e,t,n,r){return e.baseState=n,ql(e,wl,"function"===typeof r?r:Hl)}function to(e,t,n,r,a){if(Bo(e))throw Error(o(485));if(null!==(e=t.action)){var l={payload:a,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){l.listeners.push(e)}};null!==z.T?n(!0):l.isTransition=!1,r(l),null===(n=t.pending)?(l.next=t.pending=l,no(t,l)):(l.next=n.next,t.pending=n.next=l)}}function no(e,t){var n=t.action,r=t.payload,a=e.state;if(t.isTransition){var l=z.T,o={};z.T=o;try{var i=n(a,r),s=z.S;null!==s&&s(o,i),ro(e,t,i)}catch(u){lo(e,t,u)}finally{z.T=l}}else try{ro(e,t,l=n(a,r))}catch(c){lo(e,t,c)}}function ro(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then((function(n){ao(e,t,n)}),(function(n){return lo(e,t,n)})):ao(e,t,n)}function ao(e,t,n){t.status="fulfilled",t.value=n,oo(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,no(e,n)))}function lo(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,oo(t),t=t.next}while(t!==r)}e.action=null}function oo(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function io(e,t){return t}function so(e,t){if(la){var n=ru.formState;if(null!==n){e:{var r=bl;if(la){if(aa){t:{for(var a=aa,l=ia;8!==a.nodeType;){if(!l){a=null;break t}if(null===(a=yd(a.nextSibling))){a=null;break t}}a="F!"===(l=a.data)||"F"===l?a:null}if(a){aa=yd(a.nextSibling),r="F!"===a.data;break e}}ua(r)}r=!1}r&&(t=n[0])}}return(n=Ml()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:io,lastRenderedState:t},n.queue=r,n=Uo.bind(null,bl,r),r.dispatch=n,r=Zl(!1),l=Io.bind(null,bl,!1,r.queue),a={state:t,dispatch:null,action:e,pending:null},(r=Ml()).queue=a,n=to.bind(null,bl,a,l,n),a.dispatch=n,r.memoizedState=e,[t,n,!1]}function uo(e){return co(Ul(),wl,e)}function co(e,t,n){if(t=ql(e,t,io)[0],e=Wl(Hl)[0],"object"===typeof t&&null!==t&&"function"===typeof t.then)try{var r=$l(t)}catch(o){if(o===qa)throw Qa;throw o}else r=t;var a=(t=Ul()).queue,l=a.dispatch;return n!==t.memoizedState&&(bl.flags|=2048,ho(9,{destroy:void 0,resource:void 0},fo.bind(null,a,n),null)),[r,l,e]}function fo(e,t){e.action=t}function po(e){var t=Ul(),n=wl;if(null!==n)return co(t,n,e);Ul(),t=t.memoizedState;var r=(n=Ul()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function ho(e,t,n,r){return e={tag:e,create:n,deps:r,inst:t,next:null},null===(t=bl.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},bl.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function mo(){return Ul().memoizedState}function go(e,t,n,r){var a=Ml();r=void 0===r?null:r,bl.flags|=e,a.memoizedState=ho(1|t,{destroy:void 0,resource:void 0},n,r)}function yo(e,t,n,r){var a=Ul();r=void 0===r?null:r;var l=a.memoizedState.inst;null!==wl&&null!==r&&_l(r,wl.memoizedState.deps)?a.memoizedState=ho(t,l,n,r):(bl.flags|=e,a.memoizedState=ho(1|t,l,n,r))}function vo(e,t){go(8390656,8,e,t)}function bo(e,t){yo(2048,8,e,t)}function wo(e,t){return yo(4,2,e,t)}function ko(e,t){return yo(4,4,e,t)}function So(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function xo(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,yo(4,4,So.bind(null,t,e),n)}function Eo(){}function Co(e,t){var n=Ul();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&_l(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function No(e,t){var n=Ul();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&_l(t,r[1]))return r[0];if(r=e(),El){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r}function Ro(e,t,n){return void 0===n||0!==(1073741824&vl)?e.memoizedState=t:(e.memoizedState=n,e=Au(),bl.lanes|=e,pu|=e,n)}function Po(e,t,n,r){return Yn(n,t)?n:null!==pl.current?(e=Ro(e,n,r),Yn(e,t)||(Ri=!0),e):0===(42&vl)?(Ri=!0,e.memoizedState=n):(e=Au(),bl.lanes|=e,pu|=e,t)}function To(e,t,n,r,a){var l=A.p;A.p=0!==l&&8>l?l:8;var o=z.T,i={};z.T=i,Io(e,!1,t,n);try{var s=a(),u=z.S;if(null!==u&&u(i,s),null!==s&&"object"===typeof s&&"function"===typeof s.then)$o(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then((function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)}),(function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)})),r}(s,r),zu());else $o(e,t,r,zu())}catch(c){$o(e,t,{then:function(){},status:"rejected",reason:c},zu())}finally{A.p=l,z.T=o}}function _o(){}function Oo(e,t,n,r){if(5!==e.tag)throw Error(o(476));var a=Lo(e).queue;To(e,a,t,F,null===n?_o:function(){return jo(e),n(r)})}function Lo(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:F,baseState:F,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Hl,lastRenderedState:F},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Hl,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function jo(e){$o(e,Lo(e).next.queue,{},zu())}function zo(){return Na(Kd)}function Ao(){return Ul().memoizedState}function Fo(){return Ul().memoizedState}function Do(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=zu(),r=ll(t,e=al(n),n);return null!==r&&(Fu(r,t,n),ol(r,t,n)),t={cache:ja()},void(e.payload=t)}t=t.return}}function Mo(e,t,n){var r=zu();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},Bo(e)?Ho(t,n):null!==(n=_r(e,t,n,r))&&(Fu(n,e,r),Wo(n,t,r))}function Uo(e,t,n){$o(e,t,n,zu())}function $o(e,t,n,r){var a={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(Bo(e))Ho(t,a);else{var l=e.alternate;if(0===e.lanes&&(null===l||0===l.lanes)&&null!==(l=t.lastRenderedReducer))try{var o=t.lastRenderedState,i=l(o,n);if(a.hasEagerState=!0,a.eagerState=i,Yn(i,o))return Tr(e,t,a,0),null===ru&&Pr(),!1}catch(s){}if(null!==(n=_r(e,t,a,r)))return Fu(n,e,r),Wo(n,t,r),!0}return!1}function Io(e,t,n,r){if(r={lane:2,revertLane:Tc(),action:r,hasEagerState:!1,eagerState:null,next:null},Bo(e)){if(t)throw Error(o(479))}else null!==(t=_r(e,n,r,2))&&Fu(t,e,2)}function Bo(e){var t=e.alternate;return e===bl||null!==t&&t===bl}function Ho(e,t){xl=Sl=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Wo(e,t,n){if(0!==(4194048&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Re(e,n)}}var qo={readContext:Na,use:Il,useCallback:Tl,useContext:Tl,useEffect:Tl,useImperativeHandle:Tl,useLayoutEffect:Tl,useInsertionEffect:Tl,useMemo:Tl,useReducer:Tl,useRef:Tl,useState:Tl,useDebugValue:Tl,useDeferredValue:Tl,useTransition:Tl,useSyncExternalStore:Tl,useId:Tl,useHostTransitionStatus:Tl,useFormState:Tl,useActionState:Tl,useOptimistic:Tl,useMemoCache:Tl,useCacheRefresh:Tl},Vo={readContext:Na,use:Il,useCallback:function(e,t){return Ml().memoizedState=[e,void 0===t?null:t],e},useContext:Na,useEffect:vo,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,go(4194308,4,So.bind(null,t,e),n)},useLayoutEffect:function(e,t){return go(4194308,4,e,t)},useInsertionEffect:function(e,t){go(4,2,e,t)},useMemo:function(e,t){var n=Ml();t=void 0===t?null:t;var r=e();if(El){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=Ml();if(void 0!==n){var a=n(t);if(El){fe(!0);try{n(t)}finally{fe(!1)}}}else a=t;return r.memoizedState=r.baseState=a,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:a},r.queue=e,e=e.dispatch=Mo.bind(null,bl,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Ml().memoizedState=e},useState:function(e){var t=(e=Zl(e)).queue,n=Uo.bind(null,bl,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:Eo,useDeferredValue:function(e,t){return Ro(Ml(),e,t)},useTransition:function(){var e=Zl(!1);return e=To.bind(null,bl,e.queue,!0,!1),Ml().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=bl,a=Ml();if(la){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===ru)throw Error(o(349));0!==(124&lu)||Kl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,vo(Xl.bind(null,r,l,e),[e]),r.flags|=2048,ho(9,{destroy:void 0,resource:void 0},Yl.bind(null,r,l,n,t),null),n},useId:function(){var e=Ml(),t=ru.identifierPrefix;if(la){var n=Gr;t="\xab"+t+"R"+(n=(Jr&~(1<<32-pe(Jr)-1)).toString(32)+n),0<(n=Cl++)&&(t+="H"+n.toString(32)),t+="\xbb"}else t="\xab"+t+"r"+(n=Pl++).toString(32)+"\xbb";return e.memoizedState=t},useHostTransitionStatus:zo,useFormState:so,useActionState:so,useOptimistic:function(e){var t=Ml();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=Io.bind(null,bl,!0,n),n.dispatch=t,[e,t]},useMemoCache:Bl,useCacheRefresh:function(){return Ml().memoizedState=Do.bind(null,bl)}},Qo={readContext:Na,use:Il,useCallback:Co,useContext:Na,useEffect:bo,useImperativeHandle:xo,useInsertionEffect:wo,useLayoutEffect:ko,useMemo:No,useReducer:Wl,useRef:mo,useState:function(){return Wl(Hl)},useDebugValue:Eo,useDeferredValue:function(e,t){return Po(Ul(),wl.memoizedState,e,t)},useTransition:function(){var e=Wl(Hl)[0],t=Ul().memoizedState;return["boolean"===typeof e?e:$l(e),t]},useSyncExternalStore:Ql,useId:Ao,useHostTransitionStatus:zo,useFormState:uo,useActionState:uo,useOptimistic:function(e,t){return eo(Ul(),0,e,t)},useMemoCache:Bl,useCacheRefresh:Fo},Ko={readContext:Na,use:Il,useCallback:Co,useContext:Na,useEffect:bo,useImperativeHandle:xo,useInsertionEffect:wo,useLayoutEffect:ko,useMemo:No,useReducer:Vl,useRef:mo,useState:function(){return Vl(Hl)},useDebugValue:Eo,useDeferredValue:function(e,t){var n=Ul();return null===wl?Ro(n,e,t):Po(n,wl.memoizedState,e,t)},useTransition:function(){var e=Vl(Hl)[0],t=Ul().memoizedState;return["boolean"===typeof e?e:$l(e),t]},useSyncExternalStore:Ql,useId:Ao,useHostTransitionStatus:zo,useFormState:po,useActionState:po,useOptimistic:function(e,t){var n=Ul();return null!==wl?eo(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:Bl,useCacheRefresh:Fo},Yo=null,Xo=0;function Jo(e){var t=Xo;return Xo+=1,null===Yo&&(Yo=[]),Ja(Yo,e,t)}function Go(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function Zo(e,t){if(t.$$typeof===p)throw Error(o(525));throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ei(e){return(0,e._init)(e._payload)}function ti(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function a(e,t){return(e=Mr(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=67108866,n):r:(t.flags|=67108866,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=67108866),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Br(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function u(e,t,n,r){var l=n.type;return l===g?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===l||"object"===typeof l&&null!==l&&l.$$typeof===N&&ei(l)===t.type)?(Go(t=a(t,n.props),n),t.return=e,t):(Go(t=$r(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Hr(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function d(e,t,n,r,l){return null===t||7!==t.tag?((t=Ir(n,e.mode,r,l)).return=e,t):((t=a(t,n)).return=e,t)}function f(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Br(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case h:return Go(n=$r(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case m:return(t=Hr(t,e.mode,n)).return=e,t;case N:return f(e,t=(0,t._init)(t._payload),n)}if(j(t)||_(t))return(t=Ir(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return f(e,Jo(t),n);if(t.$$typeof===k)return f(e,Ra(e,t),n);Zo(e,t)}return null}function p(e,t,n,r){var a=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==a?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case h:return n.key===a?u(e,t,n,r):null;case m:return n.key===a?c(e,t,n,r):null;case N:return p(e,t,n=(a=n._init)(n._payload),r)}if(j(n)||_(n))return null!==a?null:d(e,t,n,r,null);if("function"===typeof n.then)return p(e,t,Jo(n),r);if(n.$$typeof===k)return p(e,t,Ra(e,n),r);Zo(e,n)}return null}function y(e,t,n,r,a){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return s(t,e=e.get(n)||null,""+r,a);if("object"===typeof r&&null!==r){switch(r.$$typeof){case h:return u(t,e=e.get(null===r.key?n:r.key)||null,r,a);case m:return c(t,e=e.get(null===r.key?n:r.key)||null,r,a);case N:return y(e,t,n,r=(0,r._init)(r._payload),a)}if(j(r)||_(r))return d(t,e=e.get(n)||null,r,a,null);if("function"===typeof r.then)return y(e,t,n,Jo(r),a);if(r.$$typeof===k)return y(e,t,n,Ra(t,r),a);Zo(t,r)}return null}function v(s,u,c,d){if("object"===typeof c&&null!==c&&c.type===g&&null===c.key&&(c=c.props.children),"object"===typeof c&&null!==c){switch(c.$$typeof){case h:e:{for(var b=c.key;null!==u;){if(u.key===b){if((b=c.type)===g){if(7===u.tag){n(s,u.sibling),(d=a(u,c.props.children)).return=s,s=d;break e}}else if(u.elementType===b||"object"===typeof b&&null!==b&&b.$$typeof===N&&ei(b)===u.type){n(s,u.sibling),Go(d=a(u,c.props),c),d.return=s,s=d;break e}n(s,u);break}t(s,u),u=u.sibling}c.type===g?((d=Ir(c.props.children,s.mode,d,c.key)).return=s,s=d):(Go(d=$r(c.type,c.key,c.props,null,s.mode,d),c),d.return=s,s=d)}return i(s);case m:e:{for(b=c.key;null!==u;){if(u.key===b){if(4===u.tag&&u.stateNode.containerInfo===c.containerInfo&&u.stateNode.implementation===c.implementation){n(s,u.sibling),(d=a(u,c.children||[])).return=s,s=d;break e}n(s,u);break}t(s,u),u=u.sibling}(d=Hr(c,s.mode,d)).return=s,s=d}return i(s);case N:return v(s,u,c=(b=c._init)(c._payload),d)}if(j(c))return function(a,o,i,s){for(var u=null,c=null,d=o,h=o=0,m=null;null!==d&&h<i.length;h++){d.index>h?(m=d,d=null):m=d.sibling;var g=p(a,d,i[h],s);if(null===g){null===d&&(d=m);break}e&&d&&null===g.alternate&&t(a,d),o=l(g,o,h),null===c?u=g:c.sibling=g,c=g,d=m}if(h===i.length)return n(a,d),la&&Zr(a,h),u;if(null===d){for(;h<i.length;h++)null!==(d=f(a,i[h],s))&&(o=l(d,o,h),null===c?u=d:c.sibling=d,c=d);return la&&Zr(a,h),u}for(d=r(d);h<i.length;h++)null!==(m=y(d,a,h,i[h],s))&&(e&&null!==m.alternate&&d.delete(null===m.key?h:m.key),o=l(m,o,h),null===c?u=m:c.sibling=m,c=m);return e&&d.forEach((function(e){return t(a,e)})),la&&Zr(a,h),u}(s,u,c,d);if(_(c)){if("function"!==typeof(b=_(c)))throw Error(o(150));return function(a,i,s,u){if(null==s)throw Error(o(151));for(var c=null,d=null,h=i,m=i=0,g=null,v=s.next();null!==h&&!v.done;m++,v=s.next()){h.index>m?(g=h,h=null):g=h.sibling;var b=p(a,h,v.value,u);if(null===b){null===h&&(h=g);break}e&&h&&null===b.alternate&&t(a,h),i=l(b,i,m),null===d?c=b:d.sibling=b,d=b,h=g}if(v.done)return n(a,h),la&&Zr(a,m),c;if(null===h){for(;!v.done;m++,v=s.next())null!==(v=f(a,v.value,u))&&(i=l(v,i,m),null===d?c=v:d.sibling=v,d=v);return la&&Zr(a,m),c}for(h=r(h);!v.done;m++,v=s.next())null!==(v=y(h,a,m,v.value,u))&&(e&&null!==v.alternate&&h.delete(null===v.key?m:v.key),i=l(v,i,m),null===d?c=v:d.sibling=v,d=v);return e&&h.forEach((function(e){return t(a,e)})),la&&Zr(a,m),c}(s,u,c=b.call(c),d)}if("function"===typeof c.then)return v(s,u,Jo(c),d);if(c.$$typeof===k)return v(s,u,Ra(s,c),d);Zo(s,c)}return"string"===typeof c&&""!==c||"number"===typeof c||"bigint"===typeof c?(c=""+c,null!==u&&6===u.tag?(n(s,u.sibling),(d=a(u,c)).return=s,s=d):(n(s,u),(d=Br(c,s.mode,d)).return=s,s=d),i(s)):n(s,u)}return function(e,t,n,r){try{Xo=0;var a=v(e,t,n,r);return Yo=null,a}catch(o){if(o===qa||o===Qa)throw o;var l=Fr(29,o,null,e.mode);return l.lanes=r,l.return=e,l}}}var ni=ti(!0),ri=ti(!1),ai=U(null),li=null;function oi(e){var t=e.alternate;I(ci,1&ci.current),I(ai,e),null===li&&(null===t||null!==pl.current||null!==t.memoizedState)&&(li=e)}function ii(e){if(22===e.tag){if(I(ci,ci.current),I(ai,e),null===li){var t=e.alternate;null!==t&&null!==t.memoizedState&&(li=e)}}else si()}function si(){I(ci,ci.current),I(ai,ai.current)}function ui(e){$(ai),li===e&&(li=null),$(ci)}var ci=U(0);function di(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||gd(n)))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function fi(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:f({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var pi={enqueueSetState:function(e,t,n){e=e._reactInternals;var r=zu(),a=al(r);a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Fu(t,e,r),ol(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=zu(),a=al(r);a.tag=1,a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=ll(e,a,r))&&(Fu(t,e,r),ol(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=zu(),r=al(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=ll(e,r,n))&&(Fu(t,e,n),ol(t,e,n))}};function hi(e,t,n,r,a,l,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,l,o):!t.prototype||!t.prototype.isPureReactComponent||(!Xn(n,r)||!Xn(a,l))}function mi(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&pi.enqueueReplaceState(t,t.state,null)}function gi(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var a in n===t&&(n=f({},n)),e)void 0===n[a]&&(n[a]=e[a]);return n}var yi="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function vi(e){yi(e)}function bi(e){console.error(e)}function wi(e){yi(e)}function ki(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout((function(){throw n}))}}function Si(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout((function(){throw r}))}}function xi(e,t,n){return(n=al(n)).tag=3,n.payload={element:null},n.callback=function(){ki(e,t)},n}function Ei(e){return(e=al(e)).tag=3,e}function Ci(e,t,n,r){var a=n.type.getDerivedStateFromError;if("function"===typeof a){var l=r.value;e.payload=function(){return a(l)},e.callback=function(){Si(t,n,r)}}var o=n.stateNode;null!==o&&"function"===typeof o.componentDidCatch&&(e.callback=function(){Si(t,n,r),"function"!==typeof a&&(null===Eu?Eu=new Set([this]):Eu.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var Ni=Error(o(461)),Ri=!1;function Pi(e,t,n,r){t.child=null===e?ri(t,null,n,r):ni(t,e.child,n,r)}function Ti(e,t,n,r,a){n=n.render;var l=t.ref;if("ref"in r){var o={};for(var i in r)"ref"!==i&&(o[i]=r[i])}else o=r;return Ca(t),r=Ol(e,t,n,o,l,a),i=Al(),null===e||Ri?(la&&i&&ta(t),t.flags|=1,Pi(e,t,r,a),t.child):(Fl(e,t,a),Yi(e,t,a))}function _i(e,t,n,r,a){if(null===e){var l=n.type;return"function"!==typeof l||Dr(l)||void 0!==l.defaultProps||null!==n.compare?((e=$r(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=l,Oi(e,t,l,r,a))}if(l=e.child,!Xi(e,a)){var o=l.memoizedProps;if((n=null!==(n=n.compare)?n:Xn)(o,r)&&e.ref===t.ref)return Yi(e,t,a)}return t.flags|=1,(e=Mr(l,r)).ref=t.ref,e.return=t,t.child=e}function Oi(e,t,n,r,a){if(null!==e){var l=e.memoizedProps;if(Xn(l,r)&&e.ref===t.ref){if(Ri=!1,t.pendingProps=r=l,!Xi(e,a))return t.lanes=e.lanes,Yi(e,t,a);0!==(131072&e.flags)&&(Ri=!0)}}return Ai(e,t,n,r,a)}function Li(e,t,n){var r=t.pendingProps,a=r.children,l=null!==e?e.memoizedState:null;if("hidden"===r.mode){if(0!==(128&t.flags)){if(r=null!==l?l.baseLanes|n:n,null!==e){for(a=t.child=e.child,l=0;null!==a;)l=l|a.lanes|a.childLanes,a=a.sibling;t.childLanes=l&~r}else t.childLanes=0,t.child=null;return ji(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,ji(e,t,null!==l?l.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Ha(0,null!==l?l.cachePool:null),null!==l?ml(t,l):gl(),ii(t)}else null!==l?(Ha(0,l.cachePool),ml(t,l),si(),t.memoizedState=null):(null!==e&&Ha(0,null),gl(),si());return Pi(e,t,a,n),t.child}function ji(e,t,n,r){var a=Ba();return a=null===a?null:{parent:La._currentValue,pool:a},t.memoizedState={baseLanes:n,cachePool:a},null!==e&&Ha(0,null),gl(),ii(t),null!==e&&xa(e,t,r,!0),null}function zi(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=4194816);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(o(284));null!==e&&e.ref===n||(t.flags|=4194816)}}function Ai(e,t,n,r,a){return Ca(t),n=Ol(e,t,n,r,void 0,a),r=Al(),null===e||Ri?(la&&r&&ta(t),t.flags|=1,Pi(e,t,n,a),t.child):(Fl(e,t,a),Yi(e,t,a))}function Fi(e,t,n,r,a,l){return Ca(t),t.updateQueue=null,n=jl(t,r,n,a),Ll(e),r=Al(),null===e||Ri?(la&&r&&ta(t),t.flags|=1,Pi(e,t,n,l),t.child):(Fl(e,t,l),Yi(e,t,l))}function Di(e,t,n,r,a){if(Ca(t),null===t.stateNode){var l=zr,o=n.contextType;"object"===typeof o&&null!==o&&(l=Na(o)),l=new n(r,l),t.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,l.updater=pi,t.stateNode=l,l._reactInternals=t,(l=t.stateNode).props=r,l.state=t.memoizedState,l.refs={},nl(t),o=n.contextType,l.context="object"===typeof o&&null!==o?Na(o):zr,l.state=t.memoizedState,"function"===typeof(o=n.getDerivedStateFromProps)&&(fi(t,n,o,r),l.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(o=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),o!==l.state&&pi.enqueueReplaceState(l,l.state,null),cl(t,r,l,a),ul(),l.state=t.memoizedState),"function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){l=t.stateNode;var i=t.memoizedProps,s=gi(n,i);l.props=s;var u=l.context,c=n.contextType;o=zr,"object"===typeof c&&null!==c&&(o=Na(c));var d=n.getDerivedStateFromProps;c="function"===typeof d||"function"===typeof l.getSnapshotBeforeUpdate,i=t.pendingProps!==i,c||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(i||u!==o)&&mi(t,l,r,o),tl=!1;var f=t.memoizedState;l.state=f,cl(t,r,l,a),ul(),u=t.memoizedState,i||f!==u||tl?("function"===typeof d&&(fi(t,n,d,r),u=t.memoizedState),(s=tl||hi(t,n,s,r,f,u,o))?(c||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||("function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"===typeof l.componentDidMount&&(t.flags|=4194308)):("function"===typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),l.props=r,l.state=u,l.context=o,r=s):("function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,rl(e,t),c=gi(n,o=t.memoizedProps),l.props=c,d=t.pendingProps,f=l.context,u=n.contextType,s=zr,"object"===typeof u&&null!==u&&(s=Na(u)),(u="function"===typeof(i=n.getDerivedStateFromProps)||"function"===typeof l.getSnapshotBeforeUpdate)||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(o!==d||f!==s)&&mi(t,l,r,s),tl=!1,f=t.memoizedState,l.state=f,cl(t,r,l,a),ul();var p=t.memoizedState;o!==d||f!==p||tl||null!==e&&null!==e.dependencies&&Ea(e.dependencies)?("function"===typeof i&&(fi(t,n,i,r),p=t.memoizedState),(c=tl||hi(t,n,c,r,f,p,s)||null!==e&&null!==e.dependencies&&Ea(e.dependencies))?(u||"function"!==typeof l.UNSAFE_componentWillUpdate&&"function"!==typeof l.componentWillUpdate||("function"===typeof l.componentWillUpdate&&l.componentWillUpdate(r,p,s),"function"===typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,p,s)),"function"===typeof l.componentDidUpdate&&(t.flags|=4),"function"===typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),l.props=r,l.state=p,l.context=s,r=c):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return l=r,zi(e,t),r=0!==(128&t.flags),l||r?(l=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:l.render(),t.flags|=1,null!==e&&r?(t.child=ni(t,e.child,null,a),t.child=ni(t,null,n,a)):Pi(e,t,n,a),t.memoizedState=l.state,e=t.child):e=Yi(e,t,a),e}function Mi(e,t,n,r){return pa(),t.flags|=256,Pi(e,t,n,r),t.child}var Ui={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function $i(e){return{baseLanes:e,cachePool:Wa()}}function Ii(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=gu),e}function Bi(e,t,n){var r,a=t.pendingProps,l=!1,i=0!==(128&t.flags);if((r=i)||(r=(null===e||null!==e.memoizedState)&&0!==(2&ci.current)),r&&(l=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(la){if(l?oi(t):si(),la){var s,u=aa;if(s=u){e:{for(s=u,u=ia;8!==s.nodeType;){if(!u){u=null;break e}if(null===(s=yd(s.nextSibling))){u=null;break e}}u=s}null!==u?(t.memoizedState={dehydrated:u,treeContext:null!==Xr?{id:Jr,overflow:Gr}:null,retryLane:536870912,hydrationErrors:null},(s=Fr(18,null,null,0)).stateNode=u,s.return=t,t.child=s,ra=t,aa=null,s=!0):s=!1}s||ua(t)}if(null!==(u=t.memoizedState)&&null!==(u=u.dehydrated))return gd(u)?t.lanes=32:t.lanes=536870912,null;ui(t)}return u=a.children,a=a.fallback,l?(si(),u=Wi({mode:"hidden",children:u},l=t.mode),a=Ir(a,l,n,null),u.return=t,a.return=t,u.sibling=a,t.child=u,(l=t.child).memoizedState=$i(n),l.childLanes=Ii(e,r,n),t.memoizedState=Ui,a):(oi(t),Hi(t,u))}if(null!==(s=e.memoizedState)&&null!==(u=s.dehydrated)){if(i)256&t.flags?(oi(t),t.flags&=-257,t=qi(e,t,n)):null!==t.memoizedState?(si(),t.child=e.child,t.flags|=128,t=null):(si(),l=a.fallback,u=t.mode,a=Wi({mode:"visible",children:a.children},u),(l=Ir(l,u,n,null)).flags|=2,a.return=t,l.return=t,a.sibling=l,t.child=a,ni(t,e.child,null,n),(a=t.child).memoizedState=$i(n),a.childLanes=Ii(e,r,n),t.memoizedState=Ui,t=l);else if(oi(t),gd(u)){if(r=u.nextSibling&&u.nextSibling.dataset)var c=r.dgst;r=c,(a=Error(o(419))).stack="",a.digest=r,ma({value:a,source:null,stack:null}),t=qi(e,t,n)}else if(Ri||xa(e,t,n,!1),r=0!==(n&e.childLanes),Ri||r){if(null!==(r=ru)&&(0!==(a=0!==((a=0!==(42&(a=n&-n))?1:Pe(a))&(r.suspendedLanes|n))?0:a)&&a!==s.retryLane))throw s.retryLane=a,Or(e,a),Fu(r,e,a),Ni;"$?"===u.data||Qu(),t=qi(e,t,n)}else"$?"===u.data?(t.flags|=192,t.child=e.child,t=null):(e=s.treeContext,aa=yd(u.nextSibling),ra=t,la=!0,oa=null,ia=!1,null!==e&&(Kr[Yr++]=Jr,Kr[Yr++]=Gr,Kr[Yr++]=Xr,Jr=e.id,Gr=e.overflow,Xr=t),(t=Hi(t,a.children)).flags|=4096);return t}return l?(si(),l=a.fallback,u=t.mode,c=(s=e.child).sibling,(a=Mr(s,{mode:"hidden",children:a.children})).subtreeFlags=65011712&s.subtreeFlags,null!==c?l=Mr(c,l):(l=Ir(l,u,n,null)).flags|=2,l.return=t,a.return=t,a.sibling=l,t.child=a,a=l,l=t.child,null===(u=e.child.memoizedState)?u=$i(n):(null!==(s=u.cachePool)?(c=La._currentValue,s=s.parent!==c?{parent:c,pool:c}:s):s=Wa(),u={baseLanes:u.baseLanes|n,cachePool:s}),l.memoizedState=u,l.childLanes=Ii(e,r,n),t.memoizedState=Ui,a):(oi(t),e=(n=e.child).sibling,(n=Mr(n,{mode:"visible",children:a.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function Hi(e,t){return(t=Wi({mode:"visible",children:t},e.mode)).return=e,e.child=t}function Wi(e,t){return(e=Fr(22,e,null,t)).lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function qi(e,t,n){return ni(t,e.child,null,n),(e=Hi(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Vi(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),ka(e.return,t,n)}function Qi(e,t,n,r,a){var l=e.memoizedState;null===l?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(l.isBackwards=t,l.rendering=null,l.renderingStartTime=0,l.last=r,l.tail=n,l.tailMode=a)}function Ki(e,t,n){var r=t.pendingProps,a=r.revealOrder,l=r.tail;if(Pi(e,t,r.children,n),0!==(2&(r=ci.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Vi(e,n,t);else if(19===e.tag)Vi(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(I(ci,r),a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===di(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),Qi(t,!1,a,n,l);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===di(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}Qi(t,!0,n,null,l);break;case"together":Qi(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Yi(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),pu|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(xa(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Mr(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Mr(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Xi(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Ea(e))}function Ji(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)Ri=!0;else{if(!Xi(e,n)&&0===(128&t.flags))return Ri=!1,function(e,t,n){switch(t.tag){case 3:V(t,t.stateNode.containerInfo),ba(0,La,e.memoizedState.cache),pa();break;case 27:case 5:K(t);break;case 4:V(t,t.stateNode.containerInfo);break;case 10:ba(0,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(oi(t),t.flags|=128,null):0!==(n&t.child.childLanes)?Bi(e,t,n):(oi(t),null!==(e=Yi(e,t,n))?e.sibling:null);oi(t);break;case 19:var a=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(xa(e,t,n,!1),r=0!==(n&t.childLanes)),a){if(r)return Ki(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),I(ci,ci.current),r)break;return null;case 22:case 23:return t.lanes=0,Li(e,t,n);case 24:ba(0,La,e.memoizedState.cache)}return Yi(e,t,n)}(e,t,n);Ri=0!==(131072&e.flags)}else Ri=!1,la&&0!==(1048576&t.flags)&&ea(t,Qr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,a=r._init;if(r=a(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((a=r.$$typeof)===S){t.tag=11,t=Ti(null,t,r,e,n);break e}if(a===C){t.tag=14,t=_i(null,t,r,e,n);break e}}throw t=L(r)||r,Error(o(306,t,""))}Dr(r)?(e=gi(r,e),t.tag=1,t=Di(null,t,r,e,n)):(t.tag=0,t=Ai(null,t,r,e,n))}return t;case 0:return Ai(e,t,t.type,t.pendingProps,n);case 1:return Di(e,t,r=t.type,a=gi(r,t.pendingProps),n);case 3:e:{if(V(t,t.stateNode.containerInfo),null===e)throw Error(o(387));r=t.pendingProps;var l=t.memoizedState;a=l.element,rl(e,t),cl(t,r,null,n);var i=t.memoizedState;if(r=i.cache,ba(0,La,r),r!==l.cache&&Sa(t,[La],n,!0),ul(),r=i.element,l.isDehydrated){if(l={element:r,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=l,t.memoizedState=l,256&t.flags){t=Mi(e,t,r,n);break e}if(r!==a){ma(a=Er(Error(o(424)),t)),t=Mi(e,t,r,n);break e}if(9===(e=t.stateNode.containerInfo).nodeType)e=e.body;else e="HTML"===e.nodeName?e.ownerDocument.body:e;for(aa=yd(e.firstChild),ra=t,la=!0,oa=null,ia=!0,n=ri(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(pa(),r===a){t=Yi(e,t,n);break e}Pi(e,t,r,n)}t=t.child}return t;case 26:return zi(e,t),null===e?(n=Pd(t.type,null,t.pendingProps,null))?t.memoizedState=n:la||(n=t.type,e=t.pendingProps,(r=rd(W.current).createElement(n))[Le]=t,r[je]=e,ed(r,n,e),qe(r),t.stateNode=r):t.memoizedState=Pd(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return K(t),null===e&&la&&(r=t.stateNode=wd(t.type,t.pendingProps,W.current),ra=t,ia=!0,a=aa,pd(t.type)?(vd=a,aa=yd(r.firstChild)):aa=a),Pi(e,t,t.pendingProps.children,n),zi(e,t),null===e&&(t.flags|=4194304),t.child;case 5:return null===e&&la&&((a=r=aa)&&(null!==(r=function(e,t,n,r){for(;1===e.nodeType;){var a=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[Ue])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(l=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(l!==a.rel||e.getAttribute("href")!==(null==a.href||""===a.href?null:a.href)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin)||e.getAttribute("title")!==(null==a.title?null:a.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((l=e.getAttribute("src"))!==(null==a.src?null:a.src)||e.getAttribute("type")!==(null==a.type?null:a.type)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin))&&l&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var l=null==a.name?null:""+a.name;if("hidden"===a.type&&e.getAttribute("name")===l)return e}if(null===(e=yd(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,ia))?(t.stateNode=r,ra=t,aa=yd(r.firstChild),ia=!1,a=!0):a=!1),a||ua(t)),K(t),a=t.type,l=t.pendingProps,i=null!==e?e.memoizedProps:null,r=l.children,od(a,l)?r=null:null!==i&&od(a,i)&&(t.flags|=32),null!==t.memoizedState&&(a=Ol(e,t,zl,null,null,n),Kd._currentValue=a),zi(e,t),Pi(e,t,r,n),t.child;case 6:return null===e&&la&&((e=n=aa)&&(null!==(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=yd(e.nextSibling)))return null}return e}(n,t.pendingProps,ia))?(t.stateNode=n,ra=t,aa=null,e=!0):e=!1),e||ua(t)),null;case 13:return Bi(e,t,n);case 4:return V(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=ni(t,null,r,n):Pi(e,t,r,n),t.child;case 11:return Ti(e,t,t.type,t.pendingProps,n);case 7:return Pi(e,t,t.pendingProps,n),t.child;case 8:case 12:return Pi(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,ba(0,t.type,r.value),Pi(e,t,r.children,n),t.child;case 9:return a=t.type._context,r=t.pendingProps.children,Ca(t),r=r(a=Na(a)),t.flags|=1,Pi(e,t,r,n),t.child;case 14:return _i(e,t,t.type,t.pendingProps,n);case 15:return Oi(e,t,t.type,t.pendingProps,n);case 19:return Ki(e,t,n);case 31:return r=t.pendingProps,n=t.mode,r={mode:r.mode,children:r.children},null===e?((n=Wi(r,n)).ref=t.ref,t.child=n,n.return=t,t=n):((n=Mr(e.child,r)).ref=t.ref,t.child=n,n.return=t,t=n),t;case 22:return Li(e,t,n);case 24:return Ca(t),r=Na(La),null===e?(null===(a=Ba())&&(a=ru,l=ja(),a.pooledCache=l,l.refCount++,null!==l&&(a.pooledCacheLanes|=n),a=l),t.memoizedState={parent:r,cache:a},nl(t),ba(0,La,a)):(0!==(e.lanes&n)&&(rl(e,t),cl(t,null,null,n),ul()),a=e.memoizedState,l=t.memoizedState,a.parent!==r?(a={parent:r,cache:r},t.memoizedState=a,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=a),ba(0,La,r)):(r=l.cache,ba(0,La,r),r!==a.cache&&Sa(t,[La],n,!0))),Pi(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}function Gi(e){e.flags|=4}function Zi(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!Id(t)){if(null!==(t=ai.current)&&((4194048&lu)===lu?null!==li:(62914560&lu)!==lu&&0===(536870912&lu)||t!==li))throw Ga=Ka,Va;e.flags|=8192}}function es(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?xe():536870912,e.lanes|=t,yu|=t)}function ts(e,t){if(!la)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ns(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=65011712&a.subtreeFlags,r|=65011712&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function rs(e,t,n){var r=t.pendingProps;switch(na(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return ns(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),wa(La),Q(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(fa(t)?Gi(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,ha())),ns(t),null;case 26:return n=t.memoizedState,null===e?(Gi(t),null!==n?(ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217)):n?n!==e.memoizedState?(Gi(t),ns(t),Zi(t,n)):(ns(t),t.flags&=-16777217):(e.memoizedProps!==r&&Gi(t),ns(t),t.flags&=-16777217),null;case 27:Y(t),n=W.current;var a=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Gi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}e=B.current,fa(t)?ca(t):(e=wd(a,r,n),t.stateNode=e,Gi(t))}return ns(t),null;case 5:if(Y(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Gi(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return ns(t),null}if(e=B.current,fa(t))ca(t);else{switch(a=rd(W.current),e){case 1:e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=a.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?a.createElement("select",{is:r.is}):a.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?a.createElement(n,{is:r.is}):a.createElement(n)}}e[Le]=t,e[je]=r;e:for(a=t.child;null!==a;){if(5===a.tag||6===a.tag)e.appendChild(a.stateNode);else if(4!==a.tag&&27!==a.tag&&null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break e;for(;null===a.sibling;){if(null===a.return||a.return===t)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}t.stateNode=e;e:switch(ed(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&Gi(t)}}return ns(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&Gi(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(e=W.current,fa(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(a=ra))switch(a.tag){case 27:case 5:r=a.memoizedProps}e[Le]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Xc(e.nodeValue,n)))||ua(t)}else(e=rd(e).createTextNode(r))[Le]=t,t.stateNode=e}return ns(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(a=fa(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[Le]=t}else pa(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;ns(t),a=!1}else a=ha(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=a),a=!0;if(!a)return 256&t.flags?(ui(t),t):(ui(t),null)}if(ui(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){a=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(a=r.alternate.memoizedState.cachePool.pool);var l=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(l=r.memoizedState.cachePool.pool),l!==a&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),es(t,t.updateQueue),ns(t),null;case 4:return Q(),null===e&&$c(t.stateNode.containerInfo),ns(t),null;case 10:return wa(t.type),ns(t),null;case 19:if($(ci),null===(a=t.memoizedState))return ns(t),null;if(r=0!==(128&t.flags),null===(l=a.rendering))if(r)ts(a,!1);else{if(0!==fu||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(l=di(e))){for(t.flags|=128,ts(a,!1),e=l.updateQueue,t.updateQueue=e,es(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Ur(n,e),n=n.sibling;return I(ci,1&ci.current|2),t.child}e=e.sibling}null!==a.tail&&te()>Su&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=di(l))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,es(t,e),ts(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!la)return ns(t),null}else 2*te()-a.renderingStartTime>Su&&536870912!==n&&(t.flags|=128,r=!0,ts(a,!1),t.lanes=4194304);a.isBackwards?(l.sibling=t.child,t.child=l):(null!==(e=a.last)?e.sibling=l:t.child=l,a.last=l)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=te(),t.sibling=null,e=ci.current,I(ci,r?1&e|2:1&e),t):(ns(t),null);case 22:case 23:return ui(t),yl(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(ns(t),6&t.subtreeFlags&&(t.flags|=8192)):ns(t),null!==(n=t.updateQueue)&&es(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&$(Ia),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),wa(La),ns(t),null;case 25:case 30:return null}throw Error(o(156,t.tag))}function as(e,t){switch(na(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return wa(La),Q(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return Y(t),null;case 13:if(ui(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));pa()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return $(ci),null;case 4:return Q(),null;case 10:return wa(t.type),null;case 22:case 23:return ui(t),yl(),null!==e&&$(Ia),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return wa(La),null;default:return null}}function ls(e,t){switch(na(t),t.tag){case 3:wa(La),Q();break;case 26:case 27:case 5:Y(t);break;case 4:Q();break;case 13:ui(t);break;case 19:$(ci);break;case 10:wa(t.type);break;case 22:case 23:ui(t),yl(),null!==e&&$(Ia);break;case 24:wa(La)}}function os(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var a=r.next;n=a;do{if((n.tag&e)===e){r=void 0;var l=n.create,o=n.inst;r=l(),o.destroy=r}n=n.next}while(n!==a)}}catch(i){cc(t,t.return,i)}}function is(e,t,n){try{var r=t.updateQueue,a=null!==r?r.lastEffect:null;if(null!==a){var l=a.next;r=l;do{if((r.tag&e)===e){var o=r.inst,i=o.destroy;if(void 0!==i){o.destroy=void 0,a=t;var s=n,u=i;try{u()}catch(c){cc(a,s,c)}}}r=r.next}while(r!==l)}}catch(c){cc(t,t.return,c)}}function ss(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{fl(t,n)}catch(r){cc(e,e.return,r)}}}function us(e,t,n){n.props=gi(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){cc(e,t,r)}}function cs(e,t){try{var n=e.ref;if(null!==n){switch(e.tag){case 26:case 27:case 5:var r=e.stateNode;break;default:r=e.stateNode}"function"===typeof n?e.refCleanup=n(r):n.current=r}}catch(a){cc(e,t,a)}}function ds(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(a){cc(e,t,a)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(l){cc(e,t,l)}else n.current=null}function fs(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(a){cc(e,e.return,a)}}function ps(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var a=null,l=null,i=null,s=null,u=null,c=null,d=null;for(h in n){var f=n[h];if(n.hasOwnProperty(h)&&null!=f)switch(h){case"checked":case"value":break;case"defaultValue":u=f;default:r.hasOwnProperty(h)||Gc(e,t,h,null,r,f)}}for(var p in r){var h=r[p];if(f=n[p],r.hasOwnProperty(p)&&(null!=h||null!=f))switch(p){case"type":l=h;break;case"name":a=h;break;case"checked":c=h;break;case"defaultChecked":d=h;break;case"value":i=h;break;case"defaultValue":s=h;break;case"children":case"dangerouslySetInnerHTML":if(null!=h)throw Error(o(137,t));break;default:h!==f&&Gc(e,t,p,h,r,f)}}return void gt(e,i,s,u,c,d,l,a);case"select":for(l in h=i=s=p=null,n)if(u=n[l],n.hasOwnProperty(l)&&null!=u)switch(l){case"value":break;case"multiple":h=u;default:r.hasOwnProperty(l)||Gc(e,t,l,null,r,u)}for(a in r)if(l=r[a],u=n[a],r.hasOwnProperty(a)&&(null!=l||null!=u))switch(a){case"value":p=l;break;case"defaultValue":s=l;break;case"multiple":i=l;default:l!==u&&Gc(e,t,a,l,r,u)}return t=s,n=i,r=h,void(null!=p?bt(e,!!n,p,!1):!!r!==!!n&&(null!=t?bt(e,!!n,t,!0):bt(e,!!n,n?[]:"",!1)));case"textarea":for(s in h=p=null,n)if(a=n[s],n.hasOwnProperty(s)&&null!=a&&!r.hasOwnProperty(s))switch(s){case"value":case"children":break;default:Gc(e,t,s,null,r,a)}for(i in r)if(a=r[i],l=n[i],r.hasOwnProperty(i)&&(null!=a||null!=l))switch(i){case"value":p=a;break;case"defaultValue":h=a;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=a)throw Error(o(91));break;default:a!==l&&Gc(e,t,i,a,r,l)}return void wt(e,p,h);case"option":for(var m in n)if(p=n[m],n.hasOwnProperty(m)&&null!=p&&!r.hasOwnProperty(m))if("selected"===m)e.selected=!1;else Gc(e,t,m,null,r,p);for(u in r)if(p=r[u],h=n[u],r.hasOwnProperty(u)&&p!==h&&(null!=p||null!=h))if("selected"===u)e.selected=p&&"function"!==typeof p&&"symbol"!==typeof p;else Gc(e,t,u,p,r,h);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var g in n)p=n[g],n.hasOwnProperty(g)&&null!=p&&!r.hasOwnProperty(g)&&Gc(e,t,g,null,r,p);for(c in r)if(p=r[c],h=n[c],r.hasOwnProperty(c)&&p!==h&&(null!=p||null!=h))switch(c){case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(o(137,t));break;default:Gc(e,t,c,p,r,h)}return;default:if(Nt(t)){for(var y in n)p=n[y],n.hasOwnProperty(y)&&void 0!==p&&!r.hasOwnProperty(y)&&Zc(e,t,y,void 0,r,p);for(d in r)p=r[d],h=n[d],!r.hasOwnProperty(d)||p===h||void 0===p&&void 0===h||Zc(e,t,d,p,r,h);return}}for(var v in n)p=n[v],n.hasOwnProperty(v)&&null!=p&&!r.hasOwnProperty(v)&&Gc(e,t,v,null,r,p);for(f in r)p=r[f],h=n[f],!r.hasOwnProperty(f)||p===h||null==p&&null==h||Gc(e,t,f,p,r,h)}(r,e.type,n,t),r[je]=t}catch(a){cc(e,e.return,a)}}function hs(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag&&pd(e.type)||4===e.tag}function ms(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||hs(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(27===e.tag&&pd(e.type))continue e;if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function gs(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?(9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).insertBefore(e,t):((t=9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Jc));else if(4!==r&&(27===r&&pd(e.type)&&(n=e.stateNode,t=null),null!==(e=e.child)))for(gs(e,t,n),e=e.sibling;null!==e;)gs(e,t,n),e=e.sibling}function ys(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&(27===r&&pd(e.type)&&(n=e.stateNode),null!==(e=e.child)))for(ys(e,t,n),e=e.sibling;null!==e;)ys(e,t,n),e=e.sibling}function vs(e){var t=e.stateNode,n=e.memoizedProps;try{for(var r=e.type,a=t.attributes;a.length;)t.removeAttributeNode(a[0]);ed(t,r,n),t[Le]=e,t[je]=n}catch(l){cc(e,e.return,l)}}var bs=!1,ws=!1,ks=!1,Ss="function"===typeof WeakSet?WeakSet:Set,xs=null;function Es(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:Ds(e,n),4&r&&os(5,n);break;case 1:if(Ds(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(o){cc(n,n.return,o)}else{var a=gi(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(a,t,e.__reactInternalSnapshotBeforeUpdate)}catch(i){cc(n,n.return,i)}}64&r&&ss(n),512&r&&cs(n,n.return);break;case 3:if(Ds(e,n),64&r&&null!==(e=n.updateQueue)){if(t=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:t=n.child.stateNode}try{fl(e,t)}catch(o){cc(n,n.return,o)}}break;case 27:null===t&&4&r&&vs(n);case 26:case 5:Ds(e,n),null===t&&4&r&&fs(n),512&r&&cs(n,n.return);break;case 12:Ds(e,n);break;case 13:Ds(e,n),4&r&&_s(e,n),64&r&&(null!==(e=n.memoizedState)&&(null!==(e=e.dehydrated)&&function(e,t){var n=e.ownerDocument;if("$?"!==e.data||"complete"===n.readyState)t();else{var r=function(){t(),n.removeEventListener("DOMContentLoaded",r)};n.addEventListener("DOMContentLoaded",r),e._reactRetry=r}}(e,n=hc.bind(null,n))));break;case 22:if(!(r=null!==n.memoizedState||bs)){t=null!==t&&null!==t.memoizedState||ws,a=bs;var l=ws;bs=r,(ws=t)&&!l?Us(e,n,0!==(8772&n.subtreeFlags)):Ds(e,n),bs=a,ws=l}break;case 30:break;default:Ds(e,n)}}function Cs(e){var t=e.alternate;null!==t&&(e.alternate=null,Cs(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&$e(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Ns=null,Rs=!1;function Ps(e,t,n){for(n=n.child;null!==n;)Ts(e,t,n),n=n.sibling}function Ts(e,t,n){if(de&&"function"===typeof de.onCommitFiberUnmount)try{de.onCommitFiberUnmount(ce,n)}catch(l){}switch(n.tag){case 26:ws||ds(n,t),Ps(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:ws||ds(n,t);var r=Ns,a=Rs;pd(n.type)&&(Ns=n.stateNode,Rs=!1),Ps(e,t,n),kd(n.stateNode),Ns=r,Rs=a;break;case 5:ws||ds(n,t);case 6:if(r=Ns,a=Rs,Ns=null,Ps(e,t,n),Rs=a,null!==(Ns=r))if(Rs)try{(9===Ns.nodeType?Ns.body:"HTML"===Ns.nodeName?Ns.ownerDocument.body:Ns).removeChild(n.stateNode)}catch(o){cc(n,t,o)}else try{Ns.removeChild(n.stateNode)}catch(o){cc(n,t,o)}break;case 18:null!==Ns&&(Rs?(hd(9===(e=Ns).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,n.stateNode),Pf(e)):hd(Ns,n.stateNode));break;case 4:r=Ns,a=Rs,Ns=n.stateNode.containerInfo,Rs=!0,Ps(e,t,n),Ns=r,Rs=a;break;case 0:case 11:case 14:case 15:ws||is(2,n,t),ws||is(4,n,t),Ps(e,t,n);break;case 1:ws||(ds(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&us(n,t,r)),Ps(e,t,n);break;case 21:Ps(e,t,n);break;case 22:ws=(r=ws)||null!==n.memoizedState,Ps(e,t,n),ws=r;break;default:Ps(e,t,n)}}function _s(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{Pf(e)}catch(n){cc(t,t.return,n)}}function Os(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new Ss),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new Ss),t;default:throw Error(o(435,e.tag))}}(e);t.forEach((function(t){var r=mc.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}function Ls(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r],l=e,i=t,s=i;e:for(;null!==s;){switch(s.tag){case 27:if(pd(s.type)){Ns=s.stateNode,Rs=!1;break e}break;case 5:Ns=s.stateNode,Rs=!1;break e;case 3:case 4:Ns=s.stateNode.containerInfo,Rs=!0;break e}s=s.return}if(null===Ns)throw Error(o(160));Ts(l,i,a),Ns=null,Rs=!1,null!==(l=a.alternate)&&(l.return=null),a.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)zs(t,e),t=t.sibling}var js=null;function zs(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Ls(t,e),As(e),4&r&&(is(3,e,e.return),os(3,e),is(5,e,e.return));break;case 1:Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),64&r&&bs&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var a=js;if(Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),4&r){var l=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,a=a.ownerDocument||a;t:switch(r){case"title":(!(l=a.getElementsByTagName("title")[0])||l[Ue]||l[Le]||"http://www.w3.org/2000/svg"===l.namespaceURI||l.hasAttribute("itemprop"))&&(l=a.createElement(r),a.head.insertBefore(l,a.querySelector("head > title"))),ed(l,r,n),l[Le]=e,qe(l),r=l;break e;case"link":var i=Ud("link","href",a).get(r+(n.href||""));if(i)for(var s=0;s<i.length;s++)if((l=i[s]).getAttribute("href")===(null==n.href||""===n.href?null:n.href)&&l.getAttribute("rel")===(null==n.rel?null:n.rel)&&l.getAttribute("title")===(null==n.title?null:n.title)&&l.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;case"meta":if(i=Ud("meta","content",a).get(r+(n.content||"")))for(s=0;s<i.length;s++)if((l=i[s]).getAttribute("content")===(null==n.content?null:""+n.content)&&l.getAttribute("name")===(null==n.name?null:n.name)&&l.getAttribute("property")===(null==n.property?null:n.property)&&l.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&l.getAttribute("charset")===(null==n.charSet?null:n.charSet)){i.splice(s,1);break t}ed(l=a.createElement(r),r,n),a.head.appendChild(l);break;default:throw Error(o(468,r))}l[Le]=e,qe(l),r=l}e.stateNode=r}else $d(a,e.type,e.stateNode);else e.stateNode=zd(a,r,e.memoizedProps);else l!==r?(null===l?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):l.count--,null===r?$d(a,e.type,e.stateNode):zd(a,r,e.memoizedProps)):null===r&&null!==e.stateNode&&ps(e,e.memoizedProps,n.memoizedProps)}break;case 27:Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),null!==n&&4&r&&ps(e,e.memoizedProps,n.memoizedProps);break;case 5:if(Ls(t,e),As(e),512&r&&(ws||null===n||ds(n,n.return)),32&e.flags){a=e.stateNode;try{St(a,"")}catch(h){cc(e,e.return,h)}}4&r&&null!=e.stateNode&&ps(e,a=e.memoizedProps,null!==n?n.memoizedProps:a),1024&r&&(ks=!0);break;case 6:if(Ls(t,e),As(e),4&r){if(null===e.stateNode)throw Error(o(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(h){cc(e,e.return,h)}}break;case 3:if(Md=null,a=js,js=Ed(t.containerInfo),Ls(t,e),js=a,As(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Pf(t.containerInfo)}catch(h){cc(e,e.return,h)}ks&&(ks=!1,Fs(e));break;case 4:r=js,js=Ed(e.stateNode.containerInfo),Ls(t,e),As(e),js=r;break;case 12:default:Ls(t,e),As(e);break;case 13:Ls(t,e),As(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(ku=te()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Os(e,r)));break;case 22:a=null!==e.memoizedState;var u=null!==n&&null!==n.memoizedState,c=bs,d=ws;if(bs=c||a,ws=d||u,Ls(t,e),ws=d,bs=c,As(e),8192&r)e:for(t=e.stateNode,t._visibility=a?-2&t._visibility:1|t._visibility,a&&(null===n||u||bs||ws||Ms(e)),n=null,t=e;;){if(5===t.tag||26===t.tag){if(null===n){u=n=t;try{if(l=u.stateNode,a)"function"===typeof(i=l.style).setProperty?i.setProperty("display","none","important"):i.display="none";else{s=u.stateNode;var f=u.memoizedProps.style,p=void 0!==f&&null!==f&&f.hasOwnProperty("display")?f.display:null;s.style.display=null==p||"boolean"===typeof p?"":(""+p).trim()}}catch(h){cc(u,u.return,h)}}}else if(6===t.tag){if(null===n){u=t;try{u.stateNode.nodeValue=a?"":u.memoizedProps}catch(h){cc(u,u.return,h)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,Os(e,n))));break;case 19:Ls(t,e),As(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Os(e,r)));case 30:case 21:}}function As(e){var t=e.flags;if(2&t){try{for(var n,r=e.return;null!==r;){if(hs(r)){n=r;break}r=r.return}if(null==n)throw Error(o(160));switch(n.tag){case 27:var a=n.stateNode;ys(e,ms(e),a);break;case 5:var l=n.stateNode;32&n.flags&&(St(l,""),n.flags&=-33),ys(e,ms(e),l);break;case 3:case 4:var i=n.stateNode.containerInfo;gs(e,ms(e),i);break;default:throw Error(o(161))}}catch(s){cc(e,e.return,s)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function Fs(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;Fs(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function Ds(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)Es(e,t.alternate,t),t=t.sibling}function Ms(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:is(4,t,t.return),Ms(t);break;case 1:ds(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&us(t,t.return,n),Ms(t);break;case 27:kd(t.stateNode);case 26:case 5:ds(t,t.return),Ms(t);break;case 22:null===t.memoizedState&&Ms(t);break;default:Ms(t)}e=e.sibling}}function Us(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,a=e,l=t,o=l.flags;switch(l.tag){case 0:case 11:case 15:Us(a,l,n),os(4,l);break;case 1:if(Us(a,l,n),"function"===typeof(a=(r=l).stateNode).componentDidMount)try{a.componentDidMount()}catch(u){cc(r,r.return,u)}if(null!==(a=(r=l).updateQueue)){var i=r.stateNode;try{var s=a.shared.hiddenCallbacks;if(null!==s)for(a.shared.hiddenCallbacks=null,a=0;a<s.length;a++)dl(s[a],i)}catch(u){cc(r,r.return,u)}}n&&64&o&&ss(l),cs(l,l.return);break;case 27:vs(l);case 26:case 5:Us(a,l,n),n&&null===r&&4&o&&fs(l),cs(l,l.return);break;case 12:Us(a,l,n);break;case 13:Us(a,l,n),n&&4&o&&_s(a,l);break;case 22:null===l.memoizedState&&Us(a,l,n),cs(l,l.return);break;case 30:break;default:Us(a,l,n)}t=t.sibling}}function $s(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&za(n))}function Is(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&za(e))}function Bs(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Hs(e,t,n,r),t=t.sibling}function Hs(e,t,n,r){var a=t.flags;switch(t.tag){case 0:case 11:case 15:Bs(e,t,n,r),2048&a&&os(9,t);break;case 1:case 13:default:Bs(e,t,n,r);break;case 3:Bs(e,t,n,r),2048&a&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&za(e)));break;case 12:if(2048&a){Bs(e,t,n,r),e=t.stateNode;try{var l=t.memoizedProps,o=l.id,i=l.onPostCommit;"function"===typeof i&&i(o,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(s){cc(t,t.return,s)}}else Bs(e,t,n,r);break;case 23:break;case 22:l=t.stateNode,o=t.alternate,null!==t.memoizedState?2&l._visibility?Bs(e,t,n,r):qs(e,t):2&l._visibility?Bs(e,t,n,r):(l._visibility|=2,Ws(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&a&&$s(o,t);break;case 24:Bs(e,t,n,r),2048&a&&Is(t.alternate,t)}}function Ws(e,t,n,r,a){for(a=a&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var l=e,o=t,i=n,s=r,u=o.flags;switch(o.tag){case 0:case 11:case 15:Ws(l,o,i,s,a),os(8,o);break;case 23:break;case 22:var c=o.stateNode;null!==o.memoizedState?2&c._visibility?Ws(l,o,i,s,a):qs(l,o):(c._visibility|=2,Ws(l,o,i,s,a)),a&&2048&u&&$s(o.alternate,o);break;case 24:Ws(l,o,i,s,a),a&&2048&u&&Is(o.alternate,o);break;default:Ws(l,o,i,s,a)}t=t.sibling}}function qs(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,a=r.flags;switch(r.tag){case 22:qs(n,r),2048&a&&$s(r.alternate,r);break;case 24:qs(n,r),2048&a&&Is(r.alternate,r);break;default:qs(n,r)}t=t.sibling}}var Vs=8192;function Qs(e){if(e.subtreeFlags&Vs)for(e=e.child;null!==e;)Ks(e),e=e.sibling}function Ks(e){switch(e.tag){case 26:Qs(e),e.flags&Vs&&null!==e.memoizedState&&function(e,t,n){if(null===Bd)throw Error(o(475));var r=Bd;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var a=Td(n.href),l=e.querySelector(_d(a));if(l)return null!==(e=l._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=Wd.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=l,void qe(l);l=e.ownerDocument||e,n=Od(n),(a=Sd.get(a))&&Fd(n,a),qe(l=l.createElement("link"));var i=l;i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",n),t.instance=l}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=Wd.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(js,e.memoizedState,e.memoizedProps);break;case 5:default:Qs(e);break;case 3:case 4:var t=js;js=Ed(e.stateNode.containerInfo),Qs(e),js=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=Vs,Vs=16777216,Qs(e),Vs=t):Qs(e))}}function Ys(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Xs(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];xs=r,Zs(r,e)}Ys(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Js(e),e=e.sibling}function Js(e){switch(e.tag){case 0:case 11:case 15:Xs(e),2048&e.flags&&is(9,e,e.return);break;case 3:case 12:default:Xs(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&2&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-3,Gs(e)):Xs(e)}}function Gs(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];xs=r,Zs(r,e)}Ys(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:is(8,t,t.return),Gs(t);break;case 22:2&(n=t.stateNode)._visibility&&(n._visibility&=-3,Gs(t));break;default:Gs(t)}e=e.sibling}}function Zs(e,t){for(;null!==xs;){var n=xs;switch(n.tag){case 0:case 11:case 15:is(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:za(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,xs=r;else e:for(n=e;null!==xs;){var a=(r=xs).sibling,l=r.return;if(Cs(r),r===n){xs=null;break e}if(null!==a){a.return=l,xs=a;break e}xs=l}}}var eu={getCacheForType:function(e){var t=Na(La),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},tu="function"===typeof WeakMap?WeakMap:Map,nu=0,ru=null,au=null,lu=0,ou=0,iu=null,su=!1,uu=!1,cu=!1,du=0,fu=0,pu=0,hu=0,mu=0,gu=0,yu=0,vu=null,bu=null,wu=!1,ku=0,Su=1/0,xu=null,Eu=null,Cu=0,Nu=null,Ru=null,Pu=0,Tu=0,_u=null,Ou=null,Lu=0,ju=null;function zu(){if(0!==(2&nu)&&0!==lu)return lu&-lu;if(null!==z.T){return 0!==Da?Da:Tc()}return _e()}function Au(){0===gu&&(gu=0===(536870912&lu)||la?Se():536870912);var e=ai.current;return null!==e&&(e.flags|=32),gu}function Fu(e,t,n){(e!==ru||2!==ou&&9!==ou)&&null===e.cancelPendingCommit||(Hu(e,0),$u(e,lu,gu,!1)),Ce(e,n),0!==(2&nu)&&e===ru||(e===ru&&(0===(2&nu)&&(hu|=n),4===fu&&$u(e,lu,gu,!1)),Sc(e))}function Du(e,t,n){if(0!==(6&nu))throw Error(o(327));for(var r=!n&&0===(124&t)&&0===(t&e.expiredLanes)||we(e,t),a=r?function(e,t){var n=nu;nu|=2;var r=qu(),a=Vu();ru!==e||lu!==t?(xu=null,Su=te()+500,Hu(e,t)):uu=we(e,t);e:for(;;)try{if(0!==ou&&null!==au){t=au;var l=iu;t:switch(ou){case 1:ou=0,iu=null,Zu(e,t,l,1);break;case 2:case 9:if(Ya(l)){ou=0,iu=null,Gu(t);break}t=function(){2!==ou&&9!==ou||ru!==e||(ou=7),Sc(e)},l.then(t,t);break e;case 3:ou=7;break e;case 4:ou=5;break e;case 7:Ya(l)?(ou=0,iu=null,Gu(t)):(ou=0,iu=null,Zu(e,t,l,7));break;case 5:var i=null;switch(au.tag){case 26:i=au.memoizedState;case 5:case 27:var s=au;if(!i||Id(i)){ou=0,iu=null;var u=s.sibling;if(null!==u)au=u;else{var c=s.return;null!==c?(au=c,ec(c)):au=null}break t}}ou=0,iu=null,Zu(e,t,l,5);break;case 6:ou=0,iu=null,Zu(e,t,l,6);break;case 8:Bu(),fu=6;break e;default:throw Error(o(462))}}Xu();break}catch(d){Wu(e,d)}return va=ya=null,z.H=r,z.A=a,nu=n,null!==au?0:(ru=null,lu=0,Pr(),fu)}(e,t):Ku(e,t,!0),l=r;;){if(0===a){uu&&!r&&$u(e,t,0,!1);break}if(n=e.current.alternate,!l||Uu(n)){if(2===a){if(l=t,e.errorRecoveryDisabledLanes&l)var i=0;else i=0!==(i=-536870913&e.pendingLanes)?i:536870912&i?536870912:0;if(0!==i){t=i;e:{var s=e;a=vu;var u=s.current.memoizedState.isDehydrated;if(u&&(Hu(s,i).flags|=256),2!==(i=Ku(s,i,!1))){if(cu&&!u){s.errorRecoveryDisabledLanes|=l,hu|=l,a=4;break e}l=bu,bu=a,null!==l&&(null===bu?bu=l:bu.push.apply(bu,l))}a=i}if(l=!1,2!==a)continue}}if(1===a){Hu(e,0),$u(e,t,0,!0);break}e:{switch(r=e,l=a){case 0:case 1:throw Error(o(345));case 4:if((4194048&t)!==t)break;case 6:$u(r,t,gu,!su);break e;case 2:bu=null;break;case 3:case 5:break;default:throw Error(o(329))}if((62914560&t)===t&&10<(a=ku+300-te())){if($u(r,t,gu,!su),0!==be(r,0,!0))break e;r.timeoutHandle=sd(Mu.bind(null,r,n,bu,xu,wu,t,gu,hu,yu,su,l,2,-0,0),a)}else Mu(r,n,bu,xu,wu,t,gu,hu,yu,su,l,0,-0,0)}break}a=Ku(e,t,!1),l=!1}Sc(e)}function Mu(e,t,n,r,a,l,i,s,u,c,d,f,p,h){if(e.timeoutHandle=-1,(8192&(f=t.subtreeFlags)||16785408===(16785408&f))&&(Bd={stylesheets:null,count:0,unsuspend:Hd},Ks(t),null!==(f=function(){if(null===Bd)throw Error(o(475));var e=Bd;return e.stylesheets&&0===e.count&&Vd(e,e.stylesheets),0<e.count?function(t){var n=setTimeout((function(){if(e.stylesheets&&Vd(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}}),6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=f(nc.bind(null,e,t,l,n,r,a,i,s,u,d,1,p,h)),void $u(e,l,i,!c);nc(e,t,l,n,r,a,i,s,u)}function Uu(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var a=n[r],l=a.getSnapshot;a=a.value;try{if(!Yn(l(),a))return!1}catch(o){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function $u(e,t,n,r){t&=~mu,t&=~hu,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var a=t;0<a;){var l=31-pe(a),o=1<<l;r[l]=-1,a&=~o}0!==n&&Ne(e,n,t)}function Iu(){return 0!==(6&nu)||(xc(0,!1),!1)}function Bu(){if(null!==au){if(0===ou)var e=au.return;else va=ya=null,Dl(e=au),Yo=null,Xo=0,e=au;for(;null!==e;)ls(e.alternate,e),e=e.return;au=null}}function Hu(e,t){var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,ud(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Bu(),ru=e,au=n=Mr(e.current,null),lu=t,ou=0,iu=null,su=!1,uu=we(e,t),cu=!1,yu=gu=mu=hu=pu=fu=0,bu=vu=null,wu=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var a=31-pe(r),l=1<<a;t|=e[a],r&=~l}return du=t,Pr(),n}function Wu(e,t){bl=null,z.H=qo,t===qa||t===Qa?(t=Za(),ou=3):t===Va?(t=Za(),ou=4):ou=t===Ni?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,iu=t,null===au&&(fu=1,ki(e,Er(t,e.current)))}function qu(){var e=z.H;return z.H=qo,null===e?qo:e}function Vu(){var e=z.A;return z.A=eu,e}function Qu(){fu=4,su||(4194048&lu)!==lu&&null!==ai.current||(uu=!0),0===(134217727&pu)&&0===(134217727&hu)||null===ru||$u(ru,lu,gu,!1)}function Ku(e,t,n){var r=nu;nu|=2;var a=qu(),l=Vu();ru===e&&lu===t||(xu=null,Hu(e,t)),t=!1;var o=fu;e:for(;;)try{if(0!==ou&&null!==au){var i=au,s=iu;switch(ou){case 8:Bu(),o=6;break e;case 3:case 2:case 9:case 6:null===ai.current&&(t=!0);var u=ou;if(ou=0,iu=null,Zu(e,i,s,u),n&&uu){o=0;break e}break;default:u=ou,ou=0,iu=null,Zu(e,i,s,u)}}Yu(),o=fu;break}catch(c){Wu(e,c)}return t&&e.shellSuspendCounter++,va=ya=null,nu=r,z.H=a,z.A=l,null===au&&(ru=null,lu=0,Pr()),o}function Yu(){for(;null!==au;)Ju(au)}function Xu(){for(;null!==au&&!Z();)Ju(au)}function Ju(e){var t=Ji(e.alternate,e,du);e.memoizedProps=e.pendingProps,null===t?ec(e):au=t}function Gu(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Fi(n,t,t.pendingProps,t.type,void 0,lu);break;case 11:t=Fi(n,t,t.pendingProps,t.type.render,t.ref,lu);break;case 5:Dl(t);default:ls(n,t),t=Ji(n,t=au=Ur(t,du),du)}e.memoizedProps=e.pendingProps,null===t?ec(e):au=t}function Zu(e,t,n,r){va=ya=null,Dl(t),Yo=null,Xo=0;var a=t.return;try{if(function(e,t,n,r,a){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&xa(t,n,a,!0),null!==(n=ai.current)){switch(n.tag){case 13:return null===li?Qu():null===n.alternate&&0===fu&&(fu=3),n.flags&=-257,n.flags|=65536,n.lanes=a,r===Ka?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),dc(e,r,a)),!1;case 22:return n.flags|=65536,r===Ka?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),dc(e,r,a)),!1}throw Error(o(435,n.tag))}return dc(e,r,a),Qu(),!1}if(la)return null!==(t=ai.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=a,r!==sa&&ma(Er(e=Error(o(422),{cause:r}),n))):(r!==sa&&ma(Er(t=Error(o(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,a&=-a,e.lanes|=a,r=Er(r,n),il(e,a=xi(e.stateNode,r,a)),4!==fu&&(fu=2)),!1;var l=Error(o(520),{cause:r});if(l=Er(l,n),null===vu?vu=[l]:vu.push(l),4!==fu&&(fu=2),null===t)return!0;r=Er(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=a&-a,n.lanes|=e,il(n,e=xi(n.stateNode,r,e)),!1;case 1:if(t=n.type,l=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==l&&"function"===typeof l.componentDidCatch&&(null===Eu||!Eu.has(l))))return n.flags|=65536,a&=-a,n.lanes|=a,Ci(a=Ei(a),e,n,r),il(n,a),!1}n=n.return}while(null!==n);return!1}(e,a,t,n,lu))return fu=1,ki(e,Er(n,e.current)),void(au=null)}catch(l){if(null!==a)throw au=a,l;return fu=1,ki(e,Er(n,e.current)),void(au=null)}32768&t.flags?(la||1===r?e=!0:uu||0!==(536870912&lu)?e=!1:(su=e=!0,(2===r||9===r||3===r||6===r)&&(null!==(r=ai.current)&&13===r.tag&&(r.flags|=16384))),tc(t,e)):ec(t)}function ec(e){var t=e;do{if(0!==(32768&t.flags))return void tc(t,su);e=t.return;var n=rs(t.alternate,t,du);if(null!==n)return void(au=n);if(null!==(t=t.sibling))return void(au=t);au=t=e}while(null!==t);0===fu&&(fu=5)}function tc(e,t){do{var n=as(e.alternate,e);if(null!==n)return n.flags&=32767,void(au=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(au=e);au=e=n}while(null!==e);fu=6,au=null}function nc(e,t,n,r,a,l,i,s,u){e.cancelPendingCommit=null;do{ic()}while(0!==Cu);if(0!==(6&nu))throw Error(o(327));if(null!==t){if(t===e.current)throw Error(o(177));if(l=t.lanes|t.childLanes,function(e,t,n,r,a,l){var o=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var i=e.entanglements,s=e.expirationTimes,u=e.hiddenUpdates;for(n=o&~n;0<n;){var c=31-pe(n),d=1<<c;i[c]=0,s[c]=-1;var f=u[c];if(null!==f)for(u[c]=null,c=0;c<f.length;c++){var p=f[c];null!==p&&(p.lane&=-536870913)}n&=~d}0!==r&&Ne(e,r,0),0!==l&&0===a&&0!==e.tag&&(e.suspendedLanes|=l&~(o&~t))}(e,n,l|=Rr,i,s,u),e===ru&&(au=ru=null,lu=0),Ru=t,Nu=e,Pu=n,Tu=l,_u=a,Ou=r,0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?(e.callbackNode=null,e.callbackPriority=0,J(le,(function(){return sc(),null}))):(e.callbackNode=null,e.callbackPriority=0),r=0!==(13878&t.flags),0!==(13878&t.subtreeFlags)||r){r=z.T,z.T=null,a=A.p,A.p=2,i=nu,nu|=4;try{!function(e,t){if(e=e.containerInfo,td=nf,tr(e=er(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(g){n=null;break e}var i=0,s=-1,u=-1,c=0,d=0,f=e,p=null;t:for(;;){for(var h;f!==n||0!==a&&3!==f.nodeType||(s=i+a),f!==l||0!==r&&3!==f.nodeType||(u=i+r),3===f.nodeType&&(i+=f.nodeValue.length),null!==(h=f.firstChild);)p=f,f=h;for(;;){if(f===e)break t;if(p===n&&++c===a&&(s=i),p===l&&++d===r&&(u=i),null!==(h=f.nextSibling))break;p=(f=p).parentNode}f=h}n=-1===s||-1===u?null:{start:s,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(nd={focusedElem:e,selectionRange:n},nf=!1,xs=t;null!==xs;)if(e=(t=xs).child,0!==(1024&t.subtreeFlags)&&null!==e)e.return=t,xs=e;else for(;null!==xs;){switch(l=(t=xs).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==l){e=void 0,n=t,a=l.memoizedProps,l=l.memoizedState,r=n.stateNode;try{var m=gi(n.type,a,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(m,l),r.__reactInternalSnapshotBeforeUpdate=e}catch(y){cc(n,n.return,y)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))md(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":md(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(o(163))}if(null!==(e=t.sibling)){e.return=t.return,xs=e;break}xs=t.return}}(e,t)}finally{nu=i,A.p=a,z.T=r}}Cu=1,rc(),ac(),lc()}}function rc(){if(1===Cu){Cu=0;var e=Nu,t=Ru,n=0!==(13878&t.flags);if(0!==(13878&t.subtreeFlags)||n){n=z.T,z.T=null;var r=A.p;A.p=2;var a=nu;nu|=4;try{zs(t,e);var l=nd,o=er(e.containerInfo),i=l.focusedElem,s=l.selectionRange;if(o!==i&&i&&i.ownerDocument&&Zn(i.ownerDocument.documentElement,i)){if(null!==s&&tr(i)){var u=s.start,c=s.end;if(void 0===c&&(c=u),"selectionStart"in i)i.selectionStart=u,i.selectionEnd=Math.min(c,i.value.length);else{var d=i.ownerDocument||document,f=d&&d.defaultView||window;if(f.getSelection){var p=f.getSelection(),h=i.textContent.length,m=Math.min(s.start,h),g=void 0===s.end?m:Math.min(s.end,h);!p.extend&&m>g&&(o=g,g=m,m=o);var y=Gn(i,m),v=Gn(i,g);if(y&&v&&(1!==p.rangeCount||p.anchorNode!==y.node||p.anchorOffset!==y.offset||p.focusNode!==v.node||p.focusOffset!==v.offset)){var b=d.createRange();b.setStart(y.node,y.offset),p.removeAllRanges(),m>g?(p.addRange(b),p.extend(v.node,v.offset)):(b.setEnd(v.node,v.offset),p.addRange(b))}}}}for(d=[],p=i;p=p.parentNode;)1===p.nodeType&&d.push({element:p,left:p.scrollLeft,top:p.scrollTop});for("function"===typeof i.focus&&i.focus(),i=0;i<d.length;i++){var w=d[i];w.element.scrollLeft=w.left,w.element.scrollTop=w.top}}nf=!!td,nd=td=null}finally{nu=a,A.p=r,z.T=n}}e.current=t,Cu=2}}function ac(){if(2===Cu){Cu=0;var e=Nu,t=Ru,n=0!==(8772&t.flags);if(0!==(8772&t.subtreeFlags)||n){n=z.T,z.T=null;var r=A.p;A.p=2;var a=nu;nu|=4;try{Es(e,t.alternate,t)}finally{nu=a,A.p=r,z.T=n}}Cu=3}}function lc(){if(4===Cu||3===Cu){Cu=0,ee();var e=Nu,t=Ru,n=Pu,r=Ou;0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?Cu=5:(Cu=0,Ru=Nu=null,oc(e,e.pendingLanes));var a=e.pendingLanes;if(0===a&&(Eu=null),Te(n),t=t.stateNode,de&&"function"===typeof de.onCommitFiberRoot)try{de.onCommitFiberRoot(ce,t,void 0,128===(128&t.current.flags))}catch(s){}if(null!==r){t=z.T,a=A.p,A.p=2,z.T=null;try{for(var l=e.onRecoverableError,o=0;o<r.length;o++){var i=r[o];l(i.value,{componentStack:i.stack})}}finally{z.T=t,A.p=a}}0!==(3&Pu)&&ic(),Sc(e),a=e.pendingLanes,0!==(4194090&n)&&0!==(42&a)?e===ju?Lu++:(Lu=0,ju=e):Lu=0,xc(0,!1)}}function oc(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,za(t)))}function ic(e){return rc(),ac(),lc(),sc()}function sc(){if(5!==Cu)return!1;var e=Nu,t=Tu;Tu=0;var n=Te(Pu),r=z.T,a=A.p;try{A.p=32>n?32:n,z.T=null,n=_u,_u=null;var l=Nu,i=Pu;if(Cu=0,Ru=Nu=null,Pu=0,0!==(6&nu))throw Error(o(331));var s=nu;if(nu|=4,Js(l.current),Hs(l,l.current,i,n),nu=s,xc(0,!1),de&&"function"===typeof de.onPostCommitFiberRoot)try{de.onPostCommitFiberRoot(ce,l)}catch(u){}return!0}finally{A.p=a,z.T=r,oc(e,t)}}function uc(e,t,n){t=Er(n,t),null!==(e=ll(e,t=xi(e.stateNode,t,2),2))&&(Ce(e,2),Sc(e))}function cc(e,t,n){if(3===e.tag)uc(e,e,n);else for(;null!==t;){if(3===t.tag){uc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Eu||!Eu.has(r))){e=Er(n,e),null!==(r=ll(t,n=Ei(2),2))&&(Ci(n,r,t,e),Ce(r,2),Sc(r));break}}t=t.return}}function dc(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new tu;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(cu=!0,a.add(n),e=fc.bind(null,e,t,n),t.then(e,e))}function fc(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,ru===e&&(lu&n)===n&&(4===fu||3===fu&&(62914560&lu)===lu&&300>te()-ku?0===(2&nu)&&Hu(e,0):mu|=n,yu===lu&&(yu=0)),Sc(e)}function pc(e,t){0===t&&(t=xe()),null!==(e=Or(e,t))&&(Ce(e,t),Sc(e))}function hc(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),pc(e,n)}function mc(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(o(314))}null!==r&&r.delete(t),pc(e,n)}var gc=null,yc=null,vc=!1,bc=!1,wc=!1,kc=0;function Sc(e){e!==yc&&null===e.next&&(null===yc?gc=yc=e:yc=yc.next=e),bc=!0,vc||(vc=!0,dd((function(){0!==(6&nu)?J(re,Ec):Cc()})))}function xc(e,t){if(!wc&&bc){wc=!0;do{for(var n=!1,r=gc;null!==r;){if(!t)if(0!==e){var a=r.pendingLanes;if(0===a)var l=0;else{var o=r.suspendedLanes,i=r.pingedLanes;l=(1<<31-pe(42|e)+1)-1,l=201326741&(l&=a&~(o&~i))?201326741&l|1:l?2|l:0}0!==l&&(n=!0,Pc(r,l))}else l=lu,0===(3&(l=be(r,r===ru?l:0,null!==r.cancelPendingCommit||-1!==r.timeoutHandle)))||we(r,l)||(n=!0,Pc(r,l));r=r.next}}while(n);wc=!1}}function Ec(){Cc()}function Cc(){bc=vc=!1;var e=0;0!==kc&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==id&&(id=e,!0);return id=null,!1}()&&(e=kc),kc=0);for(var t=te(),n=null,r=gc;null!==r;){var a=r.next,l=Nc(r,t);0===l?(r.next=null,null===n?gc=a:n.next=a,null===a&&(yc=n)):(n=r,(0!==e||0!==(3&l))&&(bc=!0)),r=a}xc(e,!1)}function Nc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,l=-62914561&e.pendingLanes;0<l;){var o=31-pe(l),i=1<<o,s=a[o];-1===s?0!==(i&n)&&0===(i&r)||(a[o]=ke(i,t)):s<=t&&(e.expiredLanes|=i),l&=~i}if(n=lu,n=be(e,e===(t=ru)?n:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle),r=e.callbackNode,0===n||e===t&&(2===ou||9===ou)||null!==e.cancelPendingCommit)return null!==r&&null!==r&&G(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||we(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&G(r),Te(n)){case 2:case 8:n=ae;break;case 32:default:n=le;break;case 268435456:n=ie}return r=Rc.bind(null,e),n=J(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&G(r),e.callbackPriority=2,e.callbackNode=null,2}function Rc(e,t){if(0!==Cu&&5!==Cu)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(ic()&&e.callbackNode!==n)return null;var r=lu;return 0===(r=be(e,e===ru?r:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle))?null:(Du(e,r,t),Nc(e,te()),null!=e.callbackNode&&e.callbackNode===n?Rc.bind(null,e):null)}function Pc(e,t){if(ic())return null;Du(e,t,!0)}function Tc(){return 0===kc&&(kc=Se()),kc}function _c(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Tt(""+e)}function Oc(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var Lc=0;Lc<kr.length;Lc++){var jc=kr[Lc];Sr(jc.toLowerCase(),"on"+(jc[0].toUpperCase()+jc.slice(1)))}Sr(pr,"onAnimationEnd"),Sr(hr,"onAnimationIteration"),Sr(mr,"onAnimationStart"),Sr("dblclick","onDoubleClick"),Sr("focusin","onFocus"),Sr("focusout","onBlur"),Sr(gr,"onTransitionRun"),Sr(yr,"onTransitionStart"),Sr(vr,"onTransitionCancel"),Sr(br,"onTransitionEnd"),Ye("onMouseEnter",["mouseout","mouseover"]),Ye("onMouseLeave",["mouseout","mouseover"]),Ye("onPointerEnter",["pointerout","pointerover"]),Ye("onPointerLeave",["pointerout","pointerover"]),Ke("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ke("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ke("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ke("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ke("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ke("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var zc="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ac=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(zc));function Fc(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var l=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],s=i.instance,u=i.currentTarget;if(i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=u;try{l(a)}catch(c){yi(c)}a.currentTarget=null,l=s}else for(o=0;o<r.length;o++){if(s=(i=r[o]).instance,u=i.currentTarget,i=i.listener,s!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=u;try{l(a)}catch(c){yi(c)}a.currentTarget=null,l=s}}}}function Dc(e,t){var n=t[Ae];void 0===n&&(n=t[Ae]=new Set);var r=e+"__bubble";n.has(r)||(Ic(t,e,2,!1),n.add(r))}function Mc(e,t,n){var r=0;t&&(r|=4),Ic(n,e,r,t)}var Uc="_reactListening"+Math.random().toString(36).slice(2);function $c(e){if(!e[Uc]){e[Uc]=!0,Ve.forEach((function(t){"selectionchange"!==t&&(Ac.has(t)||Mc(t,!1,e),Mc(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Uc]||(t[Uc]=!0,Mc("selectionchange",!1,t))}}function Ic(e,t,n,r){switch(cf(t)){case 2:var a=rf;break;case 8:a=af;break;default:a=lf}n=a.bind(null,t,n,e),a=void 0,!Ut||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function Bc(e,t,n,r,a){var l=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===a)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&o.stateNode.containerInfo===a)return;o=o.return}for(;null!==i;){if(null===(o=Ie(i)))return;if(5===(u=o.tag)||6===u||26===u||27===u){r=l=o;continue e}i=i.parentNode}}r=r.return}Ft((function(){var r=l,a=Ot(n),o=[];e:{var i=wr.get(e);if(void 0!==i){var u=Zt,c=e;switch(e){case"keypress":if(0===qt(n))break e;case"keydown":case"keyup":u=mn;break;case"focusin":c="focus",u=ln;break;case"focusout":c="blur",u=ln;break;case"beforeblur":case"afterblur":u=ln;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=rn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=an;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=yn;break;case pr:case hr:case mr:u=on;break;case br:u=vn;break;case"scroll":case"scrollend":u=tn;break;case"wheel":u=bn;break;case"copy":case"cut":case"paste":u=sn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=gn;break;case"toggle":case"beforetoggle":u=wn}var d=0!==(4&t),f=!d&&("scroll"===e||"scrollend"===e),p=d?null!==i?i+"Capture":null:i;d=[];for(var h,m=r;null!==m;){var g=m;if(h=g.stateNode,5!==(g=g.tag)&&26!==g&&27!==g||null===h||null===p||null!=(g=Dt(m,p))&&d.push(Hc(m,g,h)),f)break;m=m.return}0<d.length&&(i=new u(i,c,null,n,a),o.push({event:i,listeners:d}))}}if(0===(7&t)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===_t||!(c=n.relatedTarget||n.fromElement)||!Ie(c)&&!c[ze])&&(u||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(c=(c=n.relatedTarget||n.toElement)?Ie(c):null)&&(f=s(c),d=c.tag,c!==f||5!==d&&27!==d&&6!==d)&&(c=null)):(u=null,c=r),u!==c)){if(d=rn,g="onMouseLeave",p="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(d=gn,g="onPointerLeave",p="onPointerEnter",m="pointer"),f=null==u?i:He(u),h=null==c?i:He(c),(i=new d(g,m+"leave",u,n,a)).target=f,i.relatedTarget=h,g=null,Ie(a)===r&&((d=new d(p,m+"enter",c,n,a)).target=h,d.relatedTarget=f,g=d),f=g,u&&c)e:{for(p=c,m=0,h=d=u;h;h=qc(h))m++;for(h=0,g=p;g;g=qc(g))h++;for(;0<m-h;)d=qc(d),m--;for(;0<h-m;)p=qc(p),h--;for(;m--;){if(d===p||null!==p&&d===p.alternate)break e;d=qc(d),p=qc(p)}d=null}else d=null;null!==u&&Vc(o,i,u,d,!1),null!==c&&null!==f&&Vc(o,f,c,d,!0)}if("select"===(u=(i=r?He(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var y=Mn;else if(Ln(i))if(Un)y=Kn;else{y=Vn;var v=qn}else!(u=i.nodeName)||"input"!==u.toLowerCase()||"checkbox"!==i.type&&"radio"!==i.type?r&&Nt(r.elementType)&&(y=Mn):y=Qn;switch(y&&(y=y(e,r))?jn(o,y,n,a):(v&&v(e,i,r),"focusout"===e&&r&&"number"===i.type&&null!=r.memoizedProps.value&&vt(i,"number",i.value)),v=r?He(r):window,e){case"focusin":(Ln(v)||"true"===v.contentEditable)&&(rr=v,ar=r,lr=null);break;case"focusout":lr=ar=rr=null;break;case"mousedown":or=!0;break;case"contextmenu":case"mouseup":case"dragend":or=!1,ir(o,n,a);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":ir(o,n,a)}var b;if(Sn)e:{switch(e){case"compositionstart":var w="onCompositionStart";break e;case"compositionend":w="onCompositionEnd";break e;case"compositionupdate":w="onCompositionUpdate";break e}w=void 0}else _n?Pn(e,n)&&(w="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(w="onCompositionStart");w&&(Cn&&"ko"!==n.locale&&(_n||"onCompositionStart"!==w?"onCompositionEnd"===w&&_n&&(b=Wt()):(Bt="value"in(It=a)?It.value:It.textContent,_n=!0)),0<(v=Wc(r,w)).length&&(w=new un(w,e,null,n,a),o.push({event:w,listeners:v}),b?w.data=b:null!==(b=Tn(n))&&(w.data=b))),(b=En?function(e,t){switch(e){case"compositionend":return Tn(t);case"keypress":return 32!==t.which?null:(Rn=!0,Nn);case"textInput":return(e=t.data)===Nn&&Rn?null:e;default:return null}}(e,n):function(e,t){if(_n)return"compositionend"===e||!Sn&&Pn(e,t)?(e=Wt(),Ht=Bt=It=null,_n=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Cn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(w=Wc(r,"onBeforeInput")).length&&(v=new un("onBeforeInput","beforeinput",null,n,a),o.push({event:v,listeners:w}),v.data=b)),function(e,t,n,r,a){if("submit"===t&&n&&n.stateNode===a){var l=_c((a[je]||null).action),o=r.submitter;o&&null!==(t=(t=o[je]||null)?_c(t.formAction):o.getAttribute("formAction"))&&(l=t,o=null);var i=new Zt("action","action",null,r,a);e.push({event:i,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==kc){var e=o?Oc(a,o):new FormData(a);Oo(n,{pending:!0,data:e,method:a.method,action:l},null,e)}}else"function"===typeof l&&(i.preventDefault(),e=o?Oc(a,o):new FormData(a),Oo(n,{pending:!0,data:e,method:a.method,action:l},l,e))},currentTarget:a}]})}}(o,e,r,n,a)}Fc(o,t)}))}function Hc(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Wc(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,l=a.stateNode;if(5!==(a=a.tag)&&26!==a&&27!==a||null===l||(null!=(a=Dt(e,n))&&r.unshift(Hc(e,a,l)),null!=(a=Dt(e,t))&&r.push(Hc(e,a,l))),3===e.tag)return r;e=e.return}return[]}function qc(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function Vc(e,t,n,r,a){for(var l=t._reactName,o=[];null!==n&&n!==r;){var i=n,s=i.alternate,u=i.stateNode;if(i=i.tag,null!==s&&s===r)break;5!==i&&26!==i&&27!==i||null===u||(s=u,a?null!=(u=Dt(n,l))&&o.unshift(Hc(n,u,s)):a||null!=(u=Dt(n,l))&&o.push(Hc(n,u,s))),n=n.return}0!==o.length&&e.push({event:t,listeners:o})}var Qc=/\r\n?/g,Kc=/\u0000|\uFFFD/g;function Yc(e){return("string"===typeof e?e:""+e).replace(Qc,"\n").replace(Kc,"")}function Xc(e,t){return t=Yc(t),Yc(e)===t}function Jc(){}function Gc(e,t,n,r,a,l){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||St(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&St(e,""+r);break;case"className":nt(e,"class",r);break;case"tabIndex":nt(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":nt(e,n,r);break;case"style":Ct(e,r,l);break;case"data":if("object"!==t){nt(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof l&&("formAction"===n?("input"!==t&&Gc(e,t,"name",a.name,a,null),Gc(e,t,"formEncType",a.formEncType,a,null),Gc(e,t,"formMethod",a.formMethod,a,null),Gc(e,t,"formTarget",a.formTarget,a,null)):(Gc(e,t,"encType",a.encType,a,null),Gc(e,t,"method",a.method,a,null),Gc(e,t,"target",a.target,a,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Jc);break;case"onScroll":null!=r&&Dc("scroll",e);break;case"onScrollEnd":null!=r&&Dc("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Tt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Dc("beforetoggle",e),Dc("toggle",e),tt(e,"popover",r);break;case"xlinkActuate":rt(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":rt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":rt(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":rt(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":rt(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":rt(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":rt(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":rt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":rt(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":tt(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&tt(e,n=Rt.get(n)||n,r)}}function Zc(e,t,n,r,a,l){switch(n){case"style":Ct(e,r,l);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"children":"string"===typeof r?St(e,r):("number"===typeof r||"bigint"===typeof r)&&St(e,""+r);break;case"onScroll":null!=r&&Dc("scroll",e);break;case"onScrollEnd":null!=r&&Dc("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Jc);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:Qe.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(a=n.endsWith("Capture"),t=n.slice(2,a?n.length-7:void 0),"function"===typeof(l=null!=(l=e[je]||null)?l[n]:null)&&e.removeEventListener(t,l,a),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):tt(e,n,r):("function"!==typeof l&&null!==l&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,a)))}}function ed(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Dc("error",e),Dc("load",e);var r,a=!1,l=!1;for(r in n)if(n.hasOwnProperty(r)){var i=n[r];if(null!=i)switch(r){case"src":a=!0;break;case"srcSet":l=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Gc(e,t,r,i,n,null)}}return l&&Gc(e,t,"srcSet",n.srcSet,n,null),void(a&&Gc(e,t,"src",n.src,n,null));case"input":Dc("invalid",e);var s=r=i=l=null,u=null,c=null;for(a in n)if(n.hasOwnProperty(a)){var d=n[a];if(null!=d)switch(a){case"name":l=d;break;case"type":i=d;break;case"checked":u=d;break;case"defaultChecked":c=d;break;case"value":r=d;break;case"defaultValue":s=d;break;case"children":case"dangerouslySetInnerHTML":if(null!=d)throw Error(o(137,t));break;default:Gc(e,t,a,d,n,null)}}return yt(e,r,s,u,c,i,l,!1),void dt(e);case"select":for(l in Dc("invalid",e),a=i=r=null,n)if(n.hasOwnProperty(l)&&null!=(s=n[l]))switch(l){case"value":r=s;break;case"defaultValue":i=s;break;case"multiple":a=s;default:Gc(e,t,l,s,n,null)}return t=r,n=i,e.multiple=!!a,void(null!=t?bt(e,!!a,t,!1):null!=n&&bt(e,!!a,n,!0));case"textarea":for(i in Dc("invalid",e),r=l=a=null,n)if(n.hasOwnProperty(i)&&null!=(s=n[i]))switch(i){case"value":a=s;break;case"defaultValue":l=s;break;case"children":r=s;break;case"dangerouslySetInnerHTML":if(null!=s)throw Error(o(91));break;default:Gc(e,t,i,s,n,null)}return kt(e,a,l,r),void dt(e);case"option":for(u in n)if(n.hasOwnProperty(u)&&null!=(a=n[u]))if("selected"===u)e.selected=a&&"function"!==typeof a&&"symbol"!==typeof a;else Gc(e,t,u,a,n,null);return;case"dialog":Dc("beforetoggle",e),Dc("toggle",e),Dc("cancel",e),Dc("close",e);break;case"iframe":case"object":Dc("load",e);break;case"video":case"audio":for(a=0;a<zc.length;a++)Dc(zc[a],e);break;case"image":Dc("error",e),Dc("load",e);break;case"details":Dc("toggle",e);break;case"embed":case"source":case"link":Dc("error",e),Dc("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(c in n)if(n.hasOwnProperty(c)&&null!=(a=n[c]))switch(c){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:Gc(e,t,c,a,n,null)}return;default:if(Nt(t)){for(d in n)n.hasOwnProperty(d)&&(void 0!==(a=n[d])&&Zc(e,t,d,a,n,void 0));return}}for(s in n)n.hasOwnProperty(s)&&(null!=(a=n[s])&&Gc(e,t,s,a,n,null))}var td=null,nd=null;function rd(e){return 9===e.nodeType?e:e.ownerDocument}function ad(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function ld(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function od(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var id=null;var sd="function"===typeof setTimeout?setTimeout:void 0,ud="function"===typeof clearTimeout?clearTimeout:void 0,cd="function"===typeof Promise?Promise:void 0,dd="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof cd?function(e){return cd.resolve(null).then(e).catch(fd)}:sd;function fd(e){setTimeout((function(){throw e}))}function pd(e){return"head"===e}function hd(e,t){var n=t,r=0,a=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&8===l.nodeType)if("/$"===(n=l.data)){if(0<r&&8>r){n=r;var o=e.ownerDocument;if(1&n&&kd(o.documentElement),2&n&&kd(o.body),4&n)for(kd(n=o.head),o=n.firstChild;o;){var i=o.nextSibling,s=o.nodeName;o[Ue]||"SCRIPT"===s||"STYLE"===s||"LINK"===s&&"stylesheet"===o.rel.toLowerCase()||n.removeChild(o),o=i}}if(0===a)return e.removeChild(l),void Pf(t);a--}else"$"===n||"$?"===n||"$!"===n?a++:r=n.charCodeAt(0)-48;else r=0;n=l}while(n);Pf(t)}function md(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":md(n),$e(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function gd(e){return"$!"===e.data||"$?"===e.data&&"complete"===e.ownerDocument.readyState}function yd(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}var vd=null;function bd(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function wd(e,t,n){switch(t=rd(n),e){case"html":if(!(e=t.documentElement))throw Error(o(452));return e;case"head":if(!(e=t.head))throw Error(o(453));return e;case"body":if(!(e=t.body))throw Error(o(454));return e;default:throw Error(o(451))}}function kd(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);$e(e)}var Sd=new Map,xd=new Set;function Ed(e){return"function"===typeof e.getRootNode?e.getRootNode():9===e.nodeType?e:e.ownerDocument}var Cd=A.d;A.d={f:function(){var e=Cd.f(),t=Iu();return e||t},r:function(e){var t=Be(e);null!==t&&5===t.tag&&"form"===t.type?jo(t):Cd.r(e)},D:function(e){Cd.D(e),Rd("dns-prefetch",e,null)},C:function(e,t){Cd.C(e,t),Rd("preconnect",e,t)},L:function(e,t,n){Cd.L(e,t,n);var r=Nd;if(r&&e&&t){var a='link[rel="preload"][as="'+mt(t)+'"]';"image"===t&&n&&n.imageSrcSet?(a+='[imagesrcset="'+mt(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(a+='[imagesizes="'+mt(n.imageSizes)+'"]')):a+='[href="'+mt(e)+'"]';var l=a;switch(t){case"style":l=Td(e);break;case"script":l=Ld(e)}Sd.has(l)||(e=f({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),Sd.set(l,e),null!==r.querySelector(a)||"style"===t&&r.querySelector(_d(l))||"script"===t&&r.querySelector(jd(l))||(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}},m:function(e,t){Cd.m(e,t);var n=Nd;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",a='link[rel="modulepreload"][as="'+mt(r)+'"][href="'+mt(e)+'"]',l=a;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":l=Ld(e)}if(!Sd.has(l)&&(e=f({rel:"modulepreload",href:e},t),Sd.set(l,e),null===n.querySelector(a))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(jd(l)))return}ed(r=n.createElement("link"),"link",e),qe(r),n.head.appendChild(r)}}},X:function(e,t){Cd.X(e,t);var n=Nd;if(n&&e){var r=We(n).hoistableScripts,a=Ld(e),l=r.get(a);l||((l=n.querySelector(jd(a)))||(e=f({src:e,async:!0},t),(t=Sd.get(a))&&Dd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}},S:function(e,t,n){Cd.S(e,t,n);var r=Nd;if(r&&e){var a=We(r).hoistableStyles,l=Td(e);t=t||"default";var o=a.get(l);if(!o){var i={loading:0,preload:null};if(o=r.querySelector(_d(l)))i.loading=5;else{e=f({rel:"stylesheet",href:e,"data-precedence":t},n),(n=Sd.get(l))&&Fd(e,n);var s=o=r.createElement("link");qe(s),ed(s,"link",e),s._p=new Promise((function(e,t){s.onload=e,s.onerror=t})),s.addEventListener("load",(function(){i.loading|=1})),s.addEventListener("error",(function(){i.loading|=2})),i.loading|=4,Ad(o,t,r)}o={type:"stylesheet",instance:o,count:1,state:i},a.set(l,o)}}},M:function(e,t){Cd.M(e,t);var n=Nd;if(n&&e){var r=We(n).hoistableScripts,a=Ld(e),l=r.get(a);l||((l=n.querySelector(jd(a)))||(e=f({src:e,async:!0,type:"module"},t),(t=Sd.get(a))&&Dd(e,t),qe(l=n.createElement("script")),ed(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}}};var Nd="undefined"===typeof document?null:document;function Rd(e,t,n){var r=Nd;if(r&&"string"===typeof t&&t){var a=mt(t);a='link[rel="'+e+'"][href="'+a+'"]',"string"===typeof n&&(a+='[crossorigin="'+n+'"]'),xd.has(a)||(xd.add(a),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(a)&&(ed(t=r.createElement("link"),"link",e),qe(t),r.head.appendChild(t)))}}function Pd(e,t,n,r){var a,l,i,s,u=(u=W.current)?Ed(u):null;if(!u)throw Error(o(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=Td(n.href),(r=(n=We(u).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=Td(n.href);var c=We(u).hoistableStyles,d=c.get(e);if(d||(u=u.ownerDocument||u,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},c.set(e,d),(c=u.querySelector(_d(e)))&&!c._p&&(d.instance=c,d.state.loading=5),Sd.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},Sd.set(e,n),c||(a=u,l=e,i=n,s=d.state,a.querySelector('link[rel="preload"][as="style"]['+l+"]")?s.loading=1:(l=a.createElement("link"),s.preload=l,l.addEventListener("load",(function(){return s.loading|=1})),l.addEventListener("error",(function(){return s.loading|=2})),ed(l,"link",i),qe(l),a.head.appendChild(l))))),t&&null===r)throw Error(o(528,""));return d}if(t&&null!==r)throw Error(o(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Ld(n),(r=(n=We(u).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,e))}}function Td(e){return'href="'+mt(e)+'"'}function _d(e){return'link[rel="stylesheet"]['+e+"]"}function Od(e){return f({},e,{"data-precedence":e.precedence,precedence:null})}function Ld(e){return'[src="'+mt(e)+'"]'}function jd(e){return"script[async]"+e}function zd(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+mt(n.href)+'"]');if(r)return t.instance=r,qe(r),r;var a=f({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return qe(r=(e.ownerDocument||e).createElement("style")),ed(r,"style",a),Ad(r,n.precedence,e),t.instance=r;case"stylesheet":a=Td(n.href);var l=e.querySelector(_d(a));if(l)return t.state.loading|=4,t.instance=l,qe(l),l;r=Od(n),(a=Sd.get(a))&&Fd(r,a),qe(l=(e.ownerDocument||e).createElement("link"));var i=l;return i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),ed(l,"link",r),t.state.loading|=4,Ad(l,n.precedence,e),t.instance=l;case"script":return l=Ld(n.src),(a=e.querySelector(jd(l)))?(t.instance=a,qe(a),a):(r=n,(a=Sd.get(l))&&Dd(r=f({},n),a),qe(a=(e=e.ownerDocument||e).createElement("script")),ed(a,"link",r),e.head.appendChild(a),t.instance=a);case"void":return null;default:throw Error(o(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,Ad(r,n.precedence,e));return t.instance}function Ad(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),a=r.length?r[r.length-1]:null,l=a,o=0;o<r.length;o++){var i=r[o];if(i.dataset.precedence===t)l=i;else if(l!==a)break}l?l.parentNode.insertBefore(e,l.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Fd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function Dd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var Md=null;function Ud(e,t,n){if(null===Md){var r=new Map,a=Md=new Map;a.set(n,r)}else(r=(a=Md).get(n))||(r=new Map,a.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),a=0;a<n.length;a++){var l=n[a];if(!(l[Ue]||l[Le]||"link"===e&&"stylesheet"===l.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==l.namespaceURI){var o=l.getAttribute(t)||"";o=e+o;var i=r.get(o);i?i.push(l):r.set(o,[l])}}return r}function $d(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function Id(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Bd=null;function Hd(){}function Wd(){if(this.count--,0===this.count)if(this.stylesheets)Vd(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var qd=null;function Vd(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,qd=new Map,t.forEach(Qd,e),qd=null,Wd.call(e))}function Qd(e,t){if(!(4&t.state.loading)){var n=qd.get(e);if(n)var r=n.get(null);else{n=new Map,qd.set(e,n);for(var a=e.querySelectorAll("link[data-precedence],style[data-precedence]"),l=0;l<a.length;l++){var o=a[l];"LINK"!==o.nodeName&&"not all"===o.getAttribute("media")||(n.set(o.dataset.precedence,o),r=o)}r&&n.set(null,r)}o=(a=t.instance).getAttribute("data-precedence"),(l=n.get(o)||r)===r&&n.set(null,a),n.set(o,a),this.count++,r=Wd.bind(this),a.addEventListener("load",r),a.addEventListener("error",r),l?l.parentNode.insertBefore(a,l.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(a,e.firstChild),t.state.loading|=4}}var Kd={$$typeof:k,Provider:null,Consumer:null,_currentValue:F,_currentValue2:F,_threadCount:0};function Yd(e,t,n,r,a,l,o,i){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ee(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ee(0),this.hiddenUpdates=Ee(null),this.identifierPrefix=r,this.onUncaughtError=a,this.onCaughtError=l,this.onRecoverableError=o,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function Xd(e,t,n,r,a,l,o,i,s,u,c,d){return e=new Yd(e,t,n,o,i,s,u,d),t=1,!0===l&&(t|=24),l=Fr(3,null,null,t),e.current=l,l.stateNode=e,(t=ja()).refCount++,e.pooledCache=t,t.refCount++,l.memoizedState={element:r,isDehydrated:n,cache:t},nl(l),e}function Jd(e){return e?e=zr:zr}function Gd(e,t,n,r,a,l){a=Jd(a),null===r.context?r.context=a:r.pendingContext=a,(r=al(t)).payload={element:n},null!==(l=void 0===l?null:l)&&(r.callback=l),null!==(n=ll(e,r,t))&&(Fu(n,0,t),ol(n,e,t))}function Zd(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function ef(e,t){Zd(e,t),(e=e.alternate)&&Zd(e,t)}function tf(e){if(13===e.tag){var t=Or(e,67108864);null!==t&&Fu(t,0,67108864),ef(e,67108864)}}var nf=!0;function rf(e,t,n,r){var a=z.T;z.T=null;var l=A.p;try{A.p=2,lf(e,t,n,r)}finally{A.p=l,z.T=a}}function af(e,t,n,r){var a=z.T;z.T=null;var l=A.p;try{A.p=8,lf(e,t,n,r)}finally{A.p=l,z.T=a}}function lf(e,t,n,r){if(nf){var a=of(r);if(null===a)Bc(e,t,r,sf,n),bf(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return ff=wf(ff,e,t,n,r,a),!0;case"dragenter":return pf=wf(pf,e,t,n,r,a),!0;case"mouseover":return hf=wf(hf,e,t,n,r,a),!0;case"pointerover":var l=a.pointerId;return mf.set(l,wf(mf.get(l)||null,e,t,n,r,a)),!0;case"gotpointercapture":return l=a.pointerId,gf.set(l,wf(gf.get(l)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(bf(e,r),4&t&&-1<vf.indexOf(e)){for(;null!==a;){var l=Be(a);if(null!==l)switch(l.tag){case 3:if((l=l.stateNode).current.memoizedState.isDehydrated){var o=ve(l.pendingLanes);if(0!==o){var i=l;for(i.pendingLanes|=2,i.entangledLanes|=2;o;){var s=1<<31-pe(o);i.entanglements[1]|=s,o&=~s}Sc(l),0===(6&nu)&&(Su=te()+500,xc(0,!1))}}break;case 13:null!==(i=Or(l,2))&&Fu(i,0,2),Iu(),ef(l,2)}if(null===(l=of(r))&&Bc(e,t,r,sf,n),l===a)break;a=l}null!==a&&r.stopPropagation()}else Bc(e,t,r,null,n)}}function of(e){return uf(e=Ot(e))}var sf=null;function uf(e){if(sf=null,null!==(e=Ie(e))){var t=s(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=u(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return sf=e,null}function cf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ne()){case re:return 2;case ae:return 8;case le:case oe:return 32;case ie:return 268435456;default:return 32}default:return 32}}var df=!1,ff=null,pf=null,hf=null,mf=new Map,gf=new Map,yf=[],vf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function bf(e,t){switch(e){case"focusin":case"focusout":ff=null;break;case"dragenter":case"dragleave":pf=null;break;case"mouseover":case"mouseout":hf=null;break;case"pointerover":case"pointerout":mf.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":gf.delete(t.pointerId)}}function wf(e,t,n,r,a,l){return null===e||e.nativeEvent!==l?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:l,targetContainers:[a]},null!==t&&(null!==(t=Be(t))&&tf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function kf(e){var t=Ie(e.target);if(null!==t){var n=s(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=u(n)))return e.blockedOn=t,void function(e,t){var n=A.p;try{return A.p=e,t()}finally{A.p=n}}(e.priority,(function(){if(13===n.tag){var e=zu();e=Pe(e);var t=Or(n,e);null!==t&&Fu(t,0,e),ef(n,e)}}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Sf(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=of(e.nativeEvent);if(null!==n)return null!==(t=Be(n))&&tf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);_t=r,n.target.dispatchEvent(r),_t=null,t.shift()}return!0}function xf(e,t,n){Sf(e)&&n.delete(t)}function Ef(){df=!1,null!==ff&&Sf(ff)&&(ff=null),null!==pf&&Sf(pf)&&(pf=null),null!==hf&&Sf(hf)&&(hf=null),mf.forEach(xf),gf.forEach(xf)}function Cf(e,t){e.blockedOn===t&&(e.blockedOn=null,df||(df=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,Ef)))}var Nf=null;function Rf(e){Nf!==e&&(Nf=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,(function(){Nf===e&&(Nf=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],a=e[t+2];if("function"!==typeof r){if(null===uf(r||n))continue;break}var l=Be(n);null!==l&&(e.splice(t,3),t-=3,Oo(l,{pending:!0,data:a,method:n.method,action:r},r,a))}})))}function Pf(e){function t(t){return Cf(t,e)}null!==ff&&Cf(ff,e),null!==pf&&Cf(pf,e),null!==hf&&Cf(hf,e),mf.forEach(t),gf.forEach(t);for(var n=0;n<yf.length;n++){var r=yf[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<yf.length&&null===(n=yf[0]).blockedOn;)kf(n),null===n.blockedOn&&yf.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var a=n[r],l=n[r+1],o=a[je]||null;if("function"===typeof l)o||Rf(n);else if(o){var i=null;if(l&&l.hasAttribute("formAction")){if(a=l,o=l[je]||null)i=o.formAction;else if(null!==uf(a))continue}else i=o.action;"function"===typeof i?n[r+1]=i:(n.splice(r,3),r-=3),Rf(n)}}}function Tf(e){this._internalRoot=e}function _f(e){this._internalRoot=e}_f.prototype.render=Tf.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Gd(t.current,zu(),e,t,null,null)},_f.prototype.unmount=Tf.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;Gd(e.current,2,null,e,null,null),Iu(),t[ze]=null}},_f.prototype.unstable_scheduleHydration=function(e){if(e){var t=_e();e={blockedOn:null,target:e,priority:t};for(var n=0;n<yf.length&&0!==t&&t<yf[n].priority;n++);yf.splice(n,0,e),0===n&&kf(e)}};var Of=a.version;if("19.1.0"!==Of)throw Error(o(527,Of,"19.1.0"));A.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=s(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return c(a),e;if(l===r)return c(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,u=a.child;u;){if(u===n){i=!0,n=a,r=l;break}if(u===r){i=!0,r=a,n=l;break}u=u.sibling}if(!i){for(u=l.child;u;){if(u===n){i=!0,n=l,r=a;break}if(u===r){i=!0,r=l,n=a;break}u=u.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?d(e):null)?null:e.stateNode};var Lf={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:z,reconcilerVersion:"19.1.0"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var jf=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!jf.isDisabled&&jf.supportsFiber)try{ce=jf.inject(Lf),de=jf}catch(Af){}}t.createRoot=function(e,t){if(!i(e))throw Error(o(299));var n=!1,r="",a=vi,l=bi,s=wi;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(a=t.onUncaughtError),void 0!==t.onCaughtError&&(l=t.onCaughtError),void 0!==t.onRecoverableError&&(s=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Xd(e,1,!1,null,0,n,r,a,l,s,0,null),e[ze]=t.current,$c(e),new Tf(t)},t.hydrateRoot=function(e,t,n){if(!i(e))throw Error(o(299));var r=!1,a="",l=vi,s=bi,u=wi,c=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onUncaughtError&&(l=n.onUncaughtError),void 0!==n.onCaughtError&&(s=n.onCaughtError),void 0!==n.onRecoverableError&&(u=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(c=n.formState)),(t=Xd(e,1,!0,t,0,r,a,l,s,u,0,c)).context=Jd(null),n=t.current,(a=al(r=Pe(r=zu()))).callback=null,ll(n,a,r),n=r,t.current.lanes=n,Ce(t,n),Sc(t),e[ze]=t.current,$c(e),new _f(t)},t.version="19.1.0"},43:(e,t,n)=>{e.exports=n(288)},288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),l=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.consumer"),s=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),p=Symbol.iterator;var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},m=Object.assign,g={};function y(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}function v(){}function b(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}y.prototype.isReactComponent={},y.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},y.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=y.prototype;var w=b.prototype=new v;w.constructor=b,m(w,y.prototype),w.isPureReactComponent=!0;var k=Array.isArray,S={H:null,A:null,T:null,S:null,V:null},x=Object.prototype.hasOwnProperty;function E(e,t,r,a,l,o){return r=o.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:o}}function C(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var N=/\/+/g;function R(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function P(){}function T(e,t,a,l,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var s,u,c=!1;if(null===e)c=!0;else switch(i){case"bigint":case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0;break;case f:return T((c=e._init)(e._payload),t,a,l,o)}}if(c)return o=o(e),c=""===l?"."+R(e,0):l,k(o)?(a="",null!=c&&(a=c.replace(N,"$&/")+"/"),T(o,t,a,"",(function(e){return e}))):null!=o&&(C(o)&&(s=o,u=a+(null==o.key||e&&e.key===o.key?"":(""+o.key).replace(N,"$&/")+"/")+c,o=E(s.type,u,void 0,0,0,s.props)),t.push(o)),1;c=0;var d,h=""===l?".":l+":";if(k(e))for(var m=0;m<e.length;m++)c+=T(l=e[m],t,a,i=h+R(l,m),o);else if("function"===typeof(m=null===(d=e)||"object"!==typeof d?null:"function"===typeof(d=p&&d[p]||d["@@iterator"])?d:null))for(e=m.call(e),m=0;!(l=e.next()).done;)c+=T(l=l.value,t,a,i=h+R(l,m++),o);else if("object"===i){if("function"===typeof e.then)return T(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(P,P):(e.status="pending",e.then((function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)}),(function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)}))),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,a,l,o);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return c}function _(e,t,n){if(null==e)return e;var r=[],a=0;return T(e,r,"","",(function(e){return t.call(n,e,a++)})),r}function O(e){if(-1===e._status){var t=e._result;(t=t()).then((function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)}),(function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)})),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var L="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function j(){}t.Children={map:_,forEach:function(e,t,n){_(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return _(e,(function(){t++})),t},toArray:function(e){return _(e,(function(e){return e}))||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=y,t.Fragment=a,t.Profiler=o,t.PureComponent=b,t.StrictMode=l,t.Suspense=c,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=S,t.__COMPILER_RUNTIME={__proto__:null,c:function(e){return S.H.useMemoCache(e)}},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=m({},e.props),a=e.key;if(null!=t)for(l in void 0!==t.ref&&void 0,void 0!==t.key&&(a=""+t.key),t)!x.call(t,l)||"key"===l||"__self"===l||"__source"===l||"ref"===l&&void 0===t.ref||(r[l]=t[l]);var l=arguments.length-2;if(1===l)r.children=n;else if(1<l){for(var o=Array(l),i=0;i<l;i++)o[i]=arguments[i+2];r.children=o}return E(e.type,a,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:i,_context:e},e},t.createElement=function(e,t,n){var r,a={},l=null;if(null!=t)for(r in void 0!==t.key&&(l=""+t.key),t)x.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(a[r]=t[r]);var o=arguments.length-2;if(1===o)a.children=n;else if(1<o){for(var i=Array(o),s=0;s<o;s++)i[s]=arguments[s+2];a.children=i}if(e&&e.defaultProps)for(r in o=e.defaultProps)void 0===a[r]&&(a[r]=o[r]);return E(e,l,void 0,0,0,a)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:u,render:e}},t.isValidElement=C,t.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:O}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=S.T,n={};S.T=n;try{var r=e(),a=S.S;null!==a&&a(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(j,L)}catch(l){L(l)}finally{S.T=t}},t.unstable_useCacheRefresh=function(){return S.H.useCacheRefresh()},t.use=function(e){return S.H.use(e)},t.useActionState=function(e,t,n){return S.H.useActionState(e,t,n)},t.useCallback=function(e,t){return S.H.useCallback(e,t)},t.useContext=function(e){return S.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return S.H.useDeferredValue(e,t)},t.useEffect=function(e,t,n){var r=S.H;if("function"===typeof n)throw Error("useEffect CRUD overload is not enabled in this build of React.");return r.useEffect(e,t)},t.useId=function(){return S.H.useId()},t.useImperativeHandle=function(e,t,n){return S.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return S.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return S.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return S.H.useMemo(e,t)},t.useOptimistic=function(e,t){return S.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return S.H.useReducer(e,t,n)},t.useRef=function(e){return S.H.useRef(e)},t.useState=function(e){return S.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return S.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return S.H.useTransition()},t.version="19.1.0"},358:(e,t)=>{const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,r=/^[\u0021-\u003A\u003C-\u007E]*$/,a=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,l=/^[\u0020-\u003A\u003D-\u007E]*$/,o=Object.prototype.toString,i=(()=>{const e=function(){};return e.prototype=Object.create(null),e})();function s(e,t,n){do{const n=e.charCodeAt(t);if(32!==n&&9!==n)return t}while(++t<n);return n}function u(e,t,n){for(;t>n;){const n=e.charCodeAt(--t);if(32!==n&&9!==n)return t+1}return n}function c(e){if(-1===e.indexOf("%"))return e;try{return decodeURIComponent(e)}catch(t){return e}}},391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(4)},579:(e,t,n)=>{e.exports=n(799)},672:(e,t,n)=>{var r=n(43);function a(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(){}var o={d:{f:l,r:function(){throw Error(a(522))},D:l,C:l,L:l,m:l,X:l,S:l,M:l},p:0,findDOMNode:null},i=Symbol.for("react.portal");var s=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function u(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=o,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(a(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:i,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=s.T,n=o.p;try{if(s.T=null,o.p=2,e)return e()}finally{s.T=t,o.p=n,o.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,o.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&o.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=u(n,t.crossOrigin),a="string"===typeof t.integrity?t.integrity:void 0,l="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?o.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:a,fetchPriority:l}):"script"===n&&o.d.X(e,{crossOrigin:r,integrity:a,fetchPriority:l,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=u(t.as,t.crossOrigin);o.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&o.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=u(n,t.crossOrigin);o.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=u(t.as,t.crossOrigin);o.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else o.d.m(e)},t.requestFormReset=function(e){o.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return s.H.useFormState(e,t,n)},t.useFormStatus=function(){return s.H.useHostTransitionStatus()},t.version="19.1.0"},799:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.fragment");function a(e,t,r){var a=null;if(void 0!==r&&(a=""+r),void 0!==t.key&&(a=""+t.key),"key"in t)for(var l in r={},t)"key"!==l&&(r[l]=t[l]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:a,ref:void 0!==t?t:null,props:r}}t.Fragment=r,t.jsx=a,t.jsxs=a},853:(e,t,n)=>{e.exports=n(896)},896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<l(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,o=a>>>1;r<o;){var i=2*(r+1)-1,s=e[i],u=i+1,c=e[u];if(0>l(s,n))u<a&&0>l(c,s)?(e[r]=c,e[u]=n,r=u):(e[r]=s,e[i]=n,r=i);else{if(!(u<a&&0>l(c,n)))break e;e[r]=c,e[u]=n,r=u}}}return t}function l(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var o=performance;t.unstable_now=function(){return o.now()}}else{var i=Date,s=i.now();t.unstable_now=function(){return i.now()-s}}var u=[],c=[],d=1,f=null,p=3,h=!1,m=!1,g=!1,y=!1,v="function"===typeof setTimeout?setTimeout:null,b="function"===typeof clearTimeout?clearTimeout:null,w="undefined"!==typeof setImmediate?setImmediate:null;function k(e){for(var t=r(c);null!==t;){if(null===t.callback)a(c);else{if(!(t.startTime<=e))break;a(c),t.sortIndex=t.expirationTime,n(u,t)}t=r(c)}}function S(e){if(g=!1,k(e),!m)if(null!==r(u))m=!0,E||(E=!0,x());else{var t=r(c);null!==t&&L(S,t.startTime-e)}}var x,E=!1,C=-1,N=5,R=-1;function P(){return!!y||!(t.unstable_now()-R<N)}function T(){if(y=!1,E){var e=t.unstable_now();R=e;var n=!0;try{e:{m=!1,g&&(g=!1,b(C),C=-1),h=!0;var l=p;try{t:{for(k(e),f=r(u);null!==f&&!(f.expirationTime>e&&P());){var o=f.callback;if("function"===typeof o){f.callback=null,p=f.priorityLevel;var i=o(f.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof i){f.callback=i,k(e),n=!0;break t}f===r(u)&&a(u),k(e)}else a(u);f=r(u)}if(null!==f)n=!0;else{var s=r(c);null!==s&&L(S,s.startTime-e),n=!1}}break e}finally{f=null,p=l,h=!1}n=void 0}}finally{n?x():E=!1}}}if("function"===typeof w)x=function(){w(T)};else if("undefined"!==typeof MessageChannel){var _=new MessageChannel,O=_.port2;_.port1.onmessage=T,x=function(){O.postMessage(null)}}else x=function(){v(T,0)};function L(e,n){C=v((function(){e(t.unstable_now())}),n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):N=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return p},t.unstable_next=function(e){switch(p){case 1:case 2:case 3:var t=3;break;default:t=p}var n=p;p=t;try{return e()}finally{p=n}},t.unstable_requestPaint=function(){y=!0},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=p;p=e;try{return t()}finally{p=n}},t.unstable_scheduleCallback=function(e,a,l){var o=t.unstable_now();switch("object"===typeof l&&null!==l?l="number"===typeof(l=l.delay)&&0<l?o+l:o:l=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:d++,callback:a,priorityLevel:e,startTime:l,expirationTime:i=l+i,sortIndex:-1},l>o?(e.sortIndex=l,n(c,e),null===r(u)&&e===r(c)&&(g?(b(C),C=-1):g=!0,L(S,l-o))):(e.sortIndex=i,n(u,e),m||h||(m=!0,E||(E=!0,x()))),e},t.unstable_shouldYield=P,t.unstable_wrapCallback=function(e){var t=p;return function(){var n=p;p=t;try{return e.apply(this,arguments)}finally{p=n}}}},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(672)}},t={};function n(r){var a=t[r];if(void 0!==a)return a.exports;var l=t[r]={exports:{}};return e[r](l,l.exports,n),l.exports}n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})};var r={};n.r(r),n.d(r,{hasBrowserEnv:()=>wn,hasStandardBrowserEnv:()=>Sn,hasStandardBrowserWebWorkerEnv:()=>xn,navigator:()=>kn,origin:()=>En});var a=n(43),l=n(391),o=(n(358),"popstate");function i(){return h((function(e,t){let{pathname:n,search:r,hash:a}=e.location;return d("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")}),(function(e,t){return"string"===typeof t?t:f(t)}),null,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{})}function s(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}function u(e,t){if(!e){"undefined"!==typeof console&&console.warn(t);try{throw new Error(t)}catch(n){}}}function c(e,t){return{usr:e.state,key:e.key,idx:t}}function d(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3?arguments[3]:void 0;return{pathname:"string"===typeof e?e:e.pathname,search:"",hash:"",..."string"===typeof t?p(t):t,state:n,key:t&&t.key||r||Math.random().toString(36).substring(2,10)}}function f(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function p(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function h(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},{window:a=document.defaultView,v5Compat:l=!1}=r,i=a.history,u="POP",p=null,h=m();function m(){return(i.state||{idx:null}).idx}function g(){u="POP";let e=m(),t=null==e?null:e-h;h=e,p&&p({action:u,location:v.location,delta:t})}function y(e){let t="null"!==a.location.origin?a.location.origin:a.location.href,n="string"===typeof e?e:f(e);return n=n.replace(/ $/,"%20"),s(t,`No window.location.(origin|href) available to create URL for href: ${n}`),new URL(n,t)}null==h&&(h=0,i.replaceState({...i.state,idx:h},""));let v={get action(){return u},get location(){return e(a,i)},listen(e){if(p)throw new Error("A history only accepts one active listener");return a.addEventListener(o,g),p=e,()=>{a.removeEventListener(o,g),p=null}},createHref:e=>t(a,e),createURL:y,encodeLocation(e){let t=y(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){u="PUSH";let r=d(v.location,e,t);n&&n(r,e),h=m()+1;let o=c(r,h),s=v.createHref(r);try{i.pushState(o,"",s)}catch(f){if(f instanceof DOMException&&"DataCloneError"===f.name)throw f;a.location.assign(s)}l&&p&&p({action:u,location:v.location,delta:1})},replace:function(e,t){u="REPLACE";let r=d(v.location,e,t);n&&n(r,e),h=m();let a=c(r,h),o=v.createHref(r);i.replaceState(a,"",o),l&&p&&p({action:u,location:v.location,delta:0})},go:e=>i.go(e)};return v}new WeakMap;function m(e,t){return g(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:"/",!1)}function g(e,t,n,r){let a=_(("string"===typeof t?p(t):t).pathname||"/",n);if(null==a)return null;let l=y(e);!function(e){e.sort(((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){let n=e.length===t.length&&e.slice(0,-1).every(((e,n)=>e===t[n]));return n?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map((e=>e.childrenIndex)),t.routesMeta.map((e=>e.childrenIndex)))))}(l);let o=null;for(let i=0;null==o&&i<l.length;++i){let e=T(a);o=R(l[i],e,r)}return o}function y(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"",a=(e,a,l)=>{let o={relativePath:void 0===l?e.path||"":l,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};o.relativePath.startsWith("/")&&(s(o.relativePath.startsWith(r),`Absolute route path "${o.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),o.relativePath=o.relativePath.slice(r.length));let i=A([r,o.relativePath]),u=n.concat(o);e.children&&e.children.length>0&&(s(!0!==e.index,`Index routes must not have child routes. Please remove all child routes from route path "${i}".`),y(e.children,t,u,i)),(null!=e.path||e.index)&&t.push({path:i,score:N(i,e.index),routesMeta:u})};return e.forEach(((e,t)=>{if(""!==e.path&&e.path?.includes("?"))for(let n of v(e.path))a(e,t,n);else a(e,t)})),t}function v(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),l=n.replace(/\?$/,"");if(0===r.length)return a?[l,""]:[l];let o=v(r.join("/")),i=[];return i.push(...o.map((e=>""===e?l:[l,e].join("/")))),a&&i.push(...o),i.map((t=>e.startsWith("/")&&""===t?"/":t))}var b=/^:[\w-]+$/,w=3,k=2,S=1,x=10,E=-2,C=e=>"*"===e;function N(e,t){let n=e.split("/"),r=n.length;return n.some(C)&&(r+=E),t&&(r+=k),n.filter((e=>!C(e))).reduce(((e,t)=>e+(b.test(t)?w:""===t?S:x)),r)}function R(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],{routesMeta:r}=e,a={},l="/",o=[];for(let i=0;i<r.length;++i){let e=r[i],s=i===r.length-1,u="/"===l?t:t.slice(l.length)||"/",c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:s},u),d=e.route;if(!c&&s&&n&&!r[r.length-1].route.index&&(c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:!1},u)),!c)return null;Object.assign(a,c.params),o.push({params:a,pathname:A([l,c.pathname]),pathnameBase:F(A([l,c.pathnameBase])),route:d}),"/"!==c.pathnameBase&&(l=A([l,c.pathnameBase]))}return o}function P(e,t){"string"===typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];u("*"===e||!e.endsWith("*")||e.endsWith("/*"),`Route path "${e}" will be treated as if it were "${e.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${e.replace(/\*$/,"/*")}".`);let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,((e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)")));e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))");let l=new RegExp(a,t?void 0:"i");return[l,r]}(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let l=a[0],o=l.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce(((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";o=l.slice(0,l.length-e.length).replace(/(.)\/+$/,"$1")}const s=i[n];return e[r]=a&&!s?void 0:(s||"").replace(/%2F/g,"/"),e}),{}),pathname:l,pathnameBase:o,pattern:e}}function T(e){try{return e.split("/").map((e=>decodeURIComponent(e).replace(/\//g,"%2F"))).join("/")}catch(t){return u(!1,`The URL path "${e}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${t}).`),e}}function _(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}function O(e,t,n,r){return`Cannot include a '${e}' character in a manually specified \`to.${t}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${n}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function L(e){return e.filter(((e,t)=>0===t||e.route.path&&e.route.path.length>0))}function j(e){let t=L(e);return t.map(((e,n)=>n===t.length-1?e.pathname:e.pathnameBase))}function z(e,t,n){let r,a=arguments.length>3&&void 0!==arguments[3]&&arguments[3];"string"===typeof e?r=p(e):(r={...e},s(!r.pathname||!r.pathname.includes("?"),O("?","pathname","search",r)),s(!r.pathname||!r.pathname.includes("#"),O("#","pathname","hash",r)),s(!r.search||!r.search.includes("#"),O("#","search","hash",r)));let l,o=""===e||""===r.pathname,i=o?"/":r.pathname;if(null==i)l=n;else{let e=t.length-1;if(!a&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;r.pathname=t.join("/")}l=e>=0?t[e]:"/"}let u=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"/",{pathname:n,search:r="",hash:a=""}="string"===typeof e?p(e):e,l=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach((e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)})),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:l,search:D(r),hash:M(a)}}(r,l),c=i&&"/"!==i&&i.endsWith("/"),d=(o||"."===i)&&n.endsWith("/");return u.pathname.endsWith("/")||!c&&!d||(u.pathname+="/"),u}var A=e=>e.join("/").replace(/\/\/+/g,"/"),F=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),D=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",M=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function U(e){return null!=e&&"number"===typeof e.status&&"string"===typeof e.statusText&&"boolean"===typeof e.internal&&"data"in e}var $=["POST","PUT","PATCH","DELETE"],I=(new Set($),["GET",...$]);new Set(I),Symbol("ResetLoaderData");var B=a.createContext(null);B.displayName="DataRouter";var H=a.createContext(null);H.displayName="DataRouterState";var W=a.createContext({isTransitioning:!1});W.displayName="ViewTransition";var q=a.createContext(new Map);q.displayName="Fetchers";var V=a.createContext(null);V.displayName="Await";var Q=a.createContext(null);Q.displayName="Navigation";var K=a.createContext(null);K.displayName="Location";var Y=a.createContext({outlet:null,matches:[],isDataRoute:!1});Y.displayName="Route";var X=a.createContext(null);X.displayName="RouteError";function J(){return null!=a.useContext(K)}function G(){return s(J(),"useLocation() may be used only in the context of a <Router> component."),a.useContext(K).location}var Z="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function ee(e){a.useContext(Q).static||a.useLayoutEffect(e)}function te(){let{isDataRoute:e}=a.useContext(Y);return e?function(){let{router:e}=ce("useNavigate"),t=fe("useNavigate"),n=a.useRef(!1);ee((()=>{n.current=!0}));let r=a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};u(n.current,Z),n.current&&("number"===typeof r?e.navigate(r):await e.navigate(r,{fromRouteId:t,...a}))}),[e,t]);return r}():function(){s(J(),"useNavigate() may be used only in the context of a <Router> component.");let e=a.useContext(B),{basename:t,navigator:n}=a.useContext(Q),{matches:r}=a.useContext(Y),{pathname:l}=G(),o=JSON.stringify(j(r)),i=a.useRef(!1);ee((()=>{i.current=!0}));let c=a.useCallback((function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(u(i.current,Z),!i.current)return;if("number"===typeof r)return void n.go(r);let s=z(r,JSON.parse(o),l,"path"===a.relative);null==e&&"/"!==t&&(s.pathname="/"===s.pathname?t:A([t,s.pathname])),(a.replace?n.replace:n.push)(s,a.state,a)}),[t,n,o,l,e]);return c}()}a.createContext(null);function ne(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{matches:n}=a.useContext(Y),{pathname:r}=G(),l=JSON.stringify(j(n));return a.useMemo((()=>z(e,JSON.parse(l),r,"path"===t)),[e,l,r,t])}function re(e,t,n,r){s(J(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:l,static:o}=a.useContext(Q),{matches:i}=a.useContext(Y),c=i[i.length-1],d=c?c.params:{},f=c?c.pathname:"/",h=c?c.pathnameBase:"/",g=c&&c.route;{let e=g&&g.path||"";me(f,!g||e.endsWith("*")||e.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${f}" (under <Route path="${e}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.\n\nPlease change the parent <Route path="${e}"> to <Route path="${"/"===e?"*":`${e}/*`}">.`)}let y,v=G();if(t){let e="string"===typeof t?p(t):t;s("/"===h||e.pathname?.startsWith(h),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${h}" but pathname "${e.pathname}" was given in the \`location\` prop.`),y=e}else y=v;let b=y.pathname||"/",w=b;if("/"!==h){let e=h.replace(/^\//,"").split("/");w="/"+b.replace(/^\//,"").split("/").slice(e.length).join("/")}let k=!o&&n&&n.matches&&n.matches.length>0?n.matches:m(e,{pathname:w});u(g||null!=k,`No routes matched location "${y.pathname}${y.search}${y.hash}" `),u(null==k||void 0!==k[k.length-1].route.element||void 0!==k[k.length-1].route.Component||void 0!==k[k.length-1].route.lazy,`Matched leaf route at location "${y.pathname}${y.search}${y.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let S=se(k&&k.map((e=>Object.assign({},e,{params:Object.assign({},d,e.params),pathname:A([h,l.encodeLocation?l.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?h:A([h,l.encodeLocation?l.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])}))),i,n,r);return t&&S?a.createElement(K.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...y},navigationType:"POP"}},S):S}function ae(){let e=pe(),t=U(e)?`${e.status} ${e.statusText}`:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:r},o={padding:"2px 4px",backgroundColor:r},i=null;return console.error("Error handled by React Router default ErrorBoundary:",e),i=a.createElement(a.Fragment,null,a.createElement("p",null,"\ud83d\udcbf Hey developer \ud83d\udc4b"),a.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",a.createElement("code",{style:o},"ErrorBoundary")," or"," ",a.createElement("code",{style:o},"errorElement")," prop on your route.")),a.createElement(a.Fragment,null,a.createElement("h2",null,"Unexpected Application Error!"),a.createElement("h3",{style:{fontStyle:"italic"}},t),n?a.createElement("pre",{style:l},n):null,i)}var le=a.createElement(ae,null),oe=class extends a.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?a.createElement(Y.Provider,{value:this.props.routeContext},a.createElement(X.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function ie(e){let{routeContext:t,match:n,children:r}=e,l=a.useContext(B);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),a.createElement(Y.Provider,{value:t},r)}function se(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null;if(null==e){if(!n)return null;if(n.errors)e=n.matches;else{if(0!==t.length||n.initialized||!(n.matches.length>0))return null;e=n.matches}}let r=e,l=n?.errors;if(null!=l){let e=r.findIndex((e=>e.route.id&&void 0!==l?.[e.route.id]));s(e>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(l).join(",")}`),r=r.slice(0,Math.min(r.length,e+1))}let o=!1,i=-1;if(n)for(let a=0;a<r.length;a++){let e=r[a];if((e.route.HydrateFallback||e.route.hydrateFallbackElement)&&(i=a),e.route.id){let{loaderData:t,errors:a}=n,l=e.route.loader&&!t.hasOwnProperty(e.route.id)&&(!a||void 0===a[e.route.id]);if(e.route.lazy||l){o=!0,r=i>=0?r.slice(0,i+1):[r[0]];break}}}return r.reduceRight(((e,s,u)=>{let c,d=!1,f=null,p=null;n&&(c=l&&s.route.id?l[s.route.id]:void 0,f=s.route.errorElement||le,o&&(i<0&&0===u?(me("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),d=!0,p=null):i===u&&(d=!0,p=s.route.hydrateFallbackElement||null)));let h=t.concat(r.slice(0,u+1)),m=()=>{let t;return t=c?f:d?p:s.route.Component?a.createElement(s.route.Component,null):s.route.element?s.route.element:e,a.createElement(ie,{match:s,routeContext:{outlet:e,matches:h,isDataRoute:null!=n},children:t})};return n&&(s.route.ErrorBoundary||s.route.errorElement||0===u)?a.createElement(oe,{location:n.location,revalidation:n.revalidation,component:f,error:c,children:m(),routeContext:{outlet:null,matches:h,isDataRoute:!0}}):m()}),null)}function ue(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function ce(e){let t=a.useContext(B);return s(t,ue(e)),t}function de(e){let t=a.useContext(H);return s(t,ue(e)),t}function fe(e){let t=function(e){let t=a.useContext(Y);return s(t,ue(e)),t}(e),n=t.matches[t.matches.length-1];return s(n.route.id,`${e} can only be used on routes that contain a unique "id"`),n.route.id}function pe(){let e=a.useContext(X),t=de("useRouteError"),n=fe("useRouteError");return void 0!==e?e:t.errors?.[n]}var he={};function me(e,t,n){t||he[e]||(he[e]=!0,u(!1,n))}a.memo((function(e){let{routes:t,future:n,state:r}=e;return re(t,void 0,r,n)}));function ge(e){s(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function ye(e){let{basename:t="/",children:n=null,location:r,navigationType:l="POP",navigator:o,static:i=!1}=e;s(!J(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let c=t.replace(/^\/*/,"/"),d=a.useMemo((()=>({basename:c,navigator:o,static:i,future:{}})),[c,o,i]);"string"===typeof r&&(r=p(r));let{pathname:f="/",search:h="",hash:m="",state:g=null,key:y="default"}=r,v=a.useMemo((()=>{let e=_(f,c);return null==e?null:{location:{pathname:e,search:h,hash:m,state:g,key:y},navigationType:l}}),[c,f,h,m,g,y,l]);return u(null!=v,`<Router basename="${c}"> is not able to match the URL "${f}${h}${m}" because it does not start with the basename, so the <Router> won't render anything.`),null==v?null:a.createElement(Q.Provider,{value:d},a.createElement(K.Provider,{children:n,value:v}))}function ve(e){let{children:t,location:n}=e;return re(be(t),n)}a.Component;function be(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=[];return a.Children.forEach(e,((e,r)=>{if(!a.isValidElement(e))return;let l=[...t,r];if(e.type===a.Fragment)return void n.push.apply(n,be(e.props.children,l));s(e.type===ge,`[${"string"===typeof e.type?e.type:e.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),s(!e.props.index||!e.props.children,"An index route cannot have child routes.");let o={id:e.props.id||l.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,hydrateFallbackElement:e.props.hydrateFallbackElement,HydrateFallback:e.props.HydrateFallback,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:!0===e.props.hasErrorBoundary||null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=be(e.props.children,l)),n.push(o)})),n}var we="get",ke="application/x-www-form-urlencoded";function Se(e){return null!=e&&"string"===typeof e.tagName}var xe=null;var Ee=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Ce(e){return null==e||Ee.has(e)?e:(u(!1,`"${e}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${ke}"`),null)}function Ne(e,t){let n,r,a,l,o;if(Se(i=e)&&"form"===i.tagName.toLowerCase()){let o=e.getAttribute("action");r=o?_(o,t):null,n=e.getAttribute("method")||we,a=Ce(e.getAttribute("enctype"))||ke,l=new FormData(e)}else if(function(e){return Se(e)&&"button"===e.tagName.toLowerCase()}(e)||function(e){return Se(e)&&"input"===e.tagName.toLowerCase()}(e)&&("submit"===e.type||"image"===e.type)){let o=e.form;if(null==o)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let i=e.getAttribute("formaction")||o.getAttribute("action");if(r=i?_(i,t):null,n=e.getAttribute("formmethod")||o.getAttribute("method")||we,a=Ce(e.getAttribute("formenctype"))||Ce(o.getAttribute("enctype"))||ke,l=new FormData(o,e),!function(){if(null===xe)try{new FormData(document.createElement("form"),0),xe=!1}catch(e){xe=!0}return xe}()){let{name:t,type:n,value:r}=e;if("image"===n){let e=t?`${t}.`:"";l.append(`${e}x`,"0"),l.append(`${e}y`,"0")}else t&&l.append(t,r)}}else{if(Se(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=we,r=null,a=ke,o=e}var i;return l&&"text/plain"===a&&(o=l,l=void 0),{action:r,method:n.toLowerCase(),encType:a,formData:l,body:o}}function Re(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}async function Pe(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error(`Error loading route module \`${e.module}\`, reloading page...`),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise((()=>{}))}}function Te(e){return null!=e&&"string"===typeof e.page}function _e(e){return null!=e&&(null==e.href?"preload"===e.rel&&"string"===typeof e.imageSrcSet&&"string"===typeof e.imageSizes:"string"===typeof e.rel&&"string"===typeof e.href)}function Oe(e,t,n,r,a,l){let o=(e,t)=>!n[t]||e.route.id!==n[t].route.id,i=(e,t)=>n[t].pathname!==e.pathname||n[t].route.path?.endsWith("*")&&n[t].params["*"]!==e.params["*"];return"assets"===l?t.filter(((e,t)=>o(e,t)||i(e,t))):"data"===l?t.filter(((t,l)=>{let s=r.routes[t.route.id];if(!s||!s.hasLoader)return!1;if(o(t,l)||i(t,l))return!0;if(t.route.shouldRevalidate){let r=t.route.shouldRevalidate({currentUrl:new URL(a.pathname+a.search+a.hash,window.origin),currentParams:n[0]?.params||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if("boolean"===typeof r)return r}return!0})):[]}function Le(e,t){let{includeHydrateFallback:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return r=e.map((e=>{let r=t.routes[e.route.id];if(!r)return[];let a=[r.module];return r.clientActionModule&&(a=a.concat(r.clientActionModule)),r.clientLoaderModule&&(a=a.concat(r.clientLoaderModule)),n&&r.hydrateFallbackModule&&(a=a.concat(r.hydrateFallbackModule)),r.imports&&(a=a.concat(r.imports)),a})).flat(1),[...new Set(r)];var r}function je(e,t){let n=new Set,r=new Set(t);return e.reduce(((e,a)=>{if(t&&!Te(a)&&"script"===a.as&&a.href&&r.has(a.href))return e;let l=JSON.stringify(function(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}(a));return n.has(l)||(n.add(l),e.push({key:l,link:a})),e}),[])}function ze(e){return{__html:e}}Symbol("SingleFetchRedirect");function Ae(e,t){let n="string"===typeof e?new URL(e,"undefined"===typeof window?"server://singlefetch/":window.location.origin):e;return"/"===n.pathname?n.pathname="_root.data":t&&"/"===_(n.pathname,t)?n.pathname=`${t.replace(/\/$/,"")}/_root.data`:n.pathname=`${n.pathname.replace(/\/$/,"")}.data`,n}a.Component;function Fe(e){let{error:t,isOutsideRemixApp:n}=e;console.error(t);let r,l=a.createElement("script",{dangerouslySetInnerHTML:{__html:'\n        console.log(\n          "\ud83d\udcbf Hey developer \ud83d\udc4b. You can provide a way better UX than this when your app throws errors. Check out https://remix.run/guides/errors for more information."\n        );\n      '}});if(U(t))return a.createElement(De,{title:"Unhandled Thrown Response!"},a.createElement("h1",{style:{fontSize:"24px"}},t.status," ",t.statusText),l);if(t instanceof Error)r=t;else{let e=null==t?"Unknown Error":"object"===typeof t&&"toString"in t?t.toString():JSON.stringify(t);r=new Error(e)}return a.createElement(De,{title:"Application Error!",isOutsideRemixApp:n},a.createElement("h1",{style:{fontSize:"24px"}},"Application Error"),a.createElement("pre",{style:{padding:"2rem",background:"hsla(10, 50%, 50%, 0.1)",color:"red",overflow:"auto"}},r.stack),l)}function De(e){let{title:t,renderScripts:n,isOutsideRemixApp:r,children:l}=e,{routeModules:o}=Be();return o.root?.Layout&&!r?l:a.createElement("html",{lang:"en"},a.createElement("head",null,a.createElement("meta",{charSet:"utf-8"}),a.createElement("meta",{name:"viewport",content:"width=device-width,initial-scale=1,viewport-fit=cover"}),a.createElement("title",null,t)),a.createElement("body",null,a.createElement("main",{style:{fontFamily:"system-ui, sans-serif",padding:"2rem"}},l,n?a.createElement(Ye,null):null)))}function Me(e){return!0===e}function Ue(){let e=a.useContext(B);return Re(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function $e(){let e=a.useContext(H);return Re(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var Ie=a.createContext(void 0);function Be(){let e=a.useContext(Ie);return Re(e,"You must render this element inside a <HydratedRouter> element"),e}function He(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function We(e,t,n){if(n&&!Ke)return[e[0]];if(t){let n=e.findIndex((e=>void 0!==t[e.route.id]));return e.slice(0,n+1)}return e}function qe(e){let{page:t,...n}=e,{router:r}=Ue(),l=a.useMemo((()=>m(r.routes,t,r.basename)),[r.routes,t,r.basename]);return l?a.createElement(Qe,{page:t,matches:l,...n}):null}function Ve(e){let{manifest:t,routeModules:n}=Be(),[r,l]=a.useState([]);return a.useEffect((()=>{let r=!1;return async function(e,t,n){return je((await Promise.all(e.map((async e=>{let r=t.routes[e.route.id];if(r){let e=await Pe(r,n);return e.links?e.links():[]}return[]})))).flat(1).filter(_e).filter((e=>"stylesheet"===e.rel||"preload"===e.rel)).map((e=>"stylesheet"===e.rel?{...e,rel:"prefetch",as:"style"}:{...e,rel:"prefetch"})))}(e,t,n).then((e=>{r||l(e)})),()=>{r=!0}}),[e,t,n]),r}function Qe(e){let{page:t,matches:n,...r}=e,l=G(),{manifest:o,routeModules:i}=Be(),{basename:s}=Ue(),{loaderData:u,matches:c}=$e(),d=a.useMemo((()=>Oe(t,n,c,o,l,"data")),[t,n,c,o,l]),f=a.useMemo((()=>Oe(t,n,c,o,l,"assets")),[t,n,c,o,l]),p=a.useMemo((()=>{if(t===l.pathname+l.search+l.hash)return[];let e=new Set,r=!1;if(n.forEach((t=>{let n=o.routes[t.route.id];n&&n.hasLoader&&(!d.some((e=>e.route.id===t.route.id))&&t.route.id in u&&i[t.route.id]?.shouldRevalidate||n.hasClientLoader?r=!0:e.add(t.route.id))})),0===e.size)return[];let a=Ae(t,s);return r&&e.size>0&&a.searchParams.set("_routes",n.filter((t=>e.has(t.route.id))).map((e=>e.route.id)).join(",")),[a.pathname+a.search]}),[s,u,l,o,d,n,t,i]),h=a.useMemo((()=>Le(f,o)),[f,o]),m=Ve(f);return a.createElement(a.Fragment,null,p.map((e=>a.createElement("link",{key:e,rel:"prefetch",as:"fetch",href:e,...r}))),h.map((e=>a.createElement("link",{key:e,rel:"modulepreload",href:e,...r}))),m.map((e=>{let{key:t,link:n}=e;return a.createElement("link",{key:t,...n})})))}Ie.displayName="FrameworkContext";var Ke=!1;function Ye(e){let{manifest:t,serverHandoffString:n,isSpaMode:r,ssr:l,renderMeta:o}=Be(),{router:i,static:s,staticContext:u}=Ue(),{matches:c}=$e(),d=Me(l);o&&(o.didRenderScripts=!0);let f=We(c,null,r);a.useEffect((()=>{Ke=!0}),[]);let p=a.useMemo((()=>{let r=u?`window.__reactRouterContext = ${n};window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());`:" ",l=s?`${t.hmr?.runtime?`import ${JSON.stringify(t.hmr.runtime)};`:""}${d?"":`import ${JSON.stringify(t.url)}`};\n${f.map(((e,n)=>{let r=`route${n}`,a=t.routes[e.route.id];Re(a,`Route ${e.route.id} not found in manifest`);let{clientActionModule:l,clientLoaderModule:o,clientMiddlewareModule:i,hydrateFallbackModule:s,module:u}=a,c=[...l?[{module:l,varName:`${r}_clientAction`}]:[],...o?[{module:o,varName:`${r}_clientLoader`}]:[],...i?[{module:i,varName:`${r}_clientMiddleware`}]:[],...s?[{module:s,varName:`${r}_HydrateFallback`}]:[],{module:u,varName:`${r}_main`}];return 1===c.length?`import * as ${r} from ${JSON.stringify(u)};`:[c.map((e=>`import * as ${e.varName} from "${e.module}";`)).join("\n"),`const ${r} = {${c.map((e=>`...${e.varName}`)).join(",")}};`].join("\n")})).join("\n")}\n  ${d?`window.__reactRouterManifest = ${JSON.stringify(function(e,t){let n=new Set(t.state.matches.map((e=>e.route.id))),r=t.state.location.pathname.split("/").filter(Boolean),a=["/"];for(r.pop();r.length>0;)a.push(`/${r.join("/")}`),r.pop();a.forEach((e=>{let r=m(t.routes,e,t.basename);r&&r.forEach((e=>n.add(e.route.id)))}));let l=[...n].reduce(((t,n)=>Object.assign(t,{[n]:e.routes[n]})),{});return{...e,routes:l}}(t,i),null,2)};`:""}\n  window.__reactRouterRouteModules = {${f.map(((e,t)=>`${JSON.stringify(e.route.id)}:route${t}`)).join(",")}};\n\nimport(${JSON.stringify(t.entry.module)});`:" ";return a.createElement(a.Fragment,null,a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:ze(r),type:void 0}),a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:ze(l),type:"module",async:!0}))}),[]),h=Ke?[]:t.entry.imports.concat(Le(f,t,{includeHydrateFallback:!0}));return Ke?null:a.createElement(a.Fragment,null,d?null:a.createElement("link",{rel:"modulepreload",href:t.url,crossOrigin:e.crossOrigin}),a.createElement("link",{rel:"modulepreload",href:t.entry.module,crossOrigin:e.crossOrigin}),(g=h,[...new Set(g)]).map((t=>a.createElement("link",{key:t,rel:"modulepreload",href:t,crossOrigin:e.crossOrigin}))),p);var g}function Xe(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return e=>{t.forEach((t=>{"function"===typeof t?t(e):null!=t&&(t.current=e)}))}}var Je="undefined"!==typeof window&&"undefined"!==typeof window.document&&"undefined"!==typeof window.document.createElement;try{Je&&(window.__reactRouterVersion="7.4.1")}catch(Qr){}function Ge(e){let{basename:t,children:n,window:r}=e,l=a.useRef();null==l.current&&(l.current=i({window:r,v5Compat:!0}));let o=l.current,[s,u]=a.useState({action:o.action,location:o.location}),c=a.useCallback((e=>{a.startTransition((()=>u(e)))}),[u]);return a.useLayoutEffect((()=>o.listen(c)),[o,c]),a.createElement(ye,{basename:t,children:n,location:s.location,navigationType:s.action,navigator:o})}var Ze=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,et=a.forwardRef((function(e,t){let n,{onClick:r,discover:l="render",prefetch:o="none",relative:i,reloadDocument:c,replace:d,state:p,target:h,to:m,preventScrollReset:g,viewTransition:y,...v}=e,{basename:b}=a.useContext(Q),w="string"===typeof m&&Ze.test(m),k=!1;if("string"===typeof m&&w&&(n=m,Je))try{let e=new URL(window.location.href),t=m.startsWith("//")?new URL(e.protocol+m):new URL(m),n=_(t.pathname,b);t.origin===e.origin&&null!=n?m=n+t.search+t.hash:k=!0}catch(Qr){u(!1,`<Link to="${m}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let S=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};s(J(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:r}=a.useContext(Q),{hash:l,pathname:o,search:i}=ne(e,{relative:t}),u=o;return"/"!==n&&(u="/"===o?n:A([n,o])),r.createHref({pathname:u,search:i,hash:l})}(m,{relative:i}),[x,E,C]=function(e,t){let n=a.useContext(Ie),[r,l]=a.useState(!1),[o,i]=a.useState(!1),{onFocus:s,onBlur:u,onMouseEnter:c,onMouseLeave:d,onTouchStart:f}=t,p=a.useRef(null);a.useEffect((()=>{if("render"===e&&i(!0),"viewport"===e){let e=new IntersectionObserver((e=>{e.forEach((e=>{i(e.isIntersecting)}))}),{threshold:.5});return p.current&&e.observe(p.current),()=>{e.disconnect()}}}),[e]),a.useEffect((()=>{if(r){let e=setTimeout((()=>{i(!0)}),100);return()=>{clearTimeout(e)}}}),[r]);let h=()=>{l(!0)},m=()=>{l(!1),i(!1)};return n?"intent"!==e?[o,p,{}]:[o,p,{onFocus:He(s,h),onBlur:He(u,m),onMouseEnter:He(c,h),onMouseLeave:He(d,m),onTouchStart:He(f,h)}]:[!1,p,{}]}(o,v),N=function(e){let{target:t,replace:n,state:r,preventScrollReset:l,relative:o,viewTransition:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},s=te(),u=G(),c=ne(e,{relative:o});return a.useCallback((a=>{if(function(e,t){return 0===e.button&&(!t||"_self"===t)&&!function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)}(a,t)){a.preventDefault();let t=void 0!==n?n:f(u)===f(c);s(e,{replace:t,state:r,preventScrollReset:l,relative:o,viewTransition:i})}}),[u,s,c,n,r,t,e,l,o,i])}(m,{replace:d,state:p,target:h,preventScrollReset:g,relative:i,viewTransition:y});let R=a.createElement("a",{...v,...C,href:n||S,onClick:k||c?r:function(e){r&&r(e),e.defaultPrevented||N(e)},ref:Xe(t,E),target:h,"data-discover":w||"render"!==l?void 0:"true"});return x&&!w?a.createElement(a.Fragment,null,R,a.createElement(qe,{page:S})):R}));et.displayName="Link",a.forwardRef((function(e,t){let{"aria-current":n="page",caseSensitive:r=!1,className:l="",end:o=!1,style:i,to:u,viewTransition:c,children:d,...f}=e,p=ne(u,{relative:f.relative}),h=G(),m=a.useContext(H),{navigator:g,basename:y}=a.useContext(Q),v=null!=m&&function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=a.useContext(W);s(null!=n,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=rt("useViewTransitionState"),l=ne(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=_(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=_(n.nextLocation.pathname,r)||n.nextLocation.pathname;return null!=P(l.pathname,i)||null!=P(l.pathname,o)}(p)&&!0===c,b=g.encodeLocation?g.encodeLocation(p).pathname:p.pathname,w=h.pathname,k=m&&m.navigation&&m.navigation.location?m.navigation.location.pathname:null;r||(w=w.toLowerCase(),k=k?k.toLowerCase():null,b=b.toLowerCase()),k&&y&&(k=_(k,y)||k);const S="/"!==b&&b.endsWith("/")?b.length-1:b.length;let x,E=w===b||!o&&w.startsWith(b)&&"/"===w.charAt(S),C=null!=k&&(k===b||!o&&k.startsWith(b)&&"/"===k.charAt(b.length)),N={isActive:E,isPending:C,isTransitioning:v},R=E?n:void 0;x="function"===typeof l?l(N):[l,E?"active":null,C?"pending":null,v?"transitioning":null].filter(Boolean).join(" ");let T="function"===typeof i?i(N):i;return a.createElement(et,{...f,"aria-current":R,className:x,ref:t,style:T,to:u,viewTransition:c},"function"===typeof d?d(N):d)})).displayName="NavLink";var tt=a.forwardRef(((e,t)=>{let{discover:n="render",fetcherKey:r,navigate:l,reloadDocument:o,replace:i,state:u,method:c=we,action:d,onSubmit:p,relative:h,preventScrollReset:m,viewTransition:g,...y}=e,v=ot(),b=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{basename:n}=a.useContext(Q),r=a.useContext(Y);s(r,"useFormAction must be used inside a RouteContext");let[l]=r.matches.slice(-1),o={...ne(e||".",{relative:t})},i=G();if(null==e){o.search=i.search;let e=new URLSearchParams(o.search),t=e.getAll("index");if(t.some((e=>""===e))){e.delete("index"),t.filter((e=>e)).forEach((t=>e.append("index",t)));let n=e.toString();o.search=n?`?${n}`:""}}e&&"."!==e||!l.route.index||(o.search=o.search?o.search.replace(/^\?/,"?index&"):"?index");"/"!==n&&(o.pathname="/"===o.pathname?n:A([n,o.pathname]));return f(o)}(d,{relative:h}),w="get"===c.toLowerCase()?"get":"post",k="string"===typeof d&&Ze.test(d);return a.createElement("form",{ref:t,method:w,action:b,onSubmit:o?p:e=>{if(p&&p(e),e.defaultPrevented)return;e.preventDefault();let t=e.nativeEvent.submitter,n=t?.getAttribute("formmethod")||c;v(t||e.currentTarget,{fetcherKey:r,method:n,navigate:l,replace:i,state:u,relative:h,preventScrollReset:m,viewTransition:g})},...y,"data-discover":k||"render"!==n?void 0:"true"})}));function nt(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function rt(e){let t=a.useContext(B);return s(t,nt(e)),t}tt.displayName="Form";var at=0,lt=()=>`__${String(++at)}__`;function ot(){let{router:e}=rt("useSubmit"),{basename:t}=a.useContext(Q),n=fe("useRouteId");return a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{action:l,method:o,encType:i,formData:s,body:u}=Ne(r,t);if(!1===a.navigate){let t=a.fetcherKey||lt();await e.fetch(t,n,a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:u,formMethod:a.method||o,formEncType:a.encType||i,flushSync:a.flushSync})}else await e.navigate(a.action||l,{preventScrollReset:a.preventScrollReset,formData:s,body:u,formMethod:a.method||o,formEncType:a.encType||i,replace:a.replace,state:a.state,fromRouteId:n,flushSync:a.flushSync,viewTransition:a.viewTransition})}),[e,t,n])}new TextEncoder;const it=e=>{const t=(e=>e.replace(/^([A-Z])|[\s-_]+(\w)/g,((e,t,n)=>n?n.toUpperCase():t.toLowerCase())))(e);return t.charAt(0).toUpperCase()+t.slice(1)},st=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.filter(((e,t,n)=>Boolean(e)&&""!==e.trim()&&n.indexOf(e)===t)).join(" ").trim()};var ut={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const ct=(0,a.forwardRef)(((e,t)=>{let{color:n="currentColor",size:r=24,strokeWidth:l=2,absoluteStrokeWidth:o,className:i="",children:s,iconNode:u,...c}=e;return(0,a.createElement)("svg",{ref:t,...ut,width:r,height:r,stroke:n,strokeWidth:o?24*Number(l)/Number(r):l,className:st("lucide",i),...c},[...u.map((e=>{let[t,n]=e;return(0,a.createElement)(t,n)})),...Array.isArray(s)?s:[s]])})),dt=(e,t)=>{const n=(0,a.forwardRef)(((n,r)=>{let{className:l,...o}=n;return(0,a.createElement)(ct,{ref:r,iconNode:t,className:st(`lucide-${i=it(e),i.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase()}`,`lucide-${e}`,l),...o});var i}));return n.displayName=it(e),n},ft=dt("x",[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]]),pt=dt("menu",[["line",{x1:"4",x2:"20",y1:"12",y2:"12",key:"1e0a9i"}],["line",{x1:"4",x2:"20",y1:"6",y2:"6",key:"1owob3"}],["line",{x1:"4",x2:"20",y1:"18",y2:"18",key:"yk5zj1"}]]);var ht=n(579);const mt=()=>{const[e,t]=(0,a.useState)(!1);return(0,ht.jsx)("header",{className:"header",children:(0,ht.jsxs)("div",{className:"header-container",children:[(0,ht.jsx)(et,{to:"/",className:"logo",children:(0,ht.jsx)("h1",{children:"MedDiagnosis AI"})}),(0,ht.jsx)("button",{className:"menu-toggle",onClick:()=>t(!e),children:e?(0,ht.jsx)(ft,{size:24}):(0,ht.jsx)(pt,{size:24})}),(0,ht.jsx)("nav",{className:"main-nav "+(e?"open":""),children:(0,ht.jsxs)("ul",{children:[(0,ht.jsx)("li",{children:(0,ht.jsx)(et,{to:"/",onClick:()=>t(!1),children:"Home"})}),(0,ht.jsx)("li",{children:(0,ht.jsx)(et,{to:"/symptom-checker",onClick:()=>t(!1),children:"Symptom Checker"})}),(0,ht.jsx)("li",{children:(0,ht.jsx)(et,{to:"/chat",onClick:()=>t(!1),children:"Chat with AI"})})]})})]})})},gt=()=>(0,ht.jsx)("footer",{className:"footer",children:(0,ht.jsxs)("div",{className:"footer-container",children:[(0,ht.jsxs)("p",{children:["\xa9 ",(new Date).getFullYear()," MedDiagnosis AI. All rights reserved."]}),(0,ht.jsx)("p",{className:"disclaimer",children:"This application is for educational purposes only. Always consult with a healthcare professional for medical advice."})]})});function yt(e,t){return function(){return e.apply(t,arguments)}}const{toString:vt}=Object.prototype,{getPrototypeOf:bt}=Object,wt=(kt=Object.create(null),e=>{const t=vt.call(e);return kt[t]||(kt[t]=t.slice(8,-1).toLowerCase())});var kt;const St=e=>(e=e.toLowerCase(),t=>wt(t)===e),xt=e=>t=>typeof t===e,{isArray:Et}=Array,Ct=xt("undefined");const Nt=St("ArrayBuffer");const Rt=xt("string"),Pt=xt("function"),Tt=xt("number"),_t=e=>null!==e&&"object"===typeof e,Ot=e=>{if("object"!==wt(e))return!1;const t=bt(e);return(null===t||t===Object.prototype||null===Object.getPrototypeOf(t))&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)},Lt=St("Date"),jt=St("File"),zt=St("Blob"),At=St("FileList"),Ft=St("URLSearchParams"),[Dt,Mt,Ut,$t]=["ReadableStream","Request","Response","Headers"].map(St);function It(e,t){let n,r,{allOwnKeys:a=!1}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(null!==e&&"undefined"!==typeof e)if("object"!==typeof e&&(e=[e]),Et(e))for(n=0,r=e.length;n<r;n++)t.call(null,e[n],n,e);else{const r=a?Object.getOwnPropertyNames(e):Object.keys(e),l=r.length;let o;for(n=0;n<l;n++)o=r[n],t.call(null,e[o],o,e)}}function Bt(e,t){t=t.toLowerCase();const n=Object.keys(e);let r,a=n.length;for(;a-- >0;)if(r=n[a],t===r.toLowerCase())return r;return null}const Ht="undefined"!==typeof globalThis?globalThis:"undefined"!==typeof self?self:"undefined"!==typeof window?window:global,Wt=e=>!Ct(e)&&e!==Ht;const qt=(Vt="undefined"!==typeof Uint8Array&&bt(Uint8Array),e=>Vt&&e instanceof Vt);var Vt;const Qt=St("HTMLFormElement"),Kt=(e=>{let{hasOwnProperty:t}=e;return(e,n)=>t.call(e,n)})(Object.prototype),Yt=St("RegExp"),Xt=(e,t)=>{const n=Object.getOwnPropertyDescriptors(e),r={};It(n,((n,a)=>{let l;!1!==(l=t(n,a,e))&&(r[a]=l||n)})),Object.defineProperties(e,r)};const Jt=St("AsyncFunction"),Gt=((e,t)=>{return e?setImmediate:t?(n=`axios@${Math.random()}`,r=[],Ht.addEventListener("message",(e=>{let{source:t,data:a}=e;t===Ht&&a===n&&r.length&&r.shift()()}),!1),e=>{r.push(e),Ht.postMessage(n,"*")}):e=>setTimeout(e);var n,r})("function"===typeof setImmediate,Pt(Ht.postMessage)),Zt="undefined"!==typeof queueMicrotask?queueMicrotask.bind(Ht):"undefined"!==typeof process&&process.nextTick||Gt,en={isArray:Et,isArrayBuffer:Nt,isBuffer:function(e){return null!==e&&!Ct(e)&&null!==e.constructor&&!Ct(e.constructor)&&Pt(e.constructor.isBuffer)&&e.constructor.isBuffer(e)},isFormData:e=>{let t;return e&&("function"===typeof FormData&&e instanceof FormData||Pt(e.append)&&("formdata"===(t=wt(e))||"object"===t&&Pt(e.toString)&&"[object FormData]"===e.toString()))},isArrayBufferView:function(e){let t;return t="undefined"!==typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView(e):e&&e.buffer&&Nt(e.buffer),t},isString:Rt,isNumber:Tt,isBoolean:e=>!0===e||!1===e,isObject:_t,isPlainObject:Ot,isReadableStream:Dt,isRequest:Mt,isResponse:Ut,isHeaders:$t,isUndefined:Ct,isDate:Lt,isFile:jt,isBlob:zt,isRegExp:Yt,isFunction:Pt,isStream:e=>_t(e)&&Pt(e.pipe),isURLSearchParams:Ft,isTypedArray:qt,isFileList:At,forEach:It,merge:function e(){const{caseless:t}=Wt(this)&&this||{},n={},r=(r,a)=>{const l=t&&Bt(n,a)||a;Ot(n[l])&&Ot(r)?n[l]=e(n[l],r):Ot(r)?n[l]=e({},r):Et(r)?n[l]=r.slice():n[l]=r};for(let a=0,l=arguments.length;a<l;a++)arguments[a]&&It(arguments[a],r);return n},extend:function(e,t,n){let{allOwnKeys:r}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};return It(t,((t,r)=>{n&&Pt(t)?e[r]=yt(t,n):e[r]=t}),{allOwnKeys:r}),e},trim:e=>e.trim?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,""),stripBOM:e=>(65279===e.charCodeAt(0)&&(e=e.slice(1)),e),inherits:(e,t,n,r)=>{e.prototype=Object.create(t.prototype,r),e.prototype.constructor=e,Object.defineProperty(e,"super",{value:t.prototype}),n&&Object.assign(e.prototype,n)},toFlatObject:(e,t,n,r)=>{let a,l,o;const i={};if(t=t||{},null==e)return t;do{for(a=Object.getOwnPropertyNames(e),l=a.length;l-- >0;)o=a[l],r&&!r(o,e,t)||i[o]||(t[o]=e[o],i[o]=!0);e=!1!==n&&bt(e)}while(e&&(!n||n(e,t))&&e!==Object.prototype);return t},kindOf:wt,kindOfTest:St,endsWith:(e,t,n)=>{e=String(e),(void 0===n||n>e.length)&&(n=e.length),n-=t.length;const r=e.indexOf(t,n);return-1!==r&&r===n},toArray:e=>{if(!e)return null;if(Et(e))return e;let t=e.length;if(!Tt(t))return null;const n=new Array(t);for(;t-- >0;)n[t]=e[t];return n},forEachEntry:(e,t)=>{const n=(e&&e[Symbol.iterator]).call(e);let r;for(;(r=n.next())&&!r.done;){const n=r.value;t.call(e,n[0],n[1])}},matchAll:(e,t)=>{let n;const r=[];for(;null!==(n=e.exec(t));)r.push(n);return r},isHTMLForm:Qt,hasOwnProperty:Kt,hasOwnProp:Kt,reduceDescriptors:Xt,freezeMethods:e=>{Xt(e,((t,n)=>{if(Pt(e)&&-1!==["arguments","caller","callee"].indexOf(n))return!1;const r=e[n];Pt(r)&&(t.enumerable=!1,"writable"in t?t.writable=!1:t.set||(t.set=()=>{throw Error("Can not rewrite read-only method '"+n+"'")}))}))},toObjectSet:(e,t)=>{const n={},r=e=>{e.forEach((e=>{n[e]=!0}))};return Et(e)?r(e):r(String(e).split(t)),n},toCamelCase:e=>e.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,(function(e,t,n){return t.toUpperCase()+n})),noop:()=>{},toFiniteNumber:(e,t)=>null!=e&&Number.isFinite(e=+e)?e:t,findKey:Bt,global:Ht,isContextDefined:Wt,isSpecCompliantForm:function(e){return!!(e&&Pt(e.append)&&"FormData"===e[Symbol.toStringTag]&&e[Symbol.iterator])},toJSONObject:e=>{const t=new Array(10),n=(e,r)=>{if(_t(e)){if(t.indexOf(e)>=0)return;if(!("toJSON"in e)){t[r]=e;const a=Et(e)?[]:{};return It(e,((e,t)=>{const l=n(e,r+1);!Ct(l)&&(a[t]=l)})),t[r]=void 0,a}}return e};return n(e,0)},isAsyncFn:Jt,isThenable:e=>e&&(_t(e)||Pt(e))&&Pt(e.then)&&Pt(e.catch),setImmediate:Gt,asap:Zt};function tn(e,t,n,r,a){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack,this.message=e,this.name="AxiosError",t&&(this.code=t),n&&(this.config=n),r&&(this.request=r),a&&(this.response=a,this.status=a.status?a.status:null)}en.inherits(tn,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:en.toJSONObject(this.config),code:this.code,status:this.status}}});const nn=tn.prototype,rn={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach((e=>{rn[e]={value:e}})),Object.defineProperties(tn,rn),Object.defineProperty(nn,"isAxiosError",{value:!0}),tn.from=(e,t,n,r,a,l)=>{const o=Object.create(nn);return en.toFlatObject(e,o,(function(e){return e!==Error.prototype}),(e=>"isAxiosError"!==e)),tn.call(o,e.message,t,n,r,a),o.cause=e,o.name=e.name,l&&Object.assign(o,l),o};const an=tn;function ln(e){return en.isPlainObject(e)||en.isArray(e)}function on(e){return en.endsWith(e,"[]")?e.slice(0,-2):e}function sn(e,t,n){return e?e.concat(t).map((function(e,t){return e=on(e),!n&&t?"["+e+"]":e})).join(n?".":""):t}const un=en.toFlatObject(en,{},null,(function(e){return/^is[A-Z]/.test(e)}));const cn=function(e,t,n){if(!en.isObject(e))throw new TypeError("target must be an object");t=t||new FormData;const r=(n=en.toFlatObject(n,{metaTokens:!0,dots:!1,indexes:!1},!1,(function(e,t){return!en.isUndefined(t[e])}))).metaTokens,a=n.visitor||u,l=n.dots,o=n.indexes,i=(n.Blob||"undefined"!==typeof Blob&&Blob)&&en.isSpecCompliantForm(t);if(!en.isFunction(a))throw new TypeError("visitor must be a function");function s(e){if(null===e)return"";if(en.isDate(e))return e.toISOString();if(!i&&en.isBlob(e))throw new an("Blob is not supported. Use a Buffer instead.");return en.isArrayBuffer(e)||en.isTypedArray(e)?i&&"function"===typeof Blob?new Blob([e]):Buffer.from(e):e}function u(e,n,a){let i=e;if(e&&!a&&"object"===typeof e)if(en.endsWith(n,"{}"))n=r?n:n.slice(0,-2),e=JSON.stringify(e);else if(en.isArray(e)&&function(e){return en.isArray(e)&&!e.some(ln)}(e)||(en.isFileList(e)||en.endsWith(n,"[]"))&&(i=en.toArray(e)))return n=on(n),i.forEach((function(e,r){!en.isUndefined(e)&&null!==e&&t.append(!0===o?sn([n],r,l):null===o?n:n+"[]",s(e))})),!1;return!!ln(e)||(t.append(sn(a,n,l),s(e)),!1)}const c=[],d=Object.assign(un,{defaultVisitor:u,convertValue:s,isVisitable:ln});if(!en.isObject(e))throw new TypeError("data must be an object");return function e(n,r){if(!en.isUndefined(n)){if(-1!==c.indexOf(n))throw Error("Circular reference detected in "+r.join("."));c.push(n),en.forEach(n,(function(n,l){!0===(!(en.isUndefined(n)||null===n)&&a.call(t,n,en.isString(l)?l.trim():l,r,d))&&e(n,r?r.concat(l):[l])})),c.pop()}}(e),t};function dn(e){const t={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(e).replace(/[!'()~]|%20|%00/g,(function(e){return t[e]}))}function fn(e,t){this._pairs=[],e&&cn(e,this,t)}const pn=fn.prototype;pn.append=function(e,t){this._pairs.push([e,t])},pn.toString=function(e){const t=e?function(t){return e.call(this,t,dn)}:dn;return this._pairs.map((function(e){return t(e[0])+"="+t(e[1])}),"").join("&")};const hn=fn;function mn(e){return encodeURIComponent(e).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+").replace(/%5B/gi,"[").replace(/%5D/gi,"]")}function gn(e,t,n){if(!t)return e;const r=n&&n.encode||mn;en.isFunction(n)&&(n={serialize:n});const a=n&&n.serialize;let l;if(l=a?a(t,n):en.isURLSearchParams(t)?t.toString():new hn(t,n).toString(r),l){const t=e.indexOf("#");-1!==t&&(e=e.slice(0,t)),e+=(-1===e.indexOf("?")?"?":"&")+l}return e}const yn=class{constructor(){this.handlers=[]}use(e,t,n){return this.handlers.push({fulfilled:e,rejected:t,synchronous:!!n&&n.synchronous,runWhen:n?n.runWhen:null}),this.handlers.length-1}eject(e){this.handlers[e]&&(this.handlers[e]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(e){en.forEach(this.handlers,(function(t){null!==t&&e(t)}))}},vn={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1},bn={isBrowser:!0,classes:{URLSearchParams:"undefined"!==typeof URLSearchParams?URLSearchParams:hn,FormData:"undefined"!==typeof FormData?FormData:null,Blob:"undefined"!==typeof Blob?Blob:null},protocols:["http","https","file","blob","url","data"]},wn="undefined"!==typeof window&&"undefined"!==typeof document,kn="object"===typeof navigator&&navigator||void 0,Sn=wn&&(!kn||["ReactNative","NativeScript","NS"].indexOf(kn.product)<0),xn="undefined"!==typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope&&"function"===typeof self.importScripts,En=wn&&window.location.href||"http://localhost",Cn={...r,...bn};const Nn=function(e){function t(e,n,r,a){let l=e[a++];if("__proto__"===l)return!0;const o=Number.isFinite(+l),i=a>=e.length;if(l=!l&&en.isArray(r)?r.length:l,i)return en.hasOwnProp(r,l)?r[l]=[r[l],n]:r[l]=n,!o;r[l]&&en.isObject(r[l])||(r[l]=[]);return t(e,n,r[l],a)&&en.isArray(r[l])&&(r[l]=function(e){const t={},n=Object.keys(e);let r;const a=n.length;let l;for(r=0;r<a;r++)l=n[r],t[l]=e[l];return t}(r[l])),!o}if(en.isFormData(e)&&en.isFunction(e.entries)){const n={};return en.forEachEntry(e,((e,r)=>{t(function(e){return en.matchAll(/\w+|\[(\w*)]/g,e).map((e=>"[]"===e[0]?"":e[1]||e[0]))}(e),r,n,0)})),n}return null};const Rn={transitional:vn,adapter:["xhr","http","fetch"],transformRequest:[function(e,t){const n=t.getContentType()||"",r=n.indexOf("application/json")>-1,a=en.isObject(e);a&&en.isHTMLForm(e)&&(e=new FormData(e));if(en.isFormData(e))return r?JSON.stringify(Nn(e)):e;if(en.isArrayBuffer(e)||en.isBuffer(e)||en.isStream(e)||en.isFile(e)||en.isBlob(e)||en.isReadableStream(e))return e;if(en.isArrayBufferView(e))return e.buffer;if(en.isURLSearchParams(e))return t.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),e.toString();let l;if(a){if(n.indexOf("application/x-www-form-urlencoded")>-1)return function(e,t){return cn(e,new Cn.classes.URLSearchParams,Object.assign({visitor:function(e,t,n,r){return Cn.isNode&&en.isBuffer(e)?(this.append(t,e.toString("base64")),!1):r.defaultVisitor.apply(this,arguments)}},t))}(e,this.formSerializer).toString();if((l=en.isFileList(e))||n.indexOf("multipart/form-data")>-1){const t=this.env&&this.env.FormData;return cn(l?{"files[]":e}:e,t&&new t,this.formSerializer)}}return a||r?(t.setContentType("application/json",!1),function(e,t,n){if(en.isString(e))try{return(t||JSON.parse)(e),en.trim(e)}catch(Qr){if("SyntaxError"!==Qr.name)throw Qr}return(n||JSON.stringify)(e)}(e)):e}],transformResponse:[function(e){const t=this.transitional||Rn.transitional,n=t&&t.forcedJSONParsing,r="json"===this.responseType;if(en.isResponse(e)||en.isReadableStream(e))return e;if(e&&en.isString(e)&&(n&&!this.responseType||r)){const n=!(t&&t.silentJSONParsing)&&r;try{return JSON.parse(e)}catch(Qr){if(n){if("SyntaxError"===Qr.name)throw an.from(Qr,an.ERR_BAD_RESPONSE,this,null,this.response);throw Qr}}}return e}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:Cn.classes.FormData,Blob:Cn.classes.Blob},validateStatus:function(e){return e>=200&&e<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};en.forEach(["delete","get","head","post","put","patch"],(e=>{Rn.headers[e]={}}));const Pn=Rn,Tn=en.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),_n=Symbol("internals");function On(e){return e&&String(e).trim().toLowerCase()}function Ln(e){return!1===e||null==e?e:en.isArray(e)?e.map(Ln):String(e)}function jn(e,t,n,r,a){return en.isFunction(r)?r.call(this,t,n):(a&&(t=n),en.isString(t)?en.isString(r)?-1!==t.indexOf(r):en.isRegExp(r)?r.test(t):void 0:void 0)}class zn{constructor(e){e&&this.set(e)}set(e,t,n){const r=this;function a(e,t,n){const a=On(t);if(!a)throw new Error("header name must be a non-empty string");const l=en.findKey(r,a);(!l||void 0===r[l]||!0===n||void 0===n&&!1!==r[l])&&(r[l||t]=Ln(e))}const l=(e,t)=>en.forEach(e,((e,n)=>a(e,n,t)));if(en.isPlainObject(e)||e instanceof this.constructor)l(e,t);else if(en.isString(e)&&(e=e.trim())&&!/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(e.trim()))l((e=>{const t={};let n,r,a;return e&&e.split("\n").forEach((function(e){a=e.indexOf(":"),n=e.substring(0,a).trim().toLowerCase(),r=e.substring(a+1).trim(),!n||t[n]&&Tn[n]||("set-cookie"===n?t[n]?t[n].push(r):t[n]=[r]:t[n]=t[n]?t[n]+", "+r:r)})),t})(e),t);else if(en.isHeaders(e))for(const[o,i]of e.entries())a(i,o,n);else null!=e&&a(t,e,n);return this}get(e,t){if(e=On(e)){const n=en.findKey(this,e);if(n){const e=this[n];if(!t)return e;if(!0===t)return function(e){const t=Object.create(null),n=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let r;for(;r=n.exec(e);)t[r[1]]=r[2];return t}(e);if(en.isFunction(t))return t.call(this,e,n);if(en.isRegExp(t))return t.exec(e);throw new TypeError("parser must be boolean|regexp|function")}}}has(e,t){if(e=On(e)){const n=en.findKey(this,e);return!(!n||void 0===this[n]||t&&!jn(0,this[n],n,t))}return!1}delete(e,t){const n=this;let r=!1;function a(e){if(e=On(e)){const a=en.findKey(n,e);!a||t&&!jn(0,n[a],a,t)||(delete n[a],r=!0)}}return en.isArray(e)?e.forEach(a):a(e),r}clear(e){const t=Object.keys(this);let n=t.length,r=!1;for(;n--;){const a=t[n];e&&!jn(0,this[a],a,e,!0)||(delete this[a],r=!0)}return r}normalize(e){const t=this,n={};return en.forEach(this,((r,a)=>{const l=en.findKey(n,a);if(l)return t[l]=Ln(r),void delete t[a];const o=e?function(e){return e.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,((e,t,n)=>t.toUpperCase()+n))}(a):String(a).trim();o!==a&&delete t[a],t[o]=Ln(r),n[o]=!0})),this}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.constructor.concat(this,...t)}toJSON(e){const t=Object.create(null);return en.forEach(this,((n,r)=>{null!=n&&!1!==n&&(t[r]=e&&en.isArray(n)?n.join(", "):n)})),t}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map((e=>{let[t,n]=e;return t+": "+n})).join("\n")}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(e){return e instanceof this?e:new this(e)}static concat(e){const t=new this(e);for(var n=arguments.length,r=new Array(n>1?n-1:0),a=1;a<n;a++)r[a-1]=arguments[a];return r.forEach((e=>t.set(e))),t}static accessor(e){const t=(this[_n]=this[_n]={accessors:{}}).accessors,n=this.prototype;function r(e){const r=On(e);t[r]||(!function(e,t){const n=en.toCamelCase(" "+t);["get","set","has"].forEach((r=>{Object.defineProperty(e,r+n,{value:function(e,n,a){return this[r].call(this,t,e,n,a)},configurable:!0})}))}(n,e),t[r]=!0)}return en.isArray(e)?e.forEach(r):r(e),this}}zn.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]),en.reduceDescriptors(zn.prototype,((e,t)=>{let{value:n}=e,r=t[0].toUpperCase()+t.slice(1);return{get:()=>n,set(e){this[r]=e}}})),en.freezeMethods(zn);const An=zn;function Fn(e,t){const n=this||Pn,r=t||n,a=An.from(r.headers);let l=r.data;return en.forEach(e,(function(e){l=e.call(n,l,a.normalize(),t?t.status:void 0)})),a.normalize(),l}function Dn(e){return!(!e||!e.__CANCEL__)}function Mn(e,t,n){an.call(this,null==e?"canceled":e,an.ERR_CANCELED,t,n),this.name="CanceledError"}en.inherits(Mn,an,{__CANCEL__:!0});const Un=Mn;function $n(e,t,n){const r=n.config.validateStatus;n.status&&r&&!r(n.status)?t(new an("Request failed with status code "+n.status,[an.ERR_BAD_REQUEST,an.ERR_BAD_RESPONSE][Math.floor(n.status/100)-4],n.config,n.request,n)):e(n)}const In=function(e,t){e=e||10;const n=new Array(e),r=new Array(e);let a,l=0,o=0;return t=void 0!==t?t:1e3,function(i){const s=Date.now(),u=r[o];a||(a=s),n[l]=i,r[l]=s;let c=o,d=0;for(;c!==l;)d+=n[c++],c%=e;if(l=(l+1)%e,l===o&&(o=(o+1)%e),s-a<t)return;const f=u&&s-u;return f?Math.round(1e3*d/f):void 0}};const Bn=function(e,t){let n,r,a=0,l=1e3/t;const o=function(t){let l=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Date.now();a=l,n=null,r&&(clearTimeout(r),r=null),e.apply(null,t)};return[function(){const e=Date.now(),t=e-a;for(var i=arguments.length,s=new Array(i),u=0;u<i;u++)s[u]=arguments[u];t>=l?o(s,e):(n=s,r||(r=setTimeout((()=>{r=null,o(n)}),l-t)))},()=>n&&o(n)]},Hn=function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:3,r=0;const a=In(50,250);return Bn((n=>{const l=n.loaded,o=n.lengthComputable?n.total:void 0,i=l-r,s=a(i);r=l;e({loaded:l,total:o,progress:o?l/o:void 0,bytes:i,rate:s||void 0,estimated:s&&o&&l<=o?(o-l)/s:void 0,event:n,lengthComputable:null!=o,[t?"download":"upload"]:!0})}),n)},Wn=(e,t)=>{const n=null!=e;return[r=>t[0]({lengthComputable:n,total:e,loaded:r}),t[1]]},qn=e=>function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return en.asap((()=>e(...n)))},Vn=Cn.hasStandardBrowserEnv?((e,t)=>n=>(n=new URL(n,Cn.origin),e.protocol===n.protocol&&e.host===n.host&&(t||e.port===n.port)))(new URL(Cn.origin),Cn.navigator&&/(msie|trident)/i.test(Cn.navigator.userAgent)):()=>!0,Qn=Cn.hasStandardBrowserEnv?{write(e,t,n,r,a,l){const o=[e+"="+encodeURIComponent(t)];en.isNumber(n)&&o.push("expires="+new Date(n).toGMTString()),en.isString(r)&&o.push("path="+r),en.isString(a)&&o.push("domain="+a),!0===l&&o.push("secure"),document.cookie=o.join("; ")},read(e){const t=document.cookie.match(new RegExp("(^|;\\s*)("+e+")=([^;]*)"));return t?decodeURIComponent(t[3]):null},remove(e){this.write(e,"",Date.now()-864e5)}}:{write(){},read:()=>null,remove(){}};function Kn(e,t,n){let r=!/^([a-z][a-z\d+\-.]*:)?\/\//i.test(t);return e&&(r||0==n)?function(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}(e,t):t}const Yn=e=>e instanceof An?{...e}:e;function Xn(e,t){t=t||{};const n={};function r(e,t,n,r){return en.isPlainObject(e)&&en.isPlainObject(t)?en.merge.call({caseless:r},e,t):en.isPlainObject(t)?en.merge({},t):en.isArray(t)?t.slice():t}function a(e,t,n,a){return en.isUndefined(t)?en.isUndefined(e)?void 0:r(void 0,e,0,a):r(e,t,0,a)}function l(e,t){if(!en.isUndefined(t))return r(void 0,t)}function o(e,t){return en.isUndefined(t)?en.isUndefined(e)?void 0:r(void 0,e):r(void 0,t)}function i(n,a,l){return l in t?r(n,a):l in e?r(void 0,n):void 0}const s={url:l,method:l,data:l,baseURL:o,transformRequest:o,transformResponse:o,paramsSerializer:o,timeout:o,timeoutMessage:o,withCredentials:o,withXSRFToken:o,adapter:o,responseType:o,xsrfCookieName:o,xsrfHeaderName:o,onUploadProgress:o,onDownloadProgress:o,decompress:o,maxContentLength:o,maxBodyLength:o,beforeRedirect:o,transport:o,httpAgent:o,httpsAgent:o,cancelToken:o,socketPath:o,responseEncoding:o,validateStatus:i,headers:(e,t,n)=>a(Yn(e),Yn(t),0,!0)};return en.forEach(Object.keys(Object.assign({},e,t)),(function(r){const l=s[r]||a,o=l(e[r],t[r],r);en.isUndefined(o)&&l!==i||(n[r]=o)})),n}const Jn=e=>{const t=Xn({},e);let n,{data:r,withXSRFToken:a,xsrfHeaderName:l,xsrfCookieName:o,headers:i,auth:s}=t;if(t.headers=i=An.from(i),t.url=gn(Kn(t.baseURL,t.url,t.allowAbsoluteUrls),e.params,e.paramsSerializer),s&&i.set("Authorization","Basic "+btoa((s.username||"")+":"+(s.password?unescape(encodeURIComponent(s.password)):""))),en.isFormData(r))if(Cn.hasStandardBrowserEnv||Cn.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if(!1!==(n=i.getContentType())){const[e,...t]=n?n.split(";").map((e=>e.trim())).filter(Boolean):[];i.setContentType([e||"multipart/form-data",...t].join("; "))}if(Cn.hasStandardBrowserEnv&&(a&&en.isFunction(a)&&(a=a(t)),a||!1!==a&&Vn(t.url))){const e=l&&o&&Qn.read(o);e&&i.set(l,e)}return t},Gn="undefined"!==typeof XMLHttpRequest&&function(e){return new Promise((function(t,n){const r=Jn(e);let a=r.data;const l=An.from(r.headers).normalize();let o,i,s,u,c,{responseType:d,onUploadProgress:f,onDownloadProgress:p}=r;function h(){u&&u(),c&&c(),r.cancelToken&&r.cancelToken.unsubscribe(o),r.signal&&r.signal.removeEventListener("abort",o)}let m=new XMLHttpRequest;function g(){if(!m)return;const r=An.from("getAllResponseHeaders"in m&&m.getAllResponseHeaders());$n((function(e){t(e),h()}),(function(e){n(e),h()}),{data:d&&"text"!==d&&"json"!==d?m.response:m.responseText,status:m.status,statusText:m.statusText,headers:r,config:e,request:m}),m=null}m.open(r.method.toUpperCase(),r.url,!0),m.timeout=r.timeout,"onloadend"in m?m.onloadend=g:m.onreadystatechange=function(){m&&4===m.readyState&&(0!==m.status||m.responseURL&&0===m.responseURL.indexOf("file:"))&&setTimeout(g)},m.onabort=function(){m&&(n(new an("Request aborted",an.ECONNABORTED,e,m)),m=null)},m.onerror=function(){n(new an("Network Error",an.ERR_NETWORK,e,m)),m=null},m.ontimeout=function(){let t=r.timeout?"timeout of "+r.timeout+"ms exceeded":"timeout exceeded";const a=r.transitional||vn;r.timeoutErrorMessage&&(t=r.timeoutErrorMessage),n(new an(t,a.clarifyTimeoutError?an.ETIMEDOUT:an.ECONNABORTED,e,m)),m=null},void 0===a&&l.setContentType(null),"setRequestHeader"in m&&en.forEach(l.toJSON(),(function(e,t){m.setRequestHeader(t,e)})),en.isUndefined(r.withCredentials)||(m.withCredentials=!!r.withCredentials),d&&"json"!==d&&(m.responseType=r.responseType),p&&([s,c]=Hn(p,!0),m.addEventListener("progress",s)),f&&m.upload&&([i,u]=Hn(f),m.upload.addEventListener("progress",i),m.upload.addEventListener("loadend",u)),(r.cancelToken||r.signal)&&(o=t=>{m&&(n(!t||t.type?new Un(null,e,m):t),m.abort(),m=null)},r.cancelToken&&r.cancelToken.subscribe(o),r.signal&&(r.signal.aborted?o():r.signal.addEventListener("abort",o)));const y=function(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}(r.url);y&&-1===Cn.protocols.indexOf(y)?n(new an("Unsupported protocol "+y+":",an.ERR_BAD_REQUEST,e)):m.send(a||null)}))},Zn=(e,t)=>{const{length:n}=e=e?e.filter(Boolean):[];if(t||n){let n,r=new AbortController;const a=function(e){if(!n){n=!0,o();const t=e instanceof Error?e:this.reason;r.abort(t instanceof an?t:new Un(t instanceof Error?t.message:t))}};let l=t&&setTimeout((()=>{l=null,a(new an(`timeout ${t} of ms exceeded`,an.ETIMEDOUT))}),t);const o=()=>{e&&(l&&clearTimeout(l),l=null,e.forEach((e=>{e.unsubscribe?e.unsubscribe(a):e.removeEventListener("abort",a)})),e=null)};e.forEach((e=>e.addEventListener("abort",a)));const{signal:i}=r;return i.unsubscribe=()=>en.asap(o),i}},er=function*(e,t){let n=e.byteLength;if(!t||n<t)return void(yield e);let r,a=0;for(;a<n;)r=a+t,yield e.slice(a,r),a=r},tr=async function*(e){if(e[Symbol.asyncIterator])return void(yield*e);const t=e.getReader();try{for(;;){const{done:e,value:n}=await t.read();if(e)break;yield n}}finally{await t.cancel()}},nr=(e,t,n,r)=>{const a=async function*(e,t){for await(const n of tr(e))yield*er(n,t)}(e,t);let l,o=0,i=e=>{l||(l=!0,r&&r(e))};return new ReadableStream({async pull(e){try{const{done:t,value:r}=await a.next();if(t)return i(),void e.close();let l=r.byteLength;if(n){let e=o+=l;n(e)}e.enqueue(new Uint8Array(r))}catch(t){throw i(t),t}},cancel:e=>(i(e),a.return())},{highWaterMark:2})},rr="function"===typeof fetch&&"function"===typeof Request&&"function"===typeof Response,ar=rr&&"function"===typeof ReadableStream,lr=rr&&("function"===typeof TextEncoder?(e=>t=>e.encode(t))(new TextEncoder):async e=>new Uint8Array(await new Response(e).arrayBuffer())),or=function(e){try{for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return!!e(...n)}catch(Qr){return!1}},ir=ar&&or((()=>{let e=!1;const t=new Request(Cn.origin,{body:new ReadableStream,method:"POST",get duplex(){return e=!0,"half"}}).headers.has("Content-Type");return e&&!t})),sr=ar&&or((()=>en.isReadableStream(new Response("").body))),ur={stream:sr&&(e=>e.body)};var cr;rr&&(cr=new Response,["text","arrayBuffer","blob","formData","stream"].forEach((e=>{!ur[e]&&(ur[e]=en.isFunction(cr[e])?t=>t[e]():(t,n)=>{throw new an(`Response type '${e}' is not supported`,an.ERR_NOT_SUPPORT,n)})})));const dr=async(e,t)=>{const n=en.toFiniteNumber(e.getContentLength());return null==n?(async e=>{if(null==e)return 0;if(en.isBlob(e))return e.size;if(en.isSpecCompliantForm(e)){const t=new Request(Cn.origin,{method:"POST",body:e});return(await t.arrayBuffer()).byteLength}return en.isArrayBufferView(e)||en.isArrayBuffer(e)?e.byteLength:(en.isURLSearchParams(e)&&(e+=""),en.isString(e)?(await lr(e)).byteLength:void 0)})(t):n},fr=rr&&(async e=>{let{url:t,method:n,data:r,signal:a,cancelToken:l,timeout:o,onDownloadProgress:i,onUploadProgress:s,responseType:u,headers:c,withCredentials:d="same-origin",fetchOptions:f}=Jn(e);u=u?(u+"").toLowerCase():"text";let p,h=Zn([a,l&&l.toAbortSignal()],o);const m=h&&h.unsubscribe&&(()=>{h.unsubscribe()});let g;try{if(s&&ir&&"get"!==n&&"head"!==n&&0!==(g=await dr(c,r))){let e,n=new Request(t,{method:"POST",body:r,duplex:"half"});if(en.isFormData(r)&&(e=n.headers.get("content-type"))&&c.setContentType(e),n.body){const[e,t]=Wn(g,Hn(qn(s)));r=nr(n.body,65536,e,t)}}en.isString(d)||(d=d?"include":"omit");const a="credentials"in Request.prototype;p=new Request(t,{...f,signal:h,method:n.toUpperCase(),headers:c.normalize().toJSON(),body:r,duplex:"half",credentials:a?d:void 0});let l=await fetch(p);const o=sr&&("stream"===u||"response"===u);if(sr&&(i||o&&m)){const e={};["status","statusText","headers"].forEach((t=>{e[t]=l[t]}));const t=en.toFiniteNumber(l.headers.get("content-length")),[n,r]=i&&Wn(t,Hn(qn(i),!0))||[];l=new Response(nr(l.body,65536,n,(()=>{r&&r(),m&&m()})),e)}u=u||"text";let y=await ur[en.findKey(ur,u)||"text"](l,e);return!o&&m&&m(),await new Promise(((t,n)=>{$n(t,n,{data:y,headers:An.from(l.headers),status:l.status,statusText:l.statusText,config:e,request:p})}))}catch(y){if(m&&m(),y&&"TypeError"===y.name&&/fetch/i.test(y.message))throw Object.assign(new an("Network Error",an.ERR_NETWORK,e,p),{cause:y.cause||y});throw an.from(y,y&&y.code,e,p)}}),pr={http:null,xhr:Gn,fetch:fr};en.forEach(pr,((e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch(Qr){}Object.defineProperty(e,"adapterName",{value:t})}}));const hr=e=>`- ${e}`,mr=e=>en.isFunction(e)||null===e||!1===e,gr=e=>{e=en.isArray(e)?e:[e];const{length:t}=e;let n,r;const a={};for(let l=0;l<t;l++){let t;if(n=e[l],r=n,!mr(n)&&(r=pr[(t=String(n)).toLowerCase()],void 0===r))throw new an(`Unknown adapter '${t}'`);if(r)break;a[t||"#"+l]=r}if(!r){const e=Object.entries(a).map((e=>{let[t,n]=e;return`adapter ${t} `+(!1===n?"is not supported by the environment":"is not available in the build")}));let n=t?e.length>1?"since :\n"+e.map(hr).join("\n"):" "+hr(e[0]):"as no adapter specified";throw new an("There is no suitable adapter to dispatch the request "+n,"ERR_NOT_SUPPORT")}return r};function yr(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new Un(null,e)}function vr(e){yr(e),e.headers=An.from(e.headers),e.data=Fn.call(e,e.transformRequest),-1!==["post","put","patch"].indexOf(e.method)&&e.headers.setContentType("application/x-www-form-urlencoded",!1);return gr(e.adapter||Pn.adapter)(e).then((function(t){return yr(e),t.data=Fn.call(e,e.transformResponse,t),t.headers=An.from(t.headers),t}),(function(t){return Dn(t)||(yr(e),t&&t.response&&(t.response.data=Fn.call(e,e.transformResponse,t.response),t.response.headers=An.from(t.response.headers))),Promise.reject(t)}))}const br="1.8.4",wr={};["object","boolean","number","function","string","symbol"].forEach(((e,t)=>{wr[e]=function(n){return typeof n===e||"a"+(t<1?"n ":" ")+e}}));const kr={};wr.transitional=function(e,t,n){function r(e,t){return"[Axios v1.8.4] Transitional option '"+e+"'"+t+(n?". "+n:"")}return(n,a,l)=>{if(!1===e)throw new an(r(a," has been removed"+(t?" in "+t:"")),an.ERR_DEPRECATED);return t&&!kr[a]&&(kr[a]=!0,console.warn(r(a," has been deprecated since v"+t+" and will be removed in the near future"))),!e||e(n,a,l)}},wr.spelling=function(e){return(t,n)=>(console.warn(`${n} is likely a misspelling of ${e}`),!0)};const Sr={assertOptions:function(e,t,n){if("object"!==typeof e)throw new an("options must be an object",an.ERR_BAD_OPTION_VALUE);const r=Object.keys(e);let a=r.length;for(;a-- >0;){const l=r[a],o=t[l];if(o){const t=e[l],n=void 0===t||o(t,l,e);if(!0!==n)throw new an("option "+l+" must be "+n,an.ERR_BAD_OPTION_VALUE)}else if(!0!==n)throw new an("Unknown option "+l,an.ERR_BAD_OPTION)}},validators:wr},xr=Sr.validators;class Er{constructor(e){this.defaults=e,this.interceptors={request:new yn,response:new yn}}async request(e,t){try{return await this._request(e,t)}catch(n){if(n instanceof Error){let e={};Error.captureStackTrace?Error.captureStackTrace(e):e=new Error;const t=e.stack?e.stack.replace(/^.+\n/,""):"";try{n.stack?t&&!String(n.stack).endsWith(t.replace(/^.+\n.+\n/,""))&&(n.stack+="\n"+t):n.stack=t}catch(Qr){}}throw n}}_request(e,t){"string"===typeof e?(t=t||{}).url=e:t=e||{},t=Xn(this.defaults,t);const{transitional:n,paramsSerializer:r,headers:a}=t;void 0!==n&&Sr.assertOptions(n,{silentJSONParsing:xr.transitional(xr.boolean),forcedJSONParsing:xr.transitional(xr.boolean),clarifyTimeoutError:xr.transitional(xr.boolean)},!1),null!=r&&(en.isFunction(r)?t.paramsSerializer={serialize:r}:Sr.assertOptions(r,{encode:xr.function,serialize:xr.function},!0)),void 0!==t.allowAbsoluteUrls||(void 0!==this.defaults.allowAbsoluteUrls?t.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:t.allowAbsoluteUrls=!0),Sr.assertOptions(t,{baseUrl:xr.spelling("baseURL"),withXsrfToken:xr.spelling("withXSRFToken")},!0),t.method=(t.method||this.defaults.method||"get").toLowerCase();let l=a&&en.merge(a.common,a[t.method]);a&&en.forEach(["delete","get","head","post","put","patch","common"],(e=>{delete a[e]})),t.headers=An.concat(l,a);const o=[];let i=!0;this.interceptors.request.forEach((function(e){"function"===typeof e.runWhen&&!1===e.runWhen(t)||(i=i&&e.synchronous,o.unshift(e.fulfilled,e.rejected))}));const s=[];let u;this.interceptors.response.forEach((function(e){s.push(e.fulfilled,e.rejected)}));let c,d=0;if(!i){const e=[vr.bind(this),void 0];for(e.unshift.apply(e,o),e.push.apply(e,s),c=e.length,u=Promise.resolve(t);d<c;)u=u.then(e[d++],e[d++]);return u}c=o.length;let f=t;for(d=0;d<c;){const e=o[d++],t=o[d++];try{f=e(f)}catch(p){t.call(this,p);break}}try{u=vr.call(this,f)}catch(p){return Promise.reject(p)}for(d=0,c=s.length;d<c;)u=u.then(s[d++],s[d++]);return u}getUri(e){return gn(Kn((e=Xn(this.defaults,e)).baseURL,e.url,e.allowAbsoluteUrls),e.params,e.paramsSerializer)}}en.forEach(["delete","get","head","options"],(function(e){Er.prototype[e]=function(t,n){return this.request(Xn(n||{},{method:e,url:t,data:(n||{}).data}))}})),en.forEach(["post","put","patch"],(function(e){function t(t){return function(n,r,a){return this.request(Xn(a||{},{method:e,headers:t?{"Content-Type":"multipart/form-data"}:{},url:n,data:r}))}}Er.prototype[e]=t(),Er.prototype[e+"Form"]=t(!0)}));const Cr=Er;class Nr{constructor(e){if("function"!==typeof e)throw new TypeError("executor must be a function.");let t;this.promise=new Promise((function(e){t=e}));const n=this;this.promise.then((e=>{if(!n._listeners)return;let t=n._listeners.length;for(;t-- >0;)n._listeners[t](e);n._listeners=null})),this.promise.then=e=>{let t;const r=new Promise((e=>{n.subscribe(e),t=e})).then(e);return r.cancel=function(){n.unsubscribe(t)},r},e((function(e,r,a){n.reason||(n.reason=new Un(e,r,a),t(n.reason))}))}throwIfRequested(){if(this.reason)throw this.reason}subscribe(e){this.reason?e(this.reason):this._listeners?this._listeners.push(e):this._listeners=[e]}unsubscribe(e){if(!this._listeners)return;const t=this._listeners.indexOf(e);-1!==t&&this._listeners.splice(t,1)}toAbortSignal(){const e=new AbortController,t=t=>{e.abort(t)};return this.subscribe(t),e.signal.unsubscribe=()=>this.unsubscribe(t),e.signal}static source(){let e;return{token:new Nr((function(t){e=t})),cancel:e}}}const Rr=Nr;const Pr={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Pr).forEach((e=>{let[t,n]=e;Pr[n]=t}));const Tr=Pr;const _r=function e(t){const n=new Cr(t),r=yt(Cr.prototype.request,n);return en.extend(r,Cr.prototype,n,{allOwnKeys:!0}),en.extend(r,n,null,{allOwnKeys:!0}),r.create=function(n){return e(Xn(t,n))},r}(Pn);_r.Axios=Cr,_r.CanceledError=Un,_r.CancelToken=Rr,_r.isCancel=Dn,_r.VERSION=br,_r.toFormData=cn,_r.AxiosError=an,_r.Cancel=_r.CanceledError,_r.all=function(e){return Promise.all(e)},_r.spread=function(e){return function(t){return e.apply(null,t)}},_r.isAxiosError=function(e){return en.isObject(e)&&!0===e.isAxiosError},_r.mergeConfig=Xn,_r.AxiosHeaders=An,_r.formToJSON=e=>Nn(en.isHTMLForm(e)?new FormData(e):e),_r.getAdapter=gr,_r.HttpStatusCode=Tr,_r.default=_r;const Or=_r,Lr=(0,a.createContext)(),jr=e=>{let{children:t}=e;const[n,r]=(0,a.useState)({}),[l,o]=(0,a.useState)(!0),[i,s]=(0,a.useState)(null);return(0,a.useEffect)((()=>{(async()=>{try{const e=await Or.get("http://localhost:5000/api/models");r(e.data),o(!1)}catch(e){s("Failed to load models"),o(!1)}})()}),[]),(0,ht.jsx)(Lr.Provider,{value:{models:n,loading:l,error:i},children:t})},zr=e=>{let{model:t,onClick:n,selected:r}=e;return(0,ht.jsx)("div",{className:"model-card "+(r?"selected":""),onClick:()=>n(t.key),children:(0,ht.jsxs)("div",{className:"model-card-content",children:[(0,ht.jsx)("h3",{children:t.display_name}),(0,ht.jsx)("p",{children:t.description}),(0,ht.jsxs)("div",{className:"model-classes",children:[(0,ht.jsx)("strong",{children:"Detects: "}),t.classes.join(", ")]})]})})},Ar=dt("upload",[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"17 8 12 3 7 8",key:"t8dd8p"}],["line",{x1:"12",x2:"12",y1:"3",y2:"15",key:"widbto"}]]),Fr=e=>{let{onImageSelect:t}=e;const[n,r]=(0,a.useState)(null),[l,o]=(0,a.useState)(!1),i=e=>{e.preventDefault(),e.stopPropagation(),"dragenter"===e.type||"dragover"===e.type?o(!0):"dragleave"===e.type&&o(!1)},s=e=>{const n=new FileReader;n.onload=n=>{r(n.target.result),t(e)},n.readAsDataURL(e)};return(0,ht.jsx)("div",{className:"image-upload-container",children:n?(0,ht.jsxs)("div",{className:"image-preview",children:[(0,ht.jsx)("img",{src:n,alt:"Preview"}),(0,ht.jsx)("button",{className:"remove-image",onClick:()=>{r(null),t(null)},children:(0,ht.jsx)(ft,{size:20})})]}):(0,ht.jsx)("div",{className:"dropzone "+(l?"active":""),onDragEnter:i,onDragOver:i,onDragLeave:i,onDrop:e=>{e.preventDefault(),e.stopPropagation(),o(!1),e.dataTransfer.files&&e.dataTransfer.files[0]&&s(e.dataTransfer.files[0])},children:(0,ht.jsxs)("div",{className:"dropzone-content",children:[(0,ht.jsx)(Ar,{size:48}),(0,ht.jsx)("p",{children:"Drag and drop an image here or click to select"}),(0,ht.jsx)("input",{type:"file",id:"image-upload",accept:"image/png, image/jpeg, image/jpg",onChange:e=>{e.target.files&&e.target.files[0]&&s(e.target.files[0])}}),(0,ht.jsx)("label",{htmlFor:"image-upload",className:"upload-button",children:"Select Image"})]})})})},Dr=dt("loader",[["path",{d:"M12 2v4",key:"3427ic"}],["path",{d:"m16.2 7.8 2.9-2.9",key:"r700ao"}],["path",{d:"M18 12h4",key:"wj9ykh"}],["path",{d:"m16.2 16.2 2.9 2.9",key:"1bxg5t"}],["path",{d:"M12 18v4",key:"jadmvz"}],["path",{d:"m4.9 19.1 2.9-2.9",key:"bwix9q"}],["path",{d:"M2 12h4",key:"j09sii"}],["path",{d:"m4.9 4.9 2.9 2.9",key:"giyufr"}]]),Mr=()=>{const{models:e,loading:t}=(0,a.useContext)(Lr),[n,r]=(0,a.useState)(null),[l,o]=(0,a.useState)(null),[i,s]=(0,a.useState)(null),[u,c]=(0,a.useState)(!1),[d,f]=(0,a.useState)(null),p=(te(),G());(0,a.useEffect)((()=>{const t=new URLSearchParams(p.search).get("model");t&&e[t]?r(t):Object.keys(e).length>0&&!n&&r(Object.keys(e)[0])}),[p.search,e,n]);const h=e=>{r(e),s(null)};return t?(0,ht.jsxs)("div",{className:"loading-container",children:[(0,ht.jsx)(Dr,{size:48,className:"spinner"}),(0,ht.jsx)("p",{children:"Loading models..."})]}):(0,ht.jsxs)("div",{className:"home-container",children:[(0,ht.jsxs)("section",{className:"hero",children:[(0,ht.jsx)("h1",{children:"AI-Powered Medical Diagnosis"}),(0,ht.jsx)("p",{children:"Upload medical images for instant analysis using our advanced AI models"})]}),(0,ht.jsxs)("section",{className:"model-selection",children:[(0,ht.jsx)("h2",{children:"1. Select a Diagnostic Model"}),(0,ht.jsx)("div",{className:"model-grid",children:Object.entries(e).map((e=>{let[t,r]=e;return(0,ht.jsx)(zr,{model:{...r,key:t},onClick:h,selected:n===t},t)}))})]}),(0,ht.jsxs)("section",{className:"image-section",children:[(0,ht.jsx)("h2",{children:"2. Upload a Medical Image"}),(0,ht.jsx)(Fr,{onImageSelect:e=>{o(e),s(null),f(null)}})]}),(0,ht.jsxs)("section",{className:"action-section",children:[(0,ht.jsx)("button",{className:"analyze-button",onClick:async()=>{if(n&&l){c(!0),f(null);try{const e=new FormData;e.append("file",l),e.append("model",n),e.append("wait_for_report","true");const t=await Or.post("http://localhost:5000/predict",e);s(t.data)}catch(r){var e,t;f((null===(e=r.response)||void 0===e||null===(t=e.data)||void 0===t?void 0:t.error)||"Failed to process the image. Please try again."),console.error(r)}finally{c(!1)}}else f("Please select a model and upload an image.")},disabled:u||!n||!l,children:u?(0,ht.jsxs)(ht.Fragment,{children:[(0,ht.jsx)(Dr,{size:20,className:"spinner"}),"Analyzing..."]}):"Analyze Image"}),d&&(0,ht.jsx)("p",{className:"error-message",children:d})]}),i&&(0,ht.jsxs)("section",{className:"results-section",children:[(0,ht.jsx)("h2",{children:"Analysis Results"}),(0,ht.jsxs)("div",{className:"result-card",children:[(0,ht.jsxs)("div",{className:"result-header",children:[(0,ht.jsxs)("h3",{children:["Diagnosis: ",i.prediction]}),(0,ht.jsxs)("span",{className:"confidence",children:["Confidence: ",i.confidence.toFixed(2),"%"]})]}),(0,ht.jsxs)("div",{className:"result-details",children:[(0,ht.jsx)("h4",{children:"Probability Distribution:"}),(0,ht.jsx)("div",{className:"probability-bars",children:Object.entries(i.probabilities).map((e=>{let[t,n]=e;return(0,ht.jsxs)("div",{className:"probability-item",children:[(0,ht.jsx)("div",{className:"probability-label",children:t}),(0,ht.jsxs)("div",{className:"probability-bar-container",children:[(0,ht.jsx)("div",{className:"probability-bar",style:{width:`${n}%`}}),(0,ht.jsxs)("span",{className:"probability-value",children:[n.toFixed(2),"%"]})]})]},t)}))})]}),i.report_content&&(0,ht.jsxs)("div",{className:"report-preview",children:[(0,ht.jsx)("h4",{children:"Report Summary:"}),(0,ht.jsx)("div",{className:"report-content",children:i.report_content.split("\n\n").map(((e,t)=>(0,ht.jsx)("p",{children:e},t)))})]}),(0,ht.jsx)("div",{className:"result-actions",children:(0,ht.jsx)("button",{onClick:()=>{i&&i.report_url&&window.open(`http://localhost:5000${i.report_url}`,"_blank")},className:"view-report-button",children:"View Full Report"})})]})]})]})},Ur=dt("send",[["path",{d:"M14.536 21.686a.5.5 0 0 0 .937-.024l6.5-19a.496.496 0 0 0-.635-.635l-19 6.5a.5.5 0 0 0-.024.937l7.93 3.18a2 2 0 0 1 1.112 1.11z",key:"1ffxy3"}],["path",{d:"m21.854 2.147-10.94 10.939",key:"12cjpa"}]]),$r=()=>{const[e,t]=(0,a.useState)([]),[n,r]=(0,a.useState)(""),[l,o]=(0,a.useState)(!1),i=(0,a.useRef)(null);(0,a.useEffect)((()=>{(()=>{var e;null===(e=i.current)||void 0===e||e.scrollIntoView({behavior:"smooth"})})()}),[e]);return(0,ht.jsxs)("div",{className:"chat-container",children:[(0,ht.jsxs)("div",{className:"messages",children:[0===e.length?(0,ht.jsxs)("div",{className:"welcome-message",children:[(0,ht.jsx)("h3",{children:"Welcome to MedDiagnosis AI Chat"}),(0,ht.jsx)("p",{children:"Ask me any questions about medical conditions, symptoms, or how to use our diagnostic tools."})]}):e.map(((e,t)=>(0,ht.jsx)("div",{className:`message ${e.sender} ${e.error?"error":""}`,children:(0,ht.jsx)("div",{className:"message-content",children:e.text})},t))),l&&(0,ht.jsx)("div",{className:"message bot",children:(0,ht.jsx)("div",{className:"message-content",children:(0,ht.jsxs)("div",{className:"typing-indicator",children:[(0,ht.jsx)("span",{}),(0,ht.jsx)("span",{}),(0,ht.jsx)("span",{})]})})}),(0,ht.jsx)("div",{ref:i})]}),(0,ht.jsxs)("form",{className:"chat-input",onSubmit:async e=>{if(e.preventDefault(),!n.trim())return;const a=n;r(""),o(!0),t((e=>[...e,{text:a,sender:"user"}]));try{const e=await Or.post("http://localhost:5000/api/chat",{message:a});t((t=>[...t,{text:e.data.response,sender:"bot"}]))}catch(l){console.error("Error sending message:",l),t((e=>[...e,{text:"Sorry, there was an error processing your request. Please try again.",sender:"bot",error:!0}]))}finally{o(!1)}},children:[(0,ht.jsx)("input",{type:"text",value:n,onChange:e=>r(e.target.value),placeholder:"Type your message...",disabled:l}),(0,ht.jsx)("button",{type:"submit",disabled:l||!n.trim(),children:(0,ht.jsx)(Ur,{size:20})})]})]})},Ir=()=>(0,ht.jsxs)("div",{className:"chat-interface",children:[(0,ht.jsxs)("div",{className:"chat-header",children:[(0,ht.jsx)("h1",{children:"Medical AI Assistant"}),(0,ht.jsx)("p",{children:"Ask questions about medical conditions, symptoms, or how to use our diagnostic tools"})]}),(0,ht.jsx)($r,{})]}),Br=e=>{let{onSubmit:t}=e;const[n,r]=(0,a.useState)(""),[l,o]=(0,a.useState)(""),[i,s]=(0,a.useState)(""),[u,c]=(0,a.useState)(""),[d,f]=(0,a.useState)(!1);return(0,ht.jsxs)("form",{className:"symptom-form",onSubmit:async e=>{e.preventDefault(),f(!0);try{const e=await Or.post("http://localhost:5000/api/check-symptoms",{symptoms:n,age:l,gender:i,medicalHistory:u});t(e.data)}catch(r){console.error("Error checking symptoms:",r)}finally{f(!1)}},children:[(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"symptoms",children:"Describe your symptoms:"}),(0,ht.jsx)("textarea",{id:"symptoms",value:n,onChange:e=>r(e.target.value),required:!0,placeholder:"Describe your symptoms in detail. Include when they started, severity, and any factors that make them better or worse.",rows:5})]}),(0,ht.jsxs)("div",{className:"form-row",children:[(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"age",children:"Age:"}),(0,ht.jsx)("input",{type:"number",id:"age",value:l,onChange:e=>o(e.target.value),min:"0",max:"120",placeholder:"Enter your age"})]}),(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"gender",children:"Gender:"}),(0,ht.jsxs)("select",{id:"gender",value:i,onChange:e=>s(e.target.value),children:[(0,ht.jsx)("option",{value:"",children:"Select gender"}),(0,ht.jsx)("option",{value:"male",children:"Male"}),(0,ht.jsx)("option",{value:"female",children:"Female"}),(0,ht.jsx)("option",{value:"other",children:"Other"}),(0,ht.jsx)("option",{value:"prefer-not-to-say",children:"Prefer not to say"})]})]})]}),(0,ht.jsxs)("div",{className:"form-group",children:[(0,ht.jsx)("label",{htmlFor:"medicalHistory",children:"Medical History (optional):"}),(0,ht.jsx)("textarea",{id:"medicalHistory",value:u,onChange:e=>c(e.target.value),placeholder:"List any existing medical conditions, medications, allergies, or relevant family history.",rows:3})]}),(0,ht.jsx)("button",{type:"submit",className:"submit-button",disabled:d||!n.trim(),children:d?"Analyzing...":"Analyze Symptoms"})]})},Hr=e=>{let{result:t}=e;return t?(0,ht.jsxs)("div",{className:"diagnosis-result",children:[(0,ht.jsxs)("div",{className:"result-content",children:[(0,ht.jsx)("h2",{children:"Symptom Analysis"}),(0,ht.jsx)("div",{className:"analysis-text",children:t.analysis.split("\n").map(((e,t)=>(0,ht.jsx)("p",{children:e},t)))})]}),t.recommended_models&&t.recommended_models.length>0&&(0,ht.jsxs)("div",{className:"recommended-models",children:[(0,ht.jsx)("h3",{children:"Recommended Diagnostic Models"}),(0,ht.jsx)("p",{children:"Based on your symptoms, these diagnostic models might be helpful:"}),(0,ht.jsx)("div",{className:"model-cards",children:t.recommended_models.map((e=>(0,ht.jsxs)("div",{className:"recommended-model",children:[(0,ht.jsx)(zr,{model:e,onClick:()=>{}}),(0,ht.jsx)(et,{to:`/?model=${e.key}`,className:"use-model-button",children:"Use This Model"})]},e.key)))})]})]}):null},Wr=()=>{const[e,t]=(0,a.useState)(null);return(0,ht.jsxs)("div",{className:"symptom-checker",children:[(0,ht.jsxs)("div",{className:"symptom-checker-header",children:[(0,ht.jsx)("h1",{children:"Symptom Checker"}),(0,ht.jsx)("p",{children:"Describe your symptoms to get a preliminary analysis and recommendations"})]}),(0,ht.jsx)("div",{className:"symptom-checker-content",children:e?(0,ht.jsxs)("div",{className:"analysis-result",children:[(0,ht.jsx)(Hr,{result:e}),(0,ht.jsx)("button",{onClick:()=>t(null),className:"back-button",children:"Check New Symptoms"})]}):(0,ht.jsx)(Br,{onSubmit:e=>{t(e)}})})]})},qr=()=>{const{reportId:e}=function(){let{matches:e}=a.useContext(Y),t=e[e.length-1];return t?t.params:{}}(),[t,n]=(0,a.useState)(null);return(0,a.useEffect)((()=>{e&&n(`/reports/${e}`)}),[e]),(0,ht.jsx)("div",{className:"report-viewer",children:t?(0,ht.jsx)("iframe",{src:t,title:"Medical Report",className:"report-frame"}):(0,ht.jsxs)("div",{className:"report-error",children:[(0,ht.jsx)("h2",{children:"Report Not Found"}),(0,ht.jsx)("p",{children:"The requested report could not be loaded."})]})})};const Vr=function(){return(0,ht.jsx)(jr,{children:(0,ht.jsx)(Ge,{children:(0,ht.jsxs)("div",{className:"app",children:[(0,ht.jsx)(mt,{}),(0,ht.jsx)("main",{className:"main-content",children:(0,ht.jsxs)(ve,{children:[(0,ht.jsx)(ge,{path:"/",element:(0,ht.jsx)(Mr,{})}),(0,ht.jsx)(ge,{path:"/chat",element:(0,ht.jsx)(Ir,{})}),(0,ht.jsx)(ge,{path:"/symptom-checker",element:(0,ht.jsx)(Wr,{})}),(0,ht.jsx)(ge,{path:"/report/:reportId",element:(0,ht.jsx)(qr,{})})]})}),(0,ht.jsx)(gt,{})]})})})};l.createRoot(document.getElementById("root")).render((0,ht.jsx)(a.StrictMode,{children:(0,ht.jsx)(Vr,{})}))})();
 //# sourceMappingURL=main.5d1c5dc3.js.map
\ No newline at end of file
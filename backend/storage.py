@@ -0,0 +1,716 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Each entry upgrades the schema by one version (tracked in PRAGMA user_version)
+MIGRATIONS = [
+    # 1: users, chat rooms/messages and video rooms
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id TEXT PRIMARY KEY,
+        email TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        password TEXT NOT NULL,
+        role TEXT NOT NULL,
+        specialty TEXT,
+        availability INTEGER,
+        status TEXT NOT NULL DEFAULT 'offline',
+        avatar TEXT,
+        created_at REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_users_role_specialty ON users(role, specialty);
+
+    CREATE TABLE IF NOT EXISTS chat_rooms (
+        id TEXT PRIMARY KEY,
+        name TEXT,
+        created_at REAL
+    );
+    CREATE TABLE IF NOT EXISTS chat_room_participants (
+        room_id TEXT NOT NULL REFERENCES chat_rooms(id) ON DELETE CASCADE,
+        user_id TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        PRIMARY KEY (room_id, user_id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_chat_participants_user ON chat_room_participants(user_id, room_id);
+
+    CREATE TABLE IF NOT EXISTS chat_messages (
+        id TEXT PRIMARY KEY,
+        room_id TEXT NOT NULL,
+        sender_id TEXT NOT NULL,
+        sender_name TEXT,
+        content TEXT,
+        timestamp REAL NOT NULL,
+        read INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_chat_messages_room_time ON chat_messages(room_id, timestamp);
+
+    CREATE TABLE IF NOT EXISTS video_rooms (
+        id TEXT PRIMARY KEY,
+        creator TEXT,
+        created_at REAL NOT NULL,
+        patient_id TEXT,
+        doctor_id TEXT,
+        active INTEGER NOT NULL DEFAULT 1,
+        call_status TEXT,
+        ended_by TEXT,
+        end_time REAL,
+        end_reason TEXT,
+        follow_up TEXT,
+        notes TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_video_rooms_active_created ON video_rooms(active, created_at);
+    CREATE TABLE IF NOT EXISTS video_room_participants (
+        room_id TEXT NOT NULL REFERENCES video_rooms(id) ON DELETE CASCADE,
+        user_id TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        PRIMARY KEY (room_id, user_id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_video_participants_user ON video_room_participants(user_id, room_id);
+    """,
+    # 2: (user, user) -> one-to-one chat room, stored with user_a < user_b
+    """
+    CREATE TABLE IF NOT EXISTS chat_room_pairs (
+        user_a TEXT NOT NULL,
+        user_b TEXT NOT NULL,
+        room_id TEXT NOT NULL REFERENCES chat_rooms(id) ON DELETE CASCADE,
+        PRIMARY KEY (user_a, user_b)
+    );
+    CREATE INDEX IF NOT EXISTS idx_chat_room_pairs_b ON chat_room_pairs(user_b, user_a);
+    INSERT OR IGNORE INTO chat_room_pairs (user_a, user_b, room_id)
+        SELECT MIN(user_id), MAX(user_id), room_id FROM chat_room_participants
+        GROUP BY room_id HAVING COUNT(*) = 2;
+    """,
+    # 3: unread counters per (room, user) and a pointer to each room's last message
+    """
+    ALTER TABLE chat_room_participants ADD COLUMN unread_count INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE chat_rooms ADD COLUMN last_message_id TEXT;
+    UPDATE chat_room_participants SET unread_count = (
+        SELECT COUNT(*) FROM chat_messages m
+        WHERE m.room_id = chat_room_participants.room_id AND m.read = 0
+          AND m.sender_id != chat_room_participants.user_id
+    );
+    UPDATE chat_rooms SET last_message_id = (
+        SELECT m.id FROM chat_messages m WHERE m.room_id = chat_rooms.id
+        ORDER BY m.timestamp DESC, m.rowid DESC LIMIT 1
+    );
+    """,
+    # 4: per-room message sequence numbers, the cursor for paging through history
+    """
+    ALTER TABLE chat_messages ADD COLUMN seq INTEGER;
+    UPDATE chat_messages SET seq = (
+        SELECT n FROM (
+            SELECT rowid AS r, ROW_NUMBER() OVER (PARTITION BY room_id ORDER BY timestamp, rowid) AS n
+            FROM chat_messages
+        ) WHERE r = chat_messages.rowid
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_chat_messages_room_seq ON chat_messages(room_id, seq);
+    DROP INDEX IF EXISTS idx_chat_messages_room_time;
+    """,
+    # 5: when each user row last changed, so other processes can pick up the changes
+    """
+    ALTER TABLE users ADD COLUMN updated_at REAL;
+    UPDATE users SET updated_at = COALESCE(created_at, 0);
+    CREATE INDEX IF NOT EXISTS idx_users_updated_at ON users(updated_at);
+    """,
+    # 6: ended video rooms move to history tables, so video_rooms only holds live calls
+    """
+    CREATE TABLE IF NOT EXISTS video_room_history (
+        id TEXT PRIMARY KEY,
+        creator TEXT,
+        created_at REAL NOT NULL,
+        patient_id TEXT,
+        doctor_id TEXT,
+        active INTEGER NOT NULL DEFAULT 0,
+        call_status TEXT,
+        ended_by TEXT,
+        end_time REAL,
+        end_reason TEXT,
+        follow_up TEXT,
+        notes TEXT
+    );
+    CREATE TABLE IF NOT EXISTS video_room_history_participants (
+        room_id TEXT NOT NULL REFERENCES video_room_history(id) ON DELETE CASCADE,
+        user_id TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        PRIMARY KEY (room_id, user_id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_video_history_participants_user
+        ON video_room_history_participants(user_id, room_id);
+    INSERT OR REPLACE INTO video_room_history
+        SELECT id, creator, created_at, patient_id, doctor_id, active, call_status, ended_by, end_time, end_reason, follow_up, notes
+        FROM video_rooms WHERE active = 0;
+    INSERT OR REPLACE INTO video_room_history_participants (room_id, user_id, position)
+        SELECT p.room_id, p.user_id, p.position FROM video_room_participants p
+        JOIN video_rooms r ON r.id = p.room_id WHERE r.active = 0;
+    DELETE FROM video_room_participants WHERE room_id IN (SELECT id FROM video_rooms WHERE active = 0);
+    DELETE FROM video_rooms WHERE active = 0;
+    """,
+]
+
+USER_FIELDS = ('id', 'email', 'name', 'password', 'role', 'specialty', 'availability',
+               'status', 'avatar', 'created_at')
+VIDEO_ROOM_FIELDS = ('id', 'creator', 'created_at', 'patient_id', 'doctor_id', 'active', 'call_status',
+                     'ended_by', 'end_time', 'end_reason', 'follow_up', 'notes')
+
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections in WAL mode, shared between threads"""
+
+    def __init__(self, path, size=8, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        self.pool = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self.pool.put(self._connect())
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA foreign_keys=ON')
+        conn.execute(f'PRAGMA busy_timeout={int(self.timeout * 1000)}')
+        return conn
+
+    @contextmanager
+    def connection(self):
+        conn = self.pool.get(timeout=self.timeout)
+        try:
+            yield conn
+        finally:
+            self.pool.put(conn)
+
+    def close(self):
+        while not self.pool.empty():
+            self.pool.get_nowait().close()
+
+
+def _pair(user_id, other_id):
+    return (user_id, other_id) if user_id < other_id else (other_id, user_id)
+
+
+def _statements(script):
+    """Split a migration script into the single statements execute() takes"""
+    statement = ''
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ''
+    if statement.strip():
+        yield statement
+
+
+def _user_from_row(row):
+    """Shape a users row like the in-memory user dicts the routes were written against"""
+    if row is None:
+        return None
+    user = {key: row[key] for key in USER_FIELDS}
+    if user['specialty'] is None:
+        del user['specialty']
+    if user['availability'] is None:
+        del user['availability']
+    else:
+        user['availability'] = bool(user['availability'])
+    return user
+
+
+class Store:
+    """SQLite-backed storage for users, chat rooms, chat messages and video rooms"""
+
+    def __init__(self, path, pool_size=8):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.pool = ConnectionPool(path, size=pool_size)
+        self.write_lock = threading.Lock()
+        self._migrate()
+
+    @contextmanager
+    def transaction(self):
+        """Connection with an open write transaction, committed on success"""
+        with self.pool.connection() as conn:
+            # SQLite allows one writer at a time; serializing here avoids busy retries
+            with self.write_lock:
+                with conn:
+                    yield conn
+
+    def _migrate(self):
+        """
+        Apply the migrations the database is missing, one transaction each.
+
+        Each step takes SQLite's write lock with BEGIN IMMEDIATE before reading
+        user_version, so when several processes start on the same file only one applies a
+        migration; the others wait for it (busy_timeout) and then find it done.
+        """
+        with self.pool.connection() as conn, self.write_lock:
+            while True:
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    version = conn.execute('PRAGMA user_version').fetchone()[0]
+                    if version >= len(MIGRATIONS):
+                        conn.rollback()
+                        return
+                    # Not executescript(): it would commit the transaction first
+                    for statement in _statements(MIGRATIONS[version]):
+                        conn.execute(statement)
+                    conn.execute(f'PRAGMA user_version={version + 1}')
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+
+    # Users
+
+    def get_user_by_email(self, email):
+        with self.pool.connection() as conn:
+            row = conn.execute('SELECT * FROM users WHERE email = ?', (email,)).fetchone()
+        return _user_from_row(row)
+
+    def get_user(self, user_id):
+        with self.pool.connection() as conn:
+            row = conn.execute('SELECT * FROM users WHERE id = ?', (user_id,)).fetchone()
+        return _user_from_row(row)
+
+    def get_users(self, user_ids):
+        """Map of user id -> user for the given ids"""
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return {}
+        placeholders = ','.join('?' * len(user_ids))
+        with self.pool.connection() as conn:
+            rows = conn.execute(f'SELECT * FROM users WHERE id IN ({placeholders})', user_ids).fetchall()
+        return {row['id']: _user_from_row(row) for row in rows}
+
+    def create_user(self, user):
+        """Insert a user; returns False if the email or id is already taken"""
+        values = [user.get(key) for key in USER_FIELDS] + [time.time()]
+        try:
+            with self.transaction() as conn:
+                conn.execute(
+                    f'INSERT INTO users ({",".join(USER_FIELDS)}, updated_at) '
+                    f'VALUES ({",".join("?" * len(USER_FIELDS))}, ?)',
+                    values
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def update_user(self, user_id, **fields):
+        fields = {k: v for k, v in fields.items() if k in USER_FIELDS and k != 'id'}
+        if not fields:
+            return
+        assignments = ', '.join(f'{k} = ?' for k in fields)
+        with self.transaction() as conn:
+            conn.execute(f'UPDATE users SET {assignments}, updated_at = ? WHERE id = ?',
+                         list(fields.values()) + [time.time(), user_id])
+
+    def list_users_updated_since(self, timestamp):
+        """Users changed at or after timestamp, with the time of their last change"""
+        with self.pool.connection() as conn:
+            rows = conn.execute('SELECT * FROM users WHERE updated_at >= ? ORDER BY updated_at',
+                                (timestamp,)).fetchall()
+        return [(_user_from_row(row), row['updated_at']) for row in rows]
+
+    def list_users(self, role=None, specialty=None, availability=None, status=None, name=None):
+        clauses = []
+        params = []
+        if role is not None:
+            clauses.append('role = ?')
+            params.append(role)
+        if specialty is not None:
+            clauses.append('specialty = ?')
+            params.append(specialty)
+        if availability is not None:
+            clauses.append('availability = ?')
+            params.append(int(bool(availability)))
+        if status is not None:
+            clauses.append('status = ?')
+            params.append(status)
+        if name:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            escaped = name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params.append(f'%{escaped}%')
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        with self.pool.connection() as conn:
+            rows = conn.execute(f'SELECT * FROM users {where} ORDER BY created_at, rowid', params).fetchall()
+        return [_user_from_row(row) for row in rows]
+
+    # Chat rooms and messages
+
+    def _participants(self, conn, table, room_ids):
+        room_ids = list(room_ids)
+        participants = {room_id: [] for room_id in room_ids}
+        if not room_ids:
+            return participants
+        placeholders = ','.join('?' * len(room_ids))
+        rows = conn.execute(
+            f'SELECT room_id, user_id FROM {table} WHERE room_id IN ({placeholders}) ORDER BY room_id, position',
+            room_ids
+        ).fetchall()
+        for row in rows:
+            participants[row['room_id']].append(row['user_id'])
+        return participants
+
+    def _insert_chat_room(self, conn, room_id, name, participants, created_at):
+        conn.execute('INSERT OR IGNORE INTO chat_rooms (id, name, created_at) VALUES (?, ?, ?)',
+                     (room_id, name, created_at))
+        conn.executemany(
+            'INSERT OR IGNORE INTO chat_room_participants (room_id, user_id, position) VALUES (?, ?, ?)',
+            [(room_id, user_id, i) for i, user_id in enumerate(participants)]
+        )
+        if len(participants) == 2 and participants[0] != participants[1]:
+            conn.execute('INSERT OR IGNORE INTO chat_room_pairs (user_a, user_b, room_id) VALUES (?, ?, ?)',
+                         _pair(*participants) + (room_id,))
+
+    def create_chat_room(self, room_id, name, participants, created_at):
+        with self.transaction() as conn:
+            self._insert_chat_room(conn, room_id, name, participants, created_at)
+        return self.get_chat_room(room_id)
+
+    def get_or_create_chat_room_between(self, user_id, other_id, room_id, name, created_at):
+        """
+        The one-to-one room of two users, created with room_id and name if there is none.
+
+        :return: (room, created)
+        """
+        with self.transaction() as conn:
+            row = conn.execute('SELECT room_id FROM chat_room_pairs WHERE user_a = ? AND user_b = ?',
+                               _pair(user_id, other_id)).fetchone()
+            created = row is None
+            if created:
+                self._insert_chat_room(conn, room_id, name, [user_id, other_id], created_at)
+            else:
+                room_id = row['room_id']
+        return self.get_chat_room(room_id), created
+
+    def get_chat_room(self, room_id):
+        with self.pool.connection() as conn:
+            row = conn.execute('SELECT * FROM chat_rooms WHERE id = ?', (room_id,)).fetchone()
+            if row is None:
+                return None
+            room = dict(row)
+            room['participants'] = self._participants(conn, 'chat_room_participants', [room_id])[room_id]
+        return room
+
+    def list_chat_rooms_for_user(self, user_id):
+        """
+        Rooms of a user, each with 'unread_count' for that user and its 'last_message'.
+
+        Both come from the counters and pointers kept by add_chat_message, so no messages
+        are scanned.
+        """
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                'SELECT r.id, r.name, r.created_at, p.unread_count, '
+                'm.id AS m_id, m.sender_id, m.sender_name, m.content, m.timestamp, m.read '
+                'FROM chat_room_participants p JOIN chat_rooms r ON r.id = p.room_id '
+                'LEFT JOIN chat_messages m ON m.id = r.last_message_id '
+                'WHERE p.user_id = ? ORDER BY r.created_at',
+                (user_id,)
+            ).fetchall()
+            participants = self._participants(conn, 'chat_room_participants', [row['id'] for row in rows])
+
+        rooms = []
+        for row in rows:
+            last_message = None
+            if row['m_id'] is not None:
+                last_message = {
+                    'id': row['m_id'],
+                    'room_id': row['id'],
+                    'sender_id': row['sender_id'],
+                    'sender_name': row['sender_name'],
+                    'content': row['content'],
+                    'timestamp': row['timestamp'],
+                    'read': bool(row['read'])
+                }
+            rooms.append({
+                'id': row['id'],
+                'name': row['name'],
+                'created_at': row['created_at'],
+                'participants': participants[row['id']],
+                'unread_count': row['unread_count'],
+                'last_message': last_message
+            })
+        return rooms
+
+    def find_chat_room_between(self, user_id, other_id):
+        """Id of the one-to-one chat room of two users, or None"""
+        with self.pool.connection() as conn:
+            row = conn.execute('SELECT room_id FROM chat_room_pairs WHERE user_a = ? AND user_b = ?',
+                               _pair(user_id, other_id)).fetchone()
+        return row['room_id'] if row else None
+
+    def chat_room_partners(self, user_id):
+        """Map of other user id -> one-to-one chat room id for everyone user_id chats with"""
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                'SELECT user_b AS other_id, room_id FROM chat_room_pairs WHERE user_a = ? '
+                'UNION ALL SELECT user_a AS other_id, room_id FROM chat_room_pairs WHERE user_b = ?',
+                (user_id, user_id)
+            ).fetchall()
+        return {row['other_id']: row['room_id'] for row in rows}
+
+    def add_chat_message(self, msg):
+        """Append a message to its room; returns the message's sequence number in the room"""
+        with self.transaction() as conn:
+            # Writes are serialized, so the next number can't be taken by another insert
+            seq = conn.execute('SELECT COALESCE(MAX(seq), 0) + 1 FROM chat_messages WHERE room_id = ?',
+                               (msg['room_id'],)).fetchone()[0]
+            conn.execute(
+                'INSERT INTO chat_messages (id, room_id, seq, sender_id, sender_name, content, timestamp, read) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (msg['id'], msg['room_id'], seq, msg['sender_id'], msg['sender_name'], msg['content'],
+                 msg['timestamp'], int(bool(msg.get('read'))))
+            )
+            conn.execute('UPDATE chat_rooms SET last_message_id = ? WHERE id = ?', (msg['id'], msg['room_id']))
+            if not msg.get('read'):
+                conn.execute(
+                    'UPDATE chat_room_participants SET unread_count = unread_count + 1 '
+                    'WHERE room_id = ? AND user_id != ?',
+                    (msg['room_id'], msg['sender_id'])
+                )
+        return seq
+
+    def _recount_chat_rooms(self, conn, room_ids):
+        """Rebuild unread counters and last-message pointers from the messages themselves"""
+        for room_id in room_ids:
+            conn.execute(
+                'UPDATE chat_room_participants SET unread_count = ('
+                'SELECT COUNT(*) FROM chat_messages m WHERE m.room_id = ? AND m.read = 0 '
+                'AND m.sender_id != chat_room_participants.user_id) WHERE room_id = ?',
+                (room_id, room_id)
+            )
+            conn.execute(
+                'UPDATE chat_rooms SET last_message_id = (SELECT id FROM chat_messages WHERE room_id = ? '
+                'ORDER BY seq DESC LIMIT 1) WHERE id = ?',
+                (room_id, room_id)
+            )
+
+    def mark_chat_room_read(self, room_id, user_id):
+        """Mark the messages other participants sent to a room as read by user_id"""
+        with self.transaction() as conn:
+            conn.execute('UPDATE chat_room_participants SET unread_count = 0 WHERE room_id = ? AND user_id = ?',
+                         (room_id, user_id))
+            cursor = conn.execute('UPDATE chat_messages SET read = 1 WHERE room_id = ? AND sender_id != ? AND read = 0',
+                                  (room_id, user_id))
+        return cursor.rowcount
+
+    def get_chat_messages(self, room_id, before=None, after=None, limit=50):
+        """
+        One page of a room's history, oldest first.
+
+        Without cursors this is the latest page. before/after are sequence numbers, so
+        each page is a range scan on (room_id, seq) however long the history is.
+
+        :return: (messages, whether more messages exist beyond the page)
+        """
+        clauses = ['room_id = ?']
+        params = [room_id]
+        if before is not None:
+            clauses.append('seq < ?')
+            params.append(before)
+        if after is not None:
+            clauses.append('seq > ?')
+            params.append(after)
+        # Page forwards from an 'after' cursor, otherwise backwards from the newest message
+        order = 'ASC' if after is not None and before is None else 'DESC'
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM chat_messages WHERE {' AND '.join(clauses)} ORDER BY seq {order} LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if order == 'DESC':
+            rows.reverse()
+        return [dict(row, read=bool(row['read'])) for row in rows], has_more
+
+    def get_last_chat_message(self, room_id):
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                'SELECT m.* FROM chat_rooms r JOIN chat_messages m ON m.id = r.last_message_id WHERE r.id = ?',
+                (room_id,)
+            ).fetchone()
+        return dict(row, read=bool(row['read'])) if row else None
+
+    def count_unread_chat_messages(self, room_id, user_id):
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                'SELECT unread_count FROM chat_room_participants WHERE room_id = ? AND user_id = ?',
+                (room_id, user_id)
+            ).fetchone()
+        return row[0] if row else 0
+
+    # Video rooms
+
+    def create_video_room(self, room):
+        participants = room.get('participants', [])
+        values = [room.get(key) for key in VIDEO_ROOM_FIELDS]
+        with self.transaction() as conn:
+            conn.execute(
+                f'INSERT INTO video_rooms ({",".join(VIDEO_ROOM_FIELDS)}) '
+                f'VALUES ({",".join("?" * len(VIDEO_ROOM_FIELDS))})',
+                values
+            )
+            conn.executemany(
+                'INSERT INTO video_room_participants (room_id, user_id, position) VALUES (?, ?, ?)',
+                [(room['id'], user_id, i) for i, user_id in enumerate(participants)]
+            )
+        return self.get_video_room(room['id'])
+
+    def _video_rooms(self, conn, rows, participants_table='video_room_participants'):
+        rooms = [dict(row, active=bool(row['active'])) for row in rows]
+        participants = self._participants(conn, participants_table, [r['id'] for r in rooms])
+        for room in rooms:
+            room['participants'] = participants[room['id']]
+        return rooms
+
+    def get_video_room(self, room_id):
+        """A live room, or an ended one from the history tables"""
+        with self.pool.connection() as conn:
+            rows = conn.execute('SELECT * FROM video_rooms WHERE id = ?', (room_id,)).fetchall()
+            rooms = self._video_rooms(conn, rows)
+            if not rooms:
+                rows = conn.execute('SELECT * FROM video_room_history WHERE id = ?', (room_id,)).fetchall()
+                rooms = self._video_rooms(conn, rows, 'video_room_history_participants')
+        return rooms[0] if rooms else None
+
+    def _archive_video_rooms(self, conn, room_ids):
+        """Move rooms and their participants into the history tables"""
+        room_ids = list(room_ids)
+        if not room_ids:
+            return
+        placeholders = ','.join('?' * len(room_ids))
+        columns = ', '.join(VIDEO_ROOM_FIELDS)
+        conn.execute(f'INSERT OR REPLACE INTO video_room_history ({columns}) '
+                     f'SELECT {columns} FROM video_rooms WHERE id IN ({placeholders})', room_ids)
+        conn.execute('INSERT OR REPLACE INTO video_room_history_participants (room_id, user_id, position) '
+                     f'SELECT room_id, user_id, position FROM video_room_participants WHERE room_id IN ({placeholders})',
+                     room_ids)
+        conn.execute(f'DELETE FROM video_room_participants WHERE room_id IN ({placeholders})', room_ids)
+        conn.execute(f'DELETE FROM video_rooms WHERE id IN ({placeholders})', room_ids)
+
+    def end_video_room(self, room_id, **fields):
+        """
+        Mark a live room ended with fields and move it to history.
+
+        :return: the archived room, or None if the room wasn't live (already ended by
+                 someone else, or unknown)
+        """
+        fields = {k: v for k, v in fields.items() if k in VIDEO_ROOM_FIELDS and k not in ('id', 'active')}
+        fields['active'] = 0
+        assignments = ', '.join(f'{k} = ?' for k in fields)
+        with self.transaction() as conn:
+            cursor = conn.execute(f'UPDATE video_rooms SET {assignments} WHERE id = ? AND active = 1',
+                                  list(fields.values()) + [room_id])
+            if cursor.rowcount == 0:
+                return None
+            self._archive_video_rooms(conn, [room_id])
+        return self.get_video_room(room_id)
+
+    def update_video_room(self, room_id, **fields):
+        fields = {k: v for k, v in fields.items() if k in VIDEO_ROOM_FIELDS and k != 'id'}
+        if not fields:
+            return
+        assignments = ', '.join(f'{k} = ?' for k in fields)
+        with self.transaction() as conn:
+            cursor = conn.execute(f'UPDATE video_rooms SET {assignments} WHERE id = ?',
+                                  list(fields.values()) + [room_id])
+            if cursor.rowcount == 0:
+                # e.g. notes added after the call ended
+                conn.execute(f'UPDATE video_room_history SET {assignments} WHERE id = ?',
+                             list(fields.values()) + [room_id])
+
+    def list_video_rooms_for_user(self, user_id, active):
+        """A user's live rooms, or with active=False their ended rooms from history"""
+        if active:
+            rooms_table, participants_table = 'video_rooms', 'video_room_participants'
+        else:
+            rooms_table, participants_table = 'video_room_history', 'video_room_history_participants'
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f'SELECT r.* FROM {participants_table} p JOIN {rooms_table} r ON r.id = p.room_id '
+                'WHERE p.user_id = ? AND r.active = ? ORDER BY r.created_at',
+                (user_id, int(bool(active)))
+            ).fetchall()
+            return self._video_rooms(conn, rows, participants_table)
+
+    def list_active_video_rooms(self):
+        with self.pool.connection() as conn:
+            rows = conn.execute('SELECT * FROM video_rooms WHERE active = 1 ORDER BY created_at').fetchall()
+            return self._video_rooms(conn, rows)
+
+    # Migration from the old in-memory dicts and JSON files
+
+    def migrate_from_dicts(self, users=None, chat_rooms=None, chat_messages=None, video_rooms=None):
+        """
+        Import data shaped like the old module-level dicts. Existing rows are kept, so
+        this is safe to run on every start.
+
+        :param users: {email: user}
+        :param chat_rooms: {room_id: {'name', 'participants', ...}}
+        :param chat_messages: {room_id: [message, ...]}
+        :param video_rooms: {room_id: room}
+        """
+        with self.transaction() as conn:
+            for email, user in (users or {}).items():
+                row = dict(user, email=user.get('email', email))
+                if 'availability' in row and row['availability'] is not None:
+                    row['availability'] = int(bool(row['availability']))
+                row.setdefault('status', 'offline')
+                conn.execute(
+                    f'INSERT OR IGNORE INTO users ({",".join(USER_FIELDS)}, updated_at) '
+                    f'VALUES ({",".join("?" * len(USER_FIELDS))}, ?)',
+                    [row.get(key) for key in USER_FIELDS] + [time.time()]
+                )
+
+            for room_id, room in (chat_rooms or {}).items():
+                self._insert_chat_room(conn, room_id, room.get('name'), list(room.get('participants', [])),
+                                       room.get('created_at'))
+
+            for room_id, messages in (chat_messages or {}).items():
+                last_seq = conn.execute('SELECT COALESCE(MAX(seq), 0) FROM chat_messages WHERE room_id = ?',
+                                        (room_id,)).fetchone()[0]
+                ordered = sorted(messages, key=lambda m: m['timestamp'])
+                conn.executemany(
+                    'INSERT OR IGNORE INTO chat_messages '
+                    '(id, room_id, seq, sender_id, sender_name, content, timestamp, read) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(m['id'], room_id, last_seq + i, m['sender_id'], m.get('sender_name'), m.get('content'),
+                      m['timestamp'], int(bool(m.get('read')))) for i, m in enumerate(ordered, start=1)]
+                )
+            if chat_messages:
+                self._recount_chat_rooms(conn, list(chat_messages))
+
+            for room_id, room in (video_rooms or {}).items():
+                row = dict(room, id=room_id, active=int(bool(room.get('active'))))
+                conn.execute(
+                    f'INSERT OR IGNORE INTO video_rooms ({",".join(VIDEO_ROOM_FIELDS)}) '
+                    f'VALUES ({",".join("?" * len(VIDEO_ROOM_FIELDS))})',
+                    [row.get(key) for key in VIDEO_ROOM_FIELDS]
+                )
+                conn.executemany(
+                    'INSERT OR IGNORE INTO video_room_participants (room_id, user_id, position) VALUES (?, ?, ?)',
+                    [(room_id, user_id, i) for i, user_id in enumerate(room.get('participants', []))]
+                )
+            self._archive_video_rooms(conn, [room_id for room_id, room in (video_rooms or {}).items()
+                                             if not room.get('active')])
+
+    def migrate_users_json(self, path):
+        """Import a users.json file ({email: user}) written by older versions"""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r') as f:
+                users = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read {path}: {str(e)}")
+            return
+        if isinstance(users, dict) and users:
+            self.migrate_from_dicts(users=users)
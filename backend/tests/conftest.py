@@ -0,0 +1,61 @@
+import importlib
+import io
+import os
+import sys
+
+import numpy as np
+import pytest
+import torch
+import torchvision
+from PIL import Image
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+def build_model(num_classes, seed=0):
+    """Randomly initialised EfficientNet-B0 with the app's classifier head"""
+    torch.manual_seed(seed)
+    model = torchvision.models.efficientnet_b0(weights=None)
+    model.classifier = torch.nn.Sequential(
+        torch.nn.Dropout(p=0.5),
+        torch.nn.Linear(model.classifier[1].in_features, num_classes)
+    )
+    return model.eval()
+
+
+def image_bytes(width=64, height=48, fmt='JPEG', seed=0):
+    """Encoded random RGB image"""
+    rng = np.random.default_rng(seed)
+    img = Image.fromarray(rng.integers(0, 256, (height, width, 3), dtype=np.uint8))
+    buffer = io.BytesIO()
+    img.save(buffer, fmt)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope='session')
+def app_module(tmp_path_factory):
+    """
+    The Flask app, imported once in a scratch working directory: its database, uploads,
+    reports and caches live there, Gemini is replaced by the local fake and the
+    pneumonia model has random weights.
+    """
+    workdir = tmp_path_factory.mktemp('app')
+    os.makedirs(workdir / 'models')
+    torch.save(build_model(2).state_dict(), workdir / 'models' / 'pneumonia_model.pth')
+
+    os.environ.update({
+        'DATABASE_PATH': str(workdir / 'app.sqlite3'),
+        'USE_FAKE_GEMINI': '1',
+        'FAKE_GEMINI_CHUNK_DELAY': '0',
+        'PRELOAD_MODELS': 'none',
+        'REPORT_RENDER_PROCESSES': '0',
+        'PREDICTION_CACHE_DIR': str(workdir / 'cache'),
+    })
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        yield importlib.import_module('app')
+    finally:
+        os.chdir(cwd)
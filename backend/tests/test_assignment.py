@@ -0,0 +1,150 @@
+import uuid
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from assignment import DoctorAssignment
+
+
+def test_least_loaded_doctor_with_the_specialty_is_picked():
+    engine = DoctorAssignment(max_calls_per_doctor=2)
+    engine.set_doctor('gp', None, available=True)
+    engine.set_doctor('derm1', 'Dermatology', available=True)
+    engine.set_doctor('derm2', 'Dermatology', available=True)
+
+    first, _ = engine.assign('p1', 'Dermatology')
+    second, _ = engine.assign('p2', 'Dermatology')
+    assert {first, second} == {'derm1', 'derm2'}
+    # No cardiologist: anyone free will do
+    assert engine.assign('p3', 'Cardiology') == ('gp', None)
+
+
+def test_patients_wait_in_order_until_a_doctor_frees_up():
+    engine = DoctorAssignment()
+    engine.set_doctor('d1', None, available=True)
+    assert engine.assign('p1') == ('d1', None)
+
+    assert engine.assign('p2') == (None, 1)
+    assert engine.assign('p3') == (None, 2)
+    # Asking again keeps the place
+    assert engine.assign('p2') == (None, 1)
+    assert engine.next_patient('d1') is None
+
+    engine.call_ended('d1')
+    assert engine.next_patient('d1') == 'p2'
+    assert engine.waiting_position('p3') == 1
+
+
+def test_patient_who_left_is_not_handed_to_a_doctor():
+    engine = DoctorAssignment()
+    engine.assign('p1')
+    engine.assign('p2')
+    assert engine.leave_waiting_room('p1')
+    assert not engine.leave_waiting_room('p1')
+
+    engine.set_doctor('d1', None, available=True)
+    assert engine.next_patient('d1') == 'p2'
+    assert engine.stats()['waiting_patients'] == 0
+
+
+def test_removed_doctor_is_never_assigned():
+    engine = DoctorAssignment()
+    engine.set_doctor('d1', None, available=True)
+    assert engine.remove_doctor('d1')
+
+    assert engine.assign('p1') == (None, 1)
+    assert engine.next_patient('d1') is None
+
+
+def make_user(app_module, role, **fields):
+    user = dict({
+        'id': uuid.uuid4().hex,
+        'email': f"{uuid.uuid4().hex}@example.com",
+        'name': role.title(),
+        'password': 'x',
+        'role': role,
+        'status': 'offline',
+        'created_at': 0
+    }, **fields)
+    assert app_module.user_directory.create(user)
+    return user
+
+
+@pytest.fixture
+def engine(app_module, monkeypatch):
+    """A fresh assignment engine in place of the app's"""
+    engine = DoctorAssignment()
+    monkeypatch.setattr(app_module, 'doctor_assignment', engine)
+    return engine
+
+
+def test_patient_whose_last_socket_closes_leaves_the_waiting_room(app_module, engine, monkeypatch):
+    presence = app_module.presence_service
+    monkeypatch.setattr(presence, 'offline_grace', 0)
+    patient = make_user(app_module, 'patient')
+    socket = app_module.socketio.test_client(app_module.app)
+    socket.emit('user_connected', {'user_id': patient['id']})
+    presence.flush()
+    assert engine.assign(patient['id']) == (None, 1)
+
+    socket.disconnect()
+    presence.flush()
+
+    assert engine.waiting_position(patient['id']) is None
+
+
+def test_patient_stays_queued_while_another_socket_is_open(app_module, engine, monkeypatch):
+    presence = app_module.presence_service
+    monkeypatch.setattr(presence, 'offline_grace', 0)
+    patient = make_user(app_module, 'patient')
+    sockets = [app_module.socketio.test_client(app_module.app) for _ in range(2)]
+    for socket in sockets:
+        socket.emit('user_connected', {'user_id': patient['id']})
+    presence.flush()
+    engine.assign(patient['id'])
+
+    sockets[0].disconnect()
+    presence.flush()
+    assert engine.waiting_position(patient['id']) == 1
+    sockets[1].disconnect()
+
+
+def test_logout_leaves_the_waiting_room(app_module, engine):
+    patient = make_user(app_module, 'patient')
+    engine.assign(patient['id'])
+    with app_module.app.app_context():
+        token = create_access_token(identity=patient['email'])
+
+    response = app_module.app.test_client().post('/api/logout', headers={'Authorization': f'Bearer {token}'})
+
+    assert response.status_code == 200
+    assert engine.waiting_position(patient['id']) is None
+
+
+def test_missing_doctor_keeps_the_patient_waiting(app_module, engine):
+    patient = make_user(app_module, 'patient')
+    engine.assign(patient['id'])
+    # Registered with the engine, but no longer a user
+    engine.set_doctor('deleted-doctor', None, available=True)
+
+    app_module.assign_waiting_patients('deleted-doctor')
+
+    assert engine.waiting_position(patient['id']) == 1
+    assert engine.stats()['doctors'] == 0
+
+
+def test_waiting_patient_is_matched_with_a_doctor_who_frees_up(app_module, engine):
+    patient = make_user(app_module, 'patient')
+    doctor = make_user(app_module, 'doctor', specialty='Dermatology', availability=True)
+    engine.assign(patient['id'])
+    engine.set_doctor(doctor['id'], 'Dermatology', available=True)
+    socket = app_module.socketio.test_client(app_module.app)
+    socket.emit('join', {'room': patient['id']})
+    socket.get_received()
+
+    app_module.assign_waiting_patients(doctor['id'])
+
+    matched = [event for event in socket.get_received() if event['name'] == 'waiting_room_matched']
+    socket.disconnect()
+    assert matched[0]['args'][0]['doctor']['id'] == doctor['id']
+    assert engine.waiting_position(patient['id']) is None
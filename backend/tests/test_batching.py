@@ -0,0 +1,154 @@
+import threading
+import time
+
+import pytest
+import torch
+
+from batching import BatchingInferenceServer, ModelBatcher
+
+CLASSES = 8
+
+
+def image(label):
+    """Input whose logits (via LabelModel) put the highest probability on label"""
+    return (torch.nn.functional.one_hot(torch.tensor(label), CLASSES).float() * 20).view(CLASSES, 1, 1)
+
+
+class LabelModel:
+    """Returns each input as its logits and records batch sizes; the first call can be held"""
+
+    def __init__(self, hold_first=False):
+        self.batch_sizes = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not hold_first:
+            self.release.set()
+
+    def __call__(self, inputs):
+        self.started.set()
+        self.release.wait(10)
+        self.batch_sizes.append(inputs.shape[0])
+        return inputs.flatten(1)
+
+
+def batcher(model, max_batch_size=16, max_wait=0.05, **options):
+    return ModelBatcher('test', lambda key: model, torch.device('cpu'), max_batch_size, max_wait, **options)
+
+
+def label_of(future):
+    return int(future.result(timeout=10).argmax())
+
+
+def test_requests_queued_behind_a_forward_pass_run_as_one_batch():
+    model = LabelModel(hold_first=True)
+    b = batcher(model, max_wait=0)
+    first = b.submit(image(0))
+    model.started.wait(10)
+
+    futures = [b.submit(image(label)) for label in range(1, 6)]
+    assert b.queue_depth() == 5
+    model.release.set()
+
+    assert label_of(first) == 0
+    # Each caller gets its own row back, in submission order
+    assert [label_of(future) for future in futures] == [1, 2, 3, 4, 5]
+    assert model.batch_sizes == [1, 5]
+    stats = b.stats.snapshot()
+    assert (stats['requests'], stats['batches'], stats['largest_batch']) == (6, 2, 5)
+    assert stats['batch_size_histogram'] == {'1': 1, '5': 1}
+
+
+def test_batches_are_split_at_max_batch_size():
+    model = LabelModel(hold_first=True)
+    b = batcher(model, max_batch_size=2, max_wait=0)
+    first = b.submit(image(0))
+    model.started.wait(10)
+
+    futures = [b.submit(image(label)) for label in range(1, 6)]
+    model.release.set()
+
+    assert [label_of(future) for future in [first] + futures] == [0, 1, 2, 3, 4, 5]
+    assert model.batch_sizes == [1, 2, 2, 1]
+
+
+def test_lone_request_is_flushed_after_max_wait():
+    model = LabelModel()
+    max_wait = 0.1
+    b = batcher(model, max_wait=max_wait)
+
+    started = time.monotonic()
+    assert label_of(b.submit(image(3))) == 3
+    elapsed = time.monotonic() - started
+
+    assert max_wait * 0.9 <= elapsed < max_wait + 5
+    assert model.batch_sizes == [1]
+    assert b.stats.snapshot()['avg_queue_wait_ms'] >= max_wait * 900
+
+
+def test_requests_arriving_within_max_wait_share_a_batch():
+    model = LabelModel()
+    b = batcher(model, max_wait=0.5)
+
+    futures = [b.submit(image(label)) for label in range(4)]
+
+    assert [label_of(future) for future in futures] == [0, 1, 2, 3]
+    assert model.batch_sizes == [4]
+
+
+def test_full_batch_does_not_wait_for_max_wait():
+    model = LabelModel()
+    b = batcher(model, max_batch_size=3, max_wait=30)
+
+    futures = [b.submit(image(label)) for label in range(3)]
+
+    assert [label_of(future) for future in futures] == [0, 1, 2]
+    assert model.batch_sizes == [3]
+
+
+def test_cancelled_requests_are_skipped():
+    model = LabelModel(hold_first=True)
+    b = batcher(model, max_wait=0)
+    first = b.submit(image(0))
+    model.started.wait(10)
+
+    cancelled = b.submit(image(1))
+    kept = b.submit(image(2))
+    assert cancelled.cancel()
+    model.release.set()
+
+    assert label_of(first) == 0
+    assert label_of(kept) == 2
+    assert model.batch_sizes == [1, 1]
+
+
+def test_model_errors_reach_every_caller_in_the_batch():
+    b = ModelBatcher('test', lambda key: None, torch.device('cpu'), 4, 0.05)
+
+    futures = [b.submit(image(label)) for label in range(2)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match='Failed to load model'):
+            future.result(timeout=10)
+
+
+def test_inline_mode_runs_in_the_callers_thread():
+    model = LabelModel()
+    b = batcher(model, inline=True)
+
+    future = b.submit(image(2).unsqueeze(0))
+
+    assert future.done()
+    assert label_of(future) == 2
+    assert b.worker is None
+
+
+def test_server_keeps_a_queue_per_model():
+    models = {'a': LabelModel(), 'b': LabelModel()}
+    server = BatchingInferenceServer(lambda key: models[key], torch.device('cpu'), max_wait_ms=0)
+
+    assert int(server.predict('a', image(1), timeout=10).argmax()) == 1
+    assert int(server.predict('b', image(2), timeout=10).argmax()) == 2
+
+    stats = server.stats()
+    assert set(stats['models']) == {'a', 'b'}
+    assert stats['models']['a']['requests'] == 1
@@ -0,0 +1,59 @@
+import gc
+
+import torch
+
+from conftest import build_model
+from ensemble import ModelPanel
+
+
+def panel(models):
+    return ModelPanel(list(models), lambda key: models.get(key), torch.device('cpu'))
+
+
+def test_models_with_one_backbone_share_its_forward_pass():
+    # Same seed, so the same backbone; the heads differ
+    models = {'a': build_model(2, seed=0), 'b': build_model(3, seed=0)}
+    inputs = torch.randn(2, 3, 64, 64)
+
+    probabilities, shared = panel(models).run(inputs)
+
+    assert shared
+    for key, model in models.items():
+        with torch.no_grad():
+            expected = torch.nn.functional.softmax(model(inputs), dim=1)
+        assert torch.allclose(probabilities[key], expected, atol=1e-5)
+
+
+def test_different_backbones_run_separately():
+    models = {'a': build_model(2, seed=0), 'b': build_model(2, seed=1)}
+
+    probabilities, shared = panel(models).run(torch.randn(3, 64, 64))
+
+    assert not shared
+    assert probabilities['a'].shape == (2,)
+
+
+def test_backbone_check_is_redone_for_a_reloaded_model():
+    models = {'a': build_model(2, seed=0), 'b': build_model(2, seed=0)}
+    runner = panel(models)
+    assert runner.run(torch.randn(3, 64, 64))[1]
+
+    # Weights swapped: the registry drops the old model and loads a new one, which
+    # may well be allocated where the old one was
+    del models['b']
+    gc.collect()
+    models['b'] = build_model(2, seed=1)
+
+    assert not runner.run(torch.randn(3, 64, 64))[1]
+
+
+def test_backbone_check_does_not_keep_models_alive():
+    models = {'a': build_model(2, seed=0), 'b': build_model(2, seed=0)}
+    runner = panel(models)
+    runner.run(torch.randn(3, 64, 64))
+    refs, _ = runner._backbone_check
+
+    models.clear()
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
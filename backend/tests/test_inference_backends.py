@@ -0,0 +1,88 @@
+import pytest
+import torch
+
+from conftest import build_model
+from inference_backends import TOLERANCES, compare_backends, prepare_backend
+
+
+def smooth_images(count, seed):
+    # Coarse noise upsampled to the input size, closer to photos than per-pixel noise
+    generator = torch.Generator().manual_seed(seed)
+    coarse = torch.randn(count, 3, 7, 7, generator=generator)
+    return torch.nn.functional.interpolate(coarse, size=(224, 224), mode='bilinear', align_corners=False)
+
+
+@pytest.fixture(scope='module')
+def model():
+    """
+    EfficientNet-B0 with random weights but working activations.
+
+    With default BatchNorm statistics a random network's features shrink to ~1e-14, where
+    every backend trivially agrees, so the statistics are recomputed on sample inputs and the
+    classifier is scaled to give logits of spread ~0.5.
+    """
+    model = build_model(4, seed=0)
+    for module in model.modules():
+        if isinstance(module, torch.nn.BatchNorm2d):
+            module.reset_running_stats()
+            module.momentum = None
+    model.train()
+    with torch.no_grad():
+        for seed in range(4):
+            model(smooth_images(16, seed=100 + seed))
+        model.classifier[1].weight.mul_(10)
+    return model.eval()
+
+
+@pytest.fixture(scope='module')
+def weights_path(model, tmp_path_factory):
+    path = tmp_path_factory.mktemp('weights') / 'model.pth'
+    torch.save(model.state_dict(), path)
+    return str(path)
+
+
+@pytest.fixture(scope='module')
+def samples():
+    return smooth_images(64, seed=0)
+
+
+def test_model_under_test_is_not_degenerate(model, samples):
+    with torch.no_grad():
+        predictions = model(samples).argmax(dim=1)
+    # Agreement means nothing if every input lands in one class
+    assert len(predictions.unique()) > 1
+
+
+@pytest.mark.parametrize('backend', sorted(TOLERANCES))
+def test_backend_agrees_with_eager_mode(backend, model, weights_path, samples):
+    min_agreement, max_prob_diff = TOLERANCES[backend]
+    candidate = prepare_backend(model, backend, weights_path, torch.device('cpu'))
+
+    check = compare_backends(model, candidate, samples)
+
+    assert check['top1_agreement'] >= min_agreement
+    assert check['max_abs_prob_diff'] <= max_prob_diff
+    # A batch of one goes through the same artifact
+    assert candidate(samples[:1]).shape == (1, 4)
+
+
+@pytest.fixture
+def int8_static_app(app_module, model, weights_path, monkeypatch):
+    monkeypatch.setitem(app_module.MODELS, 'under-test', {'file': weights_path, 'backend': 'int8_static'})
+    monkeypatch.setitem(app_module.app.config, 'INFERENCE_BACKEND_MIN_AGREEMENT', 0.99)
+    return app_module
+
+
+def test_static_int8_is_not_served_without_samples_to_check_it(int8_static_app, model, monkeypatch):
+    monkeypatch.setitem(int8_static_app.app.config, 'INFERENCE_BACKEND_SAMPLE_DIR', None)
+
+    assert int8_static_app.select_backend('under-test', model) is model
+
+
+def test_static_int8_that_disagrees_with_eager_mode_is_not_served(int8_static_app, model, samples,
+                                                                  monkeypatch, tmp_path, capsys):
+    monkeypatch.setitem(int8_static_app.app.config, 'INFERENCE_BACKEND_SAMPLE_DIR', str(tmp_path))
+    monkeypatch.setattr(int8_static_app, 'load_sample_tensors', lambda directory, transform: samples)
+
+    assert int8_static_app.select_backend('under-test', model) is model
+    assert 'disagrees with eager mode' in capsys.readouterr().out
@@ -0,0 +1,97 @@
+import hashlib
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from conftest import image_bytes
+from ingest import LLM_MAX_SIDE, REPORT_BODY_SIZE, REPORT_HEADER_SIZE, IngestError, ingest_image
+
+
+def encoded(img, fmt):
+    buffer = io.BytesIO()
+    img.save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def test_accepted_image_is_decoded_once_to_rgb():
+    data = encoded(Image.new('L', (40, 30), 128), 'PNG')
+
+    image = ingest_image(data, path='uploads/x.png')
+
+    assert (image.format, image.size, image.image.mode) == ('PNG', (40, 30), 'RGB')
+    assert image.sha256 == hashlib.sha256(data).hexdigest()
+    assert image.path == 'uploads/x.png'
+    assert bytes(image.view()) == data
+
+
+def test_empty_upload_is_rejected():
+    with pytest.raises(IngestError, match='empty'):
+        ingest_image(b'')
+
+
+def test_bytes_that_are_not_an_image_are_rejected():
+    with pytest.raises(IngestError, match='not a readable image'):
+        ingest_image(b'%PDF-1.4 definitely not a picture')
+
+
+def test_format_is_checked_against_the_content():
+    gif = encoded(Image.new('RGB', (8, 8)), 'GIF')
+    with pytest.raises(IngestError, match='Unsupported image format: GIF'):
+        ingest_image(gif)
+
+    # Whatever the filename says, PNG content is accepted as PNG
+    assert ingest_image(image_bytes(fmt='PNG')).format == 'PNG'
+    with pytest.raises(IngestError, match='Unsupported image format: JPEG'):
+        ingest_image(image_bytes(fmt='JPEG'), allowed_formats=('PNG',))
+
+
+def test_pixel_limit_is_checked_before_decoding():
+    data = image_bytes(width=64, height=48, fmt='PNG')
+    # Only the header survives; decoding this would fail, the size check must not need it
+    truncated = data[:64]
+
+    with pytest.raises(IngestError, match=r'too large \(64x48\)'):
+        ingest_image(truncated, max_pixels=64 * 48 - 1)
+    assert ingest_image(data, max_pixels=64 * 48).size == (64, 48)
+
+
+def test_image_that_fails_to_decode_is_rejected():
+    truncated = image_bytes(width=64, height=48, fmt='PNG')[:64]
+
+    with pytest.raises(IngestError, match='could not be decoded'):
+        ingest_image(truncated)
+
+
+def test_derived_images_are_computed_once_and_sized_for_their_use():
+    pixels = np.random.default_rng(0).integers(0, 256, (1500, 2000, 3), dtype=np.uint8)
+    image = ingest_image(encoded(Image.fromarray(pixels), 'JPEG'))
+    calls = []
+
+    def transform(img):
+        calls.append(img.size)
+        return img.size
+
+    assert image.tensor(transform) == image.tensor(transform) == (2000, 1500)
+    assert calls == [(2000, 1500)]
+
+    llm = Image.open(io.BytesIO(image.llm_jpeg()))
+    assert max(llm.size) == LLM_MAX_SIDE
+    assert image.llm_jpeg() is image.llm_jpeg()
+    assert image.llm_part()['mime_type'] == 'image/jpeg'
+
+    header, body = image.report_images()
+    assert Image.open(io.BytesIO(body)).size == REPORT_BODY_SIZE
+    assert Image.open(io.BytesIO(header)).size == REPORT_HEADER_SIZE
+
+
+def test_predict_reports_rejected_uploads(app_module):
+    client = app_module.app.test_client()
+
+    empty = client.post('/predict', data={'file': (io.BytesIO(b''), 'empty.jpg'), 'model': 'pneumonia'})
+    gif = client.post('/predict', data={'file': (io.BytesIO(encoded(Image.new('RGB', (8, 8)), 'GIF')), 'x.png'),
+                                        'model': 'pneumonia'})
+
+    assert (empty.status_code, empty.json['error']) == (400, "The uploaded file is empty")
+    assert (gif.status_code, gif.json['error']) == (400, "Unsupported image format: GIF")
@@ -0,0 +1,111 @@
+import pytest
+
+import llm_cache
+from llm_cache import ResponseCache, content_words, normalize_prompt
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """Settable time.time() for llm_cache"""
+    clock = {'now': 1000.0}
+    monkeypatch.setattr(llm_cache.time, 'time', lambda: clock['now'])
+    return clock
+
+
+def test_normalization_ignores_case_punctuation_and_spacing():
+    assert normalize_prompt("  What's   the DOSE?!\n") == 'what s the dose'
+    assert normalize_prompt('Fever, cough & chills.') == 'fever cough chills'
+    assert content_words(normalize_prompt('What are the symptoms of Type 2 diabetes?')) == {
+        'symptoms', 'type', '2', 'diabetes'
+    }
+
+
+def test_trivial_variants_are_exact_hits():
+    cache = ResponseCache()
+    cache.put('chat', 'What is pneumonia?', 'answer')
+
+    assert cache.get('chat', 'what is PNEUMONIA') == 'answer'
+    assert cache.get('chat', '  What   is pneumonia ?? ') == 'answer'
+    assert cache.stats()['routes']['chat']['exact_hits'] == 2
+
+
+def test_routes_do_not_share_answers():
+    cache = ResponseCache()
+    cache.put('chat', 'What is pneumonia?', 'chat answer')
+
+    assert cache.get('symptoms', 'What is pneumonia?', similar=True) is None
+
+
+def test_near_duplicate_with_the_same_content_words_is_a_similar_hit():
+    cache = ResponseCache(similarity_threshold=0.7)
+    cache.put('symptoms', 'What are the symptoms of pneumonia?', 'answer')
+
+    assert cache.get('symptoms', 'What are symptoms of pneumonia', similar=True) == 'answer'
+    # Only when asked for
+    assert cache.get('symptoms', 'What are symptoms of pneumonia') is None
+    counters = cache.stats()['routes']['symptoms']
+    assert (counters['similar_hits'], counters['misses']) == (1, 1)
+
+
+def test_close_prompts_with_different_content_words_miss():
+    cache = ResponseCache(similarity_threshold=0.5)
+    cache.put('symptoms', 'symptoms of type 1 diabetes', 'type 1 answer')
+
+    assert cache.get('symptoms', 'symptoms of type 2 diabetes', similar=True) is None
+    assert cache.get('symptoms', 'symptoms of type 1 diabetes in children', similar=True) is None
+
+
+def test_dissimilar_prompt_misses_and_zero_threshold_disables_near_matches():
+    cache = ResponseCache(similarity_threshold=0.9)
+    cache.put('chat', 'what are the symptoms of pneumonia', 'answer')
+    # Same content words, but too little trigram overlap
+    assert cache.get('chat', 'pneumonia symptoms', similar=True) is None
+
+    disabled = ResponseCache(similarity_threshold=0)
+    disabled.put('chat', 'What are the symptoms of pneumonia?', 'answer')
+    assert disabled.get('chat', 'What are symptoms of pneumonia', similar=True) is None
+
+
+def test_most_similar_entry_wins():
+    cache = ResponseCache(similarity_threshold=0.5)
+    cache.put('chat', 'tell me about the symptoms of pneumonia please', 'further')
+    cache.put('chat', 'the symptoms of pneumonia', 'closer')
+
+    assert cache.get('chat', 'symptoms of pneumonia', similar=True) == 'closer'
+
+
+def test_entries_expire_after_ttl(now):
+    cache = ResponseCache(ttl=60, similarity_threshold=0.7)
+    cache.put('chat', 'What are the symptoms of pneumonia?', 'answer')
+
+    now['now'] += 59
+    assert cache.get('chat', 'what are the symptoms of pneumonia') == 'answer'
+    now['now'] += 1
+    assert cache.get('chat', 'What are symptoms of pneumonia', similar=True) is None
+    assert cache.get('chat', 'what are the symptoms of pneumonia') is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.index == {}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put('chat', 'first question', 'one')
+    cache.put('chat', 'second question', 'two')
+    cache.get('chat', 'first question')
+
+    cache.put('chat', 'third question', 'three')
+
+    assert cache.get('chat', 'second question') is None
+    assert cache.get('chat', 'first question') == 'one'
+    assert cache.stats()['evictions'] == 1
+    # The evicted entry's trigrams are gone from the index
+    assert set().union(*cache.index.values()) == set(cache.entries)
+
+
+def test_put_replaces_the_answer_for_the_same_prompt():
+    cache = ResponseCache()
+    cache.put('chat', 'What is pneumonia?', 'old')
+    cache.put('chat', 'what is pneumonia', 'new')
+
+    assert cache.get('chat', 'What is pneumonia?') == 'new'
+    assert cache.stats()['entries'] == 1
@@ -0,0 +1,276 @@
+import threading
+import time
+
+import pytest
+
+import llm_gateway
+from llm_gateway import CircuitBreaker, CircuitOpen, DeadlineExceeded, GatewayError, LLMGateway, TokenBucket
+
+ROUTES = {'chat': {'concurrency': 1, 'deadline': 30}}
+
+
+class FakeClock:
+    """Monotonic clock that only moves when sleep() is called"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class Response:
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    @property
+    def text(self):
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return self.outcome
+
+
+class StubModel:
+    """generate_content() answers with the given outcomes in turn: text or an exception"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def generate_content(self, contents, request_options=None, stream=False):
+        self.calls.append(request_options)
+        return Response(self.outcomes.pop(0))
+
+
+class HttpError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def longest_backoff(monkeypatch):
+    # Full jitter picks a delay in [0, cap]; take the cap so the schedule is predictable
+    monkeypatch.setattr(llm_gateway.random, 'uniform', lambda low, high: high)
+
+
+def gateway(model, clock, **options):
+    return LLMGateway(model, ROUTES, sleep=clock.sleep, clock=clock, **options)
+
+
+def test_retries_with_exponential_backoff(clock):
+    model = StubModel(HttpError(503), HttpError(500), 'answer')
+    gw = gateway(model, clock, max_retries=2, backoff=0.5)
+
+    assert gw.generate('chat', 'hello') == 'answer'
+    assert clock.sleeps == [0.5, 1.0]
+    assert len(model.calls) == 3
+    # Each attempt gets the time left before the deadline, and no SDK retries
+    assert model.calls[-1] == {'timeout': 30 - 1.5, 'retry': None}
+    stats = gw.stats()['routes']['chat']
+    assert (stats['succeeded'], stats['retries'], stats['failed'], stats['in_flight']) == (1, 2, 0, 0)
+
+
+def test_backoff_is_capped_and_gives_up_after_max_retries(clock):
+    model = StubModel(*[HttpError(503)] * 4)
+    gw = gateway(model, clock, max_retries=3, backoff=1.0, max_backoff=3.0, failure_threshold=10)
+
+    with pytest.raises(GatewayError):
+        gw.generate('chat', 'hello')
+    assert clock.sleeps == [1.0, 2.0, 3.0]
+    assert gw.stats()['routes']['chat']['failed'] == 1
+
+
+def test_no_retry_past_the_deadline(clock):
+    model = StubModel(HttpError(503), 'answer')
+    gw = LLMGateway(model, {'chat': {'concurrency': 1, 'deadline': 0.4}}, sleep=clock.sleep, clock=clock,
+                    backoff=0.5)
+
+    with pytest.raises(GatewayError):
+        gw.generate('chat', 'hello')
+    assert clock.sleeps == []
+
+
+def test_client_errors_and_blocked_answers_are_final_and_not_upstream_failures(clock):
+    model = StubModel(HttpError(400), ValueError("response was blocked"))
+    gw = gateway(model, clock, failure_threshold=1)
+
+    for _ in range(2):
+        with pytest.raises(GatewayError):
+            gw.generate('chat', 'hello')
+    assert clock.sleeps == []
+    assert gw.breaker.state == 'closed'
+
+
+def test_rate_limited_and_timeout_errors_are_retried(clock):
+    model = StubModel(HttpError(429), HttpError(408), 'answer')
+    assert gateway(model, clock).generate('chat', 'hello') == 'answer'
+
+
+def test_fallback_replaces_a_failed_call(clock):
+    gw = gateway(StubModel(HttpError(503)), clock, max_retries=0)
+
+    assert gw.generate('chat', 'hello', fallback=lambda: 'template') == 'template'
+    assert gw.stats()['routes']['chat']['fallbacks'] == 1
+
+
+def test_breaker_opens_then_lets_one_trial_through(clock):
+    model = StubModel(HttpError(503), HttpError(503), 'recovered')
+    gw = gateway(model, clock, max_retries=0, failure_threshold=2, reset_timeout=10)
+
+    for _ in range(2):
+        with pytest.raises(GatewayError):
+            gw.generate('chat', 'hello')
+    assert gw.breaker.state == 'open'
+    with pytest.raises(CircuitOpen):
+        gw.generate('chat', 'hello')
+    assert len(model.calls) == 2
+    assert gw.stats()['routes']['chat']['rejected'] == 1
+
+    clock.now += 10
+    assert gw.breaker.state == 'half-open'
+    assert gw.generate('chat', 'hello') == 'recovered'
+    assert gw.breaker.state == 'closed'
+    assert gw.stats()['circuit_trips'] == 1
+
+
+def test_failed_trial_reopens_the_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+
+    assert breaker.allow()
+    # Only one trial at a time
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert breaker.trips == 2
+
+
+def test_trial_refused_by_the_rate_limit_is_released(clock):
+    gw = gateway(StubModel('answer'), clock, rate=1, burst=1, failure_threshold=1, reset_timeout=10)
+    gw.breaker.record_failure()
+    clock.now += 10
+    gw.bucket.tokens = 0
+    gw.bucket.updated = clock.now
+
+    with pytest.raises(DeadlineExceeded):
+        gw._admit('chat', clock.now)
+    assert gw.breaker.allow()
+
+
+def test_token_bucket_allows_bursts_then_waits_for_tokens(clock):
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+    assert bucket.acquire(clock.now, sleep=clock.sleep)
+    assert bucket.acquire(clock.now, sleep=clock.sleep)
+    # The next token is 0.5s away
+    assert not bucket.acquire(clock.now + 0.4, sleep=clock.sleep)
+    assert clock.sleeps == []
+    assert bucket.acquire(clock.now + 1, sleep=clock.sleep)
+    assert clock.sleeps == [0.5]
+
+
+def test_gateway_waits_for_rate_tokens_through_its_sleep(clock):
+    gw = gateway(StubModel('a', 'b'), clock, rate=1, burst=1)
+
+    assert gw.generate('chat', 'first') == 'a'
+    assert gw.generate('chat', 'second') == 'b'
+    assert clock.sleeps == [1.0]
+
+
+def test_waiting_for_a_concurrency_slot_goes_through_sleep(clock):
+    gw = gateway(StubModel(), clock, poll_interval=0.25)
+    # The route's only slot is taken
+    release = gw._admit('chat', clock.now + 30)
+
+    with pytest.raises(DeadlineExceeded):
+        gw._admit('chat', clock.now + 1)
+    assert clock.sleeps == [0.25] * 4
+
+    release()
+    gw._admit('chat', clock.now + 1)()
+
+
+class BlockingModel:
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def generate_content(self, contents, request_options=None, stream=False):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(10)
+        return Response(f"answer to {contents}")
+
+
+def test_identical_calls_in_flight_are_coalesced():
+    model = BlockingModel()
+    gw = LLMGateway(model, {'chat': {'concurrency': 4, 'deadline': 10}}, poll_interval=0.005)
+    results = []
+    leader = threading.Thread(target=lambda: results.append(gw.generate('chat', 'same')))
+    leader.start()
+    model.started.wait(10)
+
+    follower = threading.Thread(target=lambda: results.append(gw.generate('chat', 'same')))
+    follower.start()
+    while gw.stats()['routes']['chat']['coalesced'] == 0:
+        time.sleep(0.001)
+    model.release.set()
+    leader.join(10)
+    follower.join(10)
+
+    assert results == ['answer to same', 'answer to same']
+    assert model.calls == 1
+    # Different prompts aren't merged
+    assert gw.generate('chat', 'other') == 'answer to other'
+    assert model.calls == 2
+
+
+def test_coalesced_callers_share_the_error():
+    model = StubModel(HttpError(400))
+    gw = LLMGateway(model, ROUTES)
+    call = llm_gateway._Call()
+    call.error = GatewayError("failed")
+    call.done.set()
+    gw.inflight[llm_gateway.request_key('chat', 'same')] = call
+
+    with pytest.raises(GatewayError, match='failed'):
+        gw.generate('chat', 'same')
+    assert model.calls == []
+
+
+def test_cooperative_sleep_yields_to_the_hub_only_on_the_hub():
+    from realtime import cooperative_sleep
+
+    class FakeSocketIO:
+        async_mode = 'eventlet'
+
+        def __init__(self):
+            self.sleeps = []
+
+        def sleep(self, seconds):
+            self.sleeps.append(seconds)
+
+    socketio = FakeSocketIO()
+    sleep = cooperative_sleep(socketio)
+    sleep(0.001)
+    worker = threading.Thread(target=sleep, args=(0.001,))
+    worker.start()
+    worker.join(10)
+    assert socketio.sleeps == [0.001]
+
+    socketio.async_mode = 'threading'
+    sleep(0.001)
+    assert socketio.sleeps == [0.001]
@@ -0,0 +1,149 @@
+import json
+from types import SimpleNamespace
+
+from llm_gateway import LLMGateway
+from llm_stream import fake_text_stream, gemini_text_stream, sse_text_stream
+
+
+class GrpcCall:
+    """Stands in for the gRPC call google-generativeai keeps on response._iterator"""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class RestStream:
+    """The REST transport's stream: a generator, so only close()"""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class StreamingResponse:
+    """Iterates like a streaming GenerateContentResponse, then raises error if given"""
+
+    def __init__(self, texts, error=None, iterator=None):
+        self.texts = texts
+        self.error = error
+        self._iterator = iterator if iterator is not None else GrpcCall()
+
+    def __iter__(self):
+        for text in self.texts:
+            yield SimpleNamespace(text=text)
+        if self.error is not None:
+            raise self.error
+
+
+class StreamingModel:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def generate_content(self, contents, stream=False, request_options=None):
+        self.calls.append({'stream': stream, 'request_options': request_options})
+        return self.response
+
+
+def parse(events):
+    parsed = []
+    for event in events:
+        name, data = event.strip().split('\n')
+        parsed.append((name[len('event: '):], json.loads(data[len('data: '):])))
+    return parsed
+
+
+def test_client_disconnect_cancels_the_upstream_call():
+    response = StreamingResponse(['one ', 'two ', 'three'])
+    events = sse_text_stream(gemini_text_stream(StreamingModel(response), 'prompt'))
+
+    assert parse([next(events)]) == [('chunk', {'text': 'one '})]
+    # What the server does when the client goes away
+    events.close()
+
+    assert response._iterator.cancelled
+
+
+def test_disconnect_closes_a_rest_stream():
+    response = StreamingResponse(['one ', 'two '], iterator=RestStream())
+    events = sse_text_stream(gemini_text_stream(StreamingModel(response), 'prompt'))
+    next(events)
+    events.close()
+
+    assert response._iterator.closed
+
+
+def test_disconnect_without_a_cancellable_stream_is_harmless(capsys):
+    response = StreamingResponse(['one ', 'two '], iterator=object())
+    events = sse_text_stream(gemini_text_stream(StreamingModel(response), 'prompt'))
+    next(events)
+    events.close()
+
+    assert 'not supported by this SDK version' in capsys.readouterr().out
+
+
+def test_finished_stream_is_not_cancelled_and_ends_with_done():
+    response = StreamingResponse(['Hello ', 'there'])
+    completed = []
+
+    def on_complete(text):
+        completed.append(text)
+        return {'cached': False}
+
+    events = parse(sse_text_stream(gemini_text_stream(StreamingModel(response), 'prompt'), on_complete))
+
+    assert events == [
+        ('chunk', {'text': 'Hello '}),
+        ('chunk', {'text': 'there'}),
+        ('done', {'chars': 11, 'cached': False})
+    ]
+    assert completed == ['Hello there']
+    assert not response._iterator.cancelled
+
+
+def test_upstream_error_becomes_an_error_event_and_cancels_the_call():
+    response = StreamingResponse(['partial '], error=RuntimeError("connection reset"))
+    events = parse(sse_text_stream(gemini_text_stream(StreamingModel(response), 'prompt')))
+
+    assert events == [('chunk', {'text': 'partial '}), ('error', {'error': 'connection reset'})]
+    assert response._iterator.cancelled
+
+
+def test_gateway_stream_releases_its_slot_when_the_client_goes_away():
+    response = StreamingResponse(['one ', 'two '])
+    model = StreamingModel(response)
+    gateway = LLMGateway(model, {'chat': {'concurrency': 1, 'deadline': 30}})
+
+    events = sse_text_stream(gateway.stream('chat', 'prompt'))
+    next(events)
+    assert gateway.stats()['routes']['chat']['in_flight'] == 1
+    events.close()
+
+    assert response._iterator.cancelled
+    assert model.calls[0]['stream'] is True
+    stats = gateway.stats()['routes']['chat']
+    assert (stats['in_flight'], stats['succeeded'], stats['failed']) == (0, 0, 0)
+    # The slot is free again
+    gateway._admit('chat', float('inf'))()
+
+
+def test_gateway_stream_error_is_reported_as_an_error_event():
+    model = StreamingModel(StreamingResponse(['partial '], error=RuntimeError("upstream 500")))
+    gateway = LLMGateway(model, {'chat': {'concurrency': 1, 'deadline': 30}})
+
+    events = parse(sse_text_stream(gateway.stream('chat', 'prompt')))
+
+    assert events[-1][0] == 'error'
+    assert 'upstream 500' in events[-1][1]['error']
+    assert gateway.stats()['routes']['chat']['failed'] == 1
+
+
+def test_fake_stream_yields_the_whole_text_in_pieces():
+    chunks = list(fake_text_stream('a b c d e', chunk_words=2, delay=0))
+
+    assert chunks == ['a b ', 'c d ', 'e']
@@ -0,0 +1,112 @@
+import re
+
+from metrics import CONTENT_TYPE, MetricsRegistry, StageTimer
+
+# One sample line of the Prometheus text format: name, optional labels, value
+SAMPLE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*'
+                    r'(\{[a-zA-Z_][a-zA-Z0-9_]*="(\\.|[^"\\])*"(,[a-zA-Z_][a-zA-Z0-9_]*="(\\.|[^"\\])*")*\})?'
+                    r' (-?[0-9.e+-]+|\+Inf|-Inf|NaN)$')
+
+
+def assert_valid_exposition(text):
+    assert text.endswith('\n')
+    for line in text[:-1].split('\n'):
+        if line.startswith('#'):
+            assert re.match(r'^# (HELP|TYPE) [a-zA-Z_:][a-zA-Z0-9_:]* \S', line), line
+        else:
+            assert SAMPLE.match(line), line
+
+
+def test_counter_renders_help_type_and_one_sample_per_label_set():
+    registry = MetricsRegistry()
+    errors = registry.counter('app_errors_total', 'Errors per event', ('event',))
+    errors.inc('connect')
+    errors.inc('connect')
+    errors.inc('message', amount=3)
+
+    assert registry.render() == (
+        '# HELP app_errors_total Errors per event\n'
+        '# TYPE app_errors_total counter\n'
+        'app_errors_total{event="connect"} 2.0\n'
+        'app_errors_total{event="message"} 3.0\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    registry = MetricsRegistry()
+    latency = registry.histogram('app_seconds', 'Latency', ('route',), buckets=(0.5, 0.1, 1.0))
+    for value in (0.05, 0.1, 0.7, 3.0):
+        latency.observe(value, 'predict')
+
+    assert registry.render().split('\n')[2:-1] == [
+        'app_seconds_bucket{route="predict",le="0.1"} 2.0',
+        'app_seconds_bucket{route="predict",le="0.5"} 2.0',
+        'app_seconds_bucket{route="predict",le="1.0"} 3.0',
+        'app_seconds_bucket{route="predict",le="+Inf"} 4.0',
+        'app_seconds_sum{route="predict"} 3.85',
+        'app_seconds_count{route="predict"} 4.0',
+    ]
+
+
+def test_label_values_and_help_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter('app_total', 'Line one\nback\\slash', ('path',)).inc('a "quoted"\\path\n')
+
+    text = registry.render()
+
+    assert '# HELP app_total Line one\\nback\\\\slash\n' in text
+    assert 'app_total{path="a \\"quoted\\"\\\\path\\n"} 1.0\n' in text
+    assert_valid_exposition(text)
+
+
+def test_callbacks_are_read_at_render_time_and_skip_missing_values():
+    registry = MetricsRegistry()
+    depth = {'value': 1}
+    registry.callback('app_queue_depth', 'Queued jobs', lambda: depth['value'])
+    registry.callback('app_hit_rate', 'Hit rate', lambda: {('chat',): 0.5, ('symptoms',): None},
+                      labelnames=('route',))
+    depth['value'] = 7
+
+    text = registry.render()
+
+    assert 'app_queue_depth 7.0\n' in text
+    assert 'app_hit_rate{route="chat"} 0.5\n' in text
+    assert 'symptoms' not in text
+    assert_valid_exposition(text)
+
+
+def test_failing_metric_is_left_out_of_the_scrape(capsys):
+    registry = MetricsRegistry()
+    registry.callback('app_broken', 'Broken', lambda: 1 / 0)
+    registry.counter('app_total', 'Fine').inc()
+
+    text = registry.render()
+
+    assert 'app_broken' not in text
+    assert 'app_total 1.0\n' in text
+    assert 'Error collecting metric app_broken' in capsys.readouterr().out
+
+
+def test_stage_timer_records_each_stage():
+    registry = MetricsRegistry()
+    stages = registry.histogram('app_stage_seconds', 'Stages', ('route', 'stage', 'model'))
+    timer = StageTimer(stages, 'predict')
+    with timer.stage('decode'):
+        pass
+    timer.model = 'pneumonia'
+    timer.record('inference', 0.2)
+
+    text = registry.render()
+
+    assert 'app_stage_seconds_count{route="predict",stage="decode",model=""} 1.0\n' in text
+    assert 'app_stage_seconds_sum{route="predict",stage="inference",model="pneumonia"} 0.2\n' in text
+
+
+def test_metrics_endpoint_serves_the_registry(app_module):
+    response = app_module.app.test_client().get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == CONTENT_TYPE
+    text = response.get_data(as_text=True)
+    assert '# TYPE medai_stage_seconds histogram' in text
+    assert_valid_exposition(text)
@@ -0,0 +1,105 @@
+import io
+import os
+
+import torch
+
+from conftest import build_model, image_bytes
+from prediction_cache import PredictionCache
+
+
+def entry(model_key, prediction='Normal'):
+    return {'model_key': model_key, 'result': {'prediction': prediction}, 'report_content': None,
+            'pdf_path': None, 'report_job_id': None}
+
+
+def test_entries_survive_a_restart(tmp_path):
+    cache = PredictionCache(str(tmp_path))
+    key = cache.make_key('a' * 64, 'pneumonia', 'v1')
+    cache.put(key, entry('pneumonia'))
+    cache.update(key, report_content='text')
+
+    reopened = PredictionCache(str(tmp_path))
+    assert reopened.get(key)['report_content'] == 'text'
+    assert reopened.stats()['disk_hits'] == 1
+
+
+def test_changed_weights_drop_only_that_models_entries_without_reading_them(tmp_path, monkeypatch):
+    cache = PredictionCache(str(tmp_path))
+    cache.check_model_version('pneumonia', 'v1')
+    cache.check_model_version('covid19', 'v1')
+    pneumonia = cache.make_key('a' * 64, 'pneumonia', 'v1')
+    covid = cache.make_key('a' * 64, 'covid19', 'v1')
+    cache.put(pneumonia, entry('pneumonia'))
+    cache.put(covid, entry('covid19'))
+
+    # Restarted, so entries are only on disk
+    cache = PredictionCache(str(tmp_path))
+    cache.check_model_version('pneumonia', 'v1')
+    assert cache.check_model_version('pneumonia', 'v1') is False
+
+    def read_disk(key):
+        raise AssertionError("invalidation read a cache file")
+    monkeypatch.setattr(cache, '_read_disk', read_disk)
+    assert cache.check_model_version('pneumonia', 'v2') is True
+    monkeypatch.undo()
+
+    assert cache.get(pneumonia) is None
+    assert cache.get(covid)['model_key'] == 'covid19'
+    assert len(os.listdir(tmp_path)) == 1
+    assert cache.stats()['invalidations'] == 1
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = PredictionCache(str(tmp_path), max_memory_entries=1, max_disk_bytes=1)
+    first = cache.make_key('a' * 64, 'pneumonia', 'v1')
+    second = cache.make_key('b' * 64, 'pneumonia', 'v1')
+    cache.put(first, entry('pneumonia'))
+    cache.put(second, entry('pneumonia'))
+
+    stats = cache.stats()
+    assert stats['disk_entries'] == 1
+    assert stats['evictions'] == 1
+    assert stats['disk_bytes'] == os.path.getsize(os.path.join(tmp_path, os.listdir(tmp_path)[0]))
+
+
+def test_cached_entries_are_copies(tmp_path):
+    cache = PredictionCache(str(tmp_path))
+    key = cache.make_key('a' * 64, 'pneumonia', 'v1')
+    stored = entry('pneumonia')
+    cache.put(key, stored)
+    stored['result']['prediction'] = 'changed'
+    cache.get(key)['result']['cached'] = True
+
+    assert cache.get(key)['result'] == {'prediction': 'Normal'}
+
+
+def test_swapped_weights_are_loaded_before_predictions_are_cached_again(app_module):
+    client = app_module.app.test_client()
+    weights_path = app_module.MODELS['pneumonia']['file']
+    data = image_bytes(seed=10)
+
+    def predict():
+        response = client.post('/predict', data={'file': (io.BytesIO(data), 'swap.jpg'), 'model': 'pneumonia'})
+        assert response.status_code == 200, response.json
+        return response.json
+
+    first = predict()
+    model = app_module.model_registry.get('pneumonia')
+
+    # Weights whose output differs from the current ones for any input
+    swapped = build_model(2, seed=1)
+    with torch.no_grad():
+        swapped.classifier[1].weight.zero_()
+        other = 1 - app_module.MODELS['pneumonia']['classes'].index(first['prediction'])
+        swapped.classifier[1].bias.copy_(torch.nn.functional.one_hot(torch.tensor(other), 2) * 10.0)
+    original = open(weights_path, 'rb').read()
+    torch.save(swapped.state_dict(), weights_path)
+    try:
+        second = predict()
+        assert app_module.model_registry.get('pneumonia') is not model
+        assert second['cached'] is False
+        assert second['prediction'] != first['prediction']
+        assert predict()['prediction'] == second['prediction']
+    finally:
+        with open(weights_path, 'wb') as f:
+            f.write(original)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+from torchvision import transforms
+
+from preprocess import IMAGENET_MEAN, IMAGENET_STD, Preprocessor, tolerance
+
+# The app's test_transform
+reference = transforms.Compose([
+    transforms.Resize((224, 224)),
+    transforms.ToTensor(),
+    transforms.Normalize(mean=IMAGENET_MEAN, std=IMAGENET_STD)
+])
+
+
+def noise_image(width, height, seed=0):
+    pixels = np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    return Image.fromarray(pixels)
+
+
+def gradient_image(width, height):
+    x = np.linspace(0, 255, width)
+    y = np.linspace(0, 255, height)[:, None]
+    pixels = np.stack([np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width)),
+                       (x + y) / 2], axis=-1)
+    return Image.fromarray(pixels.round().astype(np.uint8))
+
+
+SIZES = [(224, 224), (640, 480), (300, 1000), (97, 61), (2048, 1536)]
+
+
+@pytest.mark.parametrize('size', SIZES)
+@pytest.mark.parametrize('make', [noise_image, gradient_image])
+def test_matches_test_transform_within_tolerance(make, size):
+    img = make(*size)
+
+    fast = Preprocessor()(img)
+
+    assert fast.shape == (3, 224, 224)
+    assert fast.dtype == torch.float32
+    assert (reference(img) - fast).abs().max() <= tolerance()
+
+
+def test_other_modes_are_converted_to_rgb():
+    img = noise_image(320, 240).convert('L')
+
+    fast = Preprocessor()(img)
+
+    assert (reference(img.convert('RGB')) - fast).abs().max() <= tolerance()
+
+
+def test_batch_matches_stacked_single_images():
+    preprocessor = Preprocessor()
+    images = [noise_image(640, 480, seed=1), gradient_image(300, 1000), noise_image(97, 61, seed=2)]
+
+    batch = preprocessor.batch([preprocessor.resize(img) for img in images])
+
+    assert torch.equal(batch, torch.stack([preprocessor(img) for img in images]))
+
+
+def test_smaller_batch_reuses_the_buffer():
+    preprocessor = Preprocessor()
+    images = [noise_image(128, 128, seed=seed) for seed in range(3)]
+
+    preprocessor.batch([preprocessor.resize(img) for img in images])
+    second = preprocessor.batch([preprocessor.resize(images[2])])
+
+    assert second.shape == (1, 3, 224, 224)
+    assert torch.equal(second[0], preprocessor(images[2]))
@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from realtime import RedisPresenceStore
+
+fakeredis = pytest.importorskip('fakeredis')
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def node(server, clock, node_ttl=30.0):
+    """One server process's store, sharing the Redis server with the others"""
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    return RedisPresenceStore(None, node_ttl=node_ttl, client=client, clock=clock)
+
+
+def test_user_is_online_until_their_last_socket_on_any_node_closes(server, clock):
+    first, second = node(server, clock), node(server, clock)
+
+    assert first.add('a1', 'alice') == 1
+    assert second.add('b1', 'alice') == 2
+    assert second.add('b2', 'alice') == 3
+
+    assert first.remove('a1') == ('alice', 2)
+    assert second.remove('b1') == ('alice', 1)
+    assert first.is_online('alice')
+    assert second.remove('b2') == ('alice', 0)
+    assert not first.is_online('alice')
+    assert first.online_user_ids() == set()
+
+
+def test_sockets_are_counted_once_and_can_change_user(server, clock):
+    store = node(server, clock)
+
+    assert store.add('s1', 'alice') == 1
+    assert store.add('s1', 'alice') == 1
+    # The same socket identifying as someone else moves over
+    assert store.add('s1', 'bob') == 1
+    assert not store.is_online('alice')
+    assert store.user_for('s1') == 'bob'
+
+    assert store.remove('s1') == ('bob', 0)
+    assert store.remove('s1') == (None, 0)
+    assert store.remove('unknown') == (None, 0)
+
+
+def test_sockets_of_a_node_that_stops_refreshing_expire(server, clock):
+    crashed, alive = node(server, clock), node(server, clock)
+    crashed.add('c1', 'alice')
+    alive.add('l1', 'bob')
+    assert alive.online_user_ids() == {'alice', 'bob'}
+
+    clock.now += 20
+    alive.refresh()
+    clock.now += 15
+
+    assert not alive.is_online('alice')
+    assert alive.online_user_ids() == {'bob'}
+    # Alice reconnecting elsewhere starts from her live sockets only
+    assert alive.add('l2', 'alice') == 1
+    stats = alive.stats()
+    assert (stats['nodes'], stats['sockets'], stats['users']) == (1, 2, 2)
+    # The dead node was dropped from the set by the refresh that saw it expired
+    alive.refresh()
+    clock.now += 20
+    alive.refresh()
+    assert alive.client.zrange(alive.nodes_key, 0, -1) == [alive.node_id]
+
+
+def test_refresh_only_writes_every_third_of_the_ttl(server, clock):
+    store = node(server, clock, node_ttl=30)
+    store.add('s1', 'alice')
+    expires = store.client.zscore(store.nodes_key, store.node_id)
+
+    clock.now += 5
+    store.refresh()
+    assert store.client.zscore(store.nodes_key, store.node_id) == expires
+
+    clock.now += 5
+    store.refresh()
+    assert store.client.zscore(store.nodes_key, store.node_id) == expires + 10000
+    assert 0 < store.client.pttl(store.sids_key) <= 30000
+
+
+def test_concurrent_updates_for_one_user_keep_the_count(server, clock):
+    stores = [node(server, clock) for _ in range(2)]
+    errors = []
+
+    def churn(store, worker):
+        try:
+            for i in range(50):
+                sid = f"{worker}-{i}"
+                store.add(sid, 'alice')
+                store.remove(sid)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=churn, args=(stores[i % 2], i)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+
+    assert errors == []
+    assert not stores[0].is_online('alice')
+    assert stores[0].add('last', 'alice') == 1
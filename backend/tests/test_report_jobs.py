@@ -0,0 +1,179 @@
+import io
+import os
+import threading
+import time
+
+from conftest import image_bytes
+from report_jobs import ReportJobQueue, fake_report_content
+
+REPORT_DATA = {
+    'model_used': 'pneumonia',
+    'display_name': 'Pneumonia Detection',
+    'prediction': 'Normal',
+    'confidence': 91.5
+}
+
+
+def wait_for(predicate, timeout=10.0, sleep=time.sleep):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        sleep(0.01)
+
+
+def test_job_goes_from_queued_to_running_to_completed():
+    started = threading.Event()
+    release = threading.Event()
+    rendered = []
+    finished = []
+
+    def generate(report_data, image):
+        started.set()
+        release.wait(10)
+        return fake_report_content(report_data, image)
+
+    jobs = ReportJobQueue(generate, lambda *args: rendered.append(args), on_finished=finished.append,
+                          max_workers=1)
+    first = jobs.submit(REPORT_DATA, 'upload.jpg', 'reports/a.pdf', '/reports/a.pdf')
+    started.wait(10)
+    # The only worker is busy with the first job
+    second = jobs.submit(REPORT_DATA, 'upload.jpg', 'reports/b.pdf', '/reports/b.pdf')
+
+    assert first.status == 'running'
+    assert second.status == 'queued'
+    assert jobs.pending_count() == 2
+    # The PDF link is only handed out once the PDF exists
+    assert first.to_dict()['report_url'] is None
+
+    release.set()
+    assert second.done.wait(10)
+
+    assert [job.status for job in (first, second)] == ['completed', 'completed']
+    assert jobs.pending_count() == 0
+    assert finished == [first, second]
+    assert rendered[0] == (REPORT_DATA, 'upload.jpg', 'reports/a.pdf', first.report_content)
+    state = first.to_dict()
+    assert state['report_url'] == '/reports/a.pdf'
+    assert "'Normal' with 91.50% confidence" in state['report_content']
+    assert state['created_at'] <= state['started_at'] <= state['finished_at']
+    # Finished jobs don't keep the upload
+    assert first.image is None
+
+
+def test_failed_job_records_the_error():
+    def render(*args):
+        raise RuntimeError("disk full")
+
+    finished = []
+    jobs = ReportJobQueue(fake_report_content, render, on_finished=finished.append, max_workers=1)
+    job = jobs.submit(REPORT_DATA, 'upload.jpg', 'reports/a.pdf', '/reports/a.pdf')
+    assert job.done.wait(10)
+
+    assert job.status == 'failed'
+    assert job.error == 'disk full'
+    assert job.to_dict()['report_url'] is None
+    assert finished == [job]
+
+
+def test_oldest_finished_jobs_are_forgotten():
+    jobs = ReportJobQueue(fake_report_content, lambda *args: None, max_workers=1, max_jobs=2)
+    submitted = []
+    for name in 'abc':
+        submitted.append(jobs.submit(REPORT_DATA, 'upload.jpg', f'reports/{name}.pdf', f'/reports/{name}.pdf'))
+        assert submitted[-1].done.wait(10)
+
+    assert jobs.get(submitted[0].id) is None
+    assert jobs.get(submitted[2].id) is submitted[2]
+
+
+def predict(client, **form):
+    data = {'file': (io.BytesIO(image_bytes()), 'xray.jpg'), 'model': 'pneumonia'}
+    data.update(form)
+    response = client.post('/predict', data=data)
+    assert response.status_code == 200, response.json
+    return response.json
+
+
+def test_predict_returns_before_the_report_and_notifies_subscribers(app_module):
+    client = app_module.app.test_client()
+    socket = app_module.socketio.test_client(app_module.app, flask_test_client=client)
+    release = threading.Event()
+    generate = app_module.report_jobs.generate_content
+    app_module.report_jobs.generate_content = lambda *args: release.wait(10) and generate(*args)
+    try:
+        result = predict(client)
+
+        assert result['report_status'] in ('queued', 'running')
+        assert result['report_content'] == ''
+        status = client.get(result['report_status_url'])
+        assert status.status_code == 200
+        assert status.json['status'] in ('queued', 'running')
+        assert status.json['report_url'] is None
+
+        socket.emit('subscribe_report', {'job_id': result['report_job_id']})
+        release.set()
+        # Report workers are OS threads; their events reach clients through the hub
+        received = []
+        wait_for(lambda: received.extend(socket.get_received()) or
+                 any(event['name'] == 'report_ready' for event in received),
+                 sleep=app_module.socketio.sleep)
+    finally:
+        app_module.report_jobs.generate_content = generate
+        release.set()
+        socket.disconnect()
+
+    ready = next(event for event in received if event['name'] == 'report_ready')['args'][0]
+    assert ready['job_id'] == result['report_job_id']
+    assert ready['status'] == 'completed'
+    assert ready['report_url'] == result['report_url']
+    assert 'Preliminary' in ready['report_content']
+
+    status = client.get(result['report_status_url']).json
+    assert status['status'] == 'completed'
+    assert os.path.getsize(app_module.report_jobs.get(result['report_job_id']).pdf_path) > 0
+
+    # The finished report is served from the prediction cache next time
+    again = predict(client)
+    assert again['cached'] is True
+    assert again['report_status'] == 'completed'
+    assert again['report_content'] == ready['report_content']
+
+
+def test_failed_report_is_reported_to_pollers_and_subscribers(app_module):
+    client = app_module.app.test_client()
+    generate = app_module.report_jobs.generate_content
+
+    def fail(*args):
+        raise RuntimeError("Gemini unavailable")
+
+    app_module.report_jobs.generate_content = fail
+    try:
+        result = predict(client, file=(io.BytesIO(image_bytes(seed=1)), 'other.jpg'))
+        job = app_module.report_jobs.get(result['report_job_id'])
+        assert job.done.wait(10)
+    finally:
+        app_module.report_jobs.generate_content = generate
+
+    status = client.get(result['report_status_url']).json
+    assert status['status'] == 'failed'
+    assert status['error'] == 'Gemini unavailable'
+
+    # Subscribing after the job has finished still gets its outcome
+    socket = app_module.socketio.test_client(app_module.app, flask_test_client=client)
+    socket.emit('subscribe_report', {'job_id': result['report_job_id']})
+    events = socket.get_received()
+    socket.disconnect()
+    assert [event['name'] for event in events] == ['report_failed']
+    assert events[0]['args'][0]['error'] == 'Gemini unavailable'
+
+
+def test_wait_for_report_returns_the_finished_report(app_module):
+    client = app_module.app.test_client()
+    result = predict(client, file=(io.BytesIO(image_bytes(seed=2)), 'third.jpg'), wait_for_report='true')
+
+    assert result['report_status'] == 'completed'
+    assert 'Preliminary' in result['report_content']
+
+
+def test_unknown_report_job_is_404(app_module):
+    assert app_module.app.test_client().get('/api/reports/jobs/missing').status_code == 404
@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+
+from storage import MIGRATIONS, Store
+
+
+def user_version(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_new_database_gets_every_migration(tmp_path):
+    path = str(tmp_path / 'db' / 'app.sqlite3')
+    store = Store(path, pool_size=2)
+
+    assert user_version(path) == len(MIGRATIONS)
+    assert store.create_user({'id': 'u1', 'email': 'a@example.com', 'name': 'A', 'password': 'x',
+                              'role': 'patient', 'status': 'offline'})
+    assert store.get_user('u1')['email'] == 'a@example.com'
+    store.pool.close()
+
+    # Reopening applies nothing and keeps the data
+    reopened = Store(path, pool_size=2)
+    assert reopened.get_user('u1')['name'] == 'A'
+    reopened.pool.close()
+
+
+def test_workers_starting_together_apply_each_migration_once(tmp_path):
+    # Separate Stores share no locks, like worker processes opening the same file
+    path = str(tmp_path / 'app.sqlite3')
+    workers = 6
+    barrier = threading.Barrier(workers)
+    errors = []
+    stores = []
+
+    def start():
+        try:
+            barrier.wait(10)
+            stores.append(Store(path, pool_size=1))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=start) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+
+    assert errors == []
+    assert len(stores) == workers
+    assert user_version(path) == len(MIGRATIONS)
+    for store in stores:
+        store.pool.close()
+
+
+def test_failed_migration_leaves_the_version_unchanged(tmp_path, monkeypatch):
+    path = str(tmp_path / 'app.sqlite3')
+    Store(path, pool_size=1).pool.close()
+    monkeypatch.setattr('storage.MIGRATIONS', MIGRATIONS + ["CREATE TABLE extra (id TEXT);\nSELECT * FROM missing;"])
+
+    try:
+        Store(path, pool_size=1)
+    except sqlite3.OperationalError:
+        pass
+    else:
+        raise AssertionError("migration should have failed")
+
+    assert user_version(path) == len(MIGRATIONS)
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'extra'").fetchone() is None
+    conn.close()
@@ -0,0 +1,123 @@
+import os
+import time
+
+import pytest
+
+from conftest import image_bytes
+from ingest import ingest_image
+from upload_store import UploadStore
+
+HOUR = 3600
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.tasks = []
+
+    def start_background_task(self, target):
+        self.tasks.append(target)
+
+
+def stored_file(folder, name, size, age):
+    """A file in folder whose last modification was age seconds ago"""
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def digest(n):
+    return f"{n:064x}"
+
+
+@pytest.fixture
+def folder(tmp_path):
+    return str(tmp_path)
+
+
+def test_sweep_removes_only_expired_uploads(folder):
+    store = UploadStore(FakeSocketIO(), folder, enabled=True, retention=24 * HOUR)
+    expired = stored_file(folder, f"{digest(1)}.jpg", 10, 25 * HOUR)
+    fresh = stored_file(folder, f"{digest(2)}.png", 10, 23 * HOUR)
+    # Not written by the store, so never deleted however old
+    foreign = stored_file(folder, 'notes.txt', 10, 100 * HOUR)
+
+    assert store.sweep() == 1
+
+    assert not os.path.exists(expired)
+    assert os.path.exists(fresh)
+    assert os.path.exists(foreign)
+    assert store.stats()['removed'] == 1
+
+
+def test_sweep_deletes_oldest_uploads_over_the_size_cap(folder):
+    store = UploadStore(FakeSocketIO(), folder, enabled=True, retention=24 * HOUR, max_bytes=250)
+    paths = [stored_file(folder, f"{digest(n)}.jpg", 100, age) for n, age in enumerate([4, 3, 2, 1])]
+
+    assert store.sweep() == 2
+
+    assert [os.path.exists(p) for p in paths] == [False, False, True, True]
+    # Under the cap now, so the next sweep leaves them
+    assert store.sweep() == 0
+
+
+def test_no_size_cap_when_max_bytes_is_zero(folder):
+    store = UploadStore(FakeSocketIO(), folder, enabled=True, retention=24 * HOUR, max_bytes=0)
+    for n in range(3):
+        stored_file(folder, f"{digest(n)}.jpg", 1000, 60)
+
+    assert store.sweep() == 0
+
+
+def test_sweep_skips_uploads_still_being_written(folder):
+    store = UploadStore(FakeSocketIO(), folder, enabled=True, retention=HOUR, max_bytes=1, janitor_interval=600)
+    writing = stored_file(folder, f"{digest(1)}.jpg.{'a' * 32}.tmp", 100, 60)
+    abandoned = stored_file(folder, f"{digest(2)}.jpg.{'b' * 32}.tmp", 100, 2 * HOUR)
+
+    store.sweep()
+
+    assert os.path.exists(writing)
+    assert not os.path.exists(abandoned)
+
+
+def test_saved_uploads_are_content_addressed_and_deduplicated(folder):
+    store = UploadStore(FakeSocketIO(), folder, enabled=True)
+    image = ingest_image(image_bytes(fmt='PNG'))
+
+    filename = store.save(image)
+    store.executor.submit(lambda: None).result(10)
+    path = os.path.join(folder, filename)
+    assert filename == f"{image.sha256}.png"
+    with open(path, 'rb') as f:
+        assert f.read() == image.data
+
+    # Saving it again restarts its retention instead of writing another copy
+    old = time.time() - 10 * HOUR
+    os.utime(path, (old, old))
+    assert store.save(image) == filename
+    store.executor.submit(lambda: None).result(10)
+    assert os.path.getmtime(path) > old
+    stats = store.stats()
+    assert (stats['written'], stats['deduplicated'], stats['pending']) == (1, 1, 0)
+    assert os.listdir(folder) == [filename]
+
+
+def test_disabled_store_writes_nothing_and_runs_no_janitor(folder):
+    socketio = FakeSocketIO()
+    store = UploadStore(socketio, folder, enabled=False)
+
+    assert store.save(ingest_image(image_bytes())) is None
+    assert os.listdir(folder) == []
+    assert socketio.tasks == []
+
+
+def test_janitor_starts_once_on_first_save(folder):
+    socketio = FakeSocketIO()
+    store = UploadStore(socketio, folder, enabled=True)
+
+    store.save(ingest_image(image_bytes(seed=1)))
+    store.save(ingest_image(image_bytes(seed=2)))
+
+    assert socketio.tasks == [store._run]
@@ -0,0 +1,162 @@
+import io
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Request
+
+
+class InMemoryRequest(Request):
+    """
+    Request whose multipart file parts are buffered in memory.
+
+    Werkzeug spools file parts over 500 KB to temporary files; uploads here are bounded by
+    MAX_CONTENT_LENGTH and decoded straight away, so a disk round trip only adds latency.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return io.BytesIO()
+
+
+EXTENSIONS = {'JPEG': 'jpg', 'PNG': 'png'}
+# Files the store wrote (or was writing); anything else in the folder is left alone
+_stored_name = re.compile(r'^[0-9a-f]{64}\.\w+(\.[0-9a-f]{32}\.tmp)?$')
+
+
+class UploadStore:
+    """
+    Optional, content-addressed copies of uploaded images.
+
+    When enabled, save() queues the upload to be written as <sha256>.<ext> in folder by a
+    background thread, so identical uploads share one file, uploads with the same name
+    never overwrite each other and the request doesn't wait on the disk. Files are written
+    to a temporary name and renamed into place. A janitor deletes stored files older than
+    retention seconds and, oldest first, any beyond max_bytes in total; other files in
+    folder are never touched.
+
+    :param socketio: Flask-SocketIO instance the janitor loop runs on
+    :param enabled: whether uploads are persisted at all
+    :param retention: seconds a stored upload is kept after its last save
+    :param max_bytes: total size of stored uploads above which the oldest are deleted (0: no cap)
+    :param janitor_interval: seconds between janitor sweeps
+    """
+
+    def __init__(self, socketio, folder, enabled=False, retention=24 * 3600, max_bytes=0, janitor_interval=600):
+        self.socketio = socketio
+        self.folder = folder
+        self.enabled = enabled
+        self.retention = retention
+        self.max_bytes = max_bytes
+        self.janitor_interval = janitor_interval
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='upload-writer')
+        # Filenames queued but not yet written
+        self.pending = set()
+        self.started = False
+        self.counters = {'written': 0, 'deduplicated': 0, 'failed': 0, 'removed': 0, 'sweeps': 0}
+
+    def start(self):
+        """Start the janitor loop on first use, so importing the app doesn't spawn it"""
+        with self.lock:
+            if self.started or not self.enabled:
+                return
+            self.started = True
+        self.socketio.start_background_task(self._run)
+
+    def _run(self):
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"Upload janitor failed: {str(e)}")
+            self.socketio.sleep(self.janitor_interval)
+
+    def _count(self, name, delta=1):
+        with self.lock:
+            self.counters[name] += delta
+
+    @staticmethod
+    def filename_for(image):
+        return f"{image.sha256}.{EXTENSIONS.get(image.format, 'img')}"
+
+    def save(self, image):
+        """
+        Queue an IngestedImage to be stored; returns its filename in folder, or None when
+        persistence is disabled. The file may not exist yet when this returns.
+        """
+        if not self.enabled:
+            return None
+        self.start()
+        filename = self.filename_for(image)
+        with self.lock:
+            if filename in self.pending:
+                self.counters['deduplicated'] += 1
+                return filename
+            self.pending.add(filename)
+        self.executor.submit(self._write, filename, image.data)
+        return filename
+
+    def _write(self, filename, data):
+        path = os.path.join(self.folder, filename)
+        try:
+            if os.path.exists(path):
+                # Same content already stored; restart its retention period
+                os.utime(path)
+                self._count('deduplicated')
+                return
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._count('written')
+        except Exception as e:
+            print(f"Error storing upload {filename}: {str(e)}")
+            self._count('failed')
+        finally:
+            with self.lock:
+                self.pending.discard(filename)
+
+    def sweep(self):
+        """Delete expired uploads, then the oldest ones over max_bytes; returns the number removed"""
+        now = time.time()
+        files = []
+        for entry in os.scandir(self.folder):
+            if entry.is_file() and _stored_name.match(entry.name):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort()
+
+        removed = 0
+        total = sum(size for _, size, _ in files)
+        for mtime, size, path in files:
+            if now - mtime < self.retention and (not self.max_bytes or total <= self.max_bytes):
+                break
+            # Leave files that are being written alone
+            if path.endswith('.tmp') and now - mtime < self.janitor_interval:
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+                total -= size
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Error removing upload {path}: {str(e)}")
+
+        self._count('sweeps')
+        self._count('removed', removed)
+        return removed
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters, pending=len(self.pending))
+        stats.update({
+            'enabled': self.enabled,
+            'retention': self.retention,
+            'max_bytes': self.max_bytes,
+            'janitor_interval': self.janitor_interval
+        })
+        return stats
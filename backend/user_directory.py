@@ -0,0 +1,168 @@
+import threading
+import time
+
+from storage import USER_FIELDS
+
+
+class UserDirectory:
+    """
+    In-memory user index in front of the Store.
+
+    Users are kept by id with secondary indexes on email and on (role, specialty), so
+    lookups on the call setup and presence paths are dict lookups instead of queries or
+    scans. Every write goes to the store first and then updates the indexes, so the
+    directory never holds a change the database doesn't.
+
+    Returned users are copies; change them with update() so the indexes stay in sync.
+
+    When several processes share the database, pass sync_interval: at most that often,
+    reads first pull the rows other processes changed (by users.updated_at), and users
+    missing from the index are looked up in the store. Each sync re-reads sync_skew
+    seconds before the newest change it has seen: a transaction can commit after a later
+    one with an earlier updated_at, and would otherwise be skipped for good. Re-applying a
+    row is harmless.
+    """
+
+    def __init__(self, store, sync_interval=None, sync_skew=5.0):
+        self.store = store
+        self.sync_interval = sync_interval
+        self.sync_skew = sync_skew
+        self.lock = threading.RLock()
+        self.by_id = {}
+        self.id_by_email = {}
+        # role -> specialty -> {user_id: None}, an insertion-ordered set
+        self.by_role = {}
+        self.watermark = 0
+        self.synced_at = 0
+        self.load()
+
+    def load(self):
+        """(Re)build the indexes from the store"""
+        started = time.time()
+        users = self.store.list_users()
+        with self.lock:
+            self.by_id = {}
+            self.id_by_email = {}
+            self.by_role = {}
+            for user in users:
+                self._index(user)
+            self.watermark = started
+            self.synced_at = time.monotonic()
+        print(f"User directory loaded {len(users)} users")
+
+    def sync(self):
+        """Apply changes other processes made to the users table since the last sync"""
+        with self.lock:
+            self.synced_at = time.monotonic()
+            for user, updated_at in self.store.list_users_updated_since(self.watermark - self.sync_skew):
+                current = self.by_id.get(user['id'])
+                if current is not None:
+                    self._unindex(current)
+                self._index(user)
+                self.watermark = max(self.watermark, updated_at)
+
+    def _maybe_sync(self):
+        if self.sync_interval is not None and time.monotonic() - self.synced_at >= self.sync_interval:
+            self.sync()
+
+    def _load_missing(self, user):
+        """Index a user another process created since the last sync"""
+        if user is not None and self.sync_interval is not None:
+            with self.lock:
+                if user['id'] not in self.by_id:
+                    self._index(user)
+            return dict(user)
+        return user
+
+    def _index(self, user):
+        self.by_id[user['id']] = user
+        self.id_by_email[user['email']] = user['id']
+        specialties = self.by_role.setdefault(user['role'], {})
+        specialties.setdefault(user.get('specialty'), {})[user['id']] = None
+
+    def _unindex(self, user):
+        self.id_by_email.pop(user['email'], None)
+        specialties = self.by_role.get(user['role'], {})
+        members = specialties.get(user.get('specialty'))
+        if members is not None:
+            members.pop(user['id'], None)
+            if not members:
+                del specialties[user.get('specialty')]
+
+    def get(self, user_id):
+        with self.lock:
+            self._maybe_sync()
+            user = self.by_id.get(user_id)
+            if user:
+                return dict(user)
+        if self.sync_interval is not None and user_id:
+            return self._load_missing(self.store.get_user(user_id))
+        return None
+
+    def get_by_email(self, email):
+        with self.lock:
+            self._maybe_sync()
+            user_id = self.id_by_email.get(email)
+            if user_id is not None:
+                return dict(self.by_id[user_id])
+        if self.sync_interval is not None and email:
+            return self._load_missing(self.store.get_user_by_email(email))
+        return None
+
+    def get_many(self, user_ids):
+        """Map of user id -> user for the ids that exist"""
+        with self.lock:
+            self._maybe_sync()
+            return {uid: dict(self.by_id[uid]) for uid in user_ids if uid in self.by_id}
+
+    def find(self, role, specialty=None, availability=None, status=None):
+        """Users with a role, optionally narrowed by specialty, availability and status"""
+        with self.lock:
+            self._maybe_sync()
+            specialties = self.by_role.get(role, {})
+            if specialty is not None:
+                groups = [specialties.get(specialty, {})]
+            else:
+                groups = specialties.values()
+
+            matches = []
+            for members in groups:
+                for uid in members:
+                    user = self.by_id[uid]
+                    if availability is not None and bool(user.get('availability')) != bool(availability):
+                        continue
+                    if status is not None and user.get('status', 'offline') != status:
+                        continue
+                    matches.append(dict(user))
+            return matches
+
+    def create(self, user):
+        """Register a new user; returns False if the email or id is already taken"""
+        with self.lock:
+            self._maybe_sync()
+            if user['email'] in self.id_by_email or user['id'] in self.by_id:
+                return False
+            if not self.store.create_user(user):
+                return False
+            stored = self.store.get_user(user['id'])
+            self._index(stored)
+            return True
+
+    def update(self, user_id, **fields):
+        """Write fields through to the store and reindex the user"""
+        with self.lock:
+            current = self.by_id.get(user_id)
+            if current is None:
+                return None
+            fields = {k: v for k, v in fields.items() if k in USER_FIELDS and k != 'id'}
+            self.store.update_user(user_id, **fields)
+            updated = dict(current, **fields)
+            # The store drops unset optional fields, keep the same shape here
+            updated = {k: v for k, v in updated.items() if v is not None or k not in ('specialty', 'availability')}
+            self._unindex(current)
+            self._index(updated)
+            return dict(updated)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.by_id)
@@ -294,6 +294,9 @@ export const ApiService = {
       const formData = new FormData()
       formData.append("file", file)
       formData.append("model", modelKey)
+      // Reports are built in the background; this page shows report_content from the
+      // response, so ask the server to wait for it
+      formData.append("wait_for_report", "true")
 
       const response = await api.post("/predict", formData, {
         headers: {
@@ -51,6 +51,9 @@ export async function predictImage(file: File, modelKey: string): Promise<Predic
   const formData = new FormData()
   formData.append("file", file)
   formData.append("model", modelKey)
+  // Reports are built in the background; this page shows report_content from the
+  // response, so ask the server to wait for it
+  formData.append("wait_for_report", "true")
 
   const response = await fetch(`${API_BASE_URL}/predict`, {
     method: "POST",